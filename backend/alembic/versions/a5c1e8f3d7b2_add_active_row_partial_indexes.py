@@ -0,0 +1,42 @@
+"""Add partial indexes on active workflow tasks and open compliance instances
+
+Revision ID: a5c1e8f3d7b2
+Revises: f2c8d6a4b1e9
+Create Date: 2026-10-17 13:00:00.000000
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "a5c1e8f3d7b2"
+down_revision = "f2c8d6a4b1e9"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Add partial indexes covering only rows the hot workflow queries can match"""
+    # Overdue / due-soon task queries by tenant (get_overdue_tasks, get_tasks_due_soon)
+    op.create_index(
+        "idx_workflow_tasks_active_tenant_due",
+        "workflow_tasks",
+        ["tenant_id", "due_date"],
+        postgresql_where=sa.text("status IN ('Pending', 'In Progress')"),
+    )
+
+    # Overdue sweep over open instances (update_overdue_status)
+    op.create_index(
+        "idx_compliance_instances_open_due",
+        "compliance_instances",
+        ["due_date"],
+        postgresql_where=sa.text("status NOT IN ('Completed', 'Overdue')"),
+    )
+
+
+def downgrade() -> None:
+    """Drop active-row partial indexes"""
+    op.drop_index("idx_compliance_instances_open_due", table_name="compliance_instances")
+    op.drop_index("idx_workflow_tasks_active_tenant_due", table_name="workflow_tasks")
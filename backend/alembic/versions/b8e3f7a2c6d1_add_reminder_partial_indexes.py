@@ -0,0 +1,42 @@
+"""Add partial indexes for reminder and escalation scans
+
+Revision ID: b8e3f7a2c6d1
+Revises: a5c1e8f3d7b2
+Create Date: 2026-10-17 16:00:00.000000
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "b8e3f7a2c6d1"
+down_revision = "a5c1e8f3d7b2"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Add partial indexes on due_date for the scheduled reminder queries"""
+    # Due-date reminders and overdue escalations (status <> 'Completed')
+    op.create_index(
+        "idx_compliance_instances_not_completed_due",
+        "compliance_instances",
+        ["due_date"],
+        postgresql_where=sa.text("status <> 'Completed'"),
+    )
+
+    # Task reminders scan active tasks across all tenants by due_date
+    op.create_index(
+        "idx_workflow_tasks_active_due",
+        "workflow_tasks",
+        ["due_date"],
+        postgresql_where=sa.text("status IN ('Pending', 'In Progress')"),
+    )
+
+
+def downgrade() -> None:
+    """Drop reminder partial indexes"""
+    op.drop_index("idx_workflow_tasks_active_due", table_name="workflow_tasks")
+    op.drop_index("idx_compliance_instances_not_completed_due", table_name="compliance_instances")
@@ -0,0 +1,32 @@
+"""Add partial index on overdue instances not yet escalated
+
+Revision ID: c4f9a1d6e8b3
+Revises: b8e3f7a2c6d1
+Create Date: 2026-10-17 17:00:00.000000
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "c4f9a1d6e8b3"
+down_revision = "b8e3f7a2c6d1"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Add partial index covering only instances escalate_overdue_items can still escalate"""
+    op.create_index(
+        "idx_compliance_instances_unescalated_due",
+        "compliance_instances",
+        ["due_date"],
+        postgresql_where=sa.text("status <> 'Completed' AND (meta_data ->> 'escalated') IS NULL"),
+    )
+
+
+def downgrade() -> None:
+    """Drop unescalated instances partial index"""
+    op.drop_index("idx_compliance_instances_unescalated_due", table_name="compliance_instances")
@@ -0,0 +1,46 @@
+"""Add notification query indexes
+
+Revision ID: c9e2a7d3f6b1
+Revises: b7d4e5f1c8a2
+Create Date: 2026-10-17 09:00:00.000000
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "c9e2a7d3f6b1"
+down_revision = "b7d4e5f1c8a2"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Add indexes backing the notification list, unread count and purge queries"""
+    # Partial covering index for unread notifications (list + count)
+    op.create_index(
+        "idx_notifications_user_unread",
+        "notifications",
+        ["tenant_id", "user_id", "is_read", sa.text("created_at DESC")],
+        postgresql_include=["id", "title", "notification_type"],
+        postgresql_where=sa.text("is_read = false"),
+    )
+
+    # All notifications for a user, newest first
+    op.create_index(
+        "idx_notifications_user_created",
+        "notifications",
+        ["tenant_id", "user_id", sa.text("created_at DESC")],
+    )
+
+    # Retention purge by tenant and age
+    op.create_index("idx_notifications_tenant_created", "notifications", ["tenant_id", "created_at"])
+
+
+def downgrade() -> None:
+    """Drop notification query indexes"""
+    op.drop_index("idx_notifications_tenant_created", table_name="notifications")
+    op.drop_index("idx_notifications_user_created", table_name="notifications")
+    op.drop_index("idx_notifications_user_unread", table_name="notifications")
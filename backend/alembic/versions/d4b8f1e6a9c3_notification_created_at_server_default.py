@@ -0,0 +1,27 @@
+"""Notification created_at server default
+
+Revision ID: d4b8f1e6a9c3
+Revises: c9e2a7d3f6b1
+Create Date: 2026-10-17 09:30:00.000000
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "d4b8f1e6a9c3"
+down_revision = "c9e2a7d3f6b1"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Let the database stamp notifications.created_at (naive UTC, like datetime.utcnow())"""
+    op.alter_column("notifications", "created_at", server_default=sa.text("timezone('utc', now())"))
+
+
+def downgrade() -> None:
+    """Remove the created_at server default"""
+    op.alter_column("notifications", "created_at", server_default=None)
@@ -0,0 +1,31 @@
+"""Add audit log index on action, resource type and created_at
+
+Revision ID: d6b2f8a4c1e7
+Revises: c4f9a1d6e8b3
+Create Date: 2026-10-17 18:00:00.000000
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "d6b2f8a4c1e7"
+down_revision = "c4f9a1d6e8b3"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Add index for newest-first lookups of audit events by action and resource type"""
+    op.create_index(
+        "idx_audit_logs_action_resource_created",
+        "audit_logs",
+        ["action_type", "resource_type", sa.text("created_at DESC")],
+    )
+
+
+def downgrade() -> None:
+    """Drop audit log action/resource index"""
+    op.drop_index("idx_audit_logs_action_resource_created", table_name="audit_logs")
@@ -0,0 +1,37 @@
+"""Add id to notification list index for keyset pagination
+
+Revision ID: e7a3c5b9d2f4
+Revises: d4b8f1e6a9c3
+Create Date: 2026-10-17 10:00:00.000000
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "e7a3c5b9d2f4"
+down_revision = "d4b8f1e6a9c3"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Extend idx_notifications_user_created with id for (created_at, id) keyset paging"""
+    op.drop_index("idx_notifications_user_created", table_name="notifications")
+    op.create_index(
+        "idx_notifications_user_created",
+        "notifications",
+        ["tenant_id", "user_id", sa.text("created_at DESC"), sa.text("id DESC")],
+    )
+
+
+def downgrade() -> None:
+    """Restore idx_notifications_user_created without id"""
+    op.drop_index("idx_notifications_user_created", table_name="notifications")
+    op.create_index(
+        "idx_notifications_user_created",
+        "notifications",
+        ["tenant_id", "user_id", sa.text("created_at DESC")],
+    )
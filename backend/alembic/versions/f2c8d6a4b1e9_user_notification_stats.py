@@ -0,0 +1,97 @@
+"""Add user_notification_stats unread counters maintained by triggers
+
+Revision ID: f2c8d6a4b1e9
+Revises: e7a3c5b9d2f4
+Create Date: 2026-10-17 12:00:00.000000
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = "f2c8d6a4b1e9"
+down_revision = "e7a3c5b9d2f4"
+branch_labels = None
+depends_on = None
+
+
+STATS_FUNCTION = """
+CREATE OR REPLACE FUNCTION notification_stats_apply() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        INSERT INTO user_notification_stats (tenant_id, user_id, unread_count)
+        SELECT tenant_id, user_id, count(*) FROM new_rows WHERE NOT is_read GROUP BY tenant_id, user_id
+        ON CONFLICT (tenant_id, user_id)
+        DO UPDATE SET unread_count = user_notification_stats.unread_count + EXCLUDED.unread_count;
+    ELSIF TG_OP = 'UPDATE' THEN
+        INSERT INTO user_notification_stats (tenant_id, user_id, unread_count)
+        SELECT n.tenant_id, n.user_id, sum((NOT n.is_read)::int - (NOT o.is_read)::int)
+        FROM new_rows n JOIN old_rows o ON o.id = n.id
+        GROUP BY n.tenant_id, n.user_id
+        HAVING sum((NOT n.is_read)::int - (NOT o.is_read)::int) <> 0
+        ON CONFLICT (tenant_id, user_id)
+        DO UPDATE SET unread_count = GREATEST(user_notification_stats.unread_count + EXCLUDED.unread_count, 0);
+    ELSE
+        UPDATE user_notification_stats s
+        SET unread_count = GREATEST(s.unread_count - d.unread, 0)
+        FROM (
+            SELECT tenant_id, user_id, count(*) AS unread FROM old_rows WHERE NOT is_read GROUP BY tenant_id, user_id
+        ) d
+        WHERE s.tenant_id = d.tenant_id AND s.user_id = d.user_id;
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql
+"""
+
+
+def upgrade() -> None:
+    """Create user_notification_stats, backfill it and install the maintenance triggers"""
+    op.create_table(
+        "user_notification_stats",
+        sa.Column("tenant_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("user_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("unread_count", sa.Integer(), server_default="0", nullable=False),
+        sa.ForeignKeyConstraint(["tenant_id"], ["tenants.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("tenant_id", "user_id"),
+    )
+
+    op.execute(STATS_FUNCTION)
+    op.execute(
+        "CREATE TRIGGER trg_notifications_stats_insert AFTER INSERT ON notifications "
+        "REFERENCING NEW TABLE AS new_rows FOR EACH STATEMENT EXECUTE FUNCTION notification_stats_apply()"
+    )
+    op.execute(
+        "CREATE TRIGGER trg_notifications_stats_update AFTER UPDATE ON notifications "
+        "REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows "
+        "FOR EACH STATEMENT EXECUTE FUNCTION notification_stats_apply()"
+    )
+    op.execute(
+        "CREATE TRIGGER trg_notifications_stats_delete AFTER DELETE ON notifications "
+        "REFERENCING OLD TABLE AS old_rows FOR EACH STATEMENT EXECUTE FUNCTION notification_stats_apply()"
+    )
+
+    # Backfill after the triggers exist; writes between the two statements are
+    # counted by the triggers and then overwritten by the authoritative COUNT.
+    op.execute(
+        """
+        INSERT INTO user_notification_stats (tenant_id, user_id, unread_count)
+        SELECT tenant_id, user_id, count(*) FILTER (WHERE NOT is_read)
+        FROM notifications
+        GROUP BY tenant_id, user_id
+        ON CONFLICT (tenant_id, user_id) DO UPDATE SET unread_count = EXCLUDED.unread_count
+        """
+    )
+
+
+def downgrade() -> None:
+    """Drop the triggers, function and user_notification_stats"""
+    op.execute("DROP TRIGGER IF EXISTS trg_notifications_stats_delete ON notifications")
+    op.execute("DROP TRIGGER IF EXISTS trg_notifications_stats_update ON notifications")
+    op.execute("DROP TRIGGER IF EXISTS trg_notifications_stats_insert ON notifications")
+    op.execute("DROP FUNCTION IF EXISTS notification_stats_apply()")
+    op.drop_table("user_notification_stats")
@@ -11,6 +11,7 @@ from uuid import UUID
 
 from app.core.database import get_db
 from app.core.dependencies import get_current_user, get_current_tenant_id
+from app.core.redis import invalidate_cached_name
 from app.schemas import (
     ComplianceMasterCreate,
     ComplianceMasterUpdate,
@@ -433,6 +434,9 @@ async def update_compliance_master(
     master.updated_by = UUID(current_user["user_id"])
     master.updated_at = datetime.utcnow()
 
+    if "compliance_name" in new_values:
+        invalidate_cached_name("master", master.id)
+
     # Log action
     if new_values:
         await log_action(
@@ -620,6 +624,7 @@ async def bulk_import_compliance_masters(
                             setattr(existing, field, value)
                     existing.updated_by = UUID(current_user["user_id"])
                     existing.updated_at = datetime.utcnow()
+                    invalidate_cached_name("master", existing.id)
                     updated_count += 1
                 else:
                     skipped_count += 1
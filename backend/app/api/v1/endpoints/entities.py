@@ -11,6 +11,7 @@ from uuid import UUID
 
 from app.core.database import get_db
 from app.core.dependencies import get_current_user, get_current_tenant_id
+from app.core.redis import invalidate_cached_name
 from app.schemas import (
     EntityCreate,
     EntityUpdate,
@@ -426,6 +427,9 @@ async def update_entity(
     entity.updated_by = UUID(current_user["user_id"])
     entity.updated_at = datetime.utcnow()
 
+    if "entity_name" in new_values:
+        invalidate_cached_name("entity", entity.id)
+
     # Log action
     if new_values:
         await log_action(
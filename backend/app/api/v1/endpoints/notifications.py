@@ -2,12 +2,13 @@
 Notification management endpoints
 """
 
-from typing import List
+from datetime import datetime
+from typing import Any, Mapping, Optional
 from uuid import UUID
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 from sqlalchemy.orm import Session
 
-from app.core.database import get_db
+from app.core.database import get_db, get_read_db
 from app.core.dependencies import get_current_user, get_current_tenant_id
 from app.models import Notification
 from app.schemas.notification import (
@@ -19,10 +20,14 @@ from app.schemas.notification import (
     NotificationDeleteResponse,
 )
 from app.services.notification_service import (
-    get_user_notifications,
+    get_user_notifications_rows,
+    encode_notification_cursor,
+    decode_notification_cursor,
     get_unread_count,
     mark_notification_read,
+    mark_notifications_read_bulk,
     mark_all_read,
+    mark_all_read_async,
     delete_notification,
 )
 
@@ -45,34 +50,72 @@ def _build_notification_response(notification: Notification) -> dict:
     }
 
 
+def _build_notification_row_response(row: Mapping[str, Any]) -> dict:
+    """Build notification response from a column mapping (see get_user_notifications_rows)."""
+    return {
+        "id": str(row["id"]),
+        "user_id": str(row["user_id"]),
+        "tenant_id": str(row["tenant_id"]),
+        "notification_type": row["notification_type"],
+        "title": row["title"],
+        "message": row["message"],
+        "link": row["link"],
+        "is_read": row["is_read"],
+        "read_at": row["read_at"],
+        "created_at": row["created_at"],
+    }
+
+
 @router.get("/", response_model=NotificationListResponse)
 async def list_notifications(
     unread_only: bool = Query(False, description="Only return unread notifications"),
     skip: int = Query(0, ge=0),
     limit: int = Query(50, ge=1, le=200),
+    before: Optional[str] = Query(None, description="Cursor from a previous page's next_cursor"),
     db: Session = Depends(get_db),
+    read_db: Session = Depends(get_read_db),
     current_user: dict = Depends(get_current_user),
     tenant_id: str = Depends(get_current_tenant_id),
 ):
     """
     List notifications for the current user.
     Returns notifications ordered by created_at desc.
+
+    Page with `before` (keyset, constant cost at any depth) using the
+    next_cursor of the previous page; `skip` remains supported.
     """
     tenant_uuid = UUID(tenant_id)
     user_id = UUID(current_user["user_id"])
 
-    # Get notifications
-    notifications = get_user_notifications(
+    cursor = None
+    if before:
+        try:
+            cursor = decode_notification_cursor(before)
+        except ValueError:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor")
+
+    # Get notifications (column rows - no ORM hydration)
+    notifications = get_user_notifications_rows(
         db=db,
         user_id=user_id,
         tenant_id=tenant_uuid,
         unread_only=unread_only,
         limit=limit,
         offset=skip,
+        before=cursor,
+        read_db=read_db,
     )
 
-    # Get total count
-    total_query = db.query(Notification).filter(
+    next_cursor = None
+    if len(notifications) == limit:
+        last = notifications[-1]
+        created_at = last["created_at"]
+        if isinstance(created_at, str):  # entries served from the Redis list cache
+            created_at = datetime.fromisoformat(created_at)
+        next_cursor = encode_notification_cursor(created_at, last["id"])
+
+    # Get total count (uncached, so the replica is fine)
+    total_query = read_db.query(Notification).filter(
         Notification.user_id == user_id,
         Notification.tenant_id == tenant_uuid,
     )
@@ -80,15 +123,16 @@ async def list_notifications(
         total_query = total_query.filter(Notification.is_read == False)  # noqa: E712
     total = total_query.count()
 
-    # Get unread count
+    # Get unread count (a cache miss refills Redis, so read the primary)
     unread = get_unread_count(db, user_id, tenant_uuid)
 
     return {
-        "items": [_build_notification_response(n) for n in notifications],
+        "items": [_build_notification_row_response(n) for n in notifications],
         "total": total,
         "unread_count": unread,
         "skip": skip,
         "limit": limit,
+        "next_cursor": next_cursor,
     }
 
 
@@ -186,38 +230,48 @@ async def mark_notifications_read(
         count = mark_all_read(db, user_id, tenant_uuid)
         return {"marked_count": count}
 
-    # Mark specific notifications as read
-    marked_count = 0
+    # Mark specific notifications as read (batched UPDATEs)
+    notification_uuids = []
     for notification_id in request.notification_ids:
         try:
-            notification_uuid = UUID(notification_id)
-            result = mark_notification_read(
-                db=db,
-                notification_id=notification_uuid,
-                user_id=user_id,
-                tenant_id=tenant_uuid,
-            )
-            if result:
-                marked_count += 1
+            notification_uuids.append(UUID(notification_id))
         except ValueError:
             continue  # Skip invalid UUIDs
 
+    marked_count = mark_notifications_read_bulk(
+        db=db,
+        notification_ids=notification_uuids,
+        user_id=user_id,
+        tenant_id=tenant_uuid,
+    )
+
     return {"marked_count": marked_count}
 
 
-@router.post("/mark-all-read", response_model=NotificationMarkReadResponse)
+@router.post("/mark-all-read", response_model=NotificationMarkReadResponse, status_code=status.HTTP_202_ACCEPTED)
 async def mark_all_notifications_read(
+    response: Response,
+    sync: bool = Query(False, description="Mark synchronously and return the exact count"),
     db: Session = Depends(get_db),
     current_user: dict = Depends(get_current_user),
     tenant_id: str = Depends(get_current_tenant_id),
 ):
     """
     Mark all notifications as read for the current user.
+
+    By default the update runs in the background and the response (202) carries
+    the unread count at the time of the request. Pass sync=true to mark
+    synchronously (200).
     """
     tenant_uuid = UUID(tenant_id)
     user_id = UUID(current_user["user_id"])
 
-    count = mark_all_read(db, user_id, tenant_uuid)
+    if sync:
+        count = mark_all_read(db, user_id, tenant_uuid)
+        response.status_code = status.HTTP_200_OK
+        return {"marked_count": count}
+
+    count = mark_all_read_async(db, user_id, tenant_uuid)
 
     return {"marked_count": count}
 
@@ -38,6 +38,8 @@ celery_app.conf.update(
 
 # Celery Beat schedule for automated tasks
 # All times are in IST (Asia/Kolkata)
+# Reminder jobs go through dispatch_reminder_shards, which fans them out over
+# REMINDER_SHARD_COUNT tenant shards (queues reminders_0..N-1)
 celery_app.conf.beat_schedule = {
     # Daily compliance instance generation at 2 AM IST
     "generate-instances-daily": {
@@ -71,25 +73,29 @@ celery_app.conf.beat_schedule = {
     },
     # T-3 day reminders at 9 AM IST
     "send-t3-reminders": {
-        "task": "app.tasks.reminder_tasks.send_t3_reminders",
+        "task": "app.tasks.reminder_tasks.dispatch_reminder_shards",
+        "args": ("app.tasks.reminder_tasks.send_t3_reminders",),
         "schedule": crontab(hour=9, minute=0),
         "options": {"queue": "notifications"},
     },
     # Workflow task reminders at 9:15 AM IST
     "send-task-reminders": {
-        "task": "app.tasks.reminder_tasks.send_task_reminders",
+        "task": "app.tasks.reminder_tasks.dispatch_reminder_shards",
+        "args": ("app.tasks.reminder_tasks.send_task_reminders",),
         "schedule": crontab(hour=9, minute=15),
         "options": {"queue": "notifications"},
     },
     # Due date reminders at 9:30 AM IST
     "send-due-date-reminders": {
-        "task": "app.tasks.reminder_tasks.send_due_date_reminders",
+        "task": "app.tasks.reminder_tasks.dispatch_reminder_shards",
+        "args": ("app.tasks.reminder_tasks.send_due_date_reminders",),
         "schedule": crontab(hour=9, minute=30),
         "options": {"queue": "notifications"},
     },
     # Overdue escalation at 10 AM IST
     "escalate-overdue": {
-        "task": "app.tasks.reminder_tasks.escalate_overdue_items",
+        "task": "app.tasks.reminder_tasks.dispatch_reminder_shards",
+        "args": ("app.tasks.reminder_tasks.escalate_overdue_items",),
         "schedule": crontab(hour=10, minute=0),
         "options": {"queue": "notifications"},
     },
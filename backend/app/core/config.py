@@ -3,7 +3,7 @@ Application configuration using Pydantic Settings
 """
 
 from pydantic_settings import BaseSettings
-from typing import List
+from typing import List, Optional
 
 
 class Settings(BaseSettings):
@@ -21,8 +21,11 @@ class Settings(BaseSettings):
 
     # Database
     DATABASE_URL: str
-    DATABASE_POOL_SIZE: int = 10
-    DATABASE_MAX_OVERFLOW: int = 20
+    DATABASE_POOL_SIZE: int = 20
+    DATABASE_MAX_OVERFLOW: int = 40
+    DATABASE_POOL_TIMEOUT: int = 10  # seconds to wait for a pooled connection
+    DATABASE_POOL_RECYCLE: int = 300  # seconds before a pooled connection is replaced
+    READ_REPLICA_URL: Optional[str] = None  # Optional read-only replica for uncached notification list pages
 
     # Redis
     REDIS_URL: str = "redis://localhost:6379/0"
@@ -33,6 +36,7 @@ class Settings(BaseSettings):
     JWT_ALGORITHM: str = "HS256"
     JWT_ACCESS_TOKEN_EXPIRE_MINUTES: int = 1440  # 24 hours
     JWT_REFRESH_TOKEN_EXPIRE_DAYS: int = 7
+    BCRYPT_ROUNDS: int = 12  # Password hash cost (log2 rounds); tests lower it to 4
 
     # File Storage (Render Persistent Disk)
     EVIDENCE_STORAGE_PATH: str = "./uploads/evidence"  # Local dev; production: /var/data/evidence
@@ -67,6 +71,10 @@ class Settings(BaseSettings):
     # Celery
     CELERY_BROKER_URL: str = "redis://localhost:6379/1"
     CELERY_RESULT_BACKEND: str = "redis://localhost:6379/2"
+    REMINDER_SHARD_COUNT: int = 1  # >1: split reminder tasks into tenant shards on queues reminders_0..N-1
+
+    # Notifications
+    SYNC_NOTIFICATIONS: bool = False  # True: insert in-request; False: persist via Celery
 
     # Logging
     LOG_LEVEL: str = "INFO"
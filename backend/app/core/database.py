@@ -2,7 +2,7 @@
 Database connection and session management
 """
 
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 from app.core.config import settings
@@ -12,12 +12,46 @@ engine = create_engine(
     settings.DATABASE_URL,
     pool_size=settings.DATABASE_POOL_SIZE,
     max_overflow=settings.DATABASE_MAX_OVERFLOW,
+    pool_timeout=settings.DATABASE_POOL_TIMEOUT,
+    pool_recycle=settings.DATABASE_POOL_RECYCLE,
     pool_pre_ping=True,  # Verify connections before using
     echo=settings.DEBUG,  # Log SQL queries in debug mode
 )
 
-# Session factory
+# Same pool, for non-critical bulk writes (queued notification inserts).
+# Transactions on this engine commit without waiting for the WAL fsync
+# (synchronous_commit = off): a crash can lose the last few hundred ms of
+# commits, but never corrupts data. Audit logs and other critical writes
+# must keep using SessionLocal.
+write_engine = engine.execution_options(logging_token="write")
+
+
+@event.listens_for(write_engine, "begin")
+def _relax_commit_durability(conn):
+    """Apply asynchronous commit to every transaction on write_engine."""
+    if conn.dialect.name == "postgresql":
+        conn.exec_driver_sql("SET LOCAL synchronous_commit = OFF")
+
+
+# Read replica for list/count queries, falling back to the primary
+read_engine = (
+    create_engine(
+        settings.READ_REPLICA_URL,
+        pool_size=settings.DATABASE_POOL_SIZE,
+        max_overflow=settings.DATABASE_MAX_OVERFLOW,
+        pool_timeout=settings.DATABASE_POOL_TIMEOUT,
+        pool_recycle=settings.DATABASE_POOL_RECYCLE,
+        pool_pre_ping=True,
+        echo=settings.DEBUG,
+    )
+    if settings.READ_REPLICA_URL
+    else engine
+)
+
+# Session factories
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+WriteSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=write_engine)
+ReadSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=read_engine)
 
 # Base class for models
 Base = declarative_base()
@@ -33,3 +67,17 @@ def get_db():
         yield db
     finally:
         db.close()
+
+
+def get_read_db():
+    """
+    Dependency for getting a read-only database session.
+    Uses READ_REPLICA_URL when configured, so results may lag the primary slightly.
+    Do not use replica reads to fill Redis caches: a lagging read would bring
+    back entries that a write on the primary just invalidated.
+    """
+    db = ReadSessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
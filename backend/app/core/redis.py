@@ -2,11 +2,15 @@
 Redis connection for caching and sessions
 """
 
+import json
+import logging
 import redis
-from typing import Optional
+from typing import Mapping, Optional
 from uuid import uuid4
 from app.core.config import settings
 
+logger = logging.getLogger(__name__)
+
 # Create Redis client
 redis_client = redis.from_url(
     settings.REDIS_URL,
@@ -132,3 +136,289 @@ async def invalidate_user_refresh_tokens(user_id: str) -> bool:
         return True
 
     return False
+
+
+# Notification unread-count cache
+
+
+class UnreadCountCache:
+    """
+    Per-user unread notification count cached in Redis.
+
+    Keys are namespaced per tenant: ``unread:{tenant_id}:{user_id}``.
+    The cache is best-effort: Redis errors are logged and treated as a miss,
+    so callers always fall back to the database count.
+    """
+
+    # Adjust the counter only if it is already cached; a missing key means
+    # "unknown" and must be recomputed from the database, not started at 0.
+    _INCR_IF_EXISTS = """
+    if redis.call('EXISTS', KEYS[1]) == 1 then
+        local value = redis.call('INCRBY', KEYS[1], ARGV[1])
+        if value < 0 then
+            redis.call('DEL', KEYS[1])
+            return nil
+        end
+        return value
+    end
+    return nil
+    """
+
+    def __init__(self, client: redis.Redis, ttl: int = 3600):
+        self.client = client
+        self.ttl = ttl
+        self._incr_if_exists = client.register_script(self._INCR_IF_EXISTS)
+
+    @staticmethod
+    def key(tenant_id, user_id) -> str:
+        return f"unread:{tenant_id}:{user_id}"
+
+    def get(self, tenant_id, user_id) -> Optional[int]:
+        """Return the cached count, or None on a miss / Redis error."""
+        try:
+            value = self.client.get(self.key(tenant_id, user_id))
+        except redis.RedisError as e:
+            logger.warning(f"Unread count cache read failed: {e}")
+            return None
+        return int(value) if value is not None else None
+
+    def set(self, tenant_id, user_id, count: int) -> None:
+        """Cache a freshly computed count."""
+        try:
+            self.client.setex(self.key(tenant_id, user_id), self.ttl, count)
+        except redis.RedisError as e:
+            logger.warning(f"Unread count cache write failed: {e}")
+
+    def incr(self, tenant_id, user_id, amount: int = 1) -> None:
+        """Adjust a cached count by amount (negative to decrement); no-op on a miss."""
+        try:
+            self._incr_if_exists(keys=[self.key(tenant_id, user_id)], args=[amount])
+        except redis.RedisError as e:
+            logger.warning(f"Unread count cache update failed: {e}")
+            self.invalidate(tenant_id, user_id)
+
+    def incr_many(self, counts: Mapping[tuple, int]) -> None:
+        """Adjust several cached counts in one pipelined round trip."""
+        if not counts:
+            return
+        try:
+            pipe = self.client.pipeline(transaction=False)
+            for (tenant_id, user_id), amount in counts.items():
+                self._incr_if_exists(keys=[self.key(tenant_id, user_id)], args=[amount], client=pipe)
+            pipe.execute()
+        except redis.RedisError as e:
+            logger.warning(f"Unread count cache update failed: {e}")
+            for tenant_id, user_id in counts:
+                self.invalidate(tenant_id, user_id)
+
+    def invalidate(self, tenant_id, user_id) -> None:
+        """Drop the cached count so the next read recomputes it."""
+        try:
+            self.client.delete(self.key(tenant_id, user_id))
+        except redis.RedisError as e:
+            logger.warning(f"Unread count cache invalidation failed: {e}")
+
+    def invalidate_tenant(self, tenant_id) -> None:
+        """Drop cached counts for every user in a tenant."""
+        try:
+            for key in self.client.scan_iter(match=f"unread:{tenant_id}:*", count=500):
+                self.client.delete(key)
+        except redis.RedisError as e:
+            logger.warning(f"Unread count cache tenant invalidation failed: {e}")
+
+
+unread_count_cache = UnreadCountCache(redis_client)
+
+
+# Notification list cache
+
+
+class NotificationListCache:
+    """
+    Latest notifications per user, cached in a Redis sorted set.
+
+    Keys are ``notif:list:{tenant_id}:{user_id}``; members are JSON-serialized
+    notifications scored by created_at epoch. A set is only appended to once
+    it has been populated from the database, so an existing key always holds
+    the newest ``size`` notifications (or all of them, if fewer). Redis errors
+    are logged and treated as a miss.
+    """
+
+    # Append only to an already-populated list and trim it to ARGV[3] entries.
+    _PUSH_IF_EXISTS = """
+    if redis.call('EXISTS', KEYS[1]) == 1 then
+        redis.call('ZADD', KEYS[1], ARGV[1], ARGV[2])
+        redis.call('ZREMRANGEBYRANK', KEYS[1], 0, -tonumber(ARGV[3]) - 1)
+        return 1
+    end
+    return 0
+    """
+
+    def __init__(self, client: redis.Redis, size: int = 100, ttl: int = 86400):
+        self.client = client
+        self.size = size
+        self.ttl = ttl
+        self._push_if_exists = client.register_script(self._PUSH_IF_EXISTS)
+
+    @staticmethod
+    def key(tenant_id, user_id) -> str:
+        return f"notif:list:{tenant_id}:{user_id}"
+
+    @staticmethod
+    def _entry(notification) -> tuple[float, str]:
+        """Serialize a notification as a (score, member) pair."""
+        member = json.dumps(
+            {
+                "id": str(notification.id),
+                "user_id": str(notification.user_id),
+                "tenant_id": str(notification.tenant_id),
+                "notification_type": notification.notification_type,
+                "title": notification.title,
+                "message": notification.message,
+                "link": notification.link,
+                "is_read": notification.is_read,
+                "read_at": notification.read_at.isoformat() if notification.read_at else None,
+                "created_at": notification.created_at.isoformat(),
+            }
+        )
+        return notification.created_at.timestamp(), member
+
+    def get(self, tenant_id, user_id) -> Optional[list[dict]]:
+        """Return cached notifications (as dicts) newest first, or None on a miss / Redis error."""
+        try:
+            members = self.client.zrevrange(self.key(tenant_id, user_id), 0, self.size - 1)
+        except redis.RedisError as e:
+            logger.warning(f"Notification list cache read failed: {e}")
+            return None
+        return [json.loads(member) for member in members] if members else None
+
+    def set(self, tenant_id, user_id, notifications: list) -> None:
+        """Replace the cached list with notifications loaded from the database."""
+        if not notifications:
+            return
+        key = self.key(tenant_id, user_id)
+        try:
+            pipe = self.client.pipeline()
+            pipe.delete(key)
+            pipe.zadd(key, {member: score for score, member in map(self._entry, notifications)})
+            pipe.expire(key, self.ttl)
+            pipe.execute()
+        except redis.RedisError as e:
+            logger.warning(f"Notification list cache write failed: {e}")
+
+    def push_many(self, notifications: list) -> None:
+        """Append new notifications to their users' lists, where those lists are cached."""
+        if not notifications:
+            return
+        try:
+            pipe = self.client.pipeline(transaction=False)
+            for notification in notifications:
+                score, member = self._entry(notification)
+                self._push_if_exists(
+                    keys=[self.key(notification.tenant_id, notification.user_id)],
+                    args=[score, member, self.size],
+                    client=pipe,
+                )
+            pipe.execute()
+        except redis.RedisError as e:
+            logger.warning(f"Notification list cache update failed: {e}")
+            for notification in notifications:
+                self.invalidate(notification.tenant_id, notification.user_id)
+
+    def invalidate(self, tenant_id, user_id) -> None:
+        """Drop the cached list so the next read reloads it."""
+        try:
+            self.client.delete(self.key(tenant_id, user_id))
+        except redis.RedisError as e:
+            logger.warning(f"Notification list cache invalidation failed: {e}")
+
+    def invalidate_tenant(self, tenant_id) -> None:
+        """Drop cached lists for every user in a tenant."""
+        try:
+            for key in self.client.scan_iter(match=f"notif:list:{tenant_id}:*", count=500):
+                self.client.delete(key)
+        except redis.RedisError as e:
+            logger.warning(f"Notification list cache tenant invalidation failed: {e}")
+
+
+notification_list_cache = NotificationListCache(redis_client)
+
+
+# Idempotency claims
+
+
+def claim_once(key: str, ttl: int = 86400) -> bool:
+    """
+    Atomically claim an idempotency key (SET NX EX).
+
+    Args:
+        key: Idempotency key
+        ttl: Seconds before the claim expires (default: 1 day)
+
+    Returns:
+        bool: True if this caller claimed the key, False if it was already claimed.
+            Fails open (True) when Redis is unavailable.
+    """
+    try:
+        return bool(redis_client.set(key, 1, nx=True, ex=ttl))
+    except redis.RedisError as e:
+        logger.warning(f"Idempotency claim failed for {key}: {e}")
+        return True
+
+
+def release_claim(key: str) -> None:
+    """Release an idempotency key so the operation can be retried."""
+    try:
+        redis_client.delete(key)
+    except redis.RedisError as e:
+        logger.warning(f"Idempotency release failed for {key}: {e}")
+
+
+# Display-name cache (compliance masters, entities)
+
+
+def get_cached_name(kind: str, object_id) -> Optional[str]:
+    """
+    Get a cached display name.
+
+    Args:
+        kind: Object kind (e.g., "master", "entity")
+        object_id: Object UUID
+
+    Returns:
+        str | None: Cached name, or None on a miss / Redis error
+    """
+    try:
+        return redis_client.get(f"name:{kind}:{object_id}")
+    except redis.RedisError as e:
+        logger.warning(f"Name cache read failed: {e}")
+        return None
+
+
+def set_cached_name(kind: str, object_id, name: str, ttl: int = 3600) -> None:
+    """Cache a display name (default TTL: 1 hour)."""
+    try:
+        redis_client.setex(f"name:{kind}:{object_id}", ttl, name)
+    except redis.RedisError as e:
+        logger.warning(f"Name cache write failed: {e}")
+
+
+def invalidate_cached_name(kind: str, object_id) -> None:
+    """Drop a cached display name (e.g., after a rename)."""
+    try:
+        redis_client.delete(f"name:{kind}:{object_id}")
+    except redis.RedisError as e:
+        logger.warning(f"Name cache invalidation failed: {e}")
+
+
+# Dashboard cache
+
+
+def dashboard_cache_key(tenant_id, view: str) -> str:
+    """
+    Build a dashboard cache key (dashboard:{tenant_id}:{view}).
+
+    Keys are tenant-scoped so a tenant's entries can be invalidated with a
+    SCAN over dashboard:{tenant_id}:* instead of every tenant's keys.
+    """
+    return f"dashboard:{tenant_id}:{view}"
@@ -7,6 +7,7 @@ from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.gzip import GZipMiddleware
 from app.core.config import settings
 from app.api.v1.router import api_router
+from app.services.external_integrations.http_client import close_http_client
 
 # Create FastAPI app
 app = FastAPI(
@@ -34,6 +35,12 @@ app.add_middleware(GZipMiddleware, minimum_size=1000)
 app.include_router(api_router, prefix=settings.API_V1_PREFIX)
 
 
+@app.on_event("shutdown")
+async def shutdown_http_client():
+    """Close pooled connections held by the shared external API client"""
+    await close_http_client()
+
+
 @app.get("/")
 async def root():
     """Root endpoint - basic liveness check"""
@@ -10,12 +10,12 @@ from app.models.role import Role, user_roles
 from app.models.user import User
 from app.models.entity import Entity, entity_access
 from app.models.compliance_master import ComplianceMaster
-from app.models.compliance_instance import ComplianceInstance
-from app.models.workflow_task import WorkflowTask
+from app.models.compliance_instance import ComplianceInstance, OVERDUE_EXEMPT_STATUSES, REMINDER_EXEMPT_STATUSES
+from app.models.workflow_task import WorkflowTask, ACTIVE_TASK_STATUSES
 from app.models.tag import Tag
 from app.models.evidence import Evidence, evidence_tag_mappings
 from app.models.audit_log import AuditLog
-from app.models.notification import Notification
+from app.models.notification import Notification, UserNotificationStats
 
 __all__ = [
     "Base",
@@ -27,10 +27,14 @@ __all__ = [
     "entity_access",
     "ComplianceMaster",
     "ComplianceInstance",
+    "OVERDUE_EXEMPT_STATUSES",
+    "REMINDER_EXEMPT_STATUSES",
     "WorkflowTask",
+    "ACTIVE_TASK_STATUSES",
     "Tag",
     "Evidence",
     "evidence_tag_mappings",
     "AuditLog",
     "Notification",
+    "UserNotificationStats",
 ]
@@ -2,7 +2,7 @@
 Audit Log model for immutable audit trail
 """
 
-from sqlalchemy import Column, String, Text, DateTime, ForeignKey, Index
+from sqlalchemy import Column, String, Text, DateTime, ForeignKey, Index, text
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.orm import relationship
 from datetime import datetime
@@ -55,6 +55,8 @@ class AuditLog(Base, UUIDMixin):
         Index("idx_audit_logs_tenant_created", "tenant_id", "created_at"),
         Index("idx_audit_logs_resource", "resource_type", "resource_id", "created_at"),
         Index("idx_audit_logs_user_created", "user_id", "created_at"),
+        # Index for the latest event of a kind (e.g. most recent LOGIN on user)
+        Index("idx_audit_logs_action_resource_created", "action_type", "resource_type", text("created_at DESC")),
     )
 
     def __repr__(self):
@@ -2,11 +2,18 @@
 Compliance Instance model - time-bound occurrences of compliance obligations
 """
 
-from sqlalchemy import Column, String, Text, Date, ForeignKey, Index
+from sqlalchemy import Column, String, Text, Date, ForeignKey, Index, text
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.orm import relationship
 from app.models.base import Base, UUIDMixin, TenantScopedMixin, AuditMixin
 
+# Statuses skipped by the overdue sweep; matches idx_compliance_instances_open_due's predicate
+OVERDUE_EXEMPT_STATUSES = ("Completed", "Overdue")
+
+# Statuses skipped by due-date reminders and escalations (overdue instances still
+# need them); matches idx_compliance_instances_not_completed_due's predicate
+REMINDER_EXEMPT_STATUSES = ("Completed",)
+
 
 class ComplianceInstance(Base, UUIDMixin, TenantScopedMixin, AuditMixin):
     """Compliance Instance - actual occurrence of a compliance for a specific entity and period"""
@@ -99,6 +106,26 @@ class ComplianceInstance(Base, UUIDMixin, TenantScopedMixin, AuditMixin):
         ),
         # Index for entity-based queries
         Index("idx_compliance_instances_entity_status", "entity_id", "status", "due_date"),
+        # Partial index on open instances for the overdue sweep (update_overdue_status);
+        # keep the predicate in sync with OVERDUE_EXEMPT_STATUSES
+        Index(
+            "idx_compliance_instances_open_due",
+            "due_date",
+            postgresql_where=text("status NOT IN ('Completed', 'Overdue')"),
+        ),
+        # Partial index on non-completed instances for due-date reminders and escalations;
+        # keep the predicate in sync with REMINDER_EXEMPT_STATUSES
+        Index(
+            "idx_compliance_instances_not_completed_due",
+            "due_date",
+            postgresql_where=text("status <> 'Completed'"),
+        ),
+        # Partial index on open instances not yet escalated (escalate_overdue_items)
+        Index(
+            "idx_compliance_instances_unescalated_due",
+            "due_date",
+            postgresql_where=text("status <> 'Completed' AND (meta_data ->> 'escalated') IS NULL"),
+        ),
     )
 
     def __repr__(self):
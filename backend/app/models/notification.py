@@ -2,10 +2,9 @@
 Notification model for in-app notifications
 """
 
-from sqlalchemy import Column, String, Text, Boolean, DateTime, ForeignKey, Index
+from sqlalchemy import DDL, Column, Integer, String, Text, Boolean, DateTime, ForeignKey, Index, event, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
-from datetime import datetime
 from app.models.base import Base, UUIDMixin, TenantScopedMixin
 
 
@@ -36,13 +35,102 @@ class Notification(Base, UUIDMixin, TenantScopedMixin):
     read_at = Column(DateTime, nullable=True)
 
     # Timestamp
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False, index=True)
+    # Naive UTC like the rest of the schema (plain now() would store server-local time)
+    created_at = Column(DateTime, nullable=False, server_default=text("timezone('utc', now())"), index=True)
 
     # Relationships
     user = relationship("User")
 
     # Indexes for queries
-    __table_args__ = (Index("idx_notifications_user_read", "user_id", "is_read", "created_at"),)
+    __table_args__ = (
+        Index("idx_notifications_user_read", "user_id", "is_read", "created_at"),
+        # Partial covering index for unread list/count (index-only scans)
+        Index(
+            "idx_notifications_user_unread",
+            "tenant_id",
+            "user_id",
+            "is_read",
+            text("created_at DESC"),
+            postgresql_include=["id", "title", "notification_type"],
+            postgresql_where=text("is_read = false"),
+        ),
+        # Index for "all notifications" list ordered by newest first (keyset on created_at, id)
+        Index("idx_notifications_user_created", "tenant_id", "user_id", text("created_at DESC"), text("id DESC")),
+        # Index for retention purges (delete_old_notifications)
+        Index("idx_notifications_tenant_created", "tenant_id", "created_at"),
+    )
 
     def __repr__(self):
         return f"<Notification {self.notification_type} for User {self.user_id}: {self.title}>"
+
+
+class UserNotificationStats(Base):
+    """
+    Per-user unread notification counter
+
+    Maintained by statement-level triggers on notifications (see
+    NOTIFICATION_STATS_TRIGGERS) so unread counts are a primary key lookup
+    instead of a COUNT over the unread rows.
+    """
+
+    __tablename__ = "user_notification_stats"
+
+    tenant_id = Column(UUID(as_uuid=True), ForeignKey("tenants.id", ondelete="CASCADE"), primary_key=True)
+    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), primary_key=True)
+    unread_count = Column(Integer, nullable=False, server_default="0")
+
+    def __repr__(self):
+        return f"<UserNotificationStats User {self.user_id}: {self.unread_count} unread>"
+
+
+# Keep user_notification_stats.unread_count in step with notifications.is_read.
+# Statement-level triggers with transition tables apply one upsert per
+# (tenant, user) per statement, so bulk inserts and chunked mark-all-read stay cheap.
+NOTIFICATION_STATS_TRIGGERS = """
+CREATE OR REPLACE FUNCTION notification_stats_apply() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        INSERT INTO user_notification_stats (tenant_id, user_id, unread_count)
+        SELECT tenant_id, user_id, count(*) FROM new_rows WHERE NOT is_read GROUP BY tenant_id, user_id
+        ON CONFLICT (tenant_id, user_id)
+        DO UPDATE SET unread_count = user_notification_stats.unread_count + EXCLUDED.unread_count;
+    ELSIF TG_OP = 'UPDATE' THEN
+        INSERT INTO user_notification_stats (tenant_id, user_id, unread_count)
+        SELECT n.tenant_id, n.user_id, sum((NOT n.is_read)::int - (NOT o.is_read)::int)
+        FROM new_rows n JOIN old_rows o ON o.id = n.id
+        GROUP BY n.tenant_id, n.user_id
+        HAVING sum((NOT n.is_read)::int - (NOT o.is_read)::int) <> 0
+        ON CONFLICT (tenant_id, user_id)
+        DO UPDATE SET unread_count = GREATEST(user_notification_stats.unread_count + EXCLUDED.unread_count, 0);
+    ELSE
+        UPDATE user_notification_stats s
+        SET unread_count = GREATEST(s.unread_count - d.unread, 0)
+        FROM (
+            SELECT tenant_id, user_id, count(*) AS unread FROM old_rows WHERE NOT is_read GROUP BY tenant_id, user_id
+        ) d
+        WHERE s.tenant_id = d.tenant_id AND s.user_id = d.user_id;
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER trg_notifications_stats_insert AFTER INSERT ON notifications
+    REFERENCING NEW TABLE AS new_rows FOR EACH STATEMENT EXECUTE FUNCTION notification_stats_apply();
+CREATE TRIGGER trg_notifications_stats_update AFTER UPDATE ON notifications
+    REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION notification_stats_apply();
+CREATE TRIGGER trg_notifications_stats_delete AFTER DELETE ON notifications
+    REFERENCING OLD TABLE AS old_rows FOR EACH STATEMENT EXECUTE FUNCTION notification_stats_apply();
+"""
+
+# Install the triggers for metadata.create_all() too (tests, fresh databases)
+event.listen(
+    Notification.__table__,
+    "after_create",
+    DDL(NOTIFICATION_STATS_TRIGGERS).execute_if(dialect="postgresql"),
+)
+event.listen(
+    Notification.__table__,
+    "after_drop",
+    DDL("DROP FUNCTION IF EXISTS notification_stats_apply()").execute_if(dialect="postgresql"),
+)
@@ -5,13 +5,10 @@ User model for authentication and authorization
 from sqlalchemy import Column, String, Boolean, DateTime, ForeignKey
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
-from passlib.context import CryptContext
+from app.core.security import pwd_context
 from app.models.base import Base, UUIDMixin, TenantScopedMixin, AuditMixin
 from app.models.role import user_roles
 
-# Password hashing context
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
-
 
 class User(Base, UUIDMixin, TenantScopedMixin, AuditMixin):
     """User model with authentication and RBAC"""
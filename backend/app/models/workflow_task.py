@@ -2,11 +2,14 @@
 Workflow Task model for compliance workflow management
 """
 
-from sqlalchemy import Column, String, Text, Date, Integer, ForeignKey, Index
+from sqlalchemy import Column, String, Text, Date, Integer, ForeignKey, Index, text
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.orm import relationship
 from app.models.base import Base, UUIDMixin, TenantScopedMixin, AuditMixin
 
+# Statuses of tasks still awaiting work; matches the idx_workflow_tasks_active_* predicates
+ACTIVE_TASK_STATUSES = ("Pending", "In Progress")
+
 
 class WorkflowTask(Base, UUIDMixin, TenantScopedMixin, AuditMixin):
     """Workflow Task - actionable tasks within compliance instances"""
@@ -82,6 +85,20 @@ class WorkflowTask(Base, UUIDMixin, TenantScopedMixin, AuditMixin):
             "idx_workflow_tasks_assigned_user_status", "assigned_to_user_id", "status", "due_date"
         ),
         Index("idx_workflow_tasks_instance_sequence", "compliance_instance_id", "sequence_order"),
+        # Partial index on active tasks for overdue / due-soon queries by tenant;
+        # keep both active predicates in sync with ACTIVE_TASK_STATUSES
+        Index(
+            "idx_workflow_tasks_active_tenant_due",
+            "tenant_id",
+            "due_date",
+            postgresql_where=text("status IN ('Pending', 'In Progress')"),
+        ),
+        # Partial index on active tasks for the cross-tenant task reminder scan
+        Index(
+            "idx_workflow_tasks_active_due",
+            "due_date",
+            postgresql_where=text("status IN ('Pending', 'In Progress')"),
+        ),
     )
 
     def __repr__(self):
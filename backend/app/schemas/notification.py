@@ -59,6 +59,9 @@ class NotificationListResponse(BaseModel):
     unread_count: int = Field(..., ge=0, description="Count of unread notifications")
     skip: int = Field(..., ge=0, description="Number of items skipped (offset)")
     limit: int = Field(..., ge=1, description="Maximum number of items returned")
+    next_cursor: Optional[str] = Field(
+        None, description="Pass as `before` to fetch the next page; null when there are no more items"
+    )
 
     class Config:
         json_schema_extra = {
@@ -68,6 +71,7 @@ class NotificationListResponse(BaseModel):
                 "unread_count": 5,
                 "skip": 0,
                 "limit": 50,
+                "next_cursor": "2025-01-15T10:00:00_123e4567-e89b-12d3-a456-426614174000",
             }
         }
 
@@ -16,13 +16,17 @@ from app.services.compliance_engine import (
     generate_instances_for_period,
     calculate_rag_status,
     recalculate_rag_for_tenant,
+    bulk_recalculate_rag,
     check_dependencies_met,
     get_india_fy_quarter,
     get_quarter_end_date,
 )
 from app.services.workflow_engine import (
+    WORKFLOW_INSTANCE_OPTIONS,
     create_workflow_tasks,
     resolve_role_to_user,
+    RoleCache,
+    resolve_role_assignments,
     get_tasks_for_instance,
     get_current_task,
     get_next_pending_task,
@@ -31,6 +35,7 @@ from app.services.workflow_engine import (
     reject_task,
     reassign_task,
     check_instance_completion,
+    get_task_status_counts,
     get_user_assigned_tasks,
     get_overdue_tasks,
     get_tasks_due_soon,
@@ -52,12 +57,25 @@ from app.services.evidence_service import (
     validate_file,
 )
 from app.services.notification_service import (
+    INSTANCE_NOTIFY_OPTIONS,
     NotificationType,
+    NOTIFICATION_TEMPLATES,
+    get_master_name,
+    get_entity_name,
+    NotificationBatcher,
+    batch_notifications,
     create_notification,
+    create_notifications_bulk,
+    insert_notifications,
     get_user_notifications,
+    get_user_notifications_rows,
+    encode_notification_cursor,
+    decode_notification_cursor,
     get_unread_count,
     mark_notification_read,
+    mark_notifications_read_bulk,
     mark_all_read,
+    mark_all_read_async,
     delete_notification,
     delete_old_notifications,
     notify_task_assigned,
@@ -100,12 +118,16 @@ __all__ = [
     "generate_instances_for_period",
     "calculate_rag_status",
     "recalculate_rag_for_tenant",
+    "bulk_recalculate_rag",
     "check_dependencies_met",
     "get_india_fy_quarter",
     "get_quarter_end_date",
     # Workflow engine
+    "WORKFLOW_INSTANCE_OPTIONS",
     "create_workflow_tasks",
     "resolve_role_to_user",
+    "RoleCache",
+    "resolve_role_assignments",
     "get_tasks_for_instance",
     "get_current_task",
     "get_next_pending_task",
@@ -114,6 +136,7 @@ __all__ = [
     "reject_task",
     "reassign_task",
     "check_instance_completion",
+    "get_task_status_counts",
     "get_user_assigned_tasks",
     "get_overdue_tasks",
     "get_tasks_due_soon",
@@ -133,12 +156,25 @@ __all__ = [
     "check_duplicate_evidence",
     "validate_file",
     # Notification service
+    "INSTANCE_NOTIFY_OPTIONS",
     "NotificationType",
+    "NOTIFICATION_TEMPLATES",
+    "get_master_name",
+    "get_entity_name",
+    "NotificationBatcher",
+    "batch_notifications",
     "create_notification",
+    "create_notifications_bulk",
+    "insert_notifications",
     "get_user_notifications",
+    "get_user_notifications_rows",
+    "encode_notification_cursor",
+    "decode_notification_cursor",
     "get_unread_count",
     "mark_notification_read",
+    "mark_notifications_read_bulk",
     "mark_all_read",
+    "mark_all_read_async",
     "delete_notification",
     "delete_old_notifications",
     "notify_task_assigned",
@@ -8,10 +8,10 @@ from calendar import monthrange
 from typing import Optional
 from uuid import UUID
 
-from sqlalchemy import or_
-from sqlalchemy.orm import Session
+from sqlalchemy import case, exists, or_, update
+from sqlalchemy.orm import Session, aliased
 
-from app.models import ComplianceMaster, ComplianceInstance, Entity, Evidence
+from app.models import ComplianceMaster, ComplianceInstance, Entity, Evidence, OVERDUE_EXEMPT_STATUSES
 
 
 # India Financial Year quarters (Apr-Mar)
@@ -202,7 +202,12 @@ def calculate_period_for_frequency(frequency: str, target_date: date) -> tuple[d
 
 
 def generate_instances_for_period(
-    db: Session, tenant_id: UUID, period_start: date, period_end: date, created_by: Optional[UUID] = None
+    db: Session,
+    tenant_id: UUID,
+    period_start: date,
+    period_end: date,
+    created_by: Optional[UUID] = None,
+    frequency: Optional[str] = None,
 ) -> list[ComplianceInstance]:
     """
     Generate compliance instances from active masters for all entities.
@@ -213,6 +218,7 @@ def generate_instances_for_period(
         period_start: Start of period to generate instances for
         period_end: End of period to generate instances for
         created_by: User UUID who triggered generation (for audit)
+        frequency: Only generate for masters with this frequency (e.g., "Quarterly")
 
     Returns:
         List of created ComplianceInstance objects
@@ -226,17 +232,16 @@ def generate_instances_for_period(
         return created_instances
 
     # Get all active compliance masters (system templates + tenant-specific)
-    masters = (
-        db.query(ComplianceMaster)
-        .filter(
-            ComplianceMaster.is_active == True,  # noqa: E712 (SQLAlchemy comparison)
-            or_(
-                ComplianceMaster.tenant_id.is_(None),  # System templates
-                ComplianceMaster.tenant_id == tenant_id,  # Tenant-specific
-            ),
-        )
-        .all()
+    masters_query = db.query(ComplianceMaster).filter(
+        ComplianceMaster.is_active == True,  # noqa: E712 (SQLAlchemy comparison)
+        or_(
+            ComplianceMaster.tenant_id.is_(None),  # System templates
+            ComplianceMaster.tenant_id == tenant_id,  # Tenant-specific
+        ),
     )
+    if frequency is not None:
+        masters_query = masters_query.filter(ComplianceMaster.frequency == frequency)
+    masters = masters_query.all()
 
     for master in masters:
         # Skip event-based - those are created manually
@@ -376,9 +381,43 @@ def calculate_rag_status_with_evidence(db: Session, instance: ComplianceInstance
     return base_status
 
 
-def recalculate_rag_for_tenant(db: Session, tenant_id: UUID, today: Optional[date] = None) -> int:
+def rag_status_case(today: date):
     """
-    Recalculate RAG status for all non-completed instances in a tenant.
+    SQL CASE expression computing RAG status for a compliance_instances row.
+
+    Mirrors calculate_rag_status_with_evidence for non-completed instances, so
+    RAG can be recalculated set-based in the database.
+
+    Args:
+        today: Reference date
+
+    Returns:
+        SQLAlchemy CASE expression yielding "Green", "Amber", or "Red"
+    """
+    blocking = aliased(ComplianceInstance)
+    blocker_open = exists().where(
+        blocking.id == ComplianceInstance.blocking_compliance_instance_id, blocking.status != "Completed"
+    )
+    evidence_rejected = exists().where(
+        Evidence.compliance_instance_id == ComplianceInstance.id, Evidence.approval_status == "Rejected"
+    )
+
+    return case(
+        (ComplianceInstance.due_date < today, "Red"),
+        (ComplianceInstance.status.in_(["Blocked", "Overdue"]), "Red"),
+        (blocker_open, "Red"),
+        (ComplianceInstance.due_date <= today + timedelta(days=7), "Amber"),
+        (ComplianceInstance.blocking_compliance_instance_id.isnot(None), "Amber"),
+        (evidence_rejected, "Amber"),
+        else_="Green",
+    )
+
+
+def bulk_recalculate_rag(db: Session, tenant_id: UUID, today: Optional[date] = None) -> int:
+    """
+    Recalculate RAG status for a tenant's non-completed instances in one UPDATE.
+
+    Only rows whose RAG status actually changes are written.
 
     Args:
         db: Database session
@@ -391,26 +430,35 @@ def recalculate_rag_for_tenant(db: Session, tenant_id: UUID, today: Optional[dat
     if today is None:
         today = date.today()
 
-    # Get all non-completed instances
-    instances = (
-        db.query(ComplianceInstance)
-        .filter(ComplianceInstance.tenant_id == tenant_id, ComplianceInstance.status != "Completed")
-        .all()
+    new_rag = rag_status_case(today)
+    result = db.execute(
+        update(ComplianceInstance)
+        .where(
+            ComplianceInstance.tenant_id == tenant_id,
+            ComplianceInstance.status != "Completed",
+            ComplianceInstance.rag_status.is_distinct_from(new_rag),
+        )
+        .values(rag_status=new_rag)
+        .execution_options(synchronize_session=False)
     )
+    db.commit()
 
-    updated_count = 0
+    return result.rowcount
 
-    for instance in instances:
-        new_rag = calculate_rag_status_with_evidence(db, instance, today)
 
-        if instance.rag_status != new_rag:
-            instance.rag_status = new_rag
-            updated_count += 1
+def recalculate_rag_for_tenant(db: Session, tenant_id: UUID, today: Optional[date] = None) -> int:
+    """
+    Recalculate RAG status for all non-completed instances in a tenant.
 
-    if updated_count > 0:
-        db.commit()
+    Args:
+        db: Database session
+        tenant_id: Tenant UUID
+        today: Reference date (defaults to today)
 
-    return updated_count
+    Returns:
+        Count of updated instances
+    """
+    return bulk_recalculate_rag(db, tenant_id, today)
 
 
 def check_dependencies_met(db: Session, instance: ComplianceInstance) -> tuple[bool, list[str]]:
@@ -562,7 +610,7 @@ def mark_instance_overdue(db: Session, tenant_id: UUID, today: Optional[date] =
         db.query(ComplianceInstance)
         .filter(
             ComplianceInstance.tenant_id == tenant_id,
-            ComplianceInstance.status.notin_(["Completed", "Overdue"]),
+            ComplianceInstance.status.notin_(OVERDUE_EXEMPT_STATUSES),
             ComplianceInstance.due_date < today,
         )
         .all()
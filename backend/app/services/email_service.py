@@ -16,15 +16,28 @@ from app.models import User, ComplianceInstance, WorkflowTask, Evidence
 
 logger = logging.getLogger(__name__)
 
+# SendGrid statuses worth retrying (rate limited / server-side failures)
+RETRYABLE_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+
+
+class TransientEmailError(Exception):
+    """Email delivery failed for a reason a retry may fix (rate limit, 5xx, network)."""
+
+
 # Template directory
 TEMPLATE_DIR = Path(__file__).parent.parent / "templates" / "email"
 
-# Initialize Jinja2 environment for templates
+# Initialize Jinja2 environment for templates. Templates ship with the code,
+# so auto_reload is off: cached templates are never re-stat'ed on lookup.
 jinja_env = Environment(
     loader=FileSystemLoader(str(TEMPLATE_DIR)),
     autoescape=select_autoescape(["html", "xml"]),
+    auto_reload=False,
 )
 
+# Every email template compiled once at import; rendering is a dict lookup
+EMAIL_TEMPLATES = {name: jinja_env.get_template(name) for name in jinja_env.list_templates(extensions=["html"])}
+
 
 class EmailService:
     """Service for sending emails via SendGrid."""
@@ -53,7 +66,7 @@ class EmailService:
             Rendered HTML string
         """
         try:
-            template = jinja_env.get_template(template_name)
+            template = EMAIL_TEMPLATES.get(template_name) or jinja_env.get_template(template_name)
             return template.render(**context)
         except Exception as e:
             logger.error(f"Failed to render template {template_name}: {e}")
@@ -78,7 +91,10 @@ class EmailService:
             to_name: Optional recipient name
 
         Returns:
-            True if email sent successfully, False otherwise
+            True if email sent successfully, False on a permanent failure
+
+        Raises:
+            TransientEmailError: Rate limited, SendGrid 5xx or network failure
         """
         if not self.enabled:
             logger.info(f"Email disabled. Would send to {to_email}: {subject}")
@@ -107,11 +123,22 @@ class EmailService:
             if response.status_code in (200, 201, 202):
                 logger.info(f"Email sent successfully to {to_email}: {subject}")
                 return True
+            elif response.status_code in RETRYABLE_STATUS_CODES:
+                raise TransientEmailError(f"SendGrid returned status {response.status_code}")
             else:
                 logger.error(f"SendGrid returned status {response.status_code}: {response.body}")
                 return False
 
+        except TransientEmailError:
+            raise
+
+        except (ConnectionError, TimeoutError) as e:
+            raise TransientEmailError(f"Could not reach SendGrid: {e}") from e
+
         except Exception as e:
+            # SendGrid raises HTTPError subclasses carrying the response status
+            if getattr(e, "status_code", None) in RETRYABLE_STATUS_CODES:
+                raise TransientEmailError(f"SendGrid returned status {e.status_code}") from e
             logger.error(f"Failed to send email to {to_email}: {e}")
             return False
 
@@ -13,6 +13,6 @@ NOTE: These integrations will be implemented in V2 (Phase 14).
 # V2 imports will be:
 # from .gstn_adapter import GSTNAdapter
 # from .mca_adapter import MCAAdapter
-# from .erp_adapter import ERPAdapter, SAPAdapter, OracleAdapter
+# from .erp_adapter import ERPAdapter, SAPAdapter, OracleAdapter, NetSuiteAdapter
 
 __all__: list[str] = []  # Empty for V1
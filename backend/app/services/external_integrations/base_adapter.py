@@ -4,29 +4,170 @@ Base Adapter for External API Integrations (V2)
 Abstract base class defining the interface for all external API adapters
 """
 
+import copy
+import functools
+import inspect
+import time
 from abc import ABC, abstractmethod
-from typing import Dict, Any, Optional
+from types import MappingProxyType
+from typing import AsyncIterator, Dict, Any, Mapping, Optional, Tuple
 from uuid import UUID
 
+import httpx
+import ijson
+
+from .entity_resolver import EntityIdentityResolver, entity_key, get_entity_resolver
+from .http_client import RETRY_BUDGET_EXTENSION, RetryBudget, get_http_client
+
+# Shared "called successfully, no data" results. Read-only, so one instance
+# serves every call; None stays reserved for "no result / not applicable".
+EMPTY: Mapping[str, Any] = MappingProxyType({})
+EMPTY_SEQUENCE: Tuple[Any, ...] = ()
+
+ENTITY_CACHE_TTL = 300  # seconds
+ENTITY_CACHE_MAX_ENTRIES = 5000
+
+
+def _copy_result(result: Any) -> Any:
+    """Return a caller-owned copy of a cached result (read-only sentinels are shared as-is)"""
+    if result is None or result is EMPTY or result is EMPTY_SEQUENCE:
+        return result
+    return copy.deepcopy(result)
+
+
+def cache_by_entity(ttl_seconds: float = ENTITY_CACHE_TTL):
+    """
+    Cache an adapter coroutine's result per (entity, args) on the adapter instance
+
+    The decorated method must take entity_id as its first argument. Arguments
+    are bound to the method signature, so positional and keyword calls share
+    an entry, and keys use entity_key() so UUID and str forms of the same ID
+    do too. Callers get a copy of the cached result, never the cached object.
+
+    Args:
+        ttl_seconds: How long a cached result stays valid
+    """
+
+    def decorator(func):
+        signature = inspect.signature(func)
+
+        @functools.wraps(func)
+        async def wrapper(self, *args, **kwargs):
+            bound = signature.bind(self, *args, **kwargs)
+            bound.apply_defaults()
+            _, entity_id, *rest = bound.arguments.values()
+
+            cache = self._entity_cache.setdefault(func.__name__, {})
+            key = (entity_key(entity_id), *rest)
+            now = time.monotonic()
+
+            cached = cache.get(key)
+            if cached is not None and cached[0] > now:
+                return _copy_result(cached[1])
+
+            result = await func(*bound.args, **bound.kwargs)
+            if len(cache) >= ENTITY_CACHE_MAX_ENTRIES:
+                cache.clear()
+            cache[key] = (now + ttl_seconds, _copy_result(result))
+            return result
+
+        return wrapper
+
+    return decorator
+
 
 class ExternalAPIAdapter(ABC):
     """
     Abstract base class for all external API integrations
 
     This ensures consistent interface across all adapters (GSTN, MCA, ERP)
+
+    Instance attributes are declared in __slots__ (one adapter is created per
+    tenant per sync, so no per-instance __dict__). Subclasses declare their own
+    __slots__, empty unless they add attributes.
     """
 
-    def __init__(self, api_key: Optional[str] = None, api_url: Optional[str] = None):
+    __slots__ = ("api_key", "api_url", "access_token", "retry_budget", "_resolver", "_entity_cache")
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        api_url: Optional[str] = None,
+        retry_budget: Optional[RetryBudget] = None,
+        resolver: Optional[EntityIdentityResolver] = None,
+    ):
         """
         Initialize adapter
 
         Args:
             api_key: API authentication key
             api_url: Base URL for API endpoints
+            retry_budget: Cap on retries for this adapter (default: 20 per minute)
+            resolver: Entity identifier lookup (default: shared process-wide resolver)
         """
         self.api_key = api_key
         self.api_url = api_url
         self.access_token: Optional[str] = None
+        self.retry_budget = retry_budget or RetryBudget()
+        self._resolver = resolver or get_entity_resolver()
+        # method name -> {(entity_key, *args): (expires_at, result)}, see cache_by_entity
+        self._entity_cache: Dict[str, Dict[Tuple[Any, ...], Tuple[float, Any]]] = {}
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """Shared AsyncClient (pooled connections + retry transport)"""
+        return get_http_client()
+
+    async def _request(self, method: str, url: str, **kwargs) -> httpx.Response:
+        """
+        Send a request through the shared client, charged to this adapter's retry budget
+
+        Args:
+            method: HTTP method
+            url: Request URL
+            **kwargs: Passed through to httpx.AsyncClient.request
+
+        Returns:
+            httpx.Response: Final response after any retries
+        """
+        extensions = {**kwargs.pop("extensions", {}), RETRY_BUDGET_EXTENSION: self.retry_budget}
+        return await self.client.request(method, url, extensions=extensions, **kwargs)
+
+    async def _stream_json_items(self, method: str, url: str, prefix: str, **kwargs) -> AsyncIterator[Any]:
+        """
+        Stream a large JSON response and yield the items under `prefix` one at a time
+
+        Memory use is bounded by one item rather than the whole response body.
+        Non-integer numbers are yielded as Decimal so amounts stay exact;
+        consumers that need floats (e.g. pl_kernels) convert them.
+
+        Args:
+            method: HTTP method
+            url: Request URL
+            prefix: ijson prefix of the items to yield (e.g., "invoices.item")
+            **kwargs: Passed through to httpx.AsyncClient.stream
+
+        Yields:
+            Parsed JSON items (dicts for object arrays)
+
+        Raises:
+            httpx.HTTPStatusError: If the final response is an error
+        """
+        extensions = {**kwargs.pop("extensions", {}), RETRY_BUDGET_EXTENSION: self.retry_budget}
+        async with self.client.stream(method, url, extensions=extensions, **kwargs) as response:
+            response.raise_for_status()
+
+            items = ijson.sendable_list()
+            parser = ijson.items_coro(items, prefix)
+            async for chunk in response.aiter_bytes():
+                parser.send(chunk)
+                for item in items:
+                    yield item
+                del items[:]
+
+            parser.close()
+            for item in items:
+                yield item
 
     @abstractmethod
     async def authenticate(self) -> bool:
@@ -64,7 +205,7 @@ class ExternalAPIAdapter(ABC):
         pass
 
     @abstractmethod
-    async def sync_master_data(self, entity_id: UUID) -> Dict[str, Any]:
+    async def sync_master_data(self, entity_id: UUID) -> Mapping[str, Any]:
         """
         Sync entity master data from external system
 
@@ -72,7 +213,7 @@ class ExternalAPIAdapter(ABC):
             entity_id: Entity UUID
 
         Returns:
-            dict: Synced master data
+            Mapping: Synced master data (EMPTY if the system has none)
         """
         pass
 
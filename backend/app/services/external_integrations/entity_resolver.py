@@ -0,0 +1,157 @@
+"""
+Entity Identity Resolver for External API Integrations (V2)
+
+Adapters need an entity's external identifiers (CIN, GSTIN, ERP company code)
+to call GSTN/MCA/ERP APIs. EntityIdentityResolver loads them once per entity
+and keeps them in a short-TTL in-process cache, so repeated adapter calls
+during one sync window share a single database read.
+"""
+
+import asyncio
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, Optional, Tuple, Union
+from uuid import UUID
+
+from app.core.database import SessionLocal
+from app.models import Entity
+
+RESOLVER_CACHE_TTL = 300  # seconds
+RESOLVER_CACHE_MAX_ENTRIES = 5000
+
+
+def entity_key(entity_id: Union[UUID, str]) -> int:
+    """
+    Normalize an entity ID to its 128-bit integer form for use as a cache key
+
+    Args:
+        entity_id: Entity UUID (or its string form)
+
+    Returns:
+        int: UUID as an int (hashes as a plain int, no UUID object needed)
+    """
+    return entity_id.int if isinstance(entity_id, UUID) else UUID(entity_id).int
+
+
+@dataclass(frozen=True, slots=True)
+class EntityIdentity:
+    """External identifiers for an entity"""
+
+    entity_id: UUID
+    tenant_id: UUID
+    cin: Optional[str] = None
+    gstin: Optional[str] = None
+    pan: Optional[str] = None
+    sap_company_code: Optional[str] = None
+
+
+def load_entity_identity(entity_id: UUID) -> Optional[EntityIdentity]:
+    """
+    Load an entity's external identifiers from the database
+
+    Args:
+        entity_id: Entity UUID
+
+    Returns:
+        EntityIdentity | None: Identifiers, or None if the entity does not exist
+    """
+    db = SessionLocal()
+    try:
+        row = (
+            db.query(Entity.id, Entity.tenant_id, Entity.cin, Entity.gstin, Entity.pan, Entity.meta_data)
+            .filter(Entity.id == entity_id)
+            .first()
+        )
+    finally:
+        db.close()
+
+    if row is None:
+        return None
+
+    meta_data = row.meta_data or {}
+    return EntityIdentity(
+        entity_id=row.id,
+        tenant_id=row.tenant_id,
+        cin=row.cin,
+        gstin=row.gstin,
+        pan=row.pan,
+        sap_company_code=meta_data.get("sap_company_code"),
+    )
+
+
+class EntityIdentityResolver:
+    """
+    Cached entity_id -> EntityIdentity lookup shared by adapters
+
+    Lookups are single-flight: concurrent resolves of the same entity wait on
+    one database read instead of each issuing their own. The blocking load
+    runs in a worker thread so the event loop keeps serving other adapters.
+    """
+
+    def __init__(
+        self,
+        loader: Callable[[UUID], Optional[EntityIdentity]] = load_entity_identity,
+        ttl_seconds: float = RESOLVER_CACHE_TTL,
+        max_entries: int = RESOLVER_CACHE_MAX_ENTRIES,
+    ):
+        """
+        Initialize resolver
+
+        Args:
+            loader: Blocking function that loads identifiers for one entity
+            ttl_seconds: How long a resolved identity stays cached
+            max_entries: Cache size before it is cleared
+        """
+        self._loader = loader
+        self._ttl_seconds = ttl_seconds
+        self._max_entries = max_entries
+        self._cache: Dict[int, Tuple[float, Optional[EntityIdentity]]] = {}
+        self._locks: Dict[int, asyncio.Lock] = {}
+
+    async def resolve(self, entity_id: Union[UUID, str]) -> Optional[EntityIdentity]:
+        """
+        Resolve an entity's external identifiers
+
+        Args:
+            entity_id: Entity UUID (or its string form)
+
+        Returns:
+            EntityIdentity | None: Identifiers, or None if the entity does not exist
+        """
+        key = entity_key(entity_id)
+
+        cached = self._cache.get(key)
+        if cached is not None and cached[0] > time.monotonic():
+            return cached[1]
+
+        lock = self._locks.setdefault(key, asyncio.Lock())
+        async with lock:
+            # Another coroutine may have loaded it while we waited
+            cached = self._cache.get(key)
+            if cached is not None and cached[0] > time.monotonic():
+                return cached[1]
+
+            uuid = entity_id if isinstance(entity_id, UUID) else UUID(int=key)
+            identity = await asyncio.to_thread(self._loader, uuid)
+
+            if len(self._cache) >= self._max_entries:
+                self._cache.clear()
+            self._cache[key] = (time.monotonic() + self._ttl_seconds, identity)
+
+        self._locks.pop(key, None)
+        return identity
+
+    def invalidate(self, entity_id: Union[UUID, str]) -> None:
+        """Drop a cached identity (e.g., after the entity's identifiers change)"""
+        self._cache.pop(entity_key(entity_id), None)
+
+
+_default_resolver: Optional[EntityIdentityResolver] = None
+
+
+def get_entity_resolver() -> EntityIdentityResolver:
+    """Get the process-wide resolver used when an adapter is not given one"""
+    global _default_resolver
+    if _default_resolver is None:
+        _default_resolver = EntityIdentityResolver()
+    return _default_resolver
@@ -3,23 +3,165 @@ ERP Adapters (V2)
 
 Integrations with ERP systems for FP&A data import
 Supports: SAP S/4HANA, Oracle Financials, NetSuite
+
+A single ERPAdapter is configured per vendor; vendor-specific details
+(endpoints, auth scheme, P&L parsing) live in the _VENDOR_STRATEGY table.
+SAPAdapter, OracleAdapter and NetSuiteAdapter are thin subclasses that only
+set the default vendor.
 """
 
-from typing import Dict, Any, Optional
+from dataclasses import dataclass
+from typing import Any, Callable, ClassVar, Dict, List, Literal, Mapping, Optional, Sequence
 from uuid import UUID
-from .base_adapter import ExternalAPIAdapter
+
+import httpx
+
+from .base_adapter import EMPTY, ExternalAPIAdapter, cache_by_entity
+from .pl_kernels import compute_pl_ratios
+
+ERPVendor = Literal["sap", "oracle", "netsuite"]
+
+
+def _passthrough(payload: Dict[str, Any]) -> Dict[str, Any]:
+    """Default P&L parser - vendor payload is already in our shape"""
+    return payload
+
+
+@dataclass(frozen=True)
+class VendorStrategy:
+    """
+    Per-vendor ERP integration details
+
+    Attributes:
+        name: Display name of the ERP system
+        auth_scheme: Authentication mechanism used by the vendor API
+        auth_path: Token/auth endpoint (relative to adapter api_url)
+        pl_path: P&L statement endpoint (relative to adapter api_url)
+        parse_pl: Converts the vendor P&L payload to our P&L dict shape
+    """
+
+    name: str
+    auth_scheme: str
+    auth_path: str
+    pl_path: str
+    parse_pl: Callable[[Dict[str, Any]], Dict[str, Any]] = _passthrough
+
+    async def authenticate(self, client: httpx.AsyncClient, adapter: "ERPAdapter") -> bool:
+        """
+        Authenticate with the ERP system
+
+        NOTE: V1 stub - returns False
+        """
+        # V1: No auth
+        return False
+
+        # V2 implementation (OAuth 2.0 shown; Basic/TBA vendors override headers):
+        # response = await adapter._request("POST",
+        #     f"{adapter.api_url}{self.auth_path}",
+        #     data={
+        #         "grant_type": "client_credentials",
+        #         "client_id": settings.SAP_CLIENT_ID,
+        #         "client_secret": settings.SAP_CLIENT_SECRET
+        #     }
+        # )
+        # adapter.access_token = response.json()["access_token"]
+        # return True
+
+    async def fetch_pl(
+        self, client: httpx.AsyncClient, adapter: "ERPAdapter", entity_id: UUID, period: str
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Fetch P&L statement from the ERP system
+
+        NOTE: V1 stub - returns None
+        """
+        # V1: Return None
+        return None
+
+        # V2 implementation:
+        # identity = await adapter._resolver.resolve(entity_id)
+        # company_code = identity.sap_company_code
+        #
+        # response = await adapter._request("GET",
+        #     f"{adapter.api_url}{self.pl_path}",
+        #     params={
+        #         "CompanyCode": company_code,
+        #         "FiscalPeriod": period
+        #     },
+        #     headers={"Authorization": f"Bearer {adapter.access_token}"}
+        # )
+        #
+        # return self.parse_pl(response.json())
+
+
+_VENDOR_STRATEGY: Dict[str, VendorStrategy] = {
+    # SAP S/4HANA - OData API, OAuth 2.0
+    "sap": VendorStrategy(
+        name="SAP S/4HANA",
+        auth_scheme="oauth2",
+        auth_path="/oauth/token",
+        pl_path="/odata/sap/ProfitAndLoss",
+    ),
+    # Oracle Financials - Oracle Cloud REST API, Basic Auth
+    "oracle": VendorStrategy(
+        name="Oracle Financials",
+        auth_scheme="basic",
+        auth_path="/fscmRestApi/resources/latest",
+        pl_path="/fscmRestApi/resources/latest/generalLedgerBalances",
+    ),
+    # NetSuite - SuiteTalk API, Token-Based Auth
+    "netsuite": VendorStrategy(
+        name="NetSuite",
+        auth_scheme="tba",
+        auth_path="/services/rest/auth/oauth1",
+        pl_path="/services/rest/record/v1/incomeStatement",
+    ),
+}
 
 
 class ERPAdapter(ExternalAPIAdapter):
     """
-    Base ERP adapter
+    ERP adapter for SAP, Oracle and NetSuite
 
-    Provides common interface for all ERP systems
+    Vendor behaviour is selected from _VENDOR_STRATEGY by the `vendor`
+    argument, defaulting to the class-level DEFAULT_VENDOR.
+
+    NOTE: V1 stub - all methods return None/empty
     """
 
+    __slots__ = ("vendor", "_vendor")
+
+    DEFAULT_VENDOR: ClassVar[ERPVendor] = "sap"
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        api_url: Optional[str] = None,
+        vendor: Optional[ERPVendor] = None,
+        **kwargs: Any,
+    ):
+        """
+        Initialize ERP adapter
+
+        Args:
+            api_key: API authentication key
+            api_url: Base URL for API endpoints
+            vendor: ERP system ("sap", "oracle" or "netsuite"); defaults to DEFAULT_VENDOR
+
+        Raises:
+            ValueError: If vendor is not supported
+        """
+        super().__init__(api_key=api_key, api_url=api_url, **kwargs)
+        if vendor is None:
+            vendor = self.DEFAULT_VENDOR
+        if vendor not in _VENDOR_STRATEGY:
+            raise ValueError(f"Unsupported ERP vendor: {vendor}")
+        self.vendor = vendor
+        self._vendor = _VENDOR_STRATEGY[vendor]
+
     async def authenticate(self) -> bool:
         """Authenticate with ERP system"""
-        return False
+        return await self._vendor.authenticate(self.client, self)
 
     async def fetch_filing_status(
         self, compliance_code: str, period: str
@@ -27,10 +169,12 @@ class ERPAdapter(ExternalAPIAdapter):
         """Not applicable for ERP systems"""
         return None
 
-    async def sync_master_data(self, entity_id: UUID) -> Dict[str, Any]:
+    @cache_by_entity()
+    async def sync_master_data(self, entity_id: UUID) -> Mapping[str, Any]:
         """Sync entity master data"""
-        return {}
+        return EMPTY
 
+    @cache_by_entity()
     async def fetch_pl_statement(self, entity_id: UUID, period: str) -> Optional[Dict[str, Any]]:
         """
         Fetch P&L statement for FP&A compliance
@@ -44,7 +188,23 @@ class ERPAdapter(ExternalAPIAdapter):
 
         NOTE: V1 stub - returns None
         """
-        return None
+        return await self._vendor.fetch_pl(self.client, self, entity_id, period)
+
+    async def fetch_pl_ratios(self, entity_id: UUID, periods: Sequence[str]) -> List[Dict[str, Any]]:
+        """
+        Fetch P&L statements for several periods and compute ratios in one batch
+
+        Args:
+            entity_id: Entity UUID
+            periods: Financial periods, oldest first
+
+        Returns:
+            list: Ratio dicts (see pl_kernels.compute_pl_ratios) for periods with data
+        """
+        # Periods without a statement stay in the batch as None so the YoY
+        # comparative is still the statement 12 periods back
+        statements = [await self.fetch_pl_statement(entity_id, period) for period in periods]
+        return compute_pl_ratios(statements)
 
     async def fetch_balance_sheet(self, entity_id: UUID, period: str) -> Optional[Dict[str, Any]]:
         """
@@ -63,83 +223,24 @@ class ERPAdapter(ExternalAPIAdapter):
 
 
 class SAPAdapter(ERPAdapter):
-    """
-    SAP S/4HANA adapter using OData API
-
-    NOTE: V1 stub - all methods return None/empty
-          V2 implementation will use SAP OData API
-    """
+    """SAP S/4HANA adapter"""
 
-    async def authenticate(self) -> bool:
-        """Authenticate with SAP using OAuth 2.0"""
-        # V1: No auth
-        return False
+    __slots__ = ()
 
-        # V2 implementation:
-        # response = httpx.post(
-        #     f"{self.api_url}/oauth/token",
-        #     data={
-        #         "grant_type": "client_credentials",
-        #         "client_id": settings.SAP_CLIENT_ID,
-        #         "client_secret": settings.SAP_CLIENT_SECRET
-        #     }
-        # )
-        # self.access_token = response.json()["access_token"]
-        # return True
-
-    async def fetch_pl_statement(self, entity_id: UUID, period: str) -> Optional[Dict[str, Any]]:
-        """Fetch P&L from SAP"""
-        # V1: Return None
-        return None
-
-        # V2 implementation:
-        # company_code = entity.sap_company_code
-        #
-        # response = httpx.get(
-        #     f"{self.api_url}/odata/sap/ProfitAndLoss",
-        #     params={
-        #         "CompanyCode": company_code,
-        #         "FiscalPeriod": period
-        #     },
-        #     headers={"Authorization": f"Bearer {self.access_token}"}
-        # )
-        #
-        # return response.json()
+    DEFAULT_VENDOR = "sap"
 
 
 class OracleAdapter(ERPAdapter):
-    """
-    Oracle Financials adapter using REST API
+    """Oracle Financials adapter"""
 
-    NOTE: V1 stub - all methods return None/empty
-          V2 implementation will use Oracle Cloud REST API
-    """
+    __slots__ = ()
 
-    async def authenticate(self) -> bool:
-        """Authenticate with Oracle using Basic Auth"""
-        # V1: No auth
-        return False
-
-    async def fetch_pl_statement(self, entity_id: UUID, period: str) -> Optional[Dict[str, Any]]:
-        """Fetch P&L from Oracle Financials"""
-        # V1: Return None
-        return None
+    DEFAULT_VENDOR = "oracle"
 
 
 class NetSuiteAdapter(ERPAdapter):
-    """
-    NetSuite adapter using SuiteTalk SOAP API
+    """NetSuite adapter"""
 
-    NOTE: V1 stub - all methods return None/empty
-          V2 implementation will use NetSuite SuiteTalk API
-    """
+    __slots__ = ()
 
-    async def authenticate(self) -> bool:
-        """Authenticate with NetSuite using Token-Based Auth"""
-        # V1: No auth
-        return False
-
-    async def fetch_pl_statement(self, entity_id: UUID, period: str) -> Optional[Dict[str, Any]]:
-        """Fetch P&L from NetSuite"""
-        # V1: Return None
-        return None
+    DEFAULT_VENDOR = "netsuite"
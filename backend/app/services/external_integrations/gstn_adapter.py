@@ -4,9 +4,9 @@ GSTN (GST Network Portal) Adapter (V2)
 Integration with GSTN API to auto-fetch GST filing status
 """
 
-from typing import Dict, Any, Optional
+from typing import AsyncIterator, Dict, Any, Mapping, Optional
 from uuid import UUID
-from .base_adapter import ExternalAPIAdapter
+from .base_adapter import EMPTY, ExternalAPIAdapter
 
 
 class GSTNAdapter(ExternalAPIAdapter):
@@ -16,10 +16,13 @@ class GSTNAdapter(ExternalAPIAdapter):
     Features:
     - Auto-fetch GSTR-3B filing status
     - Auto-fetch GSTR-1 filing status
+    - Stream GSTR-1 invoice lists (bounded memory for large returns)
     - Fetch cash ledger balance
     - Fetch ITC (Input Tax Credit) balance
     """
 
+    __slots__ = ()
+
     async def authenticate(self) -> bool:
         """
         Authenticate with GSTN API using OAuth 2.0
@@ -34,7 +37,7 @@ class GSTNAdapter(ExternalAPIAdapter):
         return False
 
         # V2 implementation:
-        # response = httpx.post(
+        # response = await self._request("POST",
         #     f"{self.api_url}/auth/oauth/token",
         #     data={
         #         "grant_type": "client_credentials",
@@ -73,7 +76,7 @@ class GSTNAdapter(ExternalAPIAdapter):
         # V2 implementation:
         # gstin = entity.gstin  # Get from entity
         #
-        # response = httpx.get(
+        # response = await self._request("GET",
         #     f"{self.api_url}/returns/{compliance_code.lower()}/status",
         #     params={"gstin": gstin, "ret_period": period},
         #     headers={"Authorization": f"Bearer {self.access_token}"}
@@ -97,6 +100,37 @@ class GSTNAdapter(ExternalAPIAdapter):
         # V1: Return None
         return None
 
+    async def iter_gstr1_invoices(self, gstin: str, period: str) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Stream GSTR-1 B2B invoices one at a time
+
+        GSTR-1 payloads can run to many MB; invoices are parsed incrementally
+        from the response body instead of loading the whole document, so
+        consumers should write each invoice as it arrives.
+
+        Args:
+            gstin: GST Identification Number
+            period: Filing period (MMYYYY)
+
+        Yields:
+            dict: One invoice at a time
+
+        NOTE: V1 stub - yields nothing
+        """
+        # V1: No invoices (manual entry)
+        return
+        yield
+
+        # V2 implementation:
+        # async for invoice in self._stream_json_items(
+        #     "GET",
+        #     f"{self.api_url}/returns/gstr1",
+        #     "b2b.item.inv.item",
+        #     params={"gstin": gstin, "ret_period": period, "action": "B2B"},
+        #     headers={"Authorization": f"Bearer {self.access_token}"},
+        # ):
+        #     yield invoice
+
     async def fetch_cash_ledger_balance(self, gstin: str) -> Optional[float]:
         """
         Fetch current cash ledger balance
@@ -112,7 +146,7 @@ class GSTNAdapter(ExternalAPIAdapter):
         # V1: Return None
         return None
 
-    async def sync_master_data(self, entity_id: UUID) -> Dict[str, Any]:
+    async def sync_master_data(self, entity_id: UUID) -> Mapping[str, Any]:
         """
         Sync GST master data (not applicable for GSTN)
 
@@ -120,8 +154,8 @@ class GSTNAdapter(ExternalAPIAdapter):
             entity_id: Entity UUID
 
         Returns:
-            dict: Empty dict
+            Mapping: EMPTY
 
         NOTE: GSTN doesn't have master data sync
         """
-        return {}
+        return EMPTY
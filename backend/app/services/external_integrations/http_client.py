@@ -0,0 +1,195 @@
+"""
+Shared HTTP client for External API Integrations (V2)
+
+All adapters share a single httpx.AsyncClient so connections to GSTN/MCA/ERP
+endpoints are pooled across calls. The client is built on RetryTransport,
+which retries transient failures (429/5xx) of idempotent requests with
+exponential backoff + jitter and honors the Retry-After header.
+"""
+
+import asyncio
+import random
+import time
+from email.utils import parsedate_to_datetime
+from typing import Optional
+
+import httpx
+
+# Status codes worth retrying (rate limited or transient server errors)
+RETRYABLE_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+
+# Methods safe to resend after a 5xx (the first attempt may have been applied)
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "PUT", "DELETE", "OPTIONS"})
+
+# Statuses where the server asks a non-idempotent request to come back later
+# (only retried when it also sends Retry-After)
+RETRY_AFTER_STATUS_CODES = frozenset({429, 503})
+
+MAX_RETRIES = 4
+MAX_RETRY_DELAY = 30.0  # seconds
+
+# Request extension key used to pass an adapter's RetryBudget to the transport
+RETRY_BUDGET_EXTENSION = "retry_budget"
+
+
+class RetryBudget:
+    """
+    Per-adapter cap on retries within a rolling time window
+
+    Stops a persistently failing provider from tying up the event loop with
+    back-to-back retry sleeps. Once the budget is spent, failing responses are
+    returned to the caller as-is until the window rolls over.
+    """
+
+    def __init__(self, max_retries: int = 20, window_seconds: float = 60.0):
+        """
+        Initialize retry budget
+
+        Args:
+            max_retries: Retries allowed per window
+            window_seconds: Length of the rolling window in seconds
+        """
+        self.max_retries = max_retries
+        self.window_seconds = window_seconds
+        self._window_start = time.monotonic()
+        self._spent = 0
+
+    def try_acquire(self) -> bool:
+        """
+        Spend one retry from the budget
+
+        Returns:
+            bool: True if a retry is allowed, False if the budget is exhausted
+        """
+        now = time.monotonic()
+        if now - self._window_start >= self.window_seconds:
+            self._window_start = now
+            self._spent = 0
+
+        if self._spent >= self.max_retries:
+            return False
+
+        self._spent += 1
+        return True
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Parse a Retry-After header value
+
+    Args:
+        value: Header value, either delay-seconds or an HTTP-date
+
+    Returns:
+        float | None: Seconds to wait, or None if missing/unparseable
+    """
+    if not value:
+        return None
+
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+
+    return max(retry_at.timestamp() - time.time(), 0.0)
+
+
+def compute_retry_delay(attempt: int, retry_after: Optional[float] = None) -> float:
+    """
+    Compute how long to wait before the next attempt
+
+    Args:
+        attempt: Zero-based retry attempt number
+        retry_after: Server-provided delay from Retry-After (takes precedence)
+
+    Returns:
+        float: Delay in seconds, capped at MAX_RETRY_DELAY
+    """
+    if retry_after is not None:
+        return min(retry_after, MAX_RETRY_DELAY)
+    return min(2.0**attempt + random.random() * 0.5, MAX_RETRY_DELAY)
+
+
+def is_retryable(request: httpx.Request, response: httpx.Response) -> bool:
+    """
+    Decide whether a failed response may be retried
+
+    Idempotent methods are retried on any RETRYABLE_STATUS_CODES. Other
+    methods (e.g. POST) are only retried on 429/503 with a Retry-After header,
+    where the server signals it did not process the request.
+
+    Args:
+        request: Request that was sent
+        response: Response received
+
+    Returns:
+        bool: True if the request can safely be sent again
+    """
+    if response.status_code not in RETRYABLE_STATUS_CODES:
+        return False
+    if request.method in IDEMPOTENT_METHODS:
+        return True
+    return response.status_code in RETRY_AFTER_STATUS_CODES and "Retry-After" in response.headers
+
+
+class RetryTransport(httpx.AsyncHTTPTransport):
+    """
+    Async transport that retries 429/5xx responses with backoff + jitter
+
+    Only responses accepted by is_retryable are retried, so a POST that hit a
+    500 is never sent twice. Waits use asyncio.sleep so other coroutines keep running while a request
+    is backing off. Retries are charged against the RetryBudget passed in the
+    request extensions (if any).
+    """
+
+    def __init__(self, *args, max_retries: int = MAX_RETRIES, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.max_retries = max_retries
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        budget: Optional[RetryBudget] = request.extensions.get(RETRY_BUDGET_EXTENSION)
+        attempt = 0
+
+        while True:
+            response = await super().handle_async_request(request)
+
+            if not is_retryable(request, response) or attempt >= self.max_retries:
+                return response
+            if budget is not None and not budget.try_acquire():
+                return response
+
+            retry_after = parse_retry_after(response.headers.get("Retry-After"))
+            await response.aclose()
+            await asyncio.sleep(compute_retry_delay(attempt, retry_after))
+            attempt += 1
+
+
+_http_client: Optional[httpx.AsyncClient] = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """
+    Get the shared AsyncClient used by all external adapters
+
+    Returns:
+        httpx.AsyncClient: Process-wide client with RetryTransport
+    """
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = httpx.AsyncClient(
+            transport=RetryTransport(),
+            timeout=httpx.Timeout(30.0, connect=10.0),
+        )
+    return _http_client
+
+
+async def close_http_client() -> None:
+    """Close the shared AsyncClient (call on application shutdown)"""
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
@@ -4,9 +4,9 @@ MCA (Ministry of Corporate Affairs) Adapter (V2)
 Integration with MCA V3 API for company master data
 """
 
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Mapping, Optional, Sequence
 from uuid import UUID
-from .base_adapter import ExternalAPIAdapter
+from .base_adapter import EMPTY, EMPTY_SEQUENCE, ExternalAPIAdapter, cache_by_entity
 
 
 class MCAAdapter(ExternalAPIAdapter):
@@ -20,6 +20,8 @@ class MCAAdapter(ExternalAPIAdapter):
     - Track authorized capital changes
     """
 
+    __slots__ = ()
+
     async def authenticate(self) -> bool:
         """
         Authenticate with MCA V3 API
@@ -36,7 +38,7 @@ class MCAAdapter(ExternalAPIAdapter):
         # V2 implementation:
         # # MCA uses API key authentication
         # headers = {"X-API-Key": self.api_key}
-        # response = httpx.get(f"{self.api_url}/auth/validate", headers=headers)
+        # response = await self._request("GET", f"{self.api_url}/auth/validate", headers=headers)
         # return response.status_code == 200
 
     async def fetch_filing_status(
@@ -49,7 +51,8 @@ class MCAAdapter(ExternalAPIAdapter):
         """
         return None
 
-    async def sync_master_data(self, entity_id: UUID) -> Dict[str, Any]:
+    @cache_by_entity()
+    async def sync_master_data(self, entity_id: UUID) -> Mapping[str, Any]:
         """
         Sync company master data from MCA
 
@@ -66,16 +69,17 @@ class MCAAdapter(ExternalAPIAdapter):
                     'upcoming_filings': [...]
                 }
 
-        NOTE: V1 stub - returns empty dict
+        NOTE: V1 stub - returns EMPTY
               V2 implementation will call MCA API
         """
         # V1: Return empty
-        return {}
+        return EMPTY
 
         # V2 implementation:
-        # cin = entity.cin  # Get from entity
+        # identity = await self._resolver.resolve(entity_id)
+        # cin = identity.cin
         #
-        # response = httpx.get(
+        # response = await self._request("GET",
         #     f"{self.api_url}/company/{cin}",
         #     headers={"X-API-Key": self.api_key}
         # )
@@ -105,7 +109,7 @@ class MCAAdapter(ExternalAPIAdapter):
         # V1: Return None
         return None
 
-    async def fetch_directors(self, cin: str) -> List[Dict[str, Any]]:
+    async def fetch_directors(self, cin: str) -> Sequence[Dict[str, Any]]:
         """
         Fetch director list
 
@@ -115,12 +119,12 @@ class MCAAdapter(ExternalAPIAdapter):
         Returns:
             list: Director details
 
-        NOTE: V1 stub - returns empty list
+        NOTE: V1 stub - returns EMPTY_SEQUENCE
         """
         # V1: Return empty
-        return []
+        return EMPTY_SEQUENCE
 
-    async def get_upcoming_filings(self, cin: str) -> List[Dict[str, Any]]:
+    async def get_upcoming_filings(self, cin: str) -> Sequence[Dict[str, Any]]:
         """
         Get upcoming MCA filing deadlines
 
@@ -130,7 +134,7 @@ class MCAAdapter(ExternalAPIAdapter):
         Returns:
             list: Upcoming filings (AOC-4, MGT-7, etc.)
 
-        NOTE: V1 stub - returns empty list
+        NOTE: V1 stub - returns EMPTY_SEQUENCE
         """
         # V1: Return empty
-        return []
+        return EMPTY_SEQUENCE
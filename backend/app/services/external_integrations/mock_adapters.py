@@ -4,9 +4,55 @@ Mock Adapters for Testing (V1 & V2)
 Provides mock implementations for testing without actual API calls
 """
 
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Mapping, Optional
 from uuid import UUID
-from .base_adapter import ExternalAPIAdapter
+from .base_adapter import EMPTY, ExternalAPIAdapter
+from .results import CompanyMaster, Director, FilingStatus, PLStatement, UpcomingFiling
+
+# Results are immutable, so the constant mock payloads are built (and converted
+# to dicts) once at import; adapters hand out cheap copies of those dicts to
+# keep the Dict/Mapping adapter contract without a per-call asdict()
+MOCK_FILING_STATUS = FilingStatus(
+    status="Filed",
+    filing_date="2024-04-18",
+    acknowledgment_number="AB2904240012345",
+    tax_paid=125000.00,
+    taxable_turnover=5000000.00,
+)
+
+MOCK_COMPANY_MASTER = CompanyMaster(
+    company_name="ABC Private Limited",
+    cin="U74999KA2020PTC123456",
+    authorized_capital=10000000,
+    directors=[
+        Director(name="John Doe", din="01234567"),
+        Director(name="Jane Smith", din="76543210"),
+    ],
+    upcoming_filings=[
+        UpcomingFiling(form="AOC-4", due_date="2024-09-30"),
+        UpcomingFiling(form="MGT-7", due_date="2024-10-30"),
+    ],
+)
+
+# Per-call period is filled in by MockSAPAdapter.fetch_pl_statement
+MOCK_PL_STATEMENT = PLStatement(
+    period="",
+    revenue=10000000,
+    cogs=6000000,
+    gross_profit=4000000,
+    operating_expenses=2500000,
+    operating_income=1500000,
+    net_income=1200000,
+)
+
+_FILING_STATUS_DICT = MOCK_FILING_STATUS.to_dict()
+_COMPANY_MASTER_DICT = MOCK_COMPANY_MASTER.to_dict()
+_PL_STATEMENT_DICT = MOCK_PL_STATEMENT.to_dict()
+
+
+def _copy_payload(payload: Dict[str, Any]) -> Dict[str, Any]:
+    """Copy a precomputed payload and its nested lists of dicts (one level deep)"""
+    return {key: [dict(item) for item in value] if isinstance(value, list) else value for key, value in payload.items()}
 
 
 class MockGSTNAdapter(ExternalAPIAdapter):
@@ -16,6 +62,8 @@ class MockGSTNAdapter(ExternalAPIAdapter):
     Returns realistic mock data without making actual API calls
     """
 
+    __slots__ = ()
+
     async def authenticate(self) -> bool:
         """Mock authentication - always succeeds"""
         return True
@@ -24,17 +72,11 @@ class MockGSTNAdapter(ExternalAPIAdapter):
         self, compliance_code: str, period: str
     ) -> Optional[Dict[str, Any]]:
         """Return mock filing status"""
-        return {
-            "status": "Filed",
-            "filing_date": "2024-04-18",
-            "acknowledgment_number": "AB2904240012345",
-            "tax_paid": 125000.00,
-            "taxable_turnover": 5000000.00,
-        }
-
-    async def sync_master_data(self, entity_id: UUID) -> Dict[str, Any]:
+        return dict(_FILING_STATUS_DICT)
+
+    async def sync_master_data(self, entity_id: UUID) -> Mapping[str, Any]:
         """GSTN doesn't have master data"""
-        return {}
+        return EMPTY
 
 
 class MockMCAAdapter(ExternalAPIAdapter):
@@ -44,6 +86,8 @@ class MockMCAAdapter(ExternalAPIAdapter):
     Returns realistic mock company data
     """
 
+    __slots__ = ()
+
     async def authenticate(self) -> bool:
         """Mock authentication - always succeeds"""
         return True
@@ -54,21 +98,9 @@ class MockMCAAdapter(ExternalAPIAdapter):
         """Not applicable for MCA"""
         return None
 
-    async def sync_master_data(self, entity_id: UUID) -> Dict[str, Any]:
+    async def sync_master_data(self, entity_id: UUID) -> Mapping[str, Any]:
         """Return mock company data"""
-        return {
-            "company_name": "ABC Private Limited",
-            "cin": "U74999KA2020PTC123456",
-            "directors": [
-                {"name": "John Doe", "din": "01234567"},
-                {"name": "Jane Smith", "din": "76543210"},
-            ],
-            "authorized_capital": 10000000,
-            "upcoming_filings": [
-                {"form": "AOC-4", "due_date": "2024-09-30"},
-                {"form": "MGT-7", "due_date": "2024-10-30"},
-            ],
-        }
+        return _copy_payload(_COMPANY_MASTER_DICT)
 
 
 class MockSAPAdapter(ExternalAPIAdapter):
@@ -78,6 +110,8 @@ class MockSAPAdapter(ExternalAPIAdapter):
     Returns realistic mock financial data
     """
 
+    __slots__ = ()
+
     async def authenticate(self) -> bool:
         """Mock authentication - always succeeds"""
         return True
@@ -88,18 +122,10 @@ class MockSAPAdapter(ExternalAPIAdapter):
         """Not applicable for SAP"""
         return None
 
-    async def sync_master_data(self, entity_id: UUID) -> Dict[str, Any]:
+    async def sync_master_data(self, entity_id: UUID) -> Mapping[str, Any]:
         """Return empty for SAP"""
-        return {}
+        return EMPTY
 
     async def fetch_pl_statement(self, entity_id: UUID, period: str) -> Optional[Dict[str, Any]]:
         """Return mock P&L data"""
-        return {
-            "period": period,
-            "revenue": 10000000,
-            "cogs": 6000000,
-            "gross_profit": 4000000,
-            "operating_expenses": 2500000,
-            "operating_income": 1500000,
-            "net_income": 1200000,
-        }
+        return {**_PL_STATEMENT_DICT, "period": period}
@@ -0,0 +1,129 @@
+"""
+P&L Ratio Kernels (V2)
+
+Batch computation of financial ratios over P&L statements returned by the ERP
+adapters. Statements are transposed into column lists (revenue, cogs, opex,
+net_income) and the ratios are computed in one pass per batch, instead of
+per-statement dict arithmetic in every consumer.
+"""
+
+from typing import Any, Dict, List, Optional, Sequence
+
+Column = Sequence[float]
+RatioColumn = List[Optional[float]]
+# Per-period values with None for periods that have no data
+GappedColumn = Sequence[Optional[float]]
+
+
+def _safe_ratio(numerator: float, denominator: float) -> Optional[float]:
+    """Return numerator / denominator, or None when the denominator is zero"""
+    if not denominator:
+        return None
+    return numerator / denominator
+
+
+def compute_ratios(revenue: Column, cogs: Column, opex: Column, net_income: Column) -> Dict[str, RatioColumn]:
+    """
+    Compute margin ratios for a batch of periods
+
+    Args:
+        revenue: Revenue per period
+        cogs: Cost of goods sold per period
+        opex: Operating expenses per period
+        net_income: Net income per period
+
+    Returns:
+        dict: Ratio columns aligned with the inputs
+            {
+                'gross_margin': [...],
+                'operating_margin': [...],
+                'net_margin': [...]
+            }
+            Entries are None where revenue is zero.
+
+    Raises:
+        ValueError: If the input columns differ in length
+    """
+    size = len(revenue)
+    if not (len(cogs) == len(opex) == len(net_income) == size):
+        raise ValueError("P&L columns must have the same length")
+
+    gross_margin: RatioColumn = [None] * size
+    operating_margin: RatioColumn = [None] * size
+    net_margin: RatioColumn = [None] * size
+
+    for i in range(size):
+        rev = revenue[i]
+        gross = rev - cogs[i]
+        gross_margin[i] = _safe_ratio(gross, rev)
+        operating_margin[i] = _safe_ratio(gross - opex[i], rev)
+        net_margin[i] = _safe_ratio(net_income[i], rev)
+
+    return {
+        "gross_margin": gross_margin,
+        "operating_margin": operating_margin,
+        "net_margin": net_margin,
+    }
+
+
+def compute_growth(values: GappedColumn, lag: int = 12) -> RatioColumn:
+    """
+    Compute growth against the value `lag` periods earlier (YoY for monthly data)
+
+    Args:
+        values: Values per period, oldest first; None for a missing period
+            (kept in place so `lag` stays a fixed number of periods)
+        lag: Number of periods to look back (12 = YoY for monthly periods)
+
+    Returns:
+        list: Growth per period; None where either value is missing or the
+            prior value is zero
+    """
+    growth: RatioColumn = [None] * len(values)
+    for i in range(lag, len(values)):
+        current, previous = values[i], values[i - lag]
+        if current is not None and previous:
+            growth[i] = (current - previous) / previous
+    return growth
+
+
+def compute_pl_ratios(statements: Sequence[Optional[Dict[str, Any]]], yoy_lag: int = 12) -> List[Dict[str, Any]]:
+    """
+    Compute ratios for a batch of P&L statements (as returned by fetch_pl_statement)
+
+    Args:
+        statements: P&L dicts for consecutive periods, oldest first; None for
+            a period without a statement, so the YoY comparative stays
+            `yoy_lag` periods back
+        yoy_lag: Periods between a statement and its prior-year comparative
+
+    Returns:
+        list: One dict per statement (missing periods are skipped) with
+            period, margin ratios and revenue_yoy
+    """
+    positions = [i for i, s in enumerate(statements) if s is not None]
+    present = [s for s in statements if s is not None]
+
+    revenue = [float(s.get("revenue") or 0) for s in present]
+    cogs = [float(s.get("cogs") or 0) for s in present]
+    opex = [float(s.get("operating_expenses") or 0) for s in present]
+    net_income = [float(s.get("net_income") or 0) for s in present]
+
+    ratios = compute_ratios(revenue, cogs, opex, net_income)
+
+    # Growth runs over the full period axis, with gaps left as None
+    revenue_by_period: List[Optional[float]] = [None] * len(statements)
+    for position, value in zip(positions, revenue):
+        revenue_by_period[position] = value
+    revenue_yoy = compute_growth(revenue_by_period, lag=yoy_lag)
+
+    return [
+        {
+            "period": statement.get("period"),
+            "gross_margin": ratios["gross_margin"][i],
+            "operating_margin": ratios["operating_margin"][i],
+            "net_margin": ratios["net_margin"][i],
+            "revenue_yoy": revenue_yoy[positions[i]],
+        }
+        for i, statement in enumerate(present)
+    ]
@@ -0,0 +1,76 @@
+"""
+Typed Result Shapes for External API Adapters (V2)
+
+Frozen, slotted dataclasses describing the data adapters return, instead of
+hand-built nested dicts. Instances are immutable, so constant results can be
+built once and shared between calls.
+
+Adapters keep the Dict/Mapping return types of the base adapter interface;
+constant results are converted with to_dict() once and handed out as copies.
+"""
+
+from dataclasses import asdict, dataclass, field
+from typing import Any, Dict, List, Optional
+
+
+@dataclass(frozen=True, slots=True)
+class FilingStatus:
+    """Filing status of a periodic return (e.g., GSTR-3B)"""
+
+    status: str
+    filing_date: str
+    acknowledgment_number: str
+    tax_paid: float
+    taxable_turnover: Optional[float] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the legacy dict shape"""
+        return asdict(self)
+
+
+@dataclass(frozen=True, slots=True)
+class PLStatement:
+    """Profit & loss statement for one financial period"""
+
+    period: str
+    revenue: float
+    cogs: float
+    gross_profit: float
+    operating_expenses: float
+    operating_income: float
+    net_income: float
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the legacy dict shape"""
+        return asdict(self)
+
+
+@dataclass(frozen=True, slots=True)
+class Director:
+    """Company director as listed with MCA"""
+
+    name: str
+    din: str
+
+
+@dataclass(frozen=True, slots=True)
+class UpcomingFiling:
+    """Upcoming MCA filing deadline"""
+
+    form: str
+    due_date: str
+
+
+@dataclass(frozen=True, slots=True)
+class CompanyMaster:
+    """Company master data from MCA"""
+
+    company_name: str
+    cin: str
+    authorized_capital: float
+    directors: List[Director] = field(default_factory=list)
+    upcoming_filings: List[UpcomingFiling] = field(default_factory=list)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the legacy dict shape (nested lists of dicts)"""
+        return asdict(self)
@@ -3,21 +3,47 @@ Notification Service
 Handles multi-channel notifications (in-app only for Phase 4, email/Slack deferred to Phase 5)
 """
 
-from datetime import datetime
-from typing import Optional
+import functools
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import date, datetime
+from typing import Any, Iterator, Mapping, NamedTuple, Optional
 from uuid import UUID
 
-from sqlalchemy.orm import Session
-
+from sqlalchemy import delete, func, insert, inspect, select, tuple_, update
+from sqlalchemy.orm import Session, selectinload
+
+from app.core.config import settings
+from app.core.redis import (
+    claim_once,
+    get_cached_name,
+    notification_list_cache,
+    release_claim,
+    set_cached_name,
+    unread_count_cache,
+)
 from app.models import (
     Notification,
     User,
+    UserNotificationStats,
     WorkflowTask,
     ComplianceInstance,
+    ComplianceMaster,
+    Entity,
     Evidence,
 )
 
 
+# Loader options for instances passed to the notify_* helpers. Instances loaded
+# with them carry their master and entity, whose names the helpers read directly
+# (falling back to the Redis name cache otherwise).
+INSTANCE_NOTIFY_OPTIONS = (
+    selectinload(ComplianceInstance.compliance_master),
+    selectinload(ComplianceInstance.entity),
+)
+
+
 # Notification types
 class NotificationType:
     TASK_ASSIGNED = "task_assigned"
@@ -35,6 +61,182 @@ class NotificationType:
     INSTANCE_COMPLETED = "instance_completed"
 
 
+_INSTANCE_LINK = "/compliance-instances/{instance_id}"
+
+
+class Template(NamedTuple):
+    """Title, message and link format strings for one notification type."""
+
+    title: str
+    message: str
+    link: str = _INSTANCE_LINK
+
+    def render(self, ctx: Mapping[str, Any]) -> tuple[str, str, str]:
+        """Fill all three format strings from ctx."""
+        return self.title.format_map(ctx), self.message.format_map(ctx), self.link.format_map(ctx)
+
+
+# Dispatch table: notification type -> templates, rendered by _render()/_emit()
+NOTIFICATION_TEMPLATES: dict[str, Template] = {
+    NotificationType.TASK_ASSIGNED: Template(
+        "New task assigned: {task_name}",
+        "You have been assigned the '{task_type}' task for {master_name}. Due: {due_date}",
+    ),
+    NotificationType.TASK_COMPLETED: Template(
+        "Task completed: {task_name}",
+        "The '{task_type}' task for {master_name} has been completed.",
+    ),
+    NotificationType.REMINDER_T3: Template(
+        "Reminder: {master_name} due in 3 days",
+        "{master_name} is due on {due_date}. Please ensure all tasks are completed.",
+    ),
+    NotificationType.REMINDER_DUE: Template(
+        "Due today: {master_name}",
+        "{master_name} is due TODAY ({due_date}). Please complete all pending tasks.",
+    ),
+    NotificationType.ESCALATION: Template(
+        "Escalation: {master_name} overdue by {days_overdue} days",
+        "{master_name} for {entity_name} was due on {due_date} "
+        "and is now {days_overdue} days overdue. Immediate attention required.",
+    ),
+    NotificationType.EVIDENCE_UPLOADED: Template(
+        "Evidence pending approval: {evidence_name}",
+        "New evidence '{evidence_name}' has been uploaded for {master_name} and requires your approval.",
+    ),
+    NotificationType.EVIDENCE_APPROVED: Template(
+        "Evidence approved: {evidence_name}",
+        "Your evidence '{evidence_name}' has been approved.",
+    ),
+    NotificationType.EVIDENCE_REJECTED: Template(
+        "Evidence rejected: {evidence_name}",
+        "Your evidence '{evidence_name}' has been rejected. "
+        "Reason: {rejection_reason}. Please upload a corrected version.",
+    ),
+    NotificationType.INSTANCE_CREATED: Template(
+        "New compliance assigned: {master_name}",
+        "You have been assigned as owner for {master_name} ({entity_name}). Due: {due_date}",
+    ),
+    NotificationType.INSTANCE_COMPLETED: Template(
+        "Compliance completed: {master_name}",
+        "{master_name} for {entity_name} has been marked as completed.",
+    ),
+}
+
+
+@functools.lru_cache(maxsize=256)
+def _templates_for(notification_type: str, master_name: str) -> Template:
+    """
+    Get the templates for a notification type with the compliance name pre-filled.
+
+    Reminder/escalation fan-out renders many notifications for the same
+    compliance master, so the static part is substituted once and cached.
+    """
+    escaped = master_name.replace("{", "{{").replace("}", "}}")
+    return Template(
+        *(fmt.replace("{master_name}", escaped) for fmt in NOTIFICATION_TEMPLATES[notification_type])
+    )
+
+
+def _render(notification_type: str, master_name: str = "Compliance", **fields) -> tuple[str, str, str]:
+    """
+    Render notification title, message and link.
+
+    Args:
+        notification_type: Type of notification (from NotificationType)
+        master_name: Compliance master name
+        **fields: Values for the remaining template placeholders
+
+    Returns:
+        Tuple of (title, message, link)
+    """
+    return _templates_for(notification_type, str(master_name)).render(fields)
+
+
+def _from_list_cache(data: dict) -> Notification:
+    """Rebuild a (detached) Notification from a list cache entry."""
+    return Notification(
+        id=UUID(data["id"]),
+        user_id=UUID(data["user_id"]),
+        tenant_id=UUID(data["tenant_id"]),
+        notification_type=data["notification_type"],
+        title=data["title"],
+        message=data["message"],
+        link=data["link"],
+        is_read=data["is_read"],
+        read_at=datetime.fromisoformat(data["read_at"]) if data["read_at"] else None,
+        created_at=datetime.fromisoformat(data["created_at"]),
+    )
+
+
+def _utc_now():
+    """SQL expression for the current time as naive UTC (matches the DateTime columns)."""
+    return func.timezone("utc", func.now())
+
+
+class NotificationBatcher:
+    """
+    Unit of work for notifications created in one batch (e.g. a reminder run).
+
+    While a batcher is active (see batch_notifications), create_notification
+    and create_notifications_bulk queue rows here instead of committing, and
+    flush() inserts them all with one statement and one commit.
+
+    Daily dedup keys claimed for queued rows (see _dedup_daily) are held
+    here too and released if the flush fails, so a retry sends them again.
+    """
+
+    def __init__(self):
+        self.rows: list[dict] = []
+        self.claims: list[str] = []
+
+    def add(self, row: dict) -> None:
+        """Queue one notification's column values."""
+        self.rows.append(row)
+
+    def flush(self, db: Session) -> list[Notification]:
+        """
+        Insert all queued notifications.
+
+        Args:
+            db: Database session
+
+        Returns:
+            List of created Notification objects
+        """
+        rows, self.rows = self.rows, []
+        claims, self.claims = self.claims, []
+        try:
+            return _persist_notifications(db, rows)
+        except Exception:
+            for key in claims:
+                release_claim(key)
+            raise
+
+    def discard(self) -> None:
+        """Drop the queued notifications and release their dedup keys, so a retry sends them."""
+        for key in self.claims:
+            release_claim(key)
+        self.rows, self.claims = [], []
+
+
+_current_batcher: ContextVar[Optional[NotificationBatcher]] = ContextVar("notification_batcher", default=None)
+
+
+@contextmanager
+def batch_notifications() -> Iterator[NotificationBatcher]:
+    """
+    Queue notifications created in this context on a NotificationBatcher.
+
+    The caller is responsible for calling flush() on the yielded batcher.
+    """
+    batcher = NotificationBatcher()
+    token = _current_batcher.set(batcher)
+    try:
+        yield batcher
+    finally:
+        _current_batcher.reset(token)
+
+
 def create_notification(
     db: Session,
     user_id: UUID,
@@ -59,32 +261,166 @@ def create_notification(
         created_by: Optional user who triggered this notification
 
     Returns:
-        Created Notification object
+        Created Notification object (unsaved if a NotificationBatcher is active
+        or the write was queued because SYNC_NOTIFICATIONS is off)
     """
-    notification = Notification(
-        user_id=user_id,
-        tenant_id=tenant_id,
-        notification_type=notification_type,
-        title=title,
-        message=message,
-        link=link,
-        is_read=False,
-        created_at=datetime.utcnow(),
-    )
-
-    db.add(notification)
+    values = {
+        "user_id": user_id,
+        "tenant_id": tenant_id,
+        "notification_type": notification_type,
+        "title": title,
+        "message": message,
+        "link": link,
+        "is_read": False,
+    }
+
+    batcher = _current_batcher.get()
+    if batcher is not None:
+        batcher.add(values)
+        return Notification(**values)
+
+    if not settings.SYNC_NOTIFICATIONS:
+        return _persist_notifications(db, [values])[0]
+
+    # RETURNING hands back the generated columns, so no refresh SELECT is needed
+    row = db.execute(insert(Notification).returning(Notification.id, Notification.created_at), values).one()
     db.commit()
-    db.refresh(notification)
+
+    notification = Notification(id=row.id, created_at=row.created_at, **values)
+
+    unread_count_cache.incr(tenant_id, user_id)
+    notification_list_cache.push_many([notification])
 
     return notification
 
 
+def create_notifications_bulk(db: Session, rows: list[dict]) -> list[Notification]:
+    """
+    Create many in-app notifications with a single multi-row INSERT.
+
+    Args:
+        db: Database session
+        rows: Notification column values, one dict per notification
+              (user_id, tenant_id, notification_type, title, message, link)
+
+    Returns:
+        List of created Notification objects (in the same order as rows;
+        unsaved if a NotificationBatcher is active or the write was queued)
+    """
+    batcher = _current_batcher.get()
+    if batcher is not None:
+        for row in rows:
+            batcher.add(row)
+        return [Notification(**row) for row in rows]
+
+    return _persist_notifications(db, rows)
+
+
+def _persist_notifications(db: Session, rows: list[dict]) -> list[Notification]:
+    """
+    Write notification rows now (SYNC_NOTIFICATIONS) or hand them to a Celery worker.
+
+    Queued rows are returned as unsaved Notification objects.
+    """
+    if settings.SYNC_NOTIFICATIONS:
+        return insert_notifications(db, rows)
+
+    if not rows:
+        return []
+
+    from app.tasks.notification_tasks import persist_notifications_task
+
+    # kombu's JSON serializer round-trips UUID values, so rows are sent as-is
+    persist_notifications_task.delay(rows)
+
+    return [Notification(**row) for row in rows]
+
+
+def insert_notifications(db: Session, rows: list[dict]) -> list[Notification]:
+    """
+    Insert notifications with one multi-row INSERT and one commit, then update caches.
+
+    This always writes synchronously; it is the sink used by the Celery
+    persistence worker (on a WriteSessionLocal session, i.e. with
+    synchronous_commit off) and by SYNC_NOTIFICATIONS mode.
+
+    Args:
+        db: Database session
+        rows: Notification column values, one dict per notification
+
+    Returns:
+        List of created Notification objects (in the same order as rows)
+    """
+    if not rows:
+        return []
+
+    # Returning only the generated columns keeps this a plain multi-VALUES INSERT:
+    # no ORM objects are loaded into the session's identity map
+    result = db.execute(
+        insert(Notification).returning(Notification.id, Notification.created_at, sort_by_parameter_order=True),
+        rows,
+    )
+    notifications = [Notification(id=row.id, created_at=row.created_at, **values) for row, values in zip(result, rows)]
+    db.commit()
+
+    unread_count_cache.incr_many(Counter((row["tenant_id"], row["user_id"]) for row in rows))
+    notification_list_cache.push_many(notifications)
+
+    return notifications
+
+
+NotificationCursor = tuple[datetime, UUID]
+
+
+def encode_notification_cursor(created_at: datetime, notification_id: UUID) -> str:
+    """
+    Encode a keyset pagination cursor for the notification after which to continue.
+
+    Args:
+        created_at: created_at of the last notification on the page
+        notification_id: id of the last notification on the page
+
+    Returns:
+        Opaque cursor string
+    """
+    return f"{created_at.isoformat()}_{notification_id}"
+
+
+def decode_notification_cursor(cursor: str) -> NotificationCursor:
+    """
+    Decode a cursor produced by encode_notification_cursor.
+
+    Args:
+        cursor: Cursor string
+
+    Returns:
+        Tuple of (created_at, id)
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    created_at, _, notification_id = cursor.rpartition("_")
+    return datetime.fromisoformat(created_at), UUID(notification_id)
+
+
 def get_user_notifications(
-    db: Session, user_id: UUID, tenant_id: UUID, unread_only: bool = False, limit: int = 50, offset: int = 0
+    db: Session,
+    user_id: UUID,
+    tenant_id: UUID,
+    unread_only: bool = False,
+    limit: int = 50,
+    offset: int = 0,
+    before: Optional[NotificationCursor] = None,
 ) -> list[Notification]:
     """
     Get notifications for a user.
 
+    Pages within the newest notification_list_cache.size notifications are
+    served from the per-user Redis list cache (loaded from the database on a
+    miss); deeper pages query the database directly. Pass `before` (the
+    (created_at, id) of the last item seen) for keyset pagination, which
+    costs the same at any depth, instead of `offset`.
+
     Args:
         db: Database session
         user_id: User UUID
@@ -92,16 +428,135 @@ def get_user_notifications(
         unread_only: If True, only return unread notifications
         limit: Maximum number to return
         offset: Pagination offset
+        before: Keyset cursor - only return notifications older than this
 
     Returns:
-        List of Notification objects, ordered by created_at desc
+        List of Notification objects, ordered by created_at desc, id desc
     """
+    window = notification_list_cache.size
+    if before is None and offset + limit <= window:
+        latest = _get_latest_notifications(db, user_id, tenant_id, window)
+        unread = [n for n in latest if not n.is_read] if unread_only else None
+        page = _window_page(latest, unread, window, offset, limit)
+        if page is not None:
+            return page
+
     query = db.query(Notification).filter(Notification.user_id == user_id, Notification.tenant_id == tenant_id)
 
     if unread_only:
         query = query.filter(Notification.is_read == False)  # noqa: E712
 
-    return query.order_by(Notification.created_at.desc()).offset(offset).limit(limit).all()
+    if before is not None:
+        query = query.filter(tuple_(Notification.created_at, Notification.id) < tuple_(*before))
+
+    return query.order_by(Notification.created_at.desc(), Notification.id.desc()).offset(offset).limit(limit).all()
+
+
+# Columns returned by get_user_notifications_rows (everything the list API renders)
+NOTIFICATION_LIST_COLUMNS = (
+    Notification.id,
+    Notification.user_id,
+    Notification.tenant_id,
+    Notification.notification_type,
+    Notification.title,
+    Notification.message,
+    Notification.link,
+    Notification.is_read,
+    Notification.read_at,
+    Notification.created_at,
+)
+
+
+def get_user_notifications_rows(
+    db: Session,
+    user_id: UUID,
+    tenant_id: UUID,
+    unread_only: bool = False,
+    limit: int = 50,
+    offset: int = 0,
+    before: Optional[NotificationCursor] = None,
+    read_db: Optional[Session] = None,
+) -> list[Mapping[str, Any]]:
+    """
+    Get notifications for a user as plain column mappings (no ORM hydration).
+
+    Same paging and caching as get_user_notifications, for list endpoints that
+    only serialize the columns.
+
+    The cached window is always loaded from db (the primary): a lagging
+    replica read would otherwise put rows that were just marked read or
+    deleted back into the cache. Only pages outside the window use read_db.
+
+    Args:
+        db: Database session (primary)
+        user_id: User UUID
+        tenant_id: Tenant UUID
+        unread_only: If True, only return unread notifications
+        limit: Maximum number to return
+        offset: Pagination offset
+        before: Keyset cursor - only return notifications older than this
+        read_db: Optional read-replica session for pages outside the cached window
+
+    Returns:
+        List of mappings keyed by NOTIFICATION_LIST_COLUMNS names, ordered by created_at desc, id desc
+    """
+    owned = (Notification.user_id == user_id, Notification.tenant_id == tenant_id)
+
+    window = notification_list_cache.size
+    if before is None and offset + limit <= window:
+        latest = notification_list_cache.get(tenant_id, user_id)
+        if latest is None:
+            stmt = select(*NOTIFICATION_LIST_COLUMNS).where(*owned).order_by(Notification.created_at.desc())
+            rows = db.execute(stmt.limit(window)).all()
+            notification_list_cache.set(tenant_id, user_id, rows)
+            latest = [row._mapping for row in rows]
+
+        unread = [row for row in latest if not row["is_read"]] if unread_only else None
+        page = _window_page(latest, unread, window, offset, limit)
+        if page is not None:
+            return page
+
+    stmt = select(*NOTIFICATION_LIST_COLUMNS).where(*owned)
+    if unread_only:
+        stmt = stmt.where(Notification.is_read == False)  # noqa: E712
+    if before is not None:
+        stmt = stmt.where(tuple_(Notification.created_at, Notification.id) < tuple_(*before))
+
+    stmt = stmt.order_by(Notification.created_at.desc(), Notification.id.desc()).offset(offset).limit(limit)
+    return (read_db or db).execute(stmt).mappings().all()
+
+
+def _window_page(latest: list, unread: Optional[list], window: int, offset: int, limit: int) -> Optional[list]:
+    """
+    Slice a page out of a user's cached newest-notifications window.
+
+    Returns None when the page may continue past the window: the window holds
+    every notification only when it isn't full, so an unread-only page that
+    runs out of unread items in a full window must come from the database.
+    """
+    if unread is None:
+        return latest[offset : offset + limit]
+    if len(latest) < window or len(unread) >= offset + limit:
+        return unread[offset : offset + limit]
+    return None
+
+
+def _get_latest_notifications(db: Session, user_id: UUID, tenant_id: UUID, window: int) -> list[Notification]:
+    """Get a user's newest notifications from the list cache, loading it on a miss."""
+    cached = notification_list_cache.get(tenant_id, user_id)
+    if cached is not None:
+        return [_from_list_cache(data) for data in cached]
+
+    latest = (
+        db.query(Notification)
+        .filter(Notification.user_id == user_id, Notification.tenant_id == tenant_id)
+        .order_by(Notification.created_at.desc())
+        .limit(window)
+        .all()
+    )
+    notification_list_cache.set(tenant_id, user_id, latest)
+
+    return latest
 
 
 def get_unread_count(db: Session, user_id: UUID, tenant_id: UUID) -> int:
@@ -114,13 +569,21 @@ def get_unread_count(db: Session, user_id: UUID, tenant_id: UUID) -> int:
         tenant_id: Tenant UUID
 
     Returns:
-        Count of unread notifications
+        Count of unread notifications (served from the Redis cache when available)
     """
-    return (
-        db.query(Notification)
-        .filter(Notification.user_id == user_id, Notification.tenant_id == tenant_id, Notification.is_read == False)  # noqa: E712
-        .count()
-    )
+    cached = unread_count_cache.get(tenant_id, user_id)
+    if cached is not None:
+        return cached
+
+    # Trigger-maintained counter row; no row means the user has never had a notification
+    count = (
+        db.query(UserNotificationStats.unread_count)
+        .filter(UserNotificationStats.tenant_id == tenant_id, UserNotificationStats.user_id == user_id)
+        .scalar()
+    ) or 0
+    unread_count_cache.set(tenant_id, user_id, count)
+
+    return count
 
 
 def mark_notification_read(
@@ -138,7 +601,30 @@ def mark_notification_read(
     Returns:
         Updated Notification or None if not found
     """
-    notification = (
+    # Ownership check and update in one statement
+    stmt = (
+        update(Notification)
+        .where(
+            Notification.id == notification_id,
+            Notification.user_id == user_id,
+            Notification.tenant_id == tenant_id,
+            Notification.is_read == False,  # noqa: E712
+        )
+        .values(is_read=True, read_at=_utc_now())
+        .returning(Notification)
+    )
+    notification = db.scalars(stmt).first()
+
+    if notification is not None:
+        # Detach so commit doesn't expire the RETURNING values (no reload SELECT)
+        db.expunge(notification)
+        db.commit()
+        unread_count_cache.incr(tenant_id, user_id, -1)
+        notification_list_cache.invalidate(tenant_id, user_id)
+        return notification
+
+    # Nothing updated: missing, not owned, or already read
+    return (
         db.query(Notification)
         .filter(
             Notification.id == notification_id, Notification.user_id == user_id, Notification.tenant_id == tenant_id
@@ -146,37 +632,118 @@ def mark_notification_read(
         .first()
     )
 
-    if not notification:
-        return None
 
-    if not notification.is_read:
-        notification.is_read = True
-        notification.read_at = datetime.utcnow()
+def mark_notifications_read_bulk(
+    db: Session, notification_ids: list[UUID], user_id: UUID, tenant_id: UUID, batch_size: int = 50
+) -> int:
+    """
+    Mark several notifications as read with batched UPDATEs.
+
+    Only unread notifications owned by the user are updated; unknown,
+    foreign or already-read IDs are ignored.
+
+    Args:
+        db: Database session
+        notification_ids: Notification UUIDs to mark as read
+        user_id: User UUID (must match notification owner)
+        tenant_id: Tenant UUID
+        batch_size: IDs per UPDATE statement (one commit per batch)
+
+    Returns:
+        Count of notifications marked as read
+    """
+    marked = 0
+
+    for start in range(0, len(notification_ids), batch_size):
+        chunk = notification_ids[start : start + batch_size]
+        result = db.execute(
+            update(Notification)
+            .where(
+                Notification.id.in_(chunk),
+                Notification.user_id == user_id,
+                Notification.tenant_id == tenant_id,
+                Notification.is_read == False,  # noqa: E712
+            )
+            .values(is_read=True, read_at=_utc_now())
+            .execution_options(synchronize_session=False)
+        )
         db.commit()
-        db.refresh(notification)
+        marked += result.rowcount
 
-    return notification
+    if marked:
+        unread_count_cache.incr(tenant_id, user_id, -marked)
+        notification_list_cache.invalidate(tenant_id, user_id)
+
+    return marked
 
 
-def mark_all_read(db: Session, user_id: UUID, tenant_id: UUID) -> int:
+def mark_all_read(db: Session, user_id: UUID, tenant_id: UUID, batch_size: int = 5000) -> int:
     """
     Mark all notifications as read for a user.
 
+    Unread rows are updated in chunks of batch_size with a commit per chunk,
+    so users with very large backlogs never hold one long-running UPDATE.
+
     Args:
         db: Database session
         user_id: User UUID
         tenant_id: Tenant UUID
+        batch_size: Maximum rows updated per statement
 
     Returns:
         Count of notifications marked as read
     """
-    count = (
-        db.query(Notification)
-        .filter(Notification.user_id == user_id, Notification.tenant_id == tenant_id, Notification.is_read == False)  # noqa: E712
-        .update({"is_read": True, "read_at": datetime.utcnow()})
+    chunk_ids = (
+        select(Notification.id)
+        .where(
+            Notification.user_id == user_id,
+            Notification.tenant_id == tenant_id,
+            Notification.is_read == False,  # noqa: E712
+        )
+        .limit(batch_size)
+    )
+    stmt = (
+        update(Notification)
+        .where(Notification.id.in_(chunk_ids))
+        .values(is_read=True, read_at=_utc_now())
+        .execution_options(synchronize_session=False)
     )
 
-    db.commit()
+    count = 0
+    while True:
+        marked = db.execute(stmt).rowcount
+        db.commit()
+        count += marked
+        if marked < batch_size:
+            break
+
+    unread_count_cache.invalidate(tenant_id, user_id)
+    notification_list_cache.invalidate(tenant_id, user_id)
+    return count
+
+
+def mark_all_read_async(db: Session, user_id: UUID, tenant_id: UUID) -> int:
+    """
+    Mark all notifications as read in the background.
+
+    The cached unread count is set to 0 immediately so the UI updates at once;
+    the UPDATE itself runs in a Celery task (which re-syncs the cache when done).
+
+    Args:
+        db: Database session
+        user_id: User UUID
+        tenant_id: Tenant UUID
+
+    Returns:
+        Unread count before the request (number of notifications being marked)
+    """
+    from app.tasks.notification_tasks import mark_all_read_task
+
+    count = get_unread_count(db, user_id, tenant_id)
+    unread_count_cache.set(tenant_id, user_id, 0)
+    notification_list_cache.invalidate(tenant_id, user_id)
+    mark_all_read_task.delay(user_id, tenant_id)
+
     return count
 
 
@@ -193,30 +760,41 @@ def delete_notification(db: Session, notification_id: UUID, user_id: UUID, tenan
     Returns:
         True if deleted, False if not found
     """
-    notification = (
-        db.query(Notification)
-        .filter(
+    # Ownership check and delete in one statement
+    stmt = (
+        delete(Notification)
+        .where(
             Notification.id == notification_id, Notification.user_id == user_id, Notification.tenant_id == tenant_id
         )
-        .first()
+        .returning(Notification.is_read)
     )
+    row = db.execute(stmt).first()
 
-    if not notification:
+    if row is None:
         return False
 
-    db.delete(notification)
     db.commit()
+
+    if not row.is_read:
+        unread_count_cache.incr(tenant_id, user_id, -1)
+    notification_list_cache.invalidate(tenant_id, user_id)
+
     return True
 
 
-def delete_old_notifications(db: Session, tenant_id: UUID, days_old: int = 90) -> int:
+def delete_old_notifications(db: Session, tenant_id: UUID, days_old: int = 90, batch_size: int = 5000) -> int:
     """
     Delete notifications older than X days.
 
+    Rows are deleted oldest-first in chunks of batch_size, committing after
+    each chunk so no single statement holds row locks across the whole
+    backlog. Rows locked by concurrent transactions are skipped.
+
     Args:
         db: Database session
         tenant_id: Tenant UUID
         days_old: Age threshold in days
+        batch_size: Maximum rows deleted per statement
 
     Returns:
         Count of deleted notifications
@@ -225,17 +803,187 @@ def delete_old_notifications(db: Session, tenant_id: UUID, days_old: int = 90) -
 
     cutoff = datetime.utcnow() - timedelta(days=days_old)
 
-    count = (
-        db.query(Notification).filter(Notification.tenant_id == tenant_id, Notification.created_at < cutoff).delete()
+    chunk_ids = (
+        select(Notification.id)
+        .where(Notification.tenant_id == tenant_id, Notification.created_at < cutoff)
+        .order_by(Notification.created_at)
+        .limit(batch_size)
+        .with_for_update(skip_locked=True)
     )
+    stmt = delete(Notification).where(Notification.id.in_(chunk_ids)).execution_options(synchronize_session=False)
 
-    db.commit()
+    count = 0
+    while True:
+        deleted = db.execute(stmt).rowcount
+        db.commit()
+        count += deleted
+        if deleted < batch_size:
+            break
+
+    if count:
+        unread_count_cache.invalidate_tenant(tenant_id)
+        notification_list_cache.invalidate_tenant(tenant_id)
     return count
 
 
 # ============ Specific Notification Helpers ============
 
 
+def get_master_name(db: Session, master_id: Optional[UUID]) -> str:
+    """
+    Get a compliance master's display name, cached in Redis.
+
+    Args:
+        db: Database session
+        master_id: ComplianceMaster UUID
+
+    Returns:
+        Master name, or "Compliance" if unknown
+    """
+    if master_id is None:
+        return "Compliance"
+
+    name = get_cached_name("master", master_id)
+    if name is None:
+        name = db.query(ComplianceMaster.compliance_name).filter(ComplianceMaster.id == master_id).scalar()
+        if name is None:
+            return "Compliance"
+        set_cached_name("master", master_id, name)
+
+    return name
+
+
+def get_entity_name(db: Session, entity_id: Optional[UUID]) -> str:
+    """
+    Get an entity's display name, cached in Redis.
+
+    Args:
+        db: Database session
+        entity_id: Entity UUID
+
+    Returns:
+        Entity name, or "Entity" if unknown
+    """
+    if entity_id is None:
+        return "Entity"
+
+    name = get_cached_name("entity", entity_id)
+    if name is None:
+        name = db.query(Entity.entity_name).filter(Entity.id == entity_id).scalar()
+        if name is None:
+            return "Entity"
+        set_cached_name("entity", entity_id, name)
+
+    return name
+
+
+def _loaded(obj: Any, relationship: str) -> Optional[Any]:
+    """Return a relationship of an ORM object if already loaded (never lazy-loads)."""
+    state = inspect(obj, raiseerr=False)
+    if state is None or relationship in state.unloaded:
+        return None
+    return getattr(obj, relationship)
+
+
+def _instance_ctx(db: Session, instance: ComplianceInstance, with_entity: bool = False) -> dict[str, Any]:
+    """
+    Template values shared by the compliance instance notifications.
+
+    Names come from the eager-loaded master/entity (INSTANCE_NOTIFY_OPTIONS)
+    when present, so the reminder loops need no Redis or database round-trip.
+    """
+    master = _loaded(instance, "compliance_master")
+    ctx = {
+        "master_name": master.compliance_name if master else get_master_name(db, instance.compliance_master_id),
+        "due_date": instance.due_date,
+        "instance_id": instance.id,
+    }
+    if with_entity:
+        entity = _loaded(instance, "entity")
+        ctx["entity_name"] = entity.entity_name if entity else get_entity_name(db, instance.entity_id)
+    return ctx
+
+
+def _dedup_daily(notification_type: str):
+    """
+    Suppress repeat cron notifications for the same instance and user within a day.
+
+    Wraps helpers with the signature (db, instance, user, ...). A Redis key
+    notif_dedup:{tenant}:{user}:{type}:{instance}:{YYYYMMDD} is claimed before
+    the insert; if another worker already claimed it the helper returns None.
+    The key is released if the insert (or, when batching, the flush) fails.
+    """
+
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(db: Session, instance: ComplianceInstance, user: User, *args, **kwargs):
+            if not user:
+                return func(db, instance, user, *args, **kwargs)
+
+            key = (
+                f"notif_dedup:{instance.tenant_id}:{user.id}:{notification_type}:"
+                f"{instance.id}:{date.today():%Y%m%d}"
+            )
+            if not claim_once(key):
+                return None
+
+            try:
+                result = func(db, instance, user, *args, **kwargs)
+            except Exception:
+                release_claim(key)
+                raise
+
+            # Queued rows are only written on flush; the batcher releases the key if that fails
+            batcher = _current_batcher.get()
+            if batcher is not None:
+                batcher.claims.append(key)
+            return result
+
+        return wrapper
+
+    return decorator
+
+
+def _emit(
+    db: Session, user: User, tenant_id: UUID, notification_type: str, ctx: dict[str, Any]
+) -> Notification:
+    """
+    Render a notification from NOTIFICATION_TEMPLATES and create it.
+
+    Args:
+        db: Database session
+        user: User to notify
+        tenant_id: Tenant UUID
+        notification_type: Type of notification (from NotificationType)
+        ctx: Template values; "master_name" is optional
+
+    Returns:
+        Created Notification
+    """
+    title, message, link = _render(notification_type, **ctx)
+    return create_notification(
+        db=db,
+        user_id=user.id,
+        tenant_id=tenant_id,
+        notification_type=notification_type,
+        title=title,
+        message=message,
+        link=link,
+    )
+
+
+def _task_ctx(db: Session, task: WorkflowTask) -> dict[str, Any]:
+    """Template values shared by the task notifications."""
+    instance = task.compliance_instance
+    return {
+        "master_name": get_master_name(db, instance.compliance_master_id if instance else None),
+        "task_name": task.task_name,
+        "task_type": task.task_type,
+        "due_date": task.due_date,
+        "instance_id": task.compliance_instance_id,
+    }
+
+
 def notify_task_assigned(db: Session, task: WorkflowTask, assigned_user: User) -> Optional[Notification]:
     """
     Create notification when a task is assigned to a user.
@@ -250,21 +998,7 @@ def notify_task_assigned(db: Session, task: WorkflowTask, assigned_user: User) -
     """
     if not assigned_user:
         return None
-
-    instance = task.compliance_instance
-    master_name = (
-        instance.compliance_master.compliance_name if instance and instance.compliance_master else "Compliance"
-    )
-
-    return create_notification(
-        db=db,
-        user_id=assigned_user.id,
-        tenant_id=task.tenant_id,
-        notification_type=NotificationType.TASK_ASSIGNED,
-        title=f"New task assigned: {task.task_name}",
-        message=f"You have been assigned the '{task.task_type}' task for {master_name}. Due: {task.due_date}",
-        link=f"/compliance-instances/{task.compliance_instance_id}",
-    )
+    return _emit(db, assigned_user, task.tenant_id, NotificationType.TASK_ASSIGNED, _task_ctx(db, task))
 
 
 def notify_task_completed(db: Session, task: WorkflowTask, notify_user: User) -> Optional[Notification]:
@@ -281,23 +1015,10 @@ def notify_task_completed(db: Session, task: WorkflowTask, notify_user: User) ->
     """
     if not notify_user:
         return None
-
-    instance = task.compliance_instance
-    master_name = (
-        instance.compliance_master.compliance_name if instance and instance.compliance_master else "Compliance"
-    )
-
-    return create_notification(
-        db=db,
-        user_id=notify_user.id,
-        tenant_id=task.tenant_id,
-        notification_type=NotificationType.TASK_COMPLETED,
-        title=f"Task completed: {task.task_name}",
-        message=f"The '{task.task_type}' task for {master_name} has been completed.",
-        link=f"/compliance-instances/{task.compliance_instance_id}",
-    )
+    return _emit(db, notify_user, task.tenant_id, NotificationType.TASK_COMPLETED, _task_ctx(db, task))
 
 
+@_dedup_daily(NotificationType.REMINDER_T3)
 def notify_reminder_t3(db: Session, instance: ComplianceInstance, owner: User) -> Optional[Notification]:
     """
     Create T-3 day reminder notification.
@@ -312,20 +1033,10 @@ def notify_reminder_t3(db: Session, instance: ComplianceInstance, owner: User) -
     """
     if not owner:
         return None
-
-    master_name = instance.compliance_master.compliance_name if instance.compliance_master else "Compliance"
-
-    return create_notification(
-        db=db,
-        user_id=owner.id,
-        tenant_id=instance.tenant_id,
-        notification_type=NotificationType.REMINDER_T3,
-        title=f"Reminder: {master_name} due in 3 days",
-        message=f"{master_name} is due on {instance.due_date}. Please ensure all tasks are completed.",
-        link=f"/compliance-instances/{instance.id}",
-    )
+    return _emit(db, owner, instance.tenant_id, NotificationType.REMINDER_T3, _instance_ctx(db, instance))
 
 
+@_dedup_daily(NotificationType.REMINDER_DUE)
 def notify_reminder_due(db: Session, instance: ComplianceInstance, user: User) -> Optional[Notification]:
     """
     Create due date reminder notification.
@@ -340,20 +1051,10 @@ def notify_reminder_due(db: Session, instance: ComplianceInstance, user: User) -
     """
     if not user:
         return None
-
-    master_name = instance.compliance_master.compliance_name if instance.compliance_master else "Compliance"
-
-    return create_notification(
-        db=db,
-        user_id=user.id,
-        tenant_id=instance.tenant_id,
-        notification_type=NotificationType.REMINDER_DUE,
-        title=f"Due today: {master_name}",
-        message=f"{master_name} is due TODAY ({instance.due_date}). Please complete all pending tasks.",
-        link=f"/compliance-instances/{instance.id}",
-    )
+    return _emit(db, user, instance.tenant_id, NotificationType.REMINDER_DUE, _instance_ctx(db, instance))
 
 
+@_dedup_daily(NotificationType.ESCALATION)
 def notify_overdue_escalation(
     db: Session, instance: ComplianceInstance, escalate_to: User, days_overdue: int
 ) -> Optional[Notification]:
@@ -371,22 +1072,14 @@ def notify_overdue_escalation(
     """
     if not escalate_to:
         return None
+    ctx = _instance_ctx(db, instance, with_entity=True)
+    ctx["days_overdue"] = days_overdue
+    return _emit(db, escalate_to, instance.tenant_id, NotificationType.ESCALATION, ctx)
 
-    master_name = instance.compliance_master.compliance_name if instance.compliance_master else "Compliance"
-    entity_name = instance.entity.entity_name if instance.entity else "Entity"
 
-    return create_notification(
-        db=db,
-        user_id=escalate_to.id,
-        tenant_id=instance.tenant_id,
-        notification_type=NotificationType.ESCALATION,
-        title=f"Escalation: {master_name} overdue by {days_overdue} days",
-        message=(
-            f"{master_name} for {entity_name} was due on {instance.due_date} "
-            f"and is now {days_overdue} days overdue. Immediate attention required."
-        ),
-        link=f"/compliance-instances/{instance.id}",
-    )
+def _evidence_ctx(evidence: Evidence, **extra: Any) -> dict[str, Any]:
+    """Template values shared by the evidence notifications."""
+    return {"evidence_name": evidence.evidence_name, "instance_id": evidence.compliance_instance_id, **extra}
 
 
 def notify_evidence_uploaded(db: Session, evidence: Evidence, approver: User) -> Optional[Notification]:
@@ -403,23 +1096,14 @@ def notify_evidence_uploaded(db: Session, evidence: Evidence, approver: User) ->
     """
     if not approver:
         return None
-
     instance = evidence.compliance_instance
-    master_name = (
-        instance.compliance_master.compliance_name if instance and instance.compliance_master else "Compliance"
-    )
-
-    return create_notification(
-        db=db,
-        user_id=approver.id,
-        tenant_id=evidence.tenant_id,
-        notification_type=NotificationType.EVIDENCE_UPLOADED,
-        title=f"Evidence pending approval: {evidence.evidence_name}",
-        message=(
-            f"New evidence '{evidence.evidence_name}' has been uploaded for "
-            f"{master_name} and requires your approval."
-        ),
-        link=f"/compliance-instances/{evidence.compliance_instance_id}",
+    master_name = get_master_name(db, instance.compliance_master_id if instance else None)
+    return _emit(
+        db,
+        approver,
+        evidence.tenant_id,
+        NotificationType.EVIDENCE_UPLOADED,
+        _evidence_ctx(evidence, master_name=master_name),
     )
 
 
@@ -437,16 +1121,7 @@ def notify_evidence_approved(db: Session, evidence: Evidence, owner: User) -> Op
     """
     if not owner:
         return None
-
-    return create_notification(
-        db=db,
-        user_id=owner.id,
-        tenant_id=evidence.tenant_id,
-        notification_type=NotificationType.EVIDENCE_APPROVED,
-        title=f"Evidence approved: {evidence.evidence_name}",
-        message=f"Your evidence '{evidence.evidence_name}' has been approved.",
-        link=f"/compliance-instances/{evidence.compliance_instance_id}",
-    )
+    return _emit(db, owner, evidence.tenant_id, NotificationType.EVIDENCE_APPROVED, _evidence_ctx(evidence))
 
 
 def notify_evidence_rejected(
@@ -466,18 +1141,12 @@ def notify_evidence_rejected(
     """
     if not owner:
         return None
-
-    return create_notification(
-        db=db,
-        user_id=owner.id,
-        tenant_id=evidence.tenant_id,
-        notification_type=NotificationType.EVIDENCE_REJECTED,
-        title=f"Evidence rejected: {evidence.evidence_name}",
-        message=(
-            f"Your evidence '{evidence.evidence_name}' has been rejected. "
-            f"Reason: {rejection_reason}. Please upload a corrected version."
-        ),
-        link=f"/compliance-instances/{evidence.compliance_instance_id}",
+    return _emit(
+        db,
+        owner,
+        evidence.tenant_id,
+        NotificationType.EVIDENCE_REJECTED,
+        _evidence_ctx(evidence, rejection_reason=rejection_reason),
     )
 
 
@@ -495,19 +1164,8 @@ def notify_instance_created(db: Session, instance: ComplianceInstance, owner: Us
     """
     if not owner:
         return None
-
-    master_name = instance.compliance_master.compliance_name if instance.compliance_master else "Compliance"
-    entity_name = instance.entity.entity_name if instance.entity else "Entity"
-
-    return create_notification(
-        db=db,
-        user_id=owner.id,
-        tenant_id=instance.tenant_id,
-        notification_type=NotificationType.INSTANCE_CREATED,
-        title=f"New compliance assigned: {master_name}",
-        message=f"You have been assigned as owner for {master_name} ({entity_name}). Due: {instance.due_date}",
-        link=f"/compliance-instances/{instance.id}",
-    )
+    ctx = _instance_ctx(db, instance, with_entity=True)
+    return _emit(db, owner, instance.tenant_id, NotificationType.INSTANCE_CREATED, ctx)
 
 
 def notify_instance_completed(
@@ -524,22 +1182,22 @@ def notify_instance_completed(
     Returns:
         List of created Notifications
     """
-    notifications = []
-
-    master_name = instance.compliance_master.compliance_name if instance.compliance_master else "Compliance"
-    entity_name = instance.entity.entity_name if instance.entity else "Entity"
-
-    for user in notify_users:
-        if user:
-            notification = create_notification(
-                db=db,
-                user_id=user.id,
-                tenant_id=instance.tenant_id,
-                notification_type=NotificationType.INSTANCE_COMPLETED,
-                title=f"Compliance completed: {master_name}",
-                message=f"{master_name} for {entity_name} has been marked as completed.",
-                link=f"/compliance-instances/{instance.id}",
-            )
-            notifications.append(notification)
+    title, message, link = _render(
+        NotificationType.INSTANCE_COMPLETED, **_instance_ctx(db, instance, with_entity=True)
+    )
 
-    return notifications
+    rows = [
+        {
+            "user_id": user.id,
+            "tenant_id": instance.tenant_id,
+            "notification_type": NotificationType.INSTANCE_COMPLETED,
+            "title": title,
+            "message": message,
+            "link": link,
+            "is_read": False,
+        }
+        for user in notify_users
+        if user
+    ]
+
+    return create_notifications_bulk(db, rows)
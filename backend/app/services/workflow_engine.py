@@ -4,13 +4,14 @@ Handles task lifecycle, assignments, and escalations
 """
 
 from datetime import date, timedelta
-from typing import Optional
-from uuid import UUID
+from typing import NamedTuple, Optional
+from uuid import UUID, uuid4
 
-
-from sqlalchemy.orm import Session
+from sqlalchemy import func, lambda_stmt, or_, select
+from sqlalchemy.orm import Session, aliased, joinedload, load_only
 
 from app.models import (
+    ACTIVE_TASK_STATUSES,
     WorkflowTask,
     ComplianceInstance,
     User,
@@ -20,6 +21,11 @@ from app.models.entity import entity_access
 from app.models.role import user_roles
 
 
+# Loader options for instances passed to create_workflow_tasks, so the master
+# (name, roles, workflow_config) arrives with the instance in one query
+WORKFLOW_INSTANCE_OPTIONS = (joinedload(ComplianceInstance.compliance_master),)
+
+
 # Standard workflow configuration (used when no custom workflow defined)
 STANDARD_WORKFLOW = [
     {
@@ -91,60 +97,133 @@ def get_role_by_code(db: Session, role_code: str) -> Optional[Role]:
     return db.query(Role).filter(Role.role_code == role_code).first()
 
 
+class RoleCache:
+    """
+    Role and assignee lookups shared by create_workflow_tasks calls in one batch.
+
+    Create one per batch (e.g., per Celery task run) and pass it to every call;
+    each role code is then queried once, and each (role code, entity) once.
+    """
+
+    def __init__(self):
+        self.role_ids: dict[str, Optional[UUID]] = {}
+        self.assignees: dict[tuple[str, UUID], Optional[tuple[Optional[UUID], Optional[UUID]]]] = {}
+
+
+def resolve_role_assignments(
+    db: Session, entity_id: UUID, role_codes: set[str], role_cache: Optional[RoleCache] = None
+) -> dict[str, tuple[Optional[UUID], Optional[UUID]]]:
+    """
+    Resolve several role codes to assignees with at most two queries.
+
+    Batch form of resolve_role_to_user + get_role_by_code: one query for the
+    roles, one for active users holding any of them with access to the entity.
+    Codes already in role_cache are not queried again.
+
+    Args:
+        db: Database session
+        entity_id: Entity UUID
+        role_codes: Role codes to resolve
+        role_cache: Optional cache shared across calls in a batch
+
+    Returns:
+        Dict of role_code -> (user_id, role_id). user_id is set when a user
+        resolves; otherwise role_id is set if the role exists (assign to role).
+        Unknown role codes are omitted.
+    """
+    cache = role_cache if role_cache is not None else RoleCache()
+    pending = {code for code in role_codes if (code, entity_id) not in cache.assignees}
+
+    if pending:
+        unknown = pending - cache.role_ids.keys()
+        if unknown:
+            found = dict(db.query(Role.role_code, Role.id).filter(Role.role_code.in_(unknown)).all())
+            for code in unknown:
+                cache.role_ids[code] = found.get(code)
+
+        role_ids = [cache.role_ids[code] for code in pending if cache.role_ids[code] is not None]
+        user_by_role: dict[UUID, UUID] = {}
+        if role_ids:
+            candidates = (
+                db.query(User.id, user_roles.c.role_id)
+                .join(user_roles, User.id == user_roles.c.user_id)
+                .join(entity_access, User.id == entity_access.c.user_id)
+                .filter(
+                    user_roles.c.role_id.in_(role_ids),
+                    entity_access.c.entity_id == entity_id,
+                    User.status == "active",
+                )
+                .all()
+            )
+            for user_id, role_id in candidates:
+                user_by_role.setdefault(role_id, user_id)
+
+        for code in pending:
+            role_id = cache.role_ids[code]
+            if role_id is None:
+                cache.assignees[(code, entity_id)] = None
+            elif role_id in user_by_role:
+                cache.assignees[(code, entity_id)] = (user_by_role[role_id], None)
+            else:
+                cache.assignees[(code, entity_id)] = (None, role_id)
+
+    resolved = {code: cache.assignees[(code, entity_id)] for code in role_codes}
+    return {code: assignment for code, assignment in resolved.items() if assignment is not None}
+
+
 def create_workflow_tasks(
     db: Session,
     instance: ComplianceInstance,
     workflow_config: Optional[list[dict]] = None,
     created_by: Optional[UUID] = None,
+    role_cache: Optional[RoleCache] = None,
 ) -> list[WorkflowTask]:
     """
     Generate workflow tasks for a compliance instance.
 
     Args:
         db: Database session
-        instance: ComplianceInstance to create tasks for
+        instance: ComplianceInstance to create tasks for (load with
+            WORKFLOW_INSTANCE_OPTIONS to avoid a lazy load of the master)
         workflow_config: Custom workflow config, or None for standard
         created_by: User UUID who triggered creation
+        role_cache: Optional RoleCache shared across a batch of instances
 
     Returns:
         List of created WorkflowTask objects
     """
     created_tasks = []
 
+    # Read everything needed from the master once, outside the step loop
+    master = instance.compliance_master
+    compliance_name = master.compliance_name if master else "Compliance"
+    default_owner_role = master.owner_role_code if master else None
+    default_approver_role = master.approver_role_code if master else None
+
     # Use custom workflow from master if defined, otherwise standard
     if workflow_config is None:
-        if instance.compliance_master and instance.compliance_master.workflow_config:
-            workflow_config = instance.compliance_master.workflow_config
-        else:
-            workflow_config = STANDARD_WORKFLOW
-
-    # Get default owner role from master
-    default_owner_role = None
-    default_approver_role = None
-    if instance.compliance_master:
-        default_owner_role = instance.compliance_master.owner_role_code
-        default_approver_role = instance.compliance_master.approver_role_code
+        workflow_config = (master.workflow_config if master else None) or STANDARD_WORKFLOW
 
     # Calculate task due dates based on instance due date
     # Tasks should complete before the instance due date
+    today = date.today()
     total_tasks = len(workflow_config)
     days_before_due = 5  # Last task should be 5 days before due
     days_per_task = (
-        max(2, (instance.due_date - date.today() - timedelta(days=days_before_due)).days // total_tasks)
+        max(2, (instance.due_date - today - timedelta(days=days_before_due)).days // total_tasks)
         if total_tasks > 0
         else 2
     )
 
-    previous_task = None
+    # Due date per step, computed up front; dates already past move to tomorrow
+    tomorrow = today + timedelta(days=1)
+    due_dates = [instance.due_date - timedelta(days=(total_tasks - i) * days_per_task) for i in range(total_tasks)]
+    due_dates = [due if due >= today else tomorrow for due in due_dates]
 
-    for i, step in enumerate(workflow_config):
+    # Role code per step, then resolve all distinct codes in one go
+    step_roles = []
+    for step in workflow_config:
         task_type = step.get("task_type", step.get("step", "Task"))
-        compliance_name = instance.compliance_master.compliance_name if instance.compliance_master else "Compliance"
-        task_name = f"{step.get('step', task_type)} - {compliance_name}"
-        task_description = step.get("description", f"Complete {task_type} step")
-        sequence = step.get("sequence", i + 1)
-
-        # Determine role for assignment
         role_code = step.get("role")
         if not role_code:
             # Use default roles based on task type
@@ -152,43 +231,45 @@ def create_workflow_tasks(
                 role_code = default_approver_role or "CFO"
             else:
                 role_code = default_owner_role or "TAX_LEAD"
+        step_roles.append((task_type, role_code))
 
-        # Try to resolve role to specific user
-        assigned_user = resolve_role_to_user(db, instance.tenant_id, instance.entity_id, role_code)
-        assigned_role = get_role_by_code(db, role_code) if not assigned_user else None
+    assignments = resolve_role_assignments(
+        db, instance.entity_id, {code for _, code in step_roles}, role_cache=role_cache
+    )
 
-        # Calculate due date for this task
-        task_due_date = instance.due_date - timedelta(days=(total_tasks - i) * days_per_task)
-        if task_due_date < date.today():
-            task_due_date = date.today() + timedelta(days=1)
+    previous_task = None
+
+    for i, (step, (task_type, role_code)) in enumerate(zip(workflow_config, step_roles)):
+        task_name = f"{step.get('step', task_type)} - {compliance_name}"
+        task_description = step.get("description", f"Complete {task_type} step")
+        sequence = step.get("sequence", i + 1)
+        assigned_user_id, assigned_role_id = assignments.get(role_code, (None, None))
 
         task = WorkflowTask(
+            id=uuid4(),  # Client-side id so the next step can link to it without a flush
             tenant_id=instance.tenant_id,
             compliance_instance_id=instance.id,
             task_type=task_type,
             task_name=task_name,
             task_description=task_description,
-            assigned_to_user_id=assigned_user.id if assigned_user else None,
-            assigned_to_role_id=assigned_role.id if assigned_role else None,
+            assigned_to_user_id=assigned_user_id,
+            assigned_to_role_id=assigned_role_id,
             status="Pending",
-            due_date=task_due_date,
+            due_date=due_dates[i],
             sequence_order=sequence,
             parent_task_id=previous_task.id if previous_task else None,
             created_by=created_by,
             updated_by=created_by,
         )
 
-        db.add(task)
-        db.flush()  # Get the ID for next task's parent_task_id
-
         created_tasks.append(task)
         previous_task = task
 
+    db.add_all(created_tasks)
     db.commit()
 
-    # Refresh to get all relationships
-    for task in created_tasks:
-        db.refresh(task)
+    # Reload the committed rows in one query (instead of a refresh per task)
+    db.query(WorkflowTask).filter(WorkflowTask.id.in_([task.id for task in created_tasks])).all()
 
     return created_tasks
 
@@ -204,12 +285,46 @@ def get_tasks_for_instance(db: Session, compliance_instance_id: UUID) -> list[Wo
     Returns:
         List of WorkflowTask objects ordered by sequence_order
     """
-    return (
-        db.query(WorkflowTask)
-        .filter(WorkflowTask.compliance_instance_id == compliance_instance_id)
+    # lambda_stmt caches the constructed/compiled SELECT; later calls only bind new parameters
+    stmt = lambda_stmt(
+        lambda: select(WorkflowTask)
+        .where(WorkflowTask.compliance_instance_id == compliance_instance_id)
         .order_by(WorkflowTask.sequence_order)
-        .all()
     )
+    return db.execute(stmt).scalars().all()
+
+
+class TaskStatusCounts(NamedTuple):
+    """Task counts by status for one compliance instance."""
+
+    total: int
+    completed: int
+    in_progress: int
+    rejected: int
+
+
+def get_task_status_counts(db: Session, compliance_instance_id: UUID) -> TaskStatusCounts:
+    """
+    Count an instance's workflow tasks by status in one aggregate query.
+
+    Args:
+        db: Database session
+        compliance_instance_id: Instance UUID
+
+    Returns:
+        TaskStatusCounts (one row, no task rows transferred)
+    """
+    row = (
+        db.query(
+            func.count(),
+            func.count().filter(WorkflowTask.status == "Completed"),
+            func.count().filter(WorkflowTask.status == "In Progress"),
+            func.count().filter(WorkflowTask.status == "Rejected"),
+        )
+        .filter(WorkflowTask.compliance_instance_id == compliance_instance_id)
+        .one()
+    )
+    return TaskStatusCounts(*row)
 
 
 def get_current_task(db: Session, compliance_instance_id: UUID) -> Optional[WorkflowTask]:
@@ -225,15 +340,16 @@ def get_current_task(db: Session, compliance_instance_id: UUID) -> Optional[Work
     Returns:
         Current WorkflowTask or None if all completed
     """
-    return (
-        db.query(WorkflowTask)
-        .filter(
+    stmt = lambda_stmt(
+        lambda: select(WorkflowTask)
+        .where(
             WorkflowTask.compliance_instance_id == compliance_instance_id,
-            WorkflowTask.status.in_(["Pending", "In Progress"]),
+            WorkflowTask.status.in_(ACTIVE_TASK_STATUSES),
         )
         .order_by(WorkflowTask.sequence_order)
-        .first()
+        .limit(1)
     )
+    return db.execute(stmt).scalars().first()
 
 
 def get_next_pending_task(db: Session, compliance_instance_id: UUID) -> Optional[WorkflowTask]:
@@ -247,19 +363,38 @@ def get_next_pending_task(db: Session, compliance_instance_id: UUID) -> Optional
     Returns:
         Next WorkflowTask or None
     """
-    # Get all tasks ordered by sequence
-    tasks = get_tasks_for_instance(db, compliance_instance_id)
+    # First pending task in sequence plus its parent's status, in one query
+    parent = aliased(WorkflowTask)
+    row = (
+        db.query(WorkflowTask, parent.status)
+        .outerjoin(parent, WorkflowTask.parent_task_id == parent.id)
+        .filter(WorkflowTask.compliance_instance_id == compliance_instance_id, WorkflowTask.status == "Pending")
+        .order_by(WorkflowTask.sequence_order)
+        .first()
+    )
+    if row is None:
+        return None
+
+    task, parent_status = row
+    if parent_status is not None and parent_status != "Completed":
+        return None  # Can't start until parent completes
+    return task
 
-    for task in tasks:
-        if task.status == "Pending":
-            # Check if parent task (if any) is completed
-            if task.parent_task_id:
-                parent = db.query(WorkflowTask).filter(WorkflowTask.id == task.parent_task_id).first()
-                if parent and parent.status != "Completed":
-                    return None  # Can't start until parent completes
-            return task
 
-    return None
+def _commit_transition(db: Session) -> None:
+    """
+    Commit a task state transition without expiring the session's objects.
+
+    Transitions only write client-side values (updated_at comes from the
+    Python onupdate default and is set on flush), so the in-memory task is
+    already current and reloading it would cost a SELECT per transition.
+    """
+    expire_on_commit = db.expire_on_commit
+    db.expire_on_commit = False
+    try:
+        db.commit()
+    finally:
+        db.expire_on_commit = expire_on_commit
 
 
 def start_task(db: Session, task: WorkflowTask, user_id: UUID) -> WorkflowTask:
@@ -290,8 +425,7 @@ def start_task(db: Session, task: WorkflowTask, user_id: UUID) -> WorkflowTask:
     task.started_at = date.today()
     task.updated_by = user_id
 
-    db.commit()
-    db.refresh(task)
+    _commit_transition(db)
 
     return task
 
@@ -322,8 +456,7 @@ def complete_task(
     task.completion_remarks = completion_remarks
     task.updated_by = user_id
 
-    db.commit()
-    db.refresh(task)
+    _commit_transition(db)
 
     # Check if all tasks are completed to update instance status
     check_instance_completion(db, task.compliance_instance)
@@ -357,8 +490,7 @@ def reject_task(db: Session, task: WorkflowTask, user_id: UUID, rejection_reason
     task.rejection_reason = rejection_reason
     task.updated_by = user_id
 
-    db.commit()
-    db.refresh(task)
+    _commit_transition(db)
 
     return task
 
@@ -387,8 +519,7 @@ def reassign_task(
     task.assigned_to_role_id = role_id
     task.updated_by = updated_by
 
-    db.commit()
-    db.refresh(task)
+    _commit_transition(db)
 
     return task
 
@@ -404,14 +535,13 @@ def check_instance_completion(db: Session, instance: ComplianceInstance) -> bool
     Returns:
         True if instance is now completed, False otherwise
     """
-    # Get all tasks for instance
-    tasks = get_tasks_for_instance(db, instance.id)
+    counts = get_task_status_counts(db, instance.id)
 
-    if not tasks:
+    if not counts.total:
         return False
 
     # Check if all tasks are completed
-    all_completed = all(task.status == "Completed" for task in tasks)
+    all_completed = counts.completed == counts.total
 
     if all_completed and instance.status != "Completed":
         instance.status = "Completed"
@@ -423,6 +553,19 @@ def check_instance_completion(db: Session, instance: ComplianceInstance) -> bool
     return False
 
 
+# Columns loaded for "my tasks" lists (get_user_assigned_tasks)
+USER_TASK_LIST_COLUMNS = (
+    WorkflowTask.id,
+    WorkflowTask.compliance_instance_id,
+    WorkflowTask.task_name,
+    WorkflowTask.task_type,
+    WorkflowTask.status,
+    WorkflowTask.due_date,
+    WorkflowTask.assigned_to_user_id,
+    WorkflowTask.assigned_to_role_id,
+)
+
+
 def get_user_assigned_tasks(
     db: Session,
     user_id: UUID,
@@ -441,25 +584,19 @@ def get_user_assigned_tasks(
         include_role_tasks: Whether to include role-assigned tasks
 
     Returns:
-        List of WorkflowTask objects
+        List of WorkflowTask objects with only USER_TASK_LIST_COLUMNS loaded
+        (other attributes load on access)
     """
-    from sqlalchemy import or_
-
-    query = db.query(WorkflowTask).filter(WorkflowTask.tenant_id == tenant_id)
+    query = (
+        db.query(WorkflowTask).options(load_only(*USER_TASK_LIST_COLUMNS)).filter(WorkflowTask.tenant_id == tenant_id)
+    )
 
     if include_role_tasks:
-        # Get user's role IDs
-        user = db.query(User).filter(User.id == user_id).first()
-        if user:
-            role_ids = [role.id for role in user.roles]
-            query = query.filter(
-                or_(
-                    WorkflowTask.assigned_to_user_id == user_id,
-                    WorkflowTask.assigned_to_role_id.in_(role_ids) if role_ids else False,
-                )
-            )
-        else:
-            query = query.filter(WorkflowTask.assigned_to_user_id == user_id)
+        # Role IDs resolved in SQL, so no User row is loaded just for user.roles
+        role_ids = select(user_roles.c.role_id).where(user_roles.c.user_id == user_id)
+        query = query.filter(
+            or_(WorkflowTask.assigned_to_user_id == user_id, WorkflowTask.assigned_to_role_id.in_(role_ids))
+        )
     else:
         query = query.filter(WorkflowTask.assigned_to_user_id == user_id)
 
@@ -484,16 +621,16 @@ def get_overdue_tasks(db: Session, tenant_id: UUID, today: Optional[date] = None
     if today is None:
         today = date.today()
 
-    return (
-        db.query(WorkflowTask)
-        .filter(
+    stmt = lambda_stmt(
+        lambda: select(WorkflowTask)
+        .where(
             WorkflowTask.tenant_id == tenant_id,
-            WorkflowTask.status.in_(["Pending", "In Progress"]),
+            WorkflowTask.status.in_(ACTIVE_TASK_STATUSES),
             WorkflowTask.due_date < today,
         )
         .order_by(WorkflowTask.due_date)
-        .all()
     )
+    return db.execute(stmt).scalars().all()
 
 
 def get_tasks_due_soon(db: Session, tenant_id: UUID, days: int = 3, today: Optional[date] = None) -> list[WorkflowTask]:
@@ -514,17 +651,17 @@ def get_tasks_due_soon(db: Session, tenant_id: UUID, days: int = 3, today: Optio
 
     end_date = today + timedelta(days=days)
 
-    return (
-        db.query(WorkflowTask)
-        .filter(
+    stmt = lambda_stmt(
+        lambda: select(WorkflowTask)
+        .where(
             WorkflowTask.tenant_id == tenant_id,
-            WorkflowTask.status.in_(["Pending", "In Progress"]),
+            WorkflowTask.status.in_(ACTIVE_TASK_STATUSES),
             WorkflowTask.due_date >= today,
             WorkflowTask.due_date <= end_date,
         )
         .order_by(WorkflowTask.due_date)
-        .all()
     )
+    return db.execute(stmt).scalars().all()
 
 
 def update_instance_status_from_tasks(db: Session, instance: ComplianceInstance) -> str:
@@ -538,17 +675,13 @@ def update_instance_status_from_tasks(db: Session, instance: ComplianceInstance)
     Returns:
         New status string
     """
-    tasks = get_tasks_for_instance(db, instance.id)
+    counts = get_task_status_counts(db, instance.id)
 
-    if not tasks:
+    if not counts.total:
         return instance.status
 
-    # Count task statuses
-    completed_count = sum(1 for t in tasks if t.status == "Completed")
-    in_progress_count = sum(1 for t in tasks if t.status == "In Progress")
-    rejected_count = sum(1 for t in tasks if t.status == "Rejected")
-
-    total = len(tasks)
+    # Status rollup from one aggregate row
+    total, completed_count, in_progress_count, rejected_count = counts
 
     if completed_count == total:
         new_status = "Completed"
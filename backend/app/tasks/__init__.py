@@ -16,6 +16,7 @@ from app.tasks.reminder_tasks import (
 )
 from app.tasks.notification_tasks import (
     send_email_task,
+    send_typed_email_task,
     send_reminder_email_task,
     send_escalation_email_task,
     send_task_assigned_email_task,
@@ -38,6 +39,7 @@ __all__ = [
     "cleanup_old_notifications",
     # Notification (email) tasks
     "send_email_task",
+    "send_typed_email_task",
     "send_reminder_email_task",
     "send_escalation_email_task",
     "send_task_assigned_email_task",
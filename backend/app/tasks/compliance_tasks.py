@@ -5,6 +5,11 @@ Runs scheduled jobs for instance generation and status recalculation
 
 import logging
 from datetime import date
+from typing import Optional
+from uuid import UUID
+
+from celery import chord
+from sqlalchemy import select, update
 
 from app.celery_app import celery_app
 from app.core.database import SessionLocal
@@ -12,11 +17,115 @@ from app.models import Tenant
 from app.services.compliance_engine import (
     generate_instances_for_period,
     calculate_period_for_frequency,
-    recalculate_rag_for_tenant,
+    bulk_recalculate_rag,
 )
 
 logger = logging.getLogger(__name__)
 
+# Cap on failed tenant IDs kept in a task summary (stored in the result backend)
+MAX_REPORTED_ERRORS = 50
+
+
+def _active_tenants(db) -> list[tuple[UUID, str]]:
+    """Return (id, tenant_name) rows for active tenants, without loading Tenant objects."""
+    return db.execute(select(Tenant.id, Tenant.tenant_name).where(Tenant.status == "active")).all()
+
+
+def _tenant_failure(task, tenant_id: str, tenant_name: str, exc: Exception, db) -> dict:
+    """
+    Roll back and retry a per-tenant subtask, or report the error once retries run out.
+
+    Returning an error entry (instead of raising) on the last attempt keeps one
+    bad tenant from failing the whole chord.
+    """
+    db.rollback()
+    if task.request.retries < task.max_retries:
+        raise task.retry(exc=exc, countdown=60 * (2**task.request.retries))
+    logger.error(f"Giving up on tenant {tenant_name} ({tenant_id}) after {task.max_retries} retries")
+    return {"tenant_id": tenant_id, "error": True}
+
+
+def _summarize(results: list[dict], count_key: str, total_key: str) -> dict:
+    """
+    Reduce per-tenant subtask results to aggregate counters.
+
+    Per-tenant detail is already logged by the subtasks; only failed tenant
+    IDs (capped at MAX_REPORTED_ERRORS) are kept in the returned summary.
+    """
+    total = 0
+    tenant_errors = []
+    for result in results:
+        if result.get("error"):
+            tenant_errors.append(result["tenant_id"])
+        else:
+            total += result.get(count_key, 0)
+
+    return {
+        "status": "success",
+        total_key: total,
+        "total_errors": len(tenant_errors),
+        "errors": tenant_errors[:MAX_REPORTED_ERRORS],
+    }
+
+
+@celery_app.task(bind=True, max_retries=3, acks_late=True)
+def generate_tenant_instances(self, tenant_id: str, tenant_name: str, period_start: str, period_end: str):
+    """
+    Generate compliance instances for one tenant and period.
+
+    Fanned out per tenant by generate_compliance_instances_daily.
+
+    Args:
+        tenant_id: Tenant UUID (string)
+        tenant_name: Tenant name (for the summary)
+        period_start: Period start (ISO date)
+        period_end: Period end (ISO date)
+
+    Returns:
+        dict: Instances created for the tenant, or the error after retries
+    """
+    db = SessionLocal()
+
+    try:
+        instances = generate_instances_for_period(
+            db=db,
+            tenant_id=UUID(tenant_id),
+            period_start=date.fromisoformat(period_start),
+            period_end=date.fromisoformat(period_end),
+        )
+
+        logger.info(f"Generated {len(instances)} instances for tenant {tenant_name} ({period_start} to {period_end})")
+
+        return {"tenant_id": tenant_id, "instances_created": len(instances)}
+
+    except Exception as e:
+        logger.error(f"Error generating instances for tenant {tenant_id}: {str(e)}")
+        return _tenant_failure(self, tenant_id, tenant_name, e, db)
+
+    finally:
+        db.close()
+
+
+@celery_app.task
+def summarize_instance_generation(results: list[dict]):
+    """
+    Chord callback for generate_compliance_instances_daily.
+
+    Args:
+        results: Per-tenant results from generate_tenant_instances
+
+    Returns:
+        dict: Total instances created and failed tenant IDs
+    """
+    summary = _summarize(results, "instances_created", "total_created")
+
+    logger.info(
+        f"Daily instance generation complete. Total created: {summary['total_created']}, "
+        f"tenant errors: {summary['total_errors']}"
+    )
+
+    return summary
+
 
 @celery_app.task(bind=True, max_retries=3)
 def generate_compliance_instances_daily(self):
@@ -27,64 +136,95 @@ def generate_compliance_instances_daily(self):
 
     Process:
     1. Get all active tenants
-    2. For each tenant, generate monthly instances for current period
-    3. Log counts and any errors
+    2. Fan out one generate_tenant_instances subtask per tenant (in parallel)
+    3. summarize_instance_generation logs the totals once all tenants finish
 
     Returns:
-        dict: Summary of instances created per tenant
+        dict: Number of tenants dispatched
     """
     logger.info("Starting daily compliance instance generation")
 
-    db = SessionLocal()
-    results = {}
-
     try:
-        # Get all active tenants
-        tenants = db.query(Tenant).filter(Tenant.status == "active").all()
+        # Get all active tenants (session is released before dispatching)
+        with SessionLocal() as db:
+            tenants = _active_tenants(db)
 
         if not tenants:
             logger.warning("No active tenants found")
             return {"status": "no_tenants", "created": 0}
 
-        today = date.today()
+        # Calculate current monthly period
+        period_start, period_end = calculate_period_for_frequency("Monthly", date.today())
+        period = (period_start.isoformat(), period_end.isoformat())
+
+        chord(generate_tenant_instances.s(str(tenant_id), tenant_name, *period) for tenant_id, tenant_name in tenants)(
+            summarize_instance_generation.s()
+        )
+
+        return {"status": "dispatched", "tenants": len(tenants)}
+
+    except Exception as e:
+        logger.error(f"Critical error in generate_compliance_instances_daily: {str(e)}")
+        # Retry with exponential backoff
+        raise self.retry(exc=e, countdown=60 * (2**self.request.retries))
 
-        for tenant in tenants:
-            try:
-                # Calculate current monthly period
-                period_start, period_end = calculate_period_for_frequency("Monthly", today)
 
-                # Generate instances for this tenant
-                instances = generate_instances_for_period(
-                    db=db, tenant_id=tenant.id, period_start=period_start, period_end=period_end
-                )
+@celery_app.task(bind=True, max_retries=3, acks_late=True)
+def recalculate_tenant_rag(self, tenant_id: str, tenant_name: str):
+    """
+    Recalculate RAG status for one tenant's instances.
 
-                results[str(tenant.id)] = {
-                    "tenant_name": tenant.tenant_name,
-                    "instances_created": len(instances),
-                    "period": f"{period_start} to {period_end}",
-                }
+    Fanned out per tenant by recalculate_rag_status_hourly.
 
-                logger.info(f"Generated {len(instances)} instances for tenant {tenant.tenant_name}")
+    Args:
+        tenant_id: Tenant UUID (string)
+        tenant_name: Tenant name (for the summary)
 
-            except Exception as e:
-                logger.error(f"Error generating instances for tenant {tenant.id}: {str(e)}")
-                results[str(tenant.id)] = {"tenant_name": tenant.tenant_name, "error": str(e)}
+    Returns:
+        dict: Instances updated for the tenant, or the error after retries
+    """
+    db = SessionLocal()
 
-        total_created = sum(r.get("instances_created", 0) for r in results.values())
+    try:
+        updated_count = bulk_recalculate_rag(db, UUID(tenant_id))
+
+        logger.info(f"Updated RAG status for {updated_count} instances " f"for tenant {tenant_name}")
 
-        logger.info(f"Daily instance generation complete. Total created: {total_created}")
+        # Only this tenant's dashboard keys can be stale
+        if updated_count:
+            invalidate_dashboard_cache(tenant_id)
 
-        return {"status": "success", "total_created": total_created, "tenants": results}
+        return {"tenant_id": tenant_id, "instances_updated": updated_count}
 
     except Exception as e:
-        logger.error(f"Critical error in generate_compliance_instances_daily: {str(e)}")
-        # Retry with exponential backoff
-        raise self.retry(exc=e, countdown=60 * (2**self.request.retries))
+        logger.error(f"Error recalculating RAG for tenant {tenant_id}: {str(e)}")
+        return _tenant_failure(self, tenant_id, tenant_name, e, db)
 
     finally:
         db.close()
 
 
+@celery_app.task
+def summarize_rag_recalculation(results: list[dict]):
+    """
+    Chord callback for recalculate_rag_status_hourly.
+
+    Args:
+        results: Per-tenant results from recalculate_tenant_rag
+
+    Returns:
+        dict: Total instances updated and failed tenant IDs
+    """
+    summary = _summarize(results, "instances_updated", "total_updated")
+
+    logger.info(
+        f"Hourly RAG recalculation complete. Total updated: {summary['total_updated']}, "
+        f"tenant errors: {summary['total_errors']}"
+    )
+
+    return summary
+
+
 @celery_app.task(bind=True, max_retries=3)
 def recalculate_rag_status_hourly(self):
     """
@@ -94,57 +234,33 @@ def recalculate_rag_status_hourly(self):
 
     Process:
     1. Get all active tenants
-    2. For each tenant, recalculate RAG status for all instances
-    3. Update Redis cache if available
+    2. Fan out one recalculate_tenant_rag subtask per tenant (in parallel)
+    3. summarize_rag_recalculation logs the totals once all tenants finish
 
     Returns:
-        dict: Summary of instances updated per tenant
+        dict: Number of tenants dispatched
     """
     logger.info("Starting hourly RAG status recalculation")
 
-    db = SessionLocal()
-    results = {}
-
     try:
-        # Get all active tenants
-        tenants = db.query(Tenant).filter(Tenant.status == "active").all()
+        # Get all active tenants (session is released before dispatching)
+        with SessionLocal() as db:
+            tenants = _active_tenants(db)
 
         if not tenants:
             logger.warning("No active tenants found")
             return {"status": "no_tenants", "updated": 0}
 
-        for tenant in tenants:
-            try:
-                # Recalculate RAG for this tenant
-                updated_count = recalculate_rag_for_tenant(db, tenant.id)
-
-                results[str(tenant.id)] = {"tenant_name": tenant.tenant_name, "instances_updated": updated_count}
-
-                logger.info(f"Updated RAG status for {updated_count} instances " f"for tenant {tenant.tenant_name}")
-
-            except Exception as e:
-                logger.error(f"Error recalculating RAG for tenant {tenant.id}: {str(e)}")
-                results[str(tenant.id)] = {"tenant_name": tenant.tenant_name, "error": str(e)}
-
-        total_updated = sum(r.get("instances_updated", 0) for r in results.values())
-
-        logger.info(f"Hourly RAG recalculation complete. Total updated: {total_updated}")
-
-        # Invalidate dashboard cache (if Redis is configured)
-        try:
-            invalidate_dashboard_cache()
-        except Exception as e:
-            logger.warning(f"Failed to invalidate dashboard cache: {str(e)}")
+        chord(recalculate_tenant_rag.s(str(tenant_id), tenant_name) for tenant_id, tenant_name in tenants)(
+            summarize_rag_recalculation.s()
+        )
 
-        return {"status": "success", "total_updated": total_updated, "tenants": results}
+        return {"status": "dispatched", "tenants": len(tenants)}
 
     except Exception as e:
         logger.error(f"Critical error in recalculate_rag_status_hourly: {str(e)}")
         raise self.retry(exc=e, countdown=60 * (2**self.request.retries))
 
-    finally:
-        db.close()
-
 
 @celery_app.task(bind=True, max_retries=3)
 def generate_quarterly_instances(self):
@@ -154,52 +270,53 @@ def generate_quarterly_instances(self):
     Runs on the 1st of each quarter (Apr 1, Jul 1, Oct 1, Jan 1).
 
     Returns:
-        dict: Summary of quarterly instances created
+        dict: Total quarterly instances created and failed tenant IDs
     """
     logger.info("Starting quarterly instance generation")
 
-    db = SessionLocal()
-    results = {}
+    total_created = 0
+    tenant_errors = []
 
     try:
-        tenants = db.query(Tenant).filter(Tenant.status == "active").all()
+        with SessionLocal() as db:
+            tenants = _active_tenants(db)
         today = date.today()
 
         # Calculate quarterly period
         period_start, period_end = calculate_period_for_frequency("Quarterly", today)
 
-        for tenant in tenants:
-            try:
-                instances = generate_instances_for_period(
-                    db=db, tenant_id=tenant.id, period_start=period_start, period_end=period_end
-                )
-
-                # Filter for quarterly frequency only
-                quarterly_count = len(
-                    [i for i in instances if i.compliance_master and i.compliance_master.frequency == "Quarterly"]
-                )
-
-                results[str(tenant.id)] = {
-                    "tenant_name": tenant.tenant_name,
-                    "quarterly_instances": quarterly_count,
-                    "period": f"{period_start} to {period_end}",
-                }
-
-                logger.info(f"Generated {quarterly_count} quarterly instances " f"for tenant {tenant.tenant_name}")
-
-            except Exception as e:
-                logger.error(f"Error generating quarterly instances for tenant {tenant.id}: {str(e)}")
-                results[str(tenant.id)] = {"error": str(e)}
-
-        return {"status": "success", "tenants": results}
+        # Short-lived session per tenant: bounded identity map, connection returned between tenants
+        for tenant_id, tenant_name in tenants:
+            with SessionLocal() as db:
+                try:
+                    instances = generate_instances_for_period(
+                        db=db,
+                        tenant_id=tenant_id,
+                        period_start=period_start,
+                        period_end=period_end,
+                        frequency="Quarterly",
+                    )
+                    quarterly_count = len(instances)
+                    total_created += quarterly_count
+
+                    logger.info(f"Generated {quarterly_count} quarterly instances " f"for tenant {tenant_name}")
+
+                except Exception as e:
+                    db.rollback()
+                    logger.error(f"Error generating quarterly instances for tenant {tenant_id}: {str(e)}")
+                    tenant_errors.append(str(tenant_id))
+
+        return {
+            "status": "success",
+            "total_created": total_created,
+            "total_errors": len(tenant_errors),
+            "errors": tenant_errors[:MAX_REPORTED_ERRORS],
+        }
 
     except Exception as e:
         logger.error(f"Critical error in generate_quarterly_instances: {str(e)}")
         raise self.retry(exc=e, countdown=60 * (2**self.request.retries))
 
-    finally:
-        db.close()
-
 
 @celery_app.task(bind=True, max_retries=3)
 def generate_annual_instances(self):
@@ -209,52 +326,52 @@ def generate_annual_instances(self):
     Runs on April 1st (start of India Financial Year).
 
     Returns:
-        dict: Summary of annual instances created
+        dict: Total annual instances created and failed tenant IDs
     """
     logger.info("Starting annual instance generation")
 
-    db = SessionLocal()
-    results = {}
+    total_created = 0
+    tenant_errors = []
 
     try:
-        tenants = db.query(Tenant).filter(Tenant.status == "active").all()
+        with SessionLocal() as db:
+            tenants = _active_tenants(db)
         today = date.today()
 
         # Calculate annual period (India FY)
         period_start, period_end = calculate_period_for_frequency("Annual", today)
 
-        for tenant in tenants:
-            try:
-                instances = generate_instances_for_period(
-                    db=db, tenant_id=tenant.id, period_start=period_start, period_end=period_end
-                )
-
-                # Filter for annual frequency only
-                annual_count = len(
-                    [i for i in instances if i.compliance_master and i.compliance_master.frequency == "Annual"]
-                )
-
-                results[str(tenant.id)] = {
-                    "tenant_name": tenant.tenant_name,
-                    "annual_instances": annual_count,
-                    "period": f"{period_start} to {period_end}",
-                }
-
-                logger.info(f"Generated {annual_count} annual instances " f"for tenant {tenant.tenant_name}")
-
-            except Exception as e:
-                logger.error(f"Error generating annual instances for tenant {tenant.id}: {str(e)}")
-                results[str(tenant.id)] = {"error": str(e)}
-
-        return {"status": "success", "tenants": results}
+        for tenant_id, tenant_name in tenants:
+            with SessionLocal() as db:
+                try:
+                    instances = generate_instances_for_period(
+                        db=db,
+                        tenant_id=tenant_id,
+                        period_start=period_start,
+                        period_end=period_end,
+                        frequency="Annual",
+                    )
+                    annual_count = len(instances)
+                    total_created += annual_count
+
+                    logger.info(f"Generated {annual_count} annual instances " f"for tenant {tenant_name}")
+
+                except Exception as e:
+                    db.rollback()
+                    logger.error(f"Error generating annual instances for tenant {tenant_id}: {str(e)}")
+                    tenant_errors.append(str(tenant_id))
+
+        return {
+            "status": "success",
+            "total_created": total_created,
+            "total_errors": len(tenant_errors),
+            "errors": tenant_errors[:MAX_REPORTED_ERRORS],
+        }
 
     except Exception as e:
         logger.error(f"Critical error in generate_annual_instances: {str(e)}")
         raise self.retry(exc=e, countdown=60 * (2**self.request.retries))
 
-    finally:
-        db.close()
-
 
 @celery_app.task
 def update_overdue_status():
@@ -273,22 +390,17 @@ def update_overdue_status():
     db = SessionLocal()
 
     try:
-        from app.models import ComplianceInstance
+        from app.models import ComplianceInstance, OVERDUE_EXEMPT_STATUSES
 
         today = date.today()
-        overdue_count = 0
 
-        # Find all non-completed instances that are past due
-        overdue_instances = (
-            db.query(ComplianceInstance)
-            .filter(ComplianceInstance.due_date < today, ComplianceInstance.status.notin_(["Completed", "Overdue"]))
-            .all()
-        )
-
-        for instance in overdue_instances:
-            instance.status = "Overdue"
-            instance.rag_status = "Red"
-            overdue_count += 1
+        # Mark all non-completed instances that are past due in one statement
+        overdue_count = db.execute(
+            update(ComplianceInstance)
+            .where(ComplianceInstance.due_date < today, ComplianceInstance.status.notin_(OVERDUE_EXEMPT_STATUSES))
+            .values(status="Overdue", rag_status="Red")
+            .execution_options(synchronize_session=False)
+        ).rowcount
 
         db.commit()
 
@@ -305,23 +417,29 @@ def update_overdue_status():
         db.close()
 
 
-def invalidate_dashboard_cache():
+def invalidate_dashboard_cache(tenant_id: Optional[str] = None):
     """
     Invalidate Redis cache for dashboard data.
 
-    Called after RAG recalculation to ensure fresh data on dashboard.
+    Called per tenant after RAG recalculation to ensure fresh data on
+    dashboard. Keys are removed with UNLINK (memory reclaimed off the Redis
+    main thread), one call per SCAN page.
+
+    Args:
+        tenant_id: Only drop this tenant's keys (dashboard:{tenant_id}:*);
+            None drops every dashboard key
     """
     try:
-        from app.core.redis import redis_client
+        from app.core.redis import dashboard_cache_key, redis_client
 
-        # Delete all dashboard cache keys
+        match = dashboard_cache_key(tenant_id, "*") if tenant_id else "dashboard:*"
         cursor = 0
         deleted_count = 0
 
         while True:
-            cursor, keys = redis_client.scan(cursor, match="dashboard:*", count=100)
+            cursor, keys = redis_client.scan(cursor, match=match, count=1000)
             if keys:
-                redis_client.delete(*keys)
+                redis_client.unlink(*keys)
                 deleted_count += len(keys)
             if cursor == 0:
                 break
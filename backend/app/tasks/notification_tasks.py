@@ -1,16 +1,22 @@
 """
 Background tasks for email notifications.
-Handles async email sending via Celery with retry logic.
+Handles async email sending via Celery, retrying transient delivery failures.
 """
 
 import logging
-from typing import Optional
+from dataclasses import dataclass
+from datetime import date
+from typing import Callable, Optional, Union
 from uuid import UUID
 
+from sqlalchemy.exc import OperationalError
+
 from app.celery_app import celery_app
-from app.core.database import SessionLocal
+from app.core.database import SessionLocal, WriteSessionLocal
+from app.core.redis import claim_once, release_claim
 from app.models import User, ComplianceInstance, WorkflowTask, Evidence
 from app.services.email_service import (
+    TransientEmailError,
     get_email_service,
     send_reminder_email,
     send_escalation_email,
@@ -21,8 +27,123 @@ from app.services.email_service import (
 
 logger = logging.getLogger(__name__)
 
+DUPLICATE_EMAIL = {"status": "skipped", "reason": "duplicate"}
 
-@celery_app.task(bind=True, max_retries=3, default_retry_delay=60)
+# Only transient failures are retried (with jittered exponential backoff);
+# permanent ones such as a rejected recipient fail on the first attempt.
+# acks_late + reject_on_worker_lost redeliver emails whose worker died mid-send.
+EMAIL_TASK_OPTIONS = {
+    "bind": True,
+    "acks_late": True,
+    "reject_on_worker_lost": True,
+    "autoretry_for": (TransientEmailError, ConnectionError, TimeoutError, OperationalError),
+    "retry_backoff": 60,
+    "retry_backoff_max": 600,
+    "retry_jitter": True,
+    "max_retries": 3,
+}
+
+
+def as_uuid(value: Union[UUID, str]) -> UUID:
+    """
+    Coerce a task argument to UUID.
+
+    kombu's JSON serializer delivers UUIDs sent by producers as UUID objects,
+    so parsing only happens for string ids (older queued messages).
+    """
+    return value if isinstance(value, UUID) else UUID(value)
+
+
+def email_operation_id(kind: str, user_id: Union[UUID, str], object_id: str) -> str:
+    """
+    Idempotency key for one email: kind, recipient, subject object and day.
+
+    Claimed (SET NX EX) before sending so broker redeliveries and overlapping
+    beat runs don't email the same user twice; released if sending fails so
+    the retry can claim it again.
+    """
+    return f"email:{kind}:{user_id}:{object_id}:{date.today().isoformat()}"
+
+
+@dataclass(frozen=True)
+class EmailHandler:
+    """
+    How to send one kind of templated email
+
+    Attributes:
+        model: Model of the object the email is about
+        send: Email service function, called as send(user, obj, **extra)
+        dedup_on: Extra fields that tell apart emails about the same object on one day
+    """
+
+    model: type
+    send: Callable[..., bool]
+    dedup_on: tuple[str, ...] = ()
+
+
+EMAIL_HANDLERS: dict[str, EmailHandler] = {
+    "reminder": EmailHandler(ComplianceInstance, send_reminder_email),
+    "escalation": EmailHandler(ComplianceInstance, send_escalation_email),
+    "task_assigned": EmailHandler(WorkflowTask, send_task_assigned_email),
+    "evidence_status": EmailHandler(Evidence, send_evidence_status_email, dedup_on=("approved",)),
+    "task_reminder": EmailHandler(WorkflowTask, send_task_reminder_email),
+}
+
+
+def _deliver_email(kind: str, user_id: Union[UUID, str], object_id: Union[UUID, str], **extra) -> dict:
+    """
+    Claim, load and send one templated email.
+
+    Shared by every typed email task so idempotency, loading and failure
+    handling are implemented once. Failures release the claim and propagate,
+    letting EMAIL_TASK_OPTIONS decide whether to retry.
+
+    Args:
+        kind: Key into EMAIL_HANDLERS
+        user_id: UUID of the recipient
+        object_id: UUID of the object the email is about
+        **extra: Template-specific arguments passed to the handler's send function
+
+    Returns:
+        dict: Result with status
+    """
+    handler = EMAIL_HANDLERS[kind]
+    model_name = handler.model.__name__
+
+    logger.info(f"Sending {kind} email for {model_name} {object_id} to user {user_id}")
+
+    dedup_suffix = "".join(f":{extra.get(field)}" for field in handler.dedup_on)
+    op_id = email_operation_id(kind, user_id, f"{object_id}{dedup_suffix}")
+    if not claim_once(op_id):
+        logger.info(f"Skipping duplicate email {op_id}")
+        return DUPLICATE_EMAIL
+
+    db = SessionLocal()
+
+    try:
+        # Session.get uses the identity map before emitting a SELECT
+        user = db.get(User, as_uuid(user_id))
+        obj = db.get(handler.model, as_uuid(object_id))
+
+        if not user or not obj:
+            logger.error(f"User {user_id} or {model_name} {object_id} not found")
+            return {"status": "error", "message": f"User or {model_name} not found"}
+
+        if handler.send(user, obj, **extra):
+            return {"status": "success", **extra}
+        else:
+            raise Exception("Email sending failed")
+
+    except Exception as e:
+        release_claim(op_id)
+        logger.error(f"Failed to send {kind} email: {e}")
+        raise
+
+    finally:
+        db.close()
+
+
+@celery_app.task(**EMAIL_TASK_OPTIONS)
 def send_email_task(
     self,
     to_email: str,
@@ -65,15 +186,37 @@ def send_email_task(
 
     except Exception as e:
         logger.error(f"Failed to send email to {to_email}: {e}")
-        # Retry with exponential backoff
-        raise self.retry(exc=e, countdown=60 * (2**self.request.retries))
+        raise
 
 
-@celery_app.task(bind=True, max_retries=3, default_retry_delay=60)
+@celery_app.task(**EMAIL_TASK_OPTIONS)
+def send_typed_email_task(
+    self,
+    kind: str,
+    user_id: Union[UUID, str],
+    object_id: Union[UUID, str],
+    extra: Optional[dict] = None,
+):
+    """
+    Send any templated email registered in EMAIL_HANDLERS.
+
+    Args:
+        kind: Email kind ('reminder', 'escalation', 'task_assigned', ...)
+        user_id: UUID of the recipient
+        object_id: UUID of the object the email is about
+        extra: Template-specific arguments (e.g. {'days_overdue': 5})
+
+    Returns:
+        dict: Result with status
+    """
+    return _deliver_email(kind, user_id, object_id, **(extra or {}))
+
+
+@celery_app.task(**EMAIL_TASK_OPTIONS)
 def send_reminder_email_task(
     self,
-    user_id: str,
-    instance_id: str,
+    user_id: Union[UUID, str],
+    instance_id: Union[UUID, str],
     reminder_type: str,
 ):
     """
@@ -87,38 +230,14 @@ def send_reminder_email_task(
     Returns:
         dict: Result with status
     """
-    logger.info(f"Sending {reminder_type} reminder email for instance {instance_id} to user {user_id}")
-
-    db = SessionLocal()
-
-    try:
-        user = db.query(User).filter(User.id == UUID(user_id)).first()
-        instance = db.query(ComplianceInstance).filter(ComplianceInstance.id == UUID(instance_id)).first()
+    return _deliver_email("reminder", user_id, instance_id, reminder_type=reminder_type)
 
-        if not user or not instance:
-            logger.error(f"User {user_id} or instance {instance_id} not found")
-            return {"status": "error", "message": "User or instance not found"}
-
-        success = send_reminder_email(user, instance, reminder_type)
-
-        if success:
-            return {"status": "success", "reminder_type": reminder_type}
-        else:
-            raise Exception("Email sending failed")
 
-    except Exception as e:
-        logger.error(f"Failed to send reminder email: {e}")
-        raise self.retry(exc=e, countdown=60 * (2**self.request.retries))
-
-    finally:
-        db.close()
-
-
-@celery_app.task(bind=True, max_retries=3, default_retry_delay=60)
+@celery_app.task(**EMAIL_TASK_OPTIONS)
 def send_escalation_email_task(
     self,
-    user_id: str,
-    instance_id: str,
+    user_id: Union[UUID, str],
+    instance_id: Union[UUID, str],
     days_overdue: int,
 ):
     """
@@ -132,40 +251,14 @@ def send_escalation_email_task(
     Returns:
         dict: Result with status
     """
-    logger.info(
-        f"Sending escalation email for instance {instance_id} " f"({days_overdue} days overdue) to user {user_id}"
-    )
-
-    db = SessionLocal()
-
-    try:
-        user = db.query(User).filter(User.id == UUID(user_id)).first()
-        instance = db.query(ComplianceInstance).filter(ComplianceInstance.id == UUID(instance_id)).first()
-
-        if not user or not instance:
-            logger.error(f"User {user_id} or instance {instance_id} not found")
-            return {"status": "error", "message": "User or instance not found"}
-
-        success = send_escalation_email(user, instance, days_overdue)
-
-        if success:
-            return {"status": "success", "days_overdue": days_overdue}
-        else:
-            raise Exception("Email sending failed")
-
-    except Exception as e:
-        logger.error(f"Failed to send escalation email: {e}")
-        raise self.retry(exc=e, countdown=60 * (2**self.request.retries))
-
-    finally:
-        db.close()
+    return _deliver_email("escalation", user_id, instance_id, days_overdue=days_overdue)
 
 
-@celery_app.task(bind=True, max_retries=3, default_retry_delay=60)
+@celery_app.task(**EMAIL_TASK_OPTIONS)
 def send_task_assigned_email_task(
     self,
-    user_id: str,
-    task_id: str,
+    user_id: Union[UUID, str],
+    task_id: Union[UUID, str],
 ):
     """
     Send email notification when a task is assigned.
@@ -177,38 +270,14 @@ def send_task_assigned_email_task(
     Returns:
         dict: Result with status
     """
-    logger.info(f"Sending task assignment email for task {task_id} to user {user_id}")
-
-    db = SessionLocal()
-
-    try:
-        user = db.query(User).filter(User.id == UUID(user_id)).first()
-        task = db.query(WorkflowTask).filter(WorkflowTask.id == UUID(task_id)).first()
+    return _deliver_email("task_assigned", user_id, task_id)
 
-        if not user or not task:
-            logger.error(f"User {user_id} or task {task_id} not found")
-            return {"status": "error", "message": "User or task not found"}
 
-        success = send_task_assigned_email(user, task)
-
-        if success:
-            return {"status": "success", "task_name": task.task_name}
-        else:
-            raise Exception("Email sending failed")
-
-    except Exception as e:
-        logger.error(f"Failed to send task assignment email: {e}")
-        raise self.retry(exc=e, countdown=60 * (2**self.request.retries))
-
-    finally:
-        db.close()
-
-
-@celery_app.task(bind=True, max_retries=3, default_retry_delay=60)
+@celery_app.task(**EMAIL_TASK_OPTIONS)
 def send_evidence_status_email_task(
     self,
-    user_id: str,
-    evidence_id: str,
+    user_id: Union[UUID, str],
+    evidence_id: Union[UUID, str],
     approved: bool,
     rejection_reason: Optional[str] = None,
 ):
@@ -224,39 +293,14 @@ def send_evidence_status_email_task(
     Returns:
         dict: Result with status
     """
-    status_text = "approved" if approved else "rejected"
-    logger.info(f"Sending evidence {status_text} email for evidence {evidence_id} to user {user_id}")
-
-    db = SessionLocal()
-
-    try:
-        user = db.query(User).filter(User.id == UUID(user_id)).first()
-        evidence = db.query(Evidence).filter(Evidence.id == UUID(evidence_id)).first()
-
-        if not user or not evidence:
-            logger.error(f"User {user_id} or evidence {evidence_id} not found")
-            return {"status": "error", "message": "User or evidence not found"}
-
-        success = send_evidence_status_email(user, evidence, approved, rejection_reason)
-
-        if success:
-            return {"status": "success", "approved": approved}
-        else:
-            raise Exception("Email sending failed")
-
-    except Exception as e:
-        logger.error(f"Failed to send evidence status email: {e}")
-        raise self.retry(exc=e, countdown=60 * (2**self.request.retries))
-
-    finally:
-        db.close()
+    return _deliver_email("evidence_status", user_id, evidence_id, approved=approved, rejection_reason=rejection_reason)
 
 
-@celery_app.task(bind=True, max_retries=3, default_retry_delay=60)
+@celery_app.task(**EMAIL_TASK_OPTIONS)
 def send_task_reminder_email_task(
     self,
-    user_id: str,
-    task_id: str,
+    user_id: Union[UUID, str],
+    task_id: Union[UUID, str],
     days_until_due: int,
 ):
     """
@@ -270,28 +314,64 @@ def send_task_reminder_email_task(
     Returns:
         dict: Result with status
     """
-    logger.info(f"Sending task reminder email for task {task_id} " f"({days_until_due} days left) to user {user_id}")
+    return _deliver_email("task_reminder", user_id, task_id, days_until_due=days_until_due)
+
+
+@celery_app.task(bind=True, max_retries=3, default_retry_delay=60)
+def mark_all_read_task(self, user_id: Union[UUID, str], tenant_id: Union[UUID, str]):
+    """
+    Mark all of a user's notifications as read (chunked UPDATEs).
+
+    Args:
+        user_id: UUID of the user
+        tenant_id: UUID of the user's tenant
+
+    Returns:
+        dict: Result with count of notifications marked as read
+    """
+    from app.services.notification_service import mark_all_read
+
+    logger.info(f"Marking all notifications read for user {user_id}")
 
     db = SessionLocal()
 
     try:
-        user = db.query(User).filter(User.id == UUID(user_id)).first()
-        task = db.query(WorkflowTask).filter(WorkflowTask.id == UUID(task_id)).first()
+        count = mark_all_read(db, as_uuid(user_id), as_uuid(tenant_id))
+        return {"status": "success", "marked_count": count}
 
-        if not user or not task:
-            logger.error(f"User {user_id} or task {task_id} not found")
-            return {"status": "error", "message": "User or task not found"}
+    except Exception as e:
+        logger.error(f"Failed to mark all notifications read for user {user_id}: {e}")
+        raise self.retry(exc=e, countdown=60 * (2**self.request.retries))
+
+    finally:
+        db.close()
 
-        success = send_task_reminder_email(user, task, days_until_due)
 
-        if success:
-            return {"status": "success", "days_until_due": days_until_due}
-        else:
-            raise Exception("Email sending failed")
+@celery_app.task(bind=True, max_retries=5, default_retry_delay=10)
+def persist_notifications_task(self, rows: list[dict]):
+    """
+    Insert queued in-app notifications (one multi-row INSERT per batch).
+
+    Args:
+        rows: Notification column values; user_id/tenant_id as UUIDs
+
+    Returns:
+        dict: Result with count of notifications inserted
+    """
+    from app.services.notification_service import insert_notifications
+
+    # Notifications are informational: commit without waiting for fsync
+    db = WriteSessionLocal()
+
+    try:
+        values = [{**row, "user_id": as_uuid(row["user_id"]), "tenant_id": as_uuid(row["tenant_id"])} for row in rows]
+        notifications = insert_notifications(db, values)
+        return {"status": "success", "inserted": len(notifications)}
 
     except Exception as e:
-        logger.error(f"Failed to send task reminder email: {e}")
-        raise self.retry(exc=e, countdown=60 * (2**self.request.retries))
+        db.rollback()
+        logger.error(f"Failed to persist {len(rows)} notifications: {e}")
+        raise self.retry(exc=e, countdown=10 * (2**self.request.retries))
 
     finally:
         db.close()
@@ -8,18 +8,29 @@ from datetime import date, timedelta
 from typing import Optional
 from uuid import UUID
 
+from celery import group
+from sqlalchemy import BigInteger, String, and_, case, cast, func, update
+from sqlalchemy.dialects.postgresql import JSONB
+
 from app.celery_app import celery_app
+from app.core.config import settings
 from app.core.database import SessionLocal
 from app.models import (
     Tenant,
     ComplianceInstance,
+    ComplianceMaster,
     User,
     Role,
     WorkflowTask,
+    ACTIVE_TASK_STATUSES,
+    OVERDUE_EXEMPT_STATUSES,
+    REMINDER_EXEMPT_STATUSES,
 )
 from app.models.entity import entity_access
 from app.models.role import user_roles
 from app.services.notification_service import (
+    INSTANCE_NOTIFY_OPTIONS,
+    batch_notifications,
     notify_reminder_t3,
     notify_reminder_due,
     notify_overdue_escalation,
@@ -32,6 +43,146 @@ from app.tasks.notification_tasks import (
 
 logger = logging.getLogger(__name__)
 
+# Escalation targets, most preferred first
+ESCALATION_ROLE_CODES = ("CFO", "ADMIN")
+
+# role_code -> role id, filled lazily by _role_id_by_code
+_ROLE_IDS: dict[str, UUID] = {}
+
+
+def enqueue_emails(email_task, calls: list[dict]) -> None:
+    """
+    Submit email tasks collected during a reminder loop as one group.
+
+    In-app notifications are already committed, so a broker failure is
+    logged rather than failing (and re-running) the whole reminder task.
+
+    Args:
+        email_task: Celery email task (e.g., send_reminder_email_task)
+        calls: Keyword arguments for each email
+    """
+    if not calls:
+        return
+
+    try:
+        group(email_task.s(**kwargs) for kwargs in calls).apply_async()
+    except Exception as e:
+        logger.error(f"Failed to queue {len(calls)} {email_task.name} emails: {str(e)}")
+
+
+def save_notifications(db, batcher, errors: list[str]) -> bool:
+    """
+    Write the notifications a reminder loop queued, with one INSERT and one commit.
+
+    Args:
+        db: Database session
+        batcher: NotificationBatcher the loop's notify_* calls queued rows on
+        errors: Error list of the running task, extended on failure
+
+    Returns:
+        True if the notifications were saved (or queued for persistence)
+    """
+    count = len(batcher.rows)
+    try:
+        batcher.flush(db)
+        return True
+    except Exception as e:
+        error_msg = f"Error saving {count} notifications: {str(e)}"
+        logger.error(error_msg)
+        errors.append(error_msg)
+        db.rollback()
+        return False
+
+
+def shard_criteria(tenant_column, shard: int, shard_count: int) -> list:
+    """
+    Filter expressions restricting a reminder query to one tenant shard.
+
+    Tenants are assigned to shards by hashtext(tenant_id) % shard_count, so
+    every tenant's rows are handled by exactly one shard.
+
+    Args:
+        tenant_column: tenant_id column of the queried model
+        shard: Shard index (0 <= shard < shard_count)
+        shard_count: Total number of shards (1 = no sharding)
+
+    Returns:
+        List of filter expressions (empty when not sharded)
+    """
+    if shard_count <= 1:
+        return []
+
+    return [func.abs(cast(func.hashtext(cast(tenant_column, String)), BigInteger)) % shard_count == shard]
+
+
+@celery_app.task
+def dispatch_reminder_shards(task_name: str):
+    """
+    Fan a scheduled reminder task out over REMINDER_SHARD_COUNT tenant shards.
+
+    Each shard runs as its own task on queue reminders_<shard>, so separate
+    workers process disjoint sets of tenants in parallel. With one shard the
+    task is simply queued on the notifications queue.
+
+    Args:
+        task_name: Registered name of the reminder task (e.g. send_t3_reminders)
+
+    Returns:
+        dict: Number of shards dispatched
+    """
+    shard_count = max(settings.REMINDER_SHARD_COUNT, 1)
+    task = celery_app.tasks[task_name]
+
+    if shard_count == 1:
+        task.apply_async(args=(0, 1))
+    else:
+        group(task.s(shard, shard_count).set(queue=f"reminders_{shard}") for shard in range(shard_count)).apply_async()
+
+    logger.info(f"Dispatched {task_name} over {shard_count} shard(s)")
+
+    return {"status": "success", "shards": shard_count}
+
+
+def _with_owner_candidates(query):
+    """
+    Join an instance query to its owner candidates, best candidate first.
+
+    Owner priority: an active user holding the master's owner_role_code with
+    access to the entity, else any active user with entity access. DISTINCT
+    ON keeps the preferred candidate per instance (User is NULL when nobody
+    qualifies).
+    """
+    return (
+        query.join(ComplianceMaster, ComplianceMaster.id == ComplianceInstance.compliance_master_id)
+        .outerjoin(entity_access, entity_access.c.entity_id == ComplianceInstance.entity_id)
+        .outerjoin(User, and_(User.id == entity_access.c.user_id, User.status == "active"))
+        .outerjoin(Role, Role.role_code == ComplianceMaster.owner_role_code)
+        .outerjoin(user_roles, and_(user_roles.c.user_id == User.id, user_roles.c.role_id == Role.id))
+        .distinct(ComplianceInstance.id)
+        .order_by(ComplianceInstance.id, user_roles.c.role_id.is_(None), User.id.is_(None))
+    )
+
+
+def get_instance_owners_bulk(db, instance_ids) -> dict[UUID, User]:
+    """
+    Get the owner of several compliance instances in one query.
+
+    Args:
+        db: Database session
+        instance_ids: ComplianceInstance UUIDs
+
+    Returns:
+        Dict of instance_id -> owner User (instances without one are omitted)
+    """
+    if not instance_ids:
+        return {}
+
+    rows = _with_owner_candidates(
+        db.query(ComplianceInstance.id, User).filter(ComplianceInstance.id.in_(list(instance_ids)))
+    ).all()
+
+    return {instance_id: user for instance_id, user in rows if user is not None}
+
 
 def get_instance_owner(db, instance: ComplianceInstance) -> Optional[User]:
     """
@@ -41,39 +192,84 @@ def get_instance_owner(db, instance: ComplianceInstance) -> Optional[User]:
     1. User with owner_role_code and entity access
     2. Any user with entity access
     """
-    if not instance.compliance_master:
-        return None
+    return get_instance_owners_bulk(db, [instance.id]).get(instance.id)
 
-    owner_role_code = instance.compliance_master.owner_role_code
 
-    if owner_role_code:
-        # Find user with this role who has access to the entity
-        role = db.query(Role).filter(Role.role_code == owner_role_code).first()
-        if role:
-            user = (
-                db.query(User)
-                .join(user_roles, User.id == user_roles.c.user_id)
-                .join(entity_access, User.id == entity_access.c.user_id)
-                .filter(
-                    user_roles.c.role_id == role.id,
-                    entity_access.c.entity_id == instance.entity_id,
-                    User.status == "active",
-                )
-                .first()
-            )
+def get_instances_with_owners(db, *criteria) -> list[tuple[ComplianceInstance, Optional[User]]]:
+    """
+    Load instances matching criteria, each paired with its owner, in one query.
+
+    Args:
+        db: Database session
+        *criteria: Filter expressions on ComplianceInstance
 
-            if user:
-                return user
+    Returns:
+        List of (instance, owner) pairs; owner is None when nobody qualifies
+    """
+    return _with_owner_candidates(
+        db.query(ComplianceInstance, User).options(*INSTANCE_NOTIFY_OPTIONS).filter(*criteria)
+    ).all()
+
+
+def _role_id_by_code(db, role_code: str) -> Optional[UUID]:
+    """
+    Get a role's id by code.
 
-    # Fallback: any active user with entity access
-    user = (
-        db.query(User)
-        .join(entity_access, User.id == entity_access.c.user_id)
-        .filter(entity_access.c.entity_id == instance.entity_id, User.status == "active")
-        .first()
+    Roles are static reference data, so ids found are cached for the life of
+    the worker process (missing roles are looked up again next time).
+    """
+    role_id = _ROLE_IDS.get(role_code)
+    if role_id is None:
+        role_id = db.query(Role.id).filter(Role.role_code == role_code).scalar()
+        if role_id is not None:
+            _ROLE_IDS[role_code] = role_id
+    return role_id
+
+
+def _escalation_role_ranks(db) -> dict[UUID, int]:
+    """Map escalation role ids to their preference rank (0 = most preferred)."""
+    role_ranks = {}
+    for rank, role_code in enumerate(ESCALATION_ROLE_CODES):
+        role_id = _role_id_by_code(db, role_code)
+        if role_id is not None:
+            role_ranks[role_id] = rank
+    return role_ranks
+
+
+def get_escalation_users(db, tenant_ids) -> dict[UUID, User]:
+    """
+    Get the user to escalate to (CFO, else Admin) for several tenants in one query.
+
+    Args:
+        db: Database session
+        tenant_ids: Tenant UUIDs
+
+    Returns:
+        Dict of tenant_id -> escalation User (tenants without one are omitted)
+    """
+    role_ranks = _escalation_role_ranks(db)
+
+    if not role_ranks or not tenant_ids:
+        return {}
+
+    candidates = (
+        db.query(User, user_roles.c.role_id)
+        .join(user_roles, User.id == user_roles.c.user_id)
+        .filter(
+            user_roles.c.role_id.in_(list(role_ranks)),
+            User.tenant_id.in_(list(tenant_ids)),
+            User.status == "active",
+        )
+        .all()
     )
 
-    return user
+    best = {}
+    for user, role_id in candidates:
+        rank = role_ranks[role_id]
+        if user.tenant_id not in best or rank < best[user.tenant_id][0]:
+            best[user.tenant_id] = (rank, user)
+
+    return {tenant_id: user for tenant_id, (_, user) in best.items()}
 
 
 def get_escalation_user(db, tenant_id: UUID) -> Optional[User]:
@@ -84,289 +280,374 @@ def get_escalation_user(db, tenant_id: UUID) -> Optional[User]:
     1. User with CFO role
     2. User with ADMIN role
     """
-    # Try CFO first
-    cfo_role = db.query(Role).filter(Role.role_code == "CFO").first()
-    if cfo_role:
-        cfo = (
-            db.query(User)
-            .join(user_roles, User.id == user_roles.c.user_id)
-            .filter(user_roles.c.role_id == cfo_role.id, User.tenant_id == tenant_id, User.status == "active")
-            .first()
-        )
-        if cfo:
-            return cfo
-
-    # Fallback to Admin
-    admin_role = db.query(Role).filter(Role.role_code == "ADMIN").first()
-    if admin_role:
-        admin = (
-            db.query(User)
-            .join(user_roles, User.id == user_roles.c.user_id)
-            .filter(user_roles.c.role_id == admin_role.id, User.tenant_id == tenant_id, User.status == "active")
-            .first()
-        )
-        if admin:
-            return admin
+    return get_escalation_users(db, [tenant_id]).get(tenant_id)
 
-    return None
+
+def get_instances_with_escalation_users(
+    db, *criteria, skip_locked: bool = False
+) -> list[tuple[ComplianceInstance, Optional[User]]]:
+    """
+    Load instances matching criteria, each paired with its tenant's escalation user.
+
+    The escalation user (CFO, else Admin) is picked per tenant by a DISTINCT ON
+    subquery joined to the instances, so one statement serves every tenant.
+
+    Args:
+        db: Database session
+        *criteria: Filter expressions on ComplianceInstance
+        skip_locked: Lock the instance rows (FOR UPDATE OF ... SKIP LOCKED) so
+                     concurrent runs work on disjoint rows until the caller commits
+
+    Returns:
+        List of (instance, escalation user) pairs; user is None when the tenant has none
+    """
+    role_ranks = _escalation_role_ranks(db)
+    if not role_ranks:
+        query = db.query(ComplianceInstance).options(*INSTANCE_NOTIFY_OPTIONS).filter(*criteria)
+        if skip_locked:
+            query = query.with_for_update(skip_locked=True, of=ComplianceInstance)
+        return [(instance, None) for instance in query.all()]
+
+    escalation_users = (
+        db.query(User.tenant_id.label("tenant_id"), User.id.label("user_id"))
+        .join(user_roles, User.id == user_roles.c.user_id)
+        .filter(user_roles.c.role_id.in_(list(role_ranks)), User.status == "active")
+        .distinct(User.tenant_id)
+        .order_by(User.tenant_id, case(role_ranks, value=user_roles.c.role_id))
+        .subquery()
+    )
+
+    query = (
+        db.query(ComplianceInstance, User)
+        .options(*INSTANCE_NOTIFY_OPTIONS)
+        .outerjoin(escalation_users, escalation_users.c.tenant_id == ComplianceInstance.tenant_id)
+        .outerjoin(User, User.id == escalation_users.c.user_id)
+        .filter(*criteria)
+    )
+    if skip_locked:
+        # Only the instances are locked; users sit on the nullable side of the outer join
+        query = query.with_for_update(skip_locked=True, of=ComplianceInstance)
+    return query.all()
 
 
 @celery_app.task(bind=True, max_retries=3)
-def send_t3_reminders(self):
+def send_t3_reminders(self, shard: int = 0, shard_count: int = 1):
     """
     Send reminders for compliance items due in 3 days.
 
     Runs daily at 9 AM IST.
 
     Process:
-    1. Find all non-completed instances with due_date = today + 3 days
-    2. Get owner for each instance
-    3. Create in-app notification
+    1. Find all non-completed instances with due_date = today + 3 days,
+       paired with their owners in one query
+    2. Create in-app notification
+
+    Args:
+        shard: Tenant shard to process (see dispatch_reminder_shards)
+        shard_count: Total number of shards (1 = all tenants)
 
     Returns:
         dict: Summary of reminders sent
     """
     logger.info("Starting T-3 day reminder task")
 
-    db = SessionLocal()
     reminders_sent = 0
     errors = []
+    pending_emails = []
 
     try:
-        today = date.today()
-        t3_date = today + timedelta(days=3)
-
-        # Find instances due in 3 days
-        instances = (
-            db.query(ComplianceInstance)
-            .filter(ComplianceInstance.due_date == t3_date, ComplianceInstance.status.notin_(["Completed", "Overdue"]))
-            .all()
-        )
-
-        logger.info(f"Found {len(instances)} instances due in 3 days")
-
-        for instance in instances:
-            try:
-                owner = get_instance_owner(db, instance)
-                if owner:
-                    notification = notify_reminder_t3(db, instance, owner)
-                    if notification:
-                        reminders_sent += 1
-                        logger.debug(f"Sent T-3 reminder for instance {instance.id} " f"to user {owner.email}")
-                        # Queue email notification
-                        send_reminder_email_task.delay(
-                            user_id=str(owner.id),
-                            instance_id=str(instance.id),
-                            reminder_type="t3",
-                        )
-                else:
-                    logger.warning(f"No owner found for instance {instance.id}, " f"skipping T-3 reminder")
-
-            except Exception as e:
-                error_msg = f"Error sending T-3 reminder for instance {instance.id}: {str(e)}"
-                logger.error(error_msg)
-                errors.append(error_msg)
-
-        logger.info(f"T-3 reminder task complete. Sent: {reminders_sent}")
+        with SessionLocal() as db:
+            today = date.today()
+            t3_date = today + timedelta(days=3)
+
+            # Find instances due in 3 days, with their owners
+            instances = get_instances_with_owners(
+                db,
+                ComplianceInstance.due_date == t3_date,
+                ComplianceInstance.status.notin_(OVERDUE_EXEMPT_STATUSES),
+                *shard_criteria(ComplianceInstance.tenant_id, shard, shard_count),
+            )
 
-        return {
-            "status": "success",
-            "reminders_sent": reminders_sent,
-            "instances_found": len(instances),
-            "errors": errors if errors else None,
-        }
+            logger.info(f"Found {len(instances)} instances due in 3 days")
+
+            # Nothing due (the usual case): end the run without further round-trips
+            if not instances:
+                return {"status": "success", "reminders_sent": 0, "instances_found": 0, "errors": None}
+
+            # Notifications are queued and written with one INSERT after the loop
+            with batch_notifications() as batcher:
+                for instance, owner in instances:
+                    try:
+                        if owner:
+                            notification = notify_reminder_t3(db, instance, owner)
+                            if notification:
+                                reminders_sent += 1
+                                logger.debug(f"Sent T-3 reminder for instance {instance.id} " f"to user {owner.email}")
+                                pending_emails.append(
+                                    {"user_id": owner.id, "instance_id": instance.id, "reminder_type": "t3"}
+                                )
+                        else:
+                            logger.warning(f"No owner found for instance {instance.id}, " f"skipping T-3 reminder")
+
+                    except Exception as e:
+                        error_msg = f"Error sending T-3 reminder for instance {instance.id}: {str(e)}"
+                        logger.error(error_msg)
+                        errors.append(error_msg)
+
+            if not save_notifications(db, batcher, errors):
+                reminders_sent, pending_emails = 0, []
+
+            # Queue all emails in one batch
+            enqueue_emails(send_reminder_email_task, pending_emails)
+
+            logger.info(f"T-3 reminder task complete. Sent: {reminders_sent}")
+
+            return {
+                "status": "success",
+                "reminders_sent": reminders_sent,
+                "instances_found": len(instances),
+                "errors": errors if errors else None,
+            }
 
     except Exception as e:
         logger.error(f"Critical error in send_t3_reminders: {str(e)}")
         raise self.retry(exc=e, countdown=60 * (2**self.request.retries))
 
-    finally:
-        db.close()
-
 
 @celery_app.task(bind=True, max_retries=3)
-def send_due_date_reminders(self):
+def send_due_date_reminders(self, shard: int = 0, shard_count: int = 1):
     """
     Send reminders for compliance items due today.
 
     Runs daily at 9:30 AM IST.
 
     Process:
-    1. Find all non-completed instances with due_date = today
-    2. Get owner for each instance
-    3. Create in-app notification for owner
+    1. Find all non-completed instances with due_date = today,
+       paired with their owners in one query
+    2. Create in-app notification for owner
+
+    Args:
+        shard: Tenant shard to process (see dispatch_reminder_shards)
+        shard_count: Total number of shards (1 = all tenants)
 
     Returns:
         dict: Summary of reminders sent
     """
     logger.info("Starting due date reminder task")
 
-    db = SessionLocal()
     reminders_sent = 0
     errors = []
+    pending_emails = []
 
     try:
-        today = date.today()
-
-        # Find instances due today
-        instances = (
-            db.query(ComplianceInstance)
-            .filter(ComplianceInstance.due_date == today, ComplianceInstance.status.notin_(["Completed"]))
-            .all()
-        )
-
-        logger.info(f"Found {len(instances)} instances due today")
-
-        for instance in instances:
-            try:
-                owner = get_instance_owner(db, instance)
-                if owner:
-                    notification = notify_reminder_due(db, instance, owner)
-                    if notification:
-                        reminders_sent += 1
-                        logger.debug(f"Sent due date reminder for instance {instance.id} " f"to user {owner.email}")
-                        # Queue email notification
-                        send_reminder_email_task.delay(
-                            user_id=str(owner.id),
-                            instance_id=str(instance.id),
-                            reminder_type="due",
-                        )
-                else:
-                    logger.warning(f"No owner found for instance {instance.id}, " f"skipping due date reminder")
-
-            except Exception as e:
-                error_msg = f"Error sending due date reminder for instance {instance.id}: {str(e)}"
-                logger.error(error_msg)
-                errors.append(error_msg)
-
-        logger.info(f"Due date reminder task complete. Sent: {reminders_sent}")
+        with SessionLocal() as db:
+            today = date.today()
+
+            # Find instances due today, with their owners
+            instances = get_instances_with_owners(
+                db,
+                ComplianceInstance.due_date == today,
+                ComplianceInstance.status.notin_(REMINDER_EXEMPT_STATUSES),
+                *shard_criteria(ComplianceInstance.tenant_id, shard, shard_count),
+            )
 
-        return {
-            "status": "success",
-            "reminders_sent": reminders_sent,
-            "instances_found": len(instances),
-            "errors": errors if errors else None,
-        }
+            logger.info(f"Found {len(instances)} instances due today")
+
+            # Nothing due (the usual case): end the run without further round-trips
+            if not instances:
+                return {"status": "success", "reminders_sent": 0, "instances_found": 0, "errors": None}
+
+            # Notifications are queued and written with one INSERT after the loop
+            with batch_notifications() as batcher:
+                for instance, owner in instances:
+                    try:
+                        if owner:
+                            notification = notify_reminder_due(db, instance, owner)
+                            if notification:
+                                reminders_sent += 1
+                                logger.debug(
+                                    f"Sent due date reminder for instance {instance.id} " f"to user {owner.email}"
+                                )
+                                pending_emails.append(
+                                    {"user_id": owner.id, "instance_id": instance.id, "reminder_type": "due"}
+                                )
+                        else:
+                            logger.warning(f"No owner found for instance {instance.id}, " f"skipping due date reminder")
+
+                    except Exception as e:
+                        error_msg = f"Error sending due date reminder for instance {instance.id}: {str(e)}"
+                        logger.error(error_msg)
+                        errors.append(error_msg)
+
+            if not save_notifications(db, batcher, errors):
+                reminders_sent, pending_emails = 0, []
+
+            # Queue all emails in one batch
+            enqueue_emails(send_reminder_email_task, pending_emails)
+
+            logger.info(f"Due date reminder task complete. Sent: {reminders_sent}")
+
+            return {
+                "status": "success",
+                "reminders_sent": reminders_sent,
+                "instances_found": len(instances),
+                "errors": errors if errors else None,
+            }
 
     except Exception as e:
         logger.error(f"Critical error in send_due_date_reminders: {str(e)}")
         raise self.retry(exc=e, countdown=60 * (2**self.request.retries))
 
-    finally:
-        db.close()
+
+def mark_escalated(db, escalated_ids: dict[UUID, list[UUID]], today: date) -> None:
+    """
+    Record escalations in the instances' meta_data (the caller commits).
+
+    Merges the escalation keys into the existing JSONB with ``||`` in a
+    single UPDATE per escalation user (one per tenant), instead of loading,
+    rewriting and committing each instance.
+
+    Args:
+        db: Database session
+        escalated_ids: Escalation user ID -> IDs of the instances escalated to them
+        today: Escalation date
+    """
+    if not escalated_ids:
+        return
+
+    for user_id, instance_ids in escalated_ids.items():
+        patch = {"escalated": True, "escalated_at": str(today), "escalated_to": str(user_id)}
+        db.execute(
+            update(ComplianceInstance)
+            .where(ComplianceInstance.id.in_(instance_ids))
+            .values(meta_data=func.coalesce(ComplianceInstance.meta_data, cast({}, JSONB)).op("||")(cast(patch, JSONB)))
+            .execution_options(synchronize_session=False)
+        )
 
 
 @celery_app.task(bind=True, max_retries=3)
-def escalate_overdue_items(self):
+def escalate_overdue_items(self, shard: int = 0, shard_count: int = 1):
     """
     Escalate items overdue by 3+ days to CFO.
 
     Runs daily at 10 AM IST.
 
     Process:
-    1. Find instances overdue by 3+ days that haven't been escalated
-    2. Get CFO/Admin user for tenant
-    3. Create escalation notification
-    4. Mark instance as escalated to prevent duplicate notifications
+    1. Find instances overdue by 3+ days that haven't been escalated,
+       paired with their tenant's CFO/Admin user in one query, locking them
+       with SKIP LOCKED so overlapping runs never escalate the same row
+    2. Create escalation notification
+    3. Mark instance as escalated to prevent duplicate notifications
+
+    Args:
+        shard: Tenant shard to process (see dispatch_reminder_shards)
+        shard_count: Total number of shards (1 = all tenants)
 
     Returns:
         dict: Summary of escalations sent
     """
     logger.info("Starting overdue escalation task")
 
-    db = SessionLocal()
     escalations_sent = 0
     errors = []
+    pending_emails = []
 
     try:
-        today = date.today()
-        escalation_threshold = today - timedelta(days=3)
-
-        # Find instances overdue by 3+ days
-        # Use metadata to track escalation status
-        overdue_instances = (
-            db.query(ComplianceInstance)
-            .filter(
-                ComplianceInstance.due_date <= escalation_threshold, ComplianceInstance.status.notin_(["Completed"])
+        with SessionLocal() as db:
+            today = date.today()
+            escalation_threshold = today - timedelta(days=3)
+
+            # Find instances overdue by 3+ days and not yet escalated (flag kept in
+            # meta_data), with their tenant's escalation user
+            overdue_instances = get_instances_with_escalation_users(
+                db,
+                ComplianceInstance.due_date <= escalation_threshold,
+                ComplianceInstance.status.notin_(REMINDER_EXEMPT_STATUSES),
+                ComplianceInstance.meta_data["escalated"].astext.is_(None),
+                *shard_criteria(ComplianceInstance.tenant_id, shard, shard_count),
+                skip_locked=True,
             )
-            .all()
-        )
 
-        logger.info(f"Found {len(overdue_instances)} instances overdue by 3+ days")
+            logger.info(f"Found {len(overdue_instances)} instances overdue by 3+ days")
+
+            # Nothing to escalate: end the run without the trailing UPDATE/COMMIT
+            if not overdue_instances:
+                return {"status": "success", "escalations_sent": 0, "overdue_instances_found": 0, "errors": None}
+
+            # Instances to mark as escalated, grouped by escalation user
+            escalated_ids: dict[UUID, list[UUID]] = {}
+
+            # Notifications are queued and written with one INSERT after the loop
+            with batch_notifications() as batcher:
+                for instance, escalate_to in overdue_instances:
+                    try:
+                        # Calculate days overdue
+                        days_overdue = (today - instance.due_date).days
+
+                        if escalate_to:
+                            notification = notify_overdue_escalation(db, instance, escalate_to, days_overdue)
+                            if notification:
+                                escalated_ids.setdefault(escalate_to.id, []).append(instance.id)
+
+                                escalations_sent += 1
+                                logger.debug(
+                                    f"Escalated instance {instance.id} "
+                                    f"({days_overdue} days overdue) to {escalate_to.email}"
+                                )
+                                pending_emails.append(
+                                    {
+                                        "user_id": escalate_to.id,
+                                        "instance_id": instance.id,
+                                        "days_overdue": days_overdue,
+                                    }
+                                )
+                        else:
+                            logger.warning(
+                                f"No escalation user found for tenant {instance.tenant_id}, "
+                                f"skipping escalation for instance {instance.id}"
+                            )
 
-        # Group by tenant for escalation user lookup
-        tenant_escalation_users = {}
+                    except Exception as e:
+                        error_msg = f"Error escalating instance {instance.id}: {str(e)}"
+                        logger.error(error_msg)
+                        errors.append(error_msg)
 
-        for instance in overdue_instances:
+            # Flag the escalations (one UPDATE per escalation user) and commit,
+            # which releases the row locks, before any notification is written or
+            # handed to Celery: a failed commit must not leave notifications behind
             try:
-                # Check if already escalated (using metadata field)
-                metadata = instance.metadata or {}
-                if metadata.get("escalated"):
-                    continue
-
-                # Calculate days overdue
-                days_overdue = (today - instance.due_date).days
-
-                # Get escalation user for tenant
-                tenant_id = instance.tenant_id
-                if tenant_id not in tenant_escalation_users:
-                    tenant_escalation_users[tenant_id] = get_escalation_user(db, tenant_id)
-
-                escalate_to = tenant_escalation_users.get(tenant_id)
-
-                if escalate_to:
-                    notification = notify_overdue_escalation(db, instance, escalate_to, days_overdue)
-                    if notification:
-                        # Mark as escalated
-                        instance.metadata = {
-                            **(instance.metadata or {}),
-                            "escalated": True,
-                            "escalated_at": str(today),
-                            "escalated_to": str(escalate_to.id),
-                        }
-                        db.commit()
-
-                        escalations_sent += 1
-                        logger.debug(
-                            f"Escalated instance {instance.id} " f"({days_overdue} days overdue) to {escalate_to.email}"
-                        )
-                        # Queue escalation email
-                        send_escalation_email_task.delay(
-                            user_id=str(escalate_to.id),
-                            instance_id=str(instance.id),
-                            days_overdue=days_overdue,
-                        )
-                else:
-                    logger.warning(
-                        f"No escalation user found for tenant {tenant_id}, "
-                        f"skipping escalation for instance {instance.id}"
-                    )
-
+                mark_escalated(db, escalated_ids, today)
+                db.commit()
             except Exception as e:
-                error_msg = f"Error escalating instance {instance.id}: {str(e)}"
+                error_msg = f"Error marking instances as escalated: {str(e)}"
                 logger.error(error_msg)
                 errors.append(error_msg)
                 db.rollback()
+                batcher.discard()
+                escalations_sent, pending_emails = 0, []
+            else:
+                if not save_notifications(db, batcher, errors):
+                    escalations_sent, pending_emails = 0, []
+
+            # Queue all emails in one batch
+            enqueue_emails(send_escalation_email_task, pending_emails)
 
-        logger.info(f"Escalation task complete. Escalated: {escalations_sent}")
+            logger.info(f"Escalation task complete. Escalated: {escalations_sent}")
 
-        return {
-            "status": "success",
-            "escalations_sent": escalations_sent,
-            "overdue_instances_found": len(overdue_instances),
-            "errors": errors if errors else None,
-        }
+            return {
+                "status": "success",
+                "escalations_sent": escalations_sent,
+                "overdue_instances_found": len(overdue_instances),
+                "errors": errors if errors else None,
+            }
 
     except Exception as e:
         logger.error(f"Critical error in escalate_overdue_items: {str(e)}")
         raise self.retry(exc=e, countdown=60 * (2**self.request.retries))
 
-    finally:
-        db.close()
-
 
 @celery_app.task(bind=True, max_retries=3)
-def send_task_reminders(self):
+def send_task_reminders(self, shard: int = 0, shard_count: int = 1):
     """
     Send reminders for workflow tasks due soon.
 
@@ -377,88 +658,101 @@ def send_task_reminders(self):
     2. Notify assigned user
     3. Create in-app notification
 
+    Args:
+        shard: Tenant shard to process (see dispatch_reminder_shards)
+        shard_count: Total number of shards (1 = all tenants)
+
     Returns:
         dict: Summary of task reminders sent
     """
     logger.info("Starting workflow task reminder task")
 
-    db = SessionLocal()
     reminders_sent = 0
     errors = []
+    pending_emails = []
 
     try:
-        today = date.today()
-        reminder_date = today + timedelta(days=2)
-
-        # Find tasks due soon
-        tasks = (
-            db.query(WorkflowTask)
-            .filter(
-                WorkflowTask.due_date <= reminder_date,
-                WorkflowTask.due_date >= today,
-                WorkflowTask.status.in_(["Pending", "In Progress"]),
+        with SessionLocal() as db:
+            today = date.today()
+            reminder_date = today + timedelta(days=2)
+
+            # Find tasks due soon
+            tasks = (
+                db.query(WorkflowTask)
+                .filter(
+                    WorkflowTask.due_date <= reminder_date,
+                    WorkflowTask.due_date >= today,
+                    WorkflowTask.status.in_(ACTIVE_TASK_STATUSES),
+                    *shard_criteria(WorkflowTask.tenant_id, shard, shard_count),
+                )
+                .all()
             )
-            .all()
-        )
 
-        logger.info(f"Found {len(tasks)} tasks due within 2 days")
+            logger.info(f"Found {len(tasks)} tasks due within 2 days")
 
-        from app.services.notification_service import create_notification, NotificationType
+            # Nothing due: end the run without the user lookup or notification insert
+            if not tasks:
+                return {"status": "success", "reminders_sent": 0, "tasks_found": 0, "errors": None}
 
-        for task in tasks:
-            try:
-                # Get assigned user
-                if task.assigned_to_user_id:
-                    user = db.query(User).filter(User.id == task.assigned_to_user_id).first()
-
-                    if user:
-                        days_until_due = (task.due_date - today).days
-                        message = (
-                            f"Task '{task.task_name}' is due "
-                            f"{'today' if days_until_due == 0 else f'in {days_until_due} day(s)'}. "
-                            f"Please complete it before the deadline."
-                        )
-
-                        notification = create_notification(
-                            db=db,
-                            user_id=user.id,
-                            tenant_id=task.tenant_id,
-                            notification_type=NotificationType.REMINDER_DUE,
-                            title=f"Task due soon: {task.task_name}",
-                            message=message,
-                            link=f"/compliance-instances/{task.compliance_instance_id}",
-                        )
-
-                        if notification:
-                            reminders_sent += 1
-                            # Queue email notification
-                            send_task_reminder_email_task.delay(
-                                user_id=str(user.id),
-                                task_id=str(task.id),
-                                days_until_due=days_until_due,
-                            )
+            from app.services.notification_service import create_notifications_bulk, NotificationType
+
+            # Load every assigned user in one query instead of one per task
+            user_ids = {task.assigned_to_user_id for task in tasks if task.assigned_to_user_id}
+            users_by_id = {}
+            if user_ids:
+                users_by_id = {user.id: user for user in db.query(User).filter(User.id.in_(user_ids)).all()}
+
+            rows = []
+            for task in tasks:
+                user = users_by_id.get(task.assigned_to_user_id)
+                if not user:
+                    continue
+
+                days_until_due = (task.due_date - today).days
+                message = (
+                    f"Task '{task.task_name}' is due "
+                    f"{'today' if days_until_due == 0 else f'in {days_until_due} day(s)'}. "
+                    f"Please complete it before the deadline."
+                )
+                rows.append(
+                    {
+                        "user_id": user.id,
+                        "tenant_id": task.tenant_id,
+                        "notification_type": NotificationType.REMINDER_DUE,
+                        "title": f"Task due soon: {task.task_name}",
+                        "message": message,
+                        "link": f"/compliance-instances/{task.compliance_instance_id}",
+                        "is_read": False,
+                    }
+                )
+                pending_emails.append({"user_id": user.id, "task_id": task.id, "days_until_due": days_until_due})
 
+            # Create all in-app notifications with one multi-row INSERT
+            try:
+                reminders_sent = len(create_notifications_bulk(db, rows))
             except Exception as e:
-                error_msg = f"Error sending task reminder for task {task.id}: {str(e)}"
+                error_msg = f"Error creating {len(rows)} task reminder notifications: {str(e)}"
                 logger.error(error_msg)
                 errors.append(error_msg)
+                db.rollback()
+                pending_emails = []
+
+            # Queue all emails in one batch
+            enqueue_emails(send_task_reminder_email_task, pending_emails)
 
-        logger.info(f"Task reminder task complete. Sent: {reminders_sent}")
+            logger.info(f"Task reminder task complete. Sent: {reminders_sent}")
 
-        return {
-            "status": "success",
-            "reminders_sent": reminders_sent,
-            "tasks_found": len(tasks),
-            "errors": errors if errors else None,
-        }
+            return {
+                "status": "success",
+                "reminders_sent": reminders_sent,
+                "tasks_found": len(tasks),
+                "errors": errors if errors else None,
+            }
 
     except Exception as e:
         logger.error(f"Critical error in send_task_reminders: {str(e)}")
         raise self.retry(exc=e, countdown=60 * (2**self.request.retries))
 
-    finally:
-        db.close()
-
 
 @celery_app.task
 def cleanup_old_notifications():
@@ -472,22 +766,24 @@ def cleanup_old_notifications():
     """
     logger.info("Starting notification cleanup task")
 
-    db = SessionLocal()
-
     try:
         from app.services.notification_service import delete_old_notifications
 
-        tenants = db.query(Tenant).filter(Tenant.status == "active").all()
+        with SessionLocal() as db:
+            tenant_ids = [tenant_id for (tenant_id,) in db.query(Tenant.id).filter(Tenant.status == "active").all()]
+
         total_deleted = 0
 
-        for tenant in tenants:
-            try:
-                deleted = delete_old_notifications(db, tenant.id, days_old=90)
-                total_deleted += deleted
-                logger.debug(f"Deleted {deleted} old notifications for tenant {tenant.id}")
+        # One short-lived session per tenant so a slow purge doesn't pin a connection for the whole run
+        for tenant_id in tenant_ids:
+            with SessionLocal() as db:
+                try:
+                    deleted = delete_old_notifications(db, tenant_id, days_old=90)
+                    total_deleted += deleted
+                    logger.debug(f"Deleted {deleted} old notifications for tenant {tenant_id}")
 
-            except Exception as e:
-                logger.error(f"Error cleaning up notifications for tenant {tenant.id}: {str(e)}")
+                except Exception as e:
+                    logger.error(f"Error cleaning up notifications for tenant {tenant_id}: {str(e)}")
 
         logger.info(f"Notification cleanup complete. Deleted: {total_deleted}")
 
@@ -496,6 +792,3 @@ def cleanup_old_notifications():
     except Exception as e:
         logger.error(f"Error in cleanup_old_notifications: {str(e)}")
         return {"status": "error", "message": str(e)}
-
-    finally:
-        db.close()
@@ -3,6 +3,8 @@ Create a test user for manual testing
 Run this script to create a test user that you can use to login to the application.
 """
 
+from sqlalchemy.dialects.postgresql import insert
+
 from app.core.database import SessionLocal
 from app.models import Tenant, User, Role, user_roles, Entity, entity_access
 from app.core.security import get_password_hash
@@ -37,11 +39,10 @@ def create_test_data():
 
         # 2. Get or create roles
         print("\n2. Getting system roles...")
-        cfo_role = db.query(Role).filter(Role.role_code == "CFO").first()
-        system_admin_role = db.query(Role).filter(Role.role_code == "SYSTEM_ADMIN").first()
-        tax_lead_role = db.query(Role).filter(Role.role_code == "TAX_LEAD").first()
+        role_codes = ("CFO", "SYSTEM_ADMIN", "TAX_LEAD")
+        roles = {role.role_code: role for role in db.query(Role).filter(Role.role_code.in_(role_codes)).all()}
 
-        if not cfo_role or not system_admin_role or not tax_lead_role:
+        if not all(code in roles for code in role_codes):
             print("   ⚠️  System roles not found. Please run seed script first:")
             print("      cd backend && python -m app.seeds.run_seed")
             return
@@ -59,7 +60,7 @@ def create_test_data():
                 "first_name": "System",
                 "last_name": "Admin",
                 "password": "Admin123!",  # pragma: allowlist secret
-                "role": system_admin_role,
+                "role": roles["SYSTEM_ADMIN"],
                 "role_name": "System Admin",
             },
             {
@@ -67,7 +68,7 @@ def create_test_data():
                 "first_name": "Chief",
                 "last_name": "Financial Officer",
                 "password": "CFO12345!",  # pragma: allowlist secret
-                "role": cfo_role,
+                "role": roles["CFO"],
                 "role_name": "CFO",
             },
             {
@@ -75,14 +76,20 @@ def create_test_data():
                 "first_name": "Tax",
                 "last_name": "Lead",
                 "password": "Tax12345!",  # pragma: allowlist secret
-                "role": tax_lead_role,
+                "role": roles["TAX_LEAD"],
                 "role_name": "Tax Lead",
             },
         ]
 
+        existing_users = {
+            user.email: user
+            for user in db.query(User).filter(User.email.in_([u["email"] for u in users_to_create])).all()
+        }
+
         created_users = []
+        new_users = []
         for user_data in users_to_create:
-            existing_user = db.query(User).filter(User.email == user_data["email"]).first()
+            existing_user = existing_users.get(user_data["email"])
             if existing_user:
                 print(f"   ⊘ User already exists: {user_data['email']}")
                 created_users.append(existing_user)
@@ -97,20 +104,24 @@ def create_test_data():
                 status="active",
                 is_system_admin=(user_data["role_name"] == "System Admin"),
             )
-            db.add(user)
+            new_users.append((user, user_data))
+            created_users.append(user)
+
+        if new_users:
+            # One flush inserts every new user in a single multi-row INSERT
+            db.add_all([user for user, _ in new_users])
             db.flush()
 
-            # Assign role
+            # Assign roles with one executemany INSERT
             db.execute(
-                user_roles.insert().values(
-                    user_id=user.id,
-                    role_id=user_data["role"].id,
-                    tenant_id=tenant.id,
-                )
+                user_roles.insert(),
+                [
+                    {"user_id": user.id, "role_id": user_data["role"].id, "tenant_id": tenant.id}
+                    for user, user_data in new_users
+                ],
             )
-
-            created_users.append(user)
-            print(f"   ✓ Created user: {user_data['email']} ({user_data['role_name']})")
+            for user, user_data in new_users:
+                print(f"   ✓ Created user: {user_data['email']} ({user_data['role_name']})")
 
         # 4. Create test entities
         print("\n4. Creating test entities...")
@@ -127,13 +138,20 @@ def create_test_data():
             },
         ]
 
+        existing_entities = {
+            entity.entity_code: entity
+            for entity in db.query(Entity)
+            .filter(
+                Entity.tenant_id == tenant.id,
+                Entity.entity_code.in_([e["entity_code"] for e in entities_to_create]),
+            )
+            .all()
+        }
+
         created_entities = []
+        new_entities = []
         for entity_data in entities_to_create:
-            existing_entity = (
-                db.query(Entity)
-                .filter(Entity.entity_code == entity_data["entity_code"], Entity.tenant_id == tenant.id)
-                .first()
-            )
+            existing_entity = existing_entities.get(entity_data["entity_code"])
             if existing_entity:
                 print(f"   ⊘ Entity already exists: {entity_data['entity_code']}")
                 created_entities.append(existing_entity)
@@ -146,31 +164,36 @@ def create_test_data():
                 entity_type=entity_data["entity_type"],
                 status="active",
             )
-            db.add(entity)
-            db.flush()
+            new_entities.append(entity)
             created_entities.append(entity)
-            print(f"   ✓ Created entity: {entity_data['entity_code']}")
+
+        if new_entities:
+            db.add_all(new_entities)
+            db.flush()
+            for entity in new_entities:
+                print(f"   ✓ Created entity: {entity.entity_code}")
 
         # 5. Grant entity access to all users
         print("\n5. Granting entity access...")
+        access_rows = [
+            {"user_id": user.id, "entity_id": entity.id, "tenant_id": tenant.id}
+            for user in created_users
+            for entity in created_entities
+        ]
+        # One multi-VALUES INSERT; existing grants hit the primary key and are skipped
+        granted = set()
+        if access_rows:
+            granted = set(
+                db.execute(
+                    insert(entity_access)
+                    .on_conflict_do_nothing(index_elements=["user_id", "entity_id"])
+                    .returning(entity_access.c.user_id, entity_access.c.entity_id),
+                    access_rows,
+                ).tuples()
+            )
         for user in created_users:
             for entity in created_entities:
-                # Check if access already exists
-                existing_access = db.execute(
-                    entity_access.select().where(
-                        entity_access.c.user_id == user.id,
-                        entity_access.c.entity_id == entity.id,
-                    )
-                ).first()
-
-                if not existing_access:
-                    db.execute(
-                        entity_access.insert().values(
-                            user_id=user.id,
-                            entity_id=entity.id,
-                            tenant_id=tenant.id,
-                        )
-                    )
+                if (user.id, entity.id) in granted:
                     print(f"   ✓ Granted {user.email} access to {entity.entity_code}")
 
         db.commit()
@@ -4,30 +4,51 @@ Pytest configuration and fixtures
 This file contains common test fixtures used across all tests.
 """
 
-import pytest
+import functools
 import os
-from fastapi.testclient import TestClient
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
-from sqlalchemy.pool import NullPool
 
-from app.main import app
-from app.core.database import get_db
-from app.models.base import Base
-from app.models.user import User
-from app.models.tenant import Tenant
-from app.models.role import Role
-from app.core.security import get_password_hash
+import pytest
+
+# Settings are read when app modules are imported, so these overrides must be
+# in the environment before the imports below (hence the E402 noqa)
+# Write notifications in-request (not via Celery) during tests
+os.environ.setdefault("SYNC_NOTIFICATIONS", "true")
+# Minimum bcrypt cost: hashes still verify, at a fraction of the CPU time
+os.environ.setdefault("BCRYPT_ROUNDS", "4")
+
+from fastapi.testclient import TestClient  # noqa: E402
+from sqlalchemy import create_engine, text  # noqa: E402
+from sqlalchemy.orm import sessionmaker  # noqa: E402
+
+from app.main import app  # noqa: E402
+from app.core.database import get_db, get_read_db  # noqa: E402
+from app.models.base import Base  # noqa: E402
+from app.models.user import User  # noqa: E402
+from app.models.tenant import Tenant  # noqa: E402
+from app.models.role import Role  # noqa: E402
+from app.core.security import get_password_hash, pwd_context  # noqa: E402
 
 
 # PostgreSQL test database URL
 # Use separate test database on your existing PostgreSQL server
 TEST_DATABASE_URL = os.getenv("TEST_DATABASE_URL", "postgresql://gopal@localhost:5432/compliance_os_test")
 
+# One schema per pytest-xdist worker (gw0, gw1, ...) so `pytest -n auto` runs
+# don't share tables; public stays on the path for extensions
+TEST_SCHEMA = f"test_{os.getenv('PYTEST_XDIST_WORKER', 'master')}"
+
 # Create test engine with PostgreSQL
 engine = create_engine(
     TEST_DATABASE_URL,
-    poolclass=NullPool,  # Don't pool connections in tests
+    connect_args={"options": f"-csearch_path={TEST_SCHEMA},public"},
+    # Reuse connections across tests; each test still rolls back its own transaction
+    pool_size=5,
+    max_overflow=10,
+    pool_pre_ping=True,
+    # INSERT executemany already uses multi-VALUES (insertmanyvalues);
+    # batch UPDATE/DELETE executemany through psycopg2's execute_batch too
+    executemany_mode="values_plus_batch",
+    executemany_batch_page_size=500,
     echo=False,  # Set to True for SQL debugging
 )
 
@@ -35,19 +56,51 @@ engine = create_engine(
 TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 
+@pytest.fixture(scope="session", autouse=True)
+def memoized_password_hashing():
+    """
+    Hash each distinct test password once per run.
+
+    Patches the shared CryptContext, so get_password_hash and
+    User.set_password both hit the cache. Test-only: every user created
+    with the same password shares one salt.
+    """
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(pwd_context, "hash", functools.lru_cache(maxsize=64)(pwd_context.hash))
+        yield
+
+
+@pytest.fixture(scope="session")
+def db_schema():
+    """
+    Create all tables once per test run and drop them at the end.
+    Yields the test engine for fixtures that seed committed data.
+    """
+    with engine.begin() as connection:
+        # Discard tables and rows left behind by an interrupted run
+        connection.execute(text(f"DROP SCHEMA IF EXISTS {TEST_SCHEMA} CASCADE"))
+        connection.execute(text(f"CREATE SCHEMA {TEST_SCHEMA}"))
+    # Create into the worker schema explicitly: with public on the search_path,
+    # create_all would skip any table that already exists in public
+    Base.metadata.create_all(bind=engine.execution_options(schema_translate_map={None: TEST_SCHEMA}))
+    yield engine
+    with engine.begin() as connection:
+        connection.execute(text(f"DROP SCHEMA IF EXISTS {TEST_SCHEMA} CASCADE"))
+    engine.dispose()
+
+
 @pytest.fixture(scope="function")
-def db_session():
+def db_session(db_schema):
     """
     Create a fresh database session for each test function.
-    Uses PostgreSQL test database with proper transaction rollback.
-    """
-    # Create all tables before test
-    Base.metadata.create_all(bind=engine)
 
-    # Create session
+    The session is bound to a connection whose outer transaction is rolled
+    back after the test. Commits made by the test (or the code under test)
+    only release a SAVEPOINT inside that transaction, so nothing persists.
+    """
     connection = engine.connect()
     transaction = connection.begin()
-    session = TestingSessionLocal(bind=connection)
+    session = TestingSessionLocal(bind=connection, join_transaction_mode="create_savepoint")
 
     try:
         yield session
@@ -55,12 +108,19 @@ def db_session():
         session.close()
         transaction.rollback()  # Rollback changes after each test
         connection.close()
-        # Clean up all tables after test
-        Base.metadata.drop_all(bind=engine)
+
+
+@pytest.fixture(scope="session")
+def app_client():
+    """
+    Start the app once per test run; the client fixture swaps the DB per test.
+    """
+    with TestClient(app) as test_client:
+        yield test_client
 
 
 @pytest.fixture(scope="function")
-def client(db_session):
+def client(app_client, db_session):
     """
     Create a test client with dependency injection.
     """
@@ -72,11 +132,13 @@ def client(db_session):
             pass
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
 
-    with TestClient(app) as test_client:
-        yield test_client
-
-    app.dependency_overrides.clear()
+    try:
+        yield app_client
+    finally:
+        app.dependency_overrides.clear()
+        app_client.cookies.clear()
 
 
 @pytest.fixture
@@ -3,8 +3,11 @@ Integration tests for authentication endpoints.
 Tests login, refresh, logout, and /me endpoints with real database.
 """
 
+import json
+
 import pytest
 from fastapi.testclient import TestClient
+from sqlalchemy import delete
 from sqlalchemy.orm import Session
 from uuid import uuid4
 
@@ -13,65 +16,100 @@ from app.models.tenant import Tenant
 from app.models.role import Role, user_roles
 from app.core.security import get_password_hash
 
+# Valid login for the seeded user, serialized once for every test that logs in
+LOGIN_BODY_BYTES = json.dumps({"email": "testuser@example.com", "password": "TestPassword123!"}).encode()
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+
+@pytest.fixture(scope="module")
+def seeded_tenant_with_user(db_schema):
+    """
+    Commit a tenant, role and user once for the module.
+
+    Each test's db_session rolls back its own changes (e.g. deactivating the
+    user), so the seeded rows are back in their original state for the next test.
+    """
+    with Session(db_schema) as session:
+        # Create tenant
+        tenant = Tenant(
+            tenant_name="Test Company",
+            tenant_code="TEST001",
+            contact_email="test@example.com",
+            status="active",
+        )
 
-@pytest.fixture
-def test_tenant_with_user(db_session):
-    """Create a test tenant with a user and role."""
-    # Create tenant
-    tenant = Tenant(
-        tenant_name="Test Company",
-        tenant_code="TEST001",
-        contact_email="test@example.com",
-        status="active",
-    )
-    db_session.add(tenant)
-    db_session.flush()
-
-    # Create role
-    role = Role(
-        role_code="CFO",
-        role_name="Chief Financial Officer",
-        description="Financial oversight and compliance approval",
-        is_system_role=True,
-    )
-    db_session.add(role)
-    db_session.flush()
-
-    # Create user
-    user = User(
-        tenant_id=tenant.id,
-        email="testuser@example.com",
-        first_name="Test",
-        last_name="User",
-        password_hash=get_password_hash("TestPassword123!"),
-        status="active",
-        is_system_admin=False,
-    )
-    db_session.add(user)
-    db_session.flush()
-
-    # Assign role to user (manually insert with tenant_id)
-    db_session.execute(
-        user_roles.insert().values(
-            user_id=user.id,
-            role_id=role.id,
+        # Create role
+        role = Role(
+            role_code="CFO",
+            role_name="Chief Financial Officer",
+            description="Financial oversight and compliance approval",
+            is_system_role=True,
+        )
+        session.add_all([tenant, role])
+        session.flush()
+
+        # Create user
+        user = User(
             tenant_id=tenant.id,
+            email="testuser@example.com",
+            first_name="Test",
+            last_name="User",
+            password_hash=get_password_hash("TestPassword123!"),
+            status="active",
+            is_system_admin=False,
         )
-    )
-    db_session.commit()
-    db_session.refresh(user)
+        session.add(user)
+        session.flush()
+
+        # Assign role to user (manually insert with tenant_id)
+        session.execute(
+            user_roles.insert().values(
+                user_id=user.id,
+                role_id=role.id,
+                tenant_id=tenant.id,
+            )
+        )
+        ids = {"tenant": tenant.id, "role": role.id, "user": user.id}
+        session.commit()
+
+    yield ids
+
+    with Session(db_schema) as session:
+        session.execute(delete(user_roles).where(user_roles.c.user_id == ids["user"]))
+        session.execute(delete(User).where(User.id == ids["user"]))
+        session.execute(delete(Role).where(Role.id == ids["role"]))
+        session.execute(delete(Tenant).where(Tenant.id == ids["tenant"]))
+        session.commit()
+
+
+@pytest.fixture
+def test_tenant_with_user(db_session, seeded_tenant_with_user):
+    """Load the seeded tenant, user and role into the test's session."""
+    return {
+        "tenant": db_session.get(Tenant, seeded_tenant_with_user["tenant"]),
+        "user": db_session.get(User, seeded_tenant_with_user["user"]),
+        "role": db_session.get(Role, seeded_tenant_with_user["role"]),
+    }
+
 
-    return {"tenant": tenant, "user": user, "role": role}
+@pytest.fixture
+def logged_in(client: TestClient, test_tenant_with_user):
+    """Log the seeded user in and return the login response body."""
+    response = client.post(
+        "/api/v1/auth/login",
+        content=LOGIN_BODY_BYTES,
+        headers=JSON_HEADERS,
+    )
+    assert response.status_code == 200
+    return response.json()
 
 
 def test_login_success(client: TestClient, test_tenant_with_user):
     """Test successful login with valid credentials."""
     response = client.post(
         "/api/v1/auth/login",
-        json={
-            "email": "testuser@example.com",
-            "password": "TestPassword123!",
-        },
+        content=LOGIN_BODY_BYTES,
+        headers=JSON_HEADERS,
     )
 
     assert response.status_code == 200
@@ -134,27 +172,17 @@ def test_login_inactive_user(client: TestClient, test_tenant_with_user, db_sessi
 
     response = client.post(
         "/api/v1/auth/login",
-        json={
-            "email": "testuser@example.com",
-            "password": "TestPassword123!",
-        },
+        content=LOGIN_BODY_BYTES,
+        headers=JSON_HEADERS,
     )
 
     assert response.status_code == 403
     assert "inactive" in response.json()["detail"].lower()
 
 
-def test_refresh_token_success(client: TestClient, test_tenant_with_user):
+def test_refresh_token_success(client: TestClient, logged_in):
     """Test successful token refresh with valid refresh token."""
-    # First login to get tokens
-    login_response = client.post(
-        "/api/v1/auth/login",
-        json={
-            "email": "testuser@example.com",
-            "password": "TestPassword123!",
-        },
-    )
-    login_data = login_response.json()
+    login_data = logged_in
     refresh_token = login_data["refresh_token"]
 
     # Use refresh token to get new access token
@@ -190,17 +218,9 @@ def test_refresh_token_invalid(client: TestClient, test_tenant_with_user):
     assert "Invalid or expired" in response.json()["detail"]
 
 
-def test_refresh_token_old_token_invalidated(client: TestClient, test_tenant_with_user):
+def test_refresh_token_old_token_invalidated(client: TestClient, logged_in):
     """Test that old refresh token is invalidated after refresh."""
-    # Login to get tokens
-    login_response = client.post(
-        "/api/v1/auth/login",
-        json={
-            "email": "testuser@example.com",
-            "password": "TestPassword123!",
-        },
-    )
-    old_refresh_token = login_response.json()["refresh_token"]
+    old_refresh_token = logged_in["refresh_token"]
 
     # Refresh token
     client.post(
@@ -217,17 +237,9 @@ def test_refresh_token_old_token_invalidated(client: TestClient, test_tenant_wit
     assert response.status_code == 401
 
 
-def test_logout_success(client: TestClient, test_tenant_with_user):
+def test_logout_success(client: TestClient, logged_in):
     """Test successful logout."""
-    # Login to get tokens
-    login_response = client.post(
-        "/api/v1/auth/login",
-        json={
-            "email": "testuser@example.com",
-            "password": "TestPassword123!",
-        },
-    )
-    tokens = login_response.json()
+    tokens = logged_in
 
     # Logout
     response = client.post(
@@ -248,17 +260,9 @@ def test_logout_success(client: TestClient, test_tenant_with_user):
     assert refresh_response.status_code == 401
 
 
-def test_get_me_success(client: TestClient, test_tenant_with_user):
+def test_get_me_success(client: TestClient, logged_in):
     """Test getting current user information."""
-    # Login to get access token
-    login_response = client.post(
-        "/api/v1/auth/login",
-        json={
-            "email": "testuser@example.com",
-            "password": "TestPassword123!",
-        },
-    )
-    access_token = login_response.json()["access_token"]
+    access_token = logged_in["access_token"]
 
     # Get current user info
     response = client.get(
@@ -295,19 +299,10 @@ def test_get_me_invalid_token(client: TestClient, test_tenant_with_user):
     assert response.status_code in [401, 403]  # Unauthorized or Forbidden
 
 
-def test_login_creates_audit_log(client: TestClient, test_tenant_with_user, db_session):
+def test_login_creates_audit_log(logged_in, test_tenant_with_user, db_session):
     """Test that login action is logged to audit trail."""
     from app.models.audit_log import AuditLog
 
-    # Login
-    client.post(
-        "/api/v1/auth/login",
-        json={
-            "email": "testuser@example.com",
-            "password": "TestPassword123!",
-        },
-    )
-
     # Check audit log was created
     audit_log = (
         db_session.query(AuditLog)
@@ -315,6 +310,7 @@ def test_login_creates_audit_log(client: TestClient, test_tenant_with_user, db_s
             AuditLog.action_type == "LOGIN",
             AuditLog.resource_type == "user",
         )
+        .order_by(AuditLog.created_at.desc())
         .first()
     )
 
@@ -324,19 +320,11 @@ def test_login_creates_audit_log(client: TestClient, test_tenant_with_user, db_s
     assert "logged in" in audit_log.change_summary.lower()
 
 
-def test_logout_creates_audit_log(client: TestClient, test_tenant_with_user, db_session):
+def test_logout_creates_audit_log(client: TestClient, logged_in, test_tenant_with_user, db_session):
     """Test that logout action is logged to audit trail."""
     from app.models.audit_log import AuditLog
 
-    # Login to get tokens
-    login_response = client.post(
-        "/api/v1/auth/login",
-        json={
-            "email": "testuser@example.com",
-            "password": "TestPassword123!",
-        },
-    )
-    tokens = login_response.json()
+    tokens = logged_in
 
     # Logout
     client.post(
@@ -352,6 +340,7 @@ def test_logout_creates_audit_log(client: TestClient, test_tenant_with_user, db_
             AuditLog.action_type == "LOGOUT",
             AuditLog.resource_type == "user",
         )
+        .order_by(AuditLog.created_at.desc())
         .first()
     )
 
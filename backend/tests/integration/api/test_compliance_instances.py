@@ -4,6 +4,7 @@ Integration tests for Compliance Instance API endpoints
 
 import pytest
 from fastapi.testclient import TestClient
+from sqlalchemy import delete
 from sqlalchemy.orm import Session
 from datetime import date, timedelta
 
@@ -13,132 +14,138 @@ from app.models.entity import entity_access
 from app.core.security import create_access_token
 
 
-@pytest.fixture
-def test_tenant(db_session: Session):
-    """Create a test tenant"""
-    tenant = Tenant(
-        tenant_code="TEST_CI",
-        tenant_name="Test CI Tenant",
-        status="active",
-    )
-    db_session.add(tenant)
-    db_session.commit()
-    db_session.refresh(tenant)
-    return tenant
+@pytest.fixture(scope="module")
+def seeded_reference_data(db_schema):
+    """
+    Commit the tenant, users, entity and master shared by every test in this module.
 
+    Tests only read these rows or change them inside their own db_session,
+    which is rolled back, so they are created once instead of per test.
+    """
+    with Session(db_schema) as session:
+        tenant = Tenant(
+            tenant_code="TEST_CI",
+            tenant_name="Test CI Tenant",
+            status="active",
+        )
+        session.add(tenant)
+        session.flush()
+
+        # Reuse the admin role if another fixture already committed it
+        admin_role = session.query(Role).filter(Role.role_code == "admin").first()
+        created_role = admin_role is None
+        if created_role:
+            admin_role = Role(
+                role_code="admin",
+                role_name="Administrator",
+            )
+            session.add(admin_role)
 
-@pytest.fixture
-def admin_user_fixture(db_session: Session, test_tenant: Tenant):
-    """Create a tenant admin user for testing"""
-    # Check if admin role exists
-    admin_role = db_session.query(Role).filter(Role.role_code == "admin").first()
-    if not admin_role:
-        admin_role = Role(
-            role_code="admin",
-            role_name="Administrator",
+        admin = User(
+            email="admin@ci.com",
+            first_name="Admin",
+            last_name="User",
+            tenant_id=tenant.id,
+            status="active",
+            is_system_admin=False,
         )
-        db_session.add(admin_role)
-        db_session.flush()
+        admin.set_password("AdminPass123!")  # pragma: allowlist secret
+        user = User(
+            email="user@ci.com",
+            first_name="Regular",
+            last_name="User",
+            tenant_id=tenant.id,
+            status="active",
+            is_system_admin=False,
+        )
+        user.set_password("UserPass123!")  # pragma: allowlist secret
+        master = ComplianceMaster(
+            tenant_id=tenant.id,
+            compliance_code="GST_GSTR3B",
+            compliance_name="GSTR-3B Monthly Return",
+            category="GST",
+            sub_category="Monthly Returns",
+            frequency="Monthly",
+            due_date_rule={"type": "monthly", "day": 20},
+            is_active=True,
+        )
+        session.add_all([admin, user, master])
+        session.flush()
 
-    # Create admin user
-    admin = User(
-        email="admin@ci.com",
-        first_name="Admin",
-        last_name="User",
-        tenant_id=test_tenant.id,
-        status="active",
-        is_system_admin=False,
-    )
-    admin.set_password("AdminPass123!")  # pragma: allowlist secret
-    db_session.add(admin)
-    db_session.flush()
-
-    # Assign role
-    db_session.execute(
-        user_roles.insert().values(
-            user_id=admin.id,
-            role_id=admin_role.id,
-            tenant_id=test_tenant.id,
+        entity = Entity(
+            tenant_id=tenant.id,
+            entity_code="TEST-CI-001",
+            entity_name="Test CI Entity",
+            entity_type="Company",
+            status="active",
+            created_by=admin.id,
+            updated_by=admin.id,
         )
-    )
-    db_session.commit()
-    db_session.refresh(admin)
-    return admin
+        session.add(entity)
+        session.flush()
+
+        # Assign role and grant entity access to admin
+        session.execute(user_roles.insert().values(user_id=admin.id, role_id=admin_role.id, tenant_id=tenant.id))
+        session.execute(entity_access.insert().values(user_id=admin.id, entity_id=entity.id, tenant_id=tenant.id))
+
+        ids = {
+            "tenant": tenant.id,
+            "role": admin_role.id,
+            "admin": admin.id,
+            "user": user.id,
+            "entity": entity.id,
+            "master": master.id,
+        }
+        session.commit()
+
+    yield ids
+
+    # Users, entities, masters and their access rows cascade from the tenant
+    with Session(db_schema) as session:
+        session.execute(delete(Tenant).where(Tenant.id == ids["tenant"]))
+        if created_role:
+            session.execute(delete(Role).where(Role.id == ids["role"]))
+        session.commit()
 
 
 @pytest.fixture
-def regular_user_fixture(db_session: Session, test_tenant: Tenant):
-    """Create a regular (non-admin) user for testing"""
-    user = User(
-        email="user@ci.com",
-        first_name="Regular",
-        last_name="User",
-        tenant_id=test_tenant.id,
-        status="active",
-        is_system_admin=False,
-    )
-    user.set_password("UserPass123!")  # pragma: allowlist secret
-    db_session.add(user)
-    db_session.commit()
-    db_session.refresh(user)
-    return user
+def test_tenant(db_session: Session, seeded_reference_data: dict):
+    """Load the seeded test tenant"""
+    return db_session.get(Tenant, seeded_reference_data["tenant"])
 
 
 @pytest.fixture
-def test_entity(db_session: Session, test_tenant: Tenant, admin_user_fixture: User):
-    """Create a test entity"""
-    entity = Entity(
-        tenant_id=test_tenant.id,
-        entity_code="TEST-CI-001",
-        entity_name="Test CI Entity",
-        entity_type="Company",
-        status="active",
-        created_by=admin_user_fixture.id,
-        updated_by=admin_user_fixture.id,
-    )
-    db_session.add(entity)
-    db_session.flush()
+def admin_user_fixture(db_session: Session, seeded_reference_data: dict):
+    """Load the seeded tenant admin user"""
+    return db_session.get(User, seeded_reference_data["admin"])
 
-    # Grant access to admin
-    db_session.execute(
-        entity_access.insert().values(
-            user_id=admin_user_fixture.id,
-            entity_id=entity.id,
-            tenant_id=test_tenant.id,
-        )
-    )
-    db_session.commit()
-    db_session.refresh(entity)
-    return entity
+
+@pytest.fixture
+def regular_user_fixture(db_session: Session, seeded_reference_data: dict):
+    """Load the seeded regular (non-admin) user"""
+    return db_session.get(User, seeded_reference_data["user"])
 
 
 @pytest.fixture
-def test_compliance_master(db_session: Session, test_tenant: Tenant):
-    """Create a test compliance master"""
-    master = ComplianceMaster(
-        tenant_id=test_tenant.id,
-        compliance_code="GST_GSTR3B",
-        compliance_name="GSTR-3B Monthly Return",
-        category="GST",
-        sub_category="Monthly Returns",
-        frequency="Monthly",
-        due_date_rule={"type": "monthly", "day": 20},
-        is_active=True,
-    )
-    db_session.add(master)
-    db_session.commit()
-    db_session.refresh(master)
-    return master
+def test_entity(db_session: Session, seeded_reference_data: dict):
+    """Load the seeded test entity (admin has access)"""
+    return db_session.get(Entity, seeded_reference_data["entity"])
 
 
 @pytest.fixture
-def admin_headers(admin_user_fixture: User):
-    """Create auth headers for tenant admin user"""
+def test_compliance_master(db_session: Session, seeded_reference_data: dict):
+    """Load the seeded test compliance master"""
+    return db_session.get(ComplianceMaster, seeded_reference_data["master"])
+
+
+@pytest.fixture(scope="module")
+def admin_headers(seeded_reference_data: dict):
+    """Create auth headers for tenant admin user (signed once per module)"""
     token = create_access_token(
         data={
-            "user_id": str(admin_user_fixture.id),
-            "tenant_id": str(admin_user_fixture.tenant_id),
-            "email": admin_user_fixture.email,
+            "user_id": str(seeded_reference_data["admin"]),
+            "tenant_id": str(seeded_reference_data["tenant"]),
+            "email": "admin@ci.com",
             "roles": ["TENANT_ADMIN"],
             "is_system_admin": False,
         }
@@ -146,14 +153,14 @@ def admin_headers(admin_user_fixture: User):
     return {"Authorization": f"Bearer {token}"}
 
 
-@pytest.fixture
-def regular_headers(regular_user_fixture: User):
-    """Create auth headers for regular user"""
+@pytest.fixture(scope="module")
+def regular_headers(seeded_reference_data: dict):
+    """Create auth headers for regular user (signed once per module)"""
     token = create_access_token(
         data={
-            "user_id": str(regular_user_fixture.id),
-            "tenant_id": str(regular_user_fixture.tenant_id),
-            "email": regular_user_fixture.email,
+            "user_id": str(seeded_reference_data["user"]),
+            "tenant_id": str(seeded_reference_data["tenant"]),
+            "email": "user@ci.com",
             "roles": [],
             "is_system_admin": False,
         }
@@ -329,7 +336,7 @@ class TestCreateComplianceInstance:
             updated_by=admin_user_fixture.id,
         )
         db_session.add(entity)
-        db_session.commit()
+        db_session.flush()
 
         today = date.today()
         response = client.post(
@@ -395,7 +402,7 @@ class TestListComplianceInstances:
             updated_by=admin_user_fixture.id,
         )
         db_session.add(instance)
-        db_session.commit()
+        db_session.flush()
 
         response = client.get("/api/v1/compliance-instances/", headers=admin_headers)
 
@@ -433,7 +440,7 @@ class TestListComplianceInstances:
                 updated_by=admin_user_fixture.id,
             )
             db_session.add(instance)
-        db_session.commit()
+        db_session.flush()
 
         response = client.get("/api/v1/compliance-instances/?skip=0&limit=3", headers=admin_headers)
 
@@ -469,7 +476,7 @@ class TestListComplianceInstances:
             updated_by=admin_user_fixture.id,
         )
         db_session.add(instance)
-        db_session.commit()
+        db_session.flush()
 
         response = client.get(f"/api/v1/compliance-instances/?entity_id={test_entity.id}", headers=admin_headers)
 
@@ -515,7 +522,7 @@ class TestListComplianceInstances:
             updated_by=admin_user_fixture.id,
         )
         db_session.add_all([instance1, instance2])
-        db_session.commit()
+        db_session.flush()
 
         response = client.get("/api/v1/compliance-instances/?status=In Progress", headers=admin_headers)
 
@@ -561,7 +568,7 @@ class TestListComplianceInstances:
             updated_by=admin_user_fixture.id,
         )
         db_session.add_all([instance1, instance2])
-        db_session.commit()
+        db_session.flush()
 
         response = client.get("/api/v1/compliance-instances/?rag_status=Green", headers=admin_headers)
 
@@ -615,7 +622,7 @@ class TestListComplianceInstances:
             updated_by=admin_user_fixture.id,
         )
         db_session.add(gst_instance)
-        db_session.commit()
+        db_session.flush()
 
         response = client.get("/api/v1/compliance-instances/?category=GST", headers=admin_headers)
 
@@ -694,7 +701,7 @@ class TestListComplianceInstances:
             updated_by=admin_user_fixture.id,
         )
         db_session.add_all([accessible_instance, no_access_instance])
-        db_session.commit()
+        db_session.flush()
 
         # Regular user should only see accessible instance
         response = client.get("/api/v1/compliance-instances/", headers=regular_headers)
@@ -734,7 +741,7 @@ class TestGetComplianceInstance:
             updated_by=admin_user_fixture.id,
         )
         db_session.add(instance)
-        db_session.commit()
+        db_session.flush()
 
         response = client.get(f"/api/v1/compliance-instances/{instance.id}", headers=admin_headers)
 
@@ -790,7 +797,7 @@ class TestGetComplianceInstance:
             updated_by=admin_user_fixture.id,
         )
         db_session.add(instance)
-        db_session.commit()
+        db_session.flush()
 
         response = client.get(f"/api/v1/compliance-instances/{instance.id}", headers=regular_headers)
 
@@ -835,7 +842,7 @@ class TestGetComplianceInstance:
             updated_by=admin_user_fixture.id,
         )
         db_session.add(instance)
-        db_session.commit()
+        db_session.flush()
 
         response = client.get(f"/api/v1/compliance-instances/{instance.id}", headers=regular_headers)
 
@@ -878,7 +885,7 @@ class TestUpdateComplianceInstance:
             updated_by=admin_user_fixture.id,
         )
         db_session.add(instance)
-        db_session.commit()
+        db_session.flush()
 
         response = client.put(
             f"/api/v1/compliance-instances/{instance.id}",
@@ -915,7 +922,7 @@ class TestUpdateComplianceInstance:
             updated_by=admin_user_fixture.id,
         )
         db_session.add(instance)
-        db_session.commit()
+        db_session.flush()
 
         original_status = instance.status
 
@@ -955,7 +962,7 @@ class TestUpdateComplianceInstance:
             updated_by=admin_user_fixture.id,
         )
         db_session.add(instance)
-        db_session.commit()
+        db_session.flush()
 
         completion_date = str(date.today())
         response = client.put(
@@ -1010,7 +1017,7 @@ class TestUpdateComplianceInstance:
             updated_by=admin_user_fixture.id,
         )
         db_session.add(instance)
-        db_session.commit()
+        db_session.flush()
 
         response = client.put(
             f"/api/v1/compliance-instances/{instance.id}",
@@ -1062,7 +1069,7 @@ class TestRecalculateStatus:
             updated_by=admin_user_fixture.id,
         )
         db_session.add(instance)
-        db_session.commit()
+        db_session.flush()
 
         response = client.post(
             f"/api/v1/compliance-instances/{instance.id}/recalculate-status",
@@ -1100,7 +1107,7 @@ class TestRecalculateStatus:
             updated_by=admin_user_fixture.id,
         )
         db_session.add(instance)
-        db_session.commit()
+        db_session.flush()
 
         response = client.post(
             f"/api/v1/compliance-instances/{instance.id}/recalculate-status",
@@ -1137,7 +1144,7 @@ class TestRecalculateStatus:
             updated_by=admin_user_fixture.id,
         )
         db_session.add(instance)
-        db_session.commit()
+        db_session.flush()
 
         response = client.post(
             f"/api/v1/compliance-instances/{instance.id}/recalculate-status",
@@ -1174,7 +1181,7 @@ class TestRecalculateStatus:
             updated_by=admin_user_fixture.id,
         )
         db_session.add(instance)
-        db_session.commit()
+        db_session.flush()
 
         response = client.post(
             f"/api/v1/compliance-instances/{instance.id}/recalculate-status",
@@ -1211,7 +1218,7 @@ class TestRecalculateStatus:
             updated_by=admin_user_fixture.id,
         )
         db_session.add(instance)
-        db_session.commit()
+        db_session.flush()
 
         response = client.post(
             f"/api/v1/compliance-instances/{instance.id}/recalculate-status",
@@ -1266,7 +1273,7 @@ class TestRecalculateStatus:
             updated_by=admin_user_fixture.id,
         )
         db_session.add(instance)
-        db_session.commit()
+        db_session.flush()
 
         response = client.post(
             f"/api/v1/compliance-instances/{instance.id}/recalculate-status",
@@ -1314,7 +1321,7 @@ class TestRecalculateStatus:
             updated_by=admin_user_fixture.id,
         )
         db_session.add(instance)
-        db_session.commit()
+        db_session.flush()
 
         response = client.post(
             f"/api/v1/compliance-instances/{instance.id}/recalculate-status",
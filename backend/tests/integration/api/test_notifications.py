@@ -4,6 +4,7 @@ Integration tests for Notification API endpoints
 
 import pytest
 from datetime import datetime
+from unittest.mock import patch
 from fastapi.testclient import TestClient
 from sqlalchemy.orm import Session
 
@@ -161,6 +162,30 @@ class TestListNotifications:
         assert data["skip"] == 2
         assert data["limit"] == 2
 
+    def test_list_notifications_keyset_cursor(
+        self,
+        client: TestClient,
+        auth_headers: dict,
+        test_notifications: list[Notification],
+    ):
+        """Should page with next_cursor without repeating items."""
+        first = client.get("/api/v1/notifications/?limit=2", headers=auth_headers).json()
+        assert first["next_cursor"]
+
+        second = client.get(
+            "/api/v1/notifications/", params={"limit": 2, "before": first["next_cursor"]}, headers=auth_headers
+        ).json()
+
+        first_ids = {item["id"] for item in first["items"]}
+        assert second["items"]
+        assert not first_ids & {item["id"] for item in second["items"]}
+
+    def test_list_notifications_invalid_cursor(self, client: TestClient, auth_headers: dict):
+        """Should reject a malformed cursor."""
+        response = client.get("/api/v1/notifications/?before=garbage", headers=auth_headers)
+
+        assert response.status_code == 400
+
     def test_list_notifications_requires_auth(self, client: TestClient):
         """Should require authentication (returns 403 for unauthenticated requests)."""
         response = client.get("/api/v1/notifications/")
@@ -334,7 +359,7 @@ class TestMarkAllNotificationsRead:
         test_notifications: list[Notification],
     ):
         """Should mark all notifications as read."""
-        response = client.post("/api/v1/notifications/mark-all-read", headers=auth_headers)
+        response = client.post("/api/v1/notifications/mark-all-read?sync=true", headers=auth_headers)
 
         assert response.status_code == 200
         data = response.json()
@@ -351,12 +376,26 @@ class TestMarkAllNotificationsRead:
         auth_headers: dict,
     ):
         """Should return 0 if no unread notifications."""
-        response = client.post("/api/v1/notifications/mark-all-read", headers=auth_headers)
+        response = client.post("/api/v1/notifications/mark-all-read?sync=true", headers=auth_headers)
 
         assert response.status_code == 200
         data = response.json()
         assert data["marked_count"] == 0
 
+    def test_mark_all_read_async_accepted(
+        self,
+        client: TestClient,
+        auth_headers: dict,
+        test_notifications: list[Notification],
+    ):
+        """Should enqueue the update and return 202 with the prior unread count."""
+        with patch("app.tasks.notification_tasks.mark_all_read_task") as mock_task:
+            response = client.post("/api/v1/notifications/mark-all-read", headers=auth_headers)
+
+        assert response.status_code == 202
+        assert response.json()["marked_count"] == 3
+        mock_task.delay.assert_called_once()
+
 
 class TestMarkMultipleNotificationsRead:
     """Tests for POST /api/v1/notifications/mark-read"""
@@ -0,0 +1,29 @@
+"""
+Unit tests for database engine configuration
+"""
+
+from unittest.mock import MagicMock
+
+from app.core.database import _relax_commit_durability
+
+
+class TestRelaxCommitDurability:
+    """Tests for the write_engine begin hook."""
+
+    def test_disables_synchronous_commit_on_postgres(self):
+        """Should turn off synchronous_commit for the transaction."""
+        conn = MagicMock()
+        conn.dialect.name = "postgresql"
+
+        _relax_commit_durability(conn)
+
+        conn.exec_driver_sql.assert_called_once_with("SET LOCAL synchronous_commit = OFF")
+
+    def test_noop_on_other_dialects(self):
+        """Should not emit PostgreSQL settings on other databases."""
+        conn = MagicMock()
+        conn.dialect.name = "sqlite"
+
+        _relax_commit_durability(conn)
+
+        conn.exec_driver_sql.assert_not_called()
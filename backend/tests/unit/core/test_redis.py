@@ -11,6 +11,10 @@ from app.core.redis import (
     validate_refresh_token,
     invalidate_refresh_token,
     invalidate_user_refresh_tokens,
+    claim_once,
+    dashboard_cache_key,
+    UnreadCountCache,
+    NotificationListCache,
 )
 
 
@@ -156,3 +160,83 @@ async def test_invalidate_user_refresh_tokens_no_tokens():
         assert result is False
         # Verify delete was not called
         mock_redis.delete.assert_not_called()
+
+
+def test_claim_once_uses_set_nx():
+    """Test that claim_once claims a key atomically with a TTL."""
+    with patch("app.core.redis.redis_client") as mock_redis:
+        mock_redis.set.return_value = True
+
+        assert claim_once("notif_dedup:k", ttl=60) is True
+        mock_redis.set.assert_called_once_with("notif_dedup:k", 1, nx=True, ex=60)
+
+
+def test_claim_once_already_claimed():
+    """Test that claim_once returns False when the key exists."""
+    with patch("app.core.redis.redis_client") as mock_redis:
+        mock_redis.set.return_value = None
+
+        assert claim_once("notif_dedup:k") is False
+
+
+def test_claim_once_fails_open_on_redis_error():
+    """Test that claim_once allows the operation when Redis is down."""
+    import redis
+
+    with patch("app.core.redis.redis_client") as mock_redis:
+        mock_redis.set.side_effect = redis.ConnectionError("down")
+
+        assert claim_once("notif_dedup:k") is True
+
+
+def test_unread_cache_incr_many_uses_one_pipeline():
+    """Test that incr_many sends all adjustments in one pipeline."""
+    client = MagicMock()
+    cache = UnreadCountCache(client)
+    pipe = client.pipeline.return_value
+
+    cache.incr_many({("t1", "u1"): 2, ("t1", "u2"): 1})
+
+    client.pipeline.assert_called_once_with(transaction=False)
+    pipe.execute.assert_called_once()
+    assert client.register_script.return_value.call_count == 2
+
+
+def test_notification_list_cache_roundtrip():
+    """Test that cached notifications are serialized and read back newest first."""
+    from datetime import datetime
+
+    client = MagicMock()
+    cache = NotificationListCache(client, size=100)
+    notification = MagicMock(
+        id=uuid4(),
+        user_id=uuid4(),
+        tenant_id=uuid4(),
+        notification_type="task_assigned",
+        title="T",
+        message="M",
+        link=None,
+        is_read=False,
+        read_at=None,
+        created_at=datetime(2026, 1, 1, 12, 0),
+    )
+
+    cache.set("t1", "u1", [notification])
+    pipe = client.pipeline.return_value
+    mapping = pipe.zadd.call_args[0][1]
+    member, score = next(iter(mapping.items()))
+    assert score == notification.created_at.timestamp()
+
+    client.zrevrange.return_value = [member]
+    cached = cache.get("t1", "u1")
+
+    assert cached[0]["title"] == "T"
+    assert cached[0]["created_at"] == "2026-01-01T12:00:00"
+    client.zrevrange.assert_called_with("notif:list:t1:u1", 0, 99)
+
+
+def test_dashboard_cache_key_is_tenant_scoped():
+    """Test dashboard keys are namespaced by tenant so they can be invalidated per tenant."""
+    tenant_id = uuid4()
+
+    assert dashboard_cache_key(tenant_id, "overview") == f"dashboard:{tenant_id}:overview"
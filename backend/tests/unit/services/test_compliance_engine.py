@@ -14,7 +14,10 @@ Test Categories:
 from datetime import date, timedelta
 from unittest.mock import MagicMock
 
+from sqlalchemy.dialects import postgresql
+
 from app.services.compliance_engine import (
+    bulk_recalculate_rag,
     calculate_due_date,
     calculate_period_for_frequency,
     calculate_rag_status,
@@ -421,6 +424,33 @@ class TestRAGStatusCalculation:
         assert result == "Red"
 
 
+class TestBulkRecalculateRag:
+    """Tests for the set-based RAG recalculation."""
+
+    def test_single_update_returns_rowcount(self):
+        """One UPDATE statement should recalculate the tenant and report changed rows."""
+        mock_db = MagicMock()
+        mock_db.execute.return_value.rowcount = 4
+
+        result = bulk_recalculate_rag(mock_db, MagicMock(), today=date(2024, 6, 15))
+
+        assert result == 4
+        mock_db.execute.assert_called_once()
+        mock_db.commit.assert_called_once()
+        mock_db.query.assert_not_called()
+
+    def test_update_only_touches_changed_open_instances(self):
+        """The UPDATE should skip completed instances and rows whose RAG is unchanged."""
+        mock_db = MagicMock()
+
+        bulk_recalculate_rag(mock_db, MagicMock(), today=date(2024, 6, 15))
+
+        sql = str(mock_db.execute.call_args.args[0].compile(dialect=postgresql.dialect()))
+        assert sql.startswith("UPDATE compliance_instances SET rag_status=CASE")
+        assert "IS DISTINCT FROM CASE" in sql
+        assert "evidence.approval_status" in sql
+
+
 class TestDependencyResolution:
     """Tests for compliance dependency handling."""
 
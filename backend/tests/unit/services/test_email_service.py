@@ -134,6 +134,33 @@ class TestEmailService:
 
         assert result is False
 
+    @patch("app.services.email_service.SendGridAPIClient")
+    @patch("app.services.email_service.settings")
+    def test_rate_limited_send_raises_transient_error(self, mock_settings, mock_sg_client):
+        """Test a 429 from SendGrid is surfaced as retryable instead of returning False."""
+        mock_settings.EMAIL_ENABLED = True
+        mock_settings.SENDGRID_API_KEY = "SG.test_api_key"  # pragma: allowlist secret
+        mock_settings.EMAIL_FROM_ADDRESS = "noreply@complianceos.com"
+        mock_settings.EMAIL_FROM_NAME = "Compliance OS"
+
+        mock_response = MagicMock()
+        mock_response.status_code = 429
+        mock_sg_instance = MagicMock()
+        mock_sg_instance.send.return_value = mock_response
+        mock_sg_client.return_value = mock_sg_instance
+
+        from app.services.email_service import EmailService, TransientEmailError
+
+        service = EmailService()
+
+        with pytest.raises(TransientEmailError):
+            service.send_email(
+                to_email="user@example.com",
+                subject="Test Subject",
+                template_name="reminder_t3.html",
+                context={"user_name": "Test"},
+            )
+
 
 class TestTemplateRendering:
     """Tests for email template rendering."""
@@ -175,6 +202,23 @@ class TestTemplateRendering:
         with pytest.raises(Exception):
             service._render_template("nonexistent_template.html", {})
 
+    def test_templates_compiled_once_at_import(self):
+        """Test rendering uses the templates compiled at import without reloading from disk."""
+        from app.services.email_service import EMAIL_TEMPLATES, EmailService, jinja_env
+
+        assert "reminder_t3.html" in EMAIL_TEMPLATES
+        assert jinja_env.auto_reload is False
+
+        # {% extends %} still goes through get_template, so count source loads instead:
+        # every template was read from disk at import and must not be read again
+        loader = jinja_env.loader
+        with patch.object(loader, "get_source", wraps=loader.get_source) as mock_get_source:
+            service = EmailService()
+            service._render_template("reminder_t3.html", {"user_name": "Test"})
+            service._render_template("reminder_t3.html", {"user_name": "Test"})
+
+        mock_get_source.assert_not_called()
+
 
 class TestEmailHelperFunctions:
     """Tests for email helper functions."""
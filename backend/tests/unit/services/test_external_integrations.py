@@ -0,0 +1,499 @@
+"""
+Unit tests for external integration adapters.
+
+Tests cover:
+- Retry-After parsing and backoff delay computation
+- RetryTransport retry behaviour for 429/5xx responses (idempotent methods only)
+- Per-adapter retry budget
+- Vendor-configured ERPAdapter
+- P&L ratio kernels
+- Entity-keyed adapter cache
+- Streaming JSON responses
+- Typed mock adapter results
+- Cached entity identity resolver
+- Slotted adapter instances
+- Shared empty-result sentinels
+"""
+
+import asyncio
+import pytest
+import httpx
+from dataclasses import FrozenInstanceError
+from decimal import Decimal
+from unittest.mock import AsyncMock, PropertyMock, patch
+from uuid import uuid4
+
+from app.services.external_integrations.base_adapter import EMPTY, EMPTY_SEQUENCE, entity_key
+from app.services.external_integrations.entity_resolver import EntityIdentity, EntityIdentityResolver
+from app.services.external_integrations.erp_adapter import (
+    ERPAdapter,
+    NetSuiteAdapter,
+    OracleAdapter,
+    SAPAdapter,
+    VendorStrategy,
+)
+from app.services.external_integrations.gstn_adapter import GSTNAdapter
+from app.services.external_integrations.mca_adapter import MCAAdapter
+from app.services.external_integrations.mock_adapters import (
+    MOCK_FILING_STATUS,
+    MOCK_PL_STATEMENT,
+    MockGSTNAdapter,
+    MockMCAAdapter,
+    MockSAPAdapter,
+)
+from app.services.external_integrations.pl_kernels import compute_growth, compute_pl_ratios, compute_ratios
+from app.services.external_integrations.http_client import (
+    MAX_RETRY_DELAY,
+    RETRY_BUDGET_EXTENSION,
+    RetryBudget,
+    RetryTransport,
+    compute_retry_delay,
+    parse_retry_after,
+)
+
+
+def _request(budget=None, method="GET"):
+    extensions = {RETRY_BUDGET_EXTENSION: budget} if budget is not None else {}
+    return httpx.Request(method, "https://gstn.example/returns", extensions=extensions)
+
+
+class TestRetryHelpers:
+    """Tests for Retry-After parsing and delay computation."""
+
+    def test_parse_retry_after_seconds(self):
+        assert parse_retry_after("7") == 7.0
+
+    def test_parse_retry_after_http_date_in_past(self):
+        assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+
+    def test_parse_retry_after_invalid(self):
+        assert parse_retry_after(None) is None
+        assert parse_retry_after("soon") is None
+
+    def test_delay_prefers_retry_after_and_is_capped(self):
+        assert compute_retry_delay(0, retry_after=3.0) == 3.0
+        assert compute_retry_delay(0, retry_after=120.0) == MAX_RETRY_DELAY
+        assert compute_retry_delay(10) == MAX_RETRY_DELAY
+
+    def test_delay_exponential_with_jitter(self):
+        delay = compute_retry_delay(2)
+        assert 4.0 <= delay <= 4.5
+
+
+class TestRetryTransport:
+    """Tests for RetryTransport."""
+
+    @pytest.mark.asyncio
+    async def test_retries_until_success(self):
+        responses = [
+            httpx.Response(503),
+            httpx.Response(429, headers={"Retry-After": "1"}),
+            httpx.Response(200, json={"status": "Filed"}),
+        ]
+        with (
+            patch.object(httpx.AsyncHTTPTransport, "handle_async_request", AsyncMock(side_effect=responses)),
+            patch("app.services.external_integrations.http_client.asyncio.sleep", AsyncMock()) as mock_sleep,
+        ):
+            response = await RetryTransport().handle_async_request(_request())
+
+        assert response.status_code == 200
+        assert mock_sleep.await_count == 2
+        assert mock_sleep.await_args_list[1].args[0] == 1.0
+
+    @pytest.mark.asyncio
+    async def test_non_retryable_status_returned_immediately(self):
+        mock_send = AsyncMock(return_value=httpx.Response(404))
+        with patch.object(httpx.AsyncHTTPTransport, "handle_async_request", mock_send):
+            response = await RetryTransport().handle_async_request(_request())
+
+        assert response.status_code == 404
+        assert mock_send.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_gives_up_after_max_retries(self):
+        mock_send = AsyncMock(side_effect=lambda request: httpx.Response(502))
+        with (
+            patch.object(httpx.AsyncHTTPTransport, "handle_async_request", mock_send),
+            patch("app.services.external_integrations.http_client.asyncio.sleep", AsyncMock()),
+        ):
+            response = await RetryTransport(max_retries=2).handle_async_request(_request())
+
+        assert response.status_code == 502
+        assert mock_send.await_count == 3
+
+    @pytest.mark.asyncio
+    async def test_post_not_retried_on_server_error(self):
+        mock_send = AsyncMock(side_effect=lambda request: httpx.Response(500))
+        with (
+            patch.object(httpx.AsyncHTTPTransport, "handle_async_request", mock_send),
+            patch("app.services.external_integrations.http_client.asyncio.sleep", AsyncMock()) as mock_sleep,
+        ):
+            response = await RetryTransport().handle_async_request(_request(method="POST"))
+
+        assert response.status_code == 500
+        assert mock_send.await_count == 1
+        mock_sleep.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_post_retried_on_503_with_retry_after(self):
+        responses = [httpx.Response(503, headers={"Retry-After": "2"}), httpx.Response(201)]
+        with (
+            patch.object(httpx.AsyncHTTPTransport, "handle_async_request", AsyncMock(side_effect=responses)),
+            patch("app.services.external_integrations.http_client.asyncio.sleep", AsyncMock()) as mock_sleep,
+        ):
+            response = await RetryTransport().handle_async_request(_request(method="POST"))
+
+        assert response.status_code == 201
+        mock_sleep.assert_awaited_once_with(2.0)
+
+    @pytest.mark.asyncio
+    async def test_exhausted_budget_stops_retrying(self):
+        budget = RetryBudget(max_retries=1)
+        mock_send = AsyncMock(side_effect=lambda request: httpx.Response(500))
+        with (
+            patch.object(httpx.AsyncHTTPTransport, "handle_async_request", mock_send),
+            patch("app.services.external_integrations.http_client.asyncio.sleep", AsyncMock()),
+        ):
+            response = await RetryTransport().handle_async_request(_request(budget))
+
+        assert response.status_code == 500
+        assert mock_send.await_count == 2
+        assert budget.try_acquire() is False
+
+
+class TestERPAdapter:
+    """Tests for the table-driven ERPAdapter."""
+
+    @pytest.mark.parametrize(
+        "factory,vendor",
+        [(SAPAdapter, "sap"), (OracleAdapter, "oracle"), (NetSuiteAdapter, "netsuite")],
+    )
+    def test_vendor_aliases(self, factory, vendor):
+        adapter = factory(api_url="https://erp.example")
+        assert isinstance(adapter, ERPAdapter)
+        assert isinstance(adapter, factory)
+        assert adapter.vendor == vendor
+
+    def test_vendor_adapters_can_be_subclassed(self):
+        class CustomOracleAdapter(OracleAdapter):
+            __slots__ = ()
+
+        adapter = CustomOracleAdapter()
+        assert isinstance(adapter, OracleAdapter)
+        assert adapter.vendor == "oracle"
+        assert CustomOracleAdapter(vendor="netsuite").vendor == "netsuite"
+
+    def test_unknown_vendor_rejected(self):
+        with pytest.raises(ValueError):
+            ERPAdapter(vendor="tally")
+
+    @pytest.mark.asyncio
+    async def test_v1_stub_behaviour(self):
+        adapter = SAPAdapter()
+        assert await adapter.authenticate() is False
+        assert await adapter.fetch_pl_statement(uuid4(), "202403") is None
+
+
+class TestPLKernels:
+    """Tests for batch P&L ratio computation."""
+
+    def test_compute_ratios(self):
+        ratios = compute_ratios([100.0, 0.0], [60.0, 0.0], [25.0, 0.0], [12.0, 0.0])
+        assert ratios["gross_margin"] == [0.4, None]
+        assert ratios["operating_margin"] == [0.15, None]
+        assert ratios["net_margin"] == [0.12, None]
+
+    def test_compute_ratios_length_mismatch(self):
+        with pytest.raises(ValueError):
+            compute_ratios([1.0], [1.0, 2.0], [1.0], [1.0])
+
+    def test_compute_growth(self):
+        assert compute_growth([100.0, 110.0, 0.0, 5.0], lag=1) == [None, 0.1, -1.0, None]
+
+    def test_compute_pl_ratios_accepts_decimal_amounts(self):
+        statements = [{"period": "202403", "revenue": Decimal("100.00"), "cogs": Decimal("60.00"), "net_income": 12}]
+
+        (result,) = compute_pl_ratios(statements)
+
+        assert result["gross_margin"] == 0.4
+        assert result["net_margin"] == 0.12
+
+    @pytest.mark.asyncio
+    async def test_compute_pl_ratios_from_mock_statements(self):
+        adapter = MockSAPAdapter()
+        statements = [await adapter.fetch_pl_statement(uuid4(), period) for period in ("202402", "202403")]
+
+        results = compute_pl_ratios(statements, yoy_lag=1)
+
+        assert [r["period"] for r in results] == ["202402", "202403"]
+        assert results[0]["gross_margin"] == 0.4
+        assert results[0]["operating_margin"] == 0.15
+        assert results[0]["revenue_yoy"] is None
+        assert results[1]["revenue_yoy"] == 0.0
+
+    def test_compute_growth_skips_missing_periods(self):
+        assert compute_growth([100.0, 50.0, None, 150.0, 120.0], lag=2) == [None, None, None, 2.0, None]
+
+    def test_compute_pl_ratios_keeps_yoy_aligned_across_missing_month(self):
+        # 13 consecutive months with February missing: March 2025 still compares to March 2024
+        statements = [{"period": f"2024{month:02d}", "revenue": 100.0 + month} for month in range(1, 13)]
+        statements.append({"period": "202501", "revenue": 202.0})
+        statements[1] = None
+
+        results = compute_pl_ratios(statements)
+
+        assert len(results) == 12
+        assert "202402" not in [r["period"] for r in results]
+        assert results[-1]["period"] == "202501"
+        assert results[-1]["revenue_yoy"] == 1.0
+
+    @pytest.mark.asyncio
+    async def test_fetch_pl_ratios_keeps_missing_periods_in_place(self):
+        periods = [f"2024{month:02d}" for month in range(1, 13)] + ["202501", "202502"]
+        revenue = {period: 100.0 * (i + 1) for i, period in enumerate(periods) if period != "202402"}
+
+        async def fetch(entity_id, period):
+            return {"period": period, "revenue": revenue[period]} if period in revenue else None
+
+        with patch.object(ERPAdapter, "fetch_pl_statement", side_effect=fetch):
+            results = await SAPAdapter().fetch_pl_ratios(uuid4(), periods)
+
+        assert len(results) == 13
+        by_period = {r["period"]: r["revenue_yoy"] for r in results}
+        # January 2025 compares to January 2024; February 2025 has no comparative
+        assert by_period["202501"] == 12.0
+        assert by_period["202502"] is None
+
+
+class TestEntityCache:
+    """Tests for the entity-keyed adapter result cache."""
+
+    def test_entity_key_accepts_uuid_and_str(self):
+        entity_id = uuid4()
+        assert entity_key(entity_id) == entity_key(str(entity_id)) == entity_id.int
+
+    @pytest.mark.asyncio
+    async def test_fetch_pl_statement_cached_per_entity(self):
+        adapter = ERPAdapter()
+        entity_id = uuid4()
+        with patch.object(VendorStrategy, "fetch_pl", AsyncMock(return_value={"revenue": 1})) as mock_fetch:
+            first = await adapter.fetch_pl_statement(entity_id, "202403")
+            second = await adapter.fetch_pl_statement(str(entity_id), "202403")
+            await adapter.fetch_pl_statement(entity_id, "202404")
+
+        assert first == second
+        assert mock_fetch.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_keyword_calls_share_the_entity_entry(self):
+        adapter = ERPAdapter()
+        entity_id, other_entity_id = uuid4(), uuid4()
+        with patch.object(VendorStrategy, "fetch_pl", AsyncMock(return_value={"revenue": 1})) as mock_fetch:
+            await adapter.fetch_pl_statement(entity_id, period="202403")
+            await adapter.fetch_pl_statement(entity_id=str(entity_id), period="202403")
+            await adapter.fetch_pl_statement(entity_id, "202403")
+            await adapter.fetch_pl_statement(other_entity_id, period="202403")
+
+        assert mock_fetch.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_cached_result_is_not_shared_with_callers(self):
+        adapter = ERPAdapter()
+        entity_id = uuid4()
+        with patch.object(VendorStrategy, "fetch_pl", AsyncMock(return_value={"revenue": 1})):
+            first = await adapter.fetch_pl_statement(entity_id, "202403")
+            first["revenue"] = 99
+            second = await adapter.fetch_pl_statement(entity_id, "202403")
+            second["revenue"] = 42
+            third = await adapter.fetch_pl_statement(entity_id, "202403")
+
+        assert third == {"revenue": 1}
+
+    @pytest.mark.asyncio
+    async def test_sync_master_data_cached_per_entity(self):
+        adapter = MCAAdapter()
+        entity_id = uuid4()
+        first = await adapter.sync_master_data(entity_id)
+        second = await adapter.sync_master_data(entity_id=str(entity_id))
+        await adapter.sync_master_data(uuid4())
+
+        # Read-only sentinels are shared rather than copied
+        assert first is second is EMPTY
+        assert len(adapter._entity_cache["sync_master_data"]) == 2
+
+
+class TestStreamingResponses:
+    """Tests for incremental JSON streaming through the shared client."""
+
+    @pytest.mark.asyncio
+    async def test_stream_json_items_yields_across_chunks(self):
+        async def body():
+            yield b'{"b2b": [{"inv": [{"inum": "INV-1", "val": 1180.5},'
+            yield b' {"inum": "INV-2", "val": 590}]}]}'
+
+        transport = httpx.MockTransport(lambda request: httpx.Response(200, content=body()))
+        async with httpx.AsyncClient(transport=transport) as client:
+            with patch.object(GSTNAdapter, "client", new_callable=PropertyMock, return_value=client):
+                adapter = GSTNAdapter(api_url="https://gstn.example")
+                invoices = [
+                    invoice
+                    async for invoice in adapter._stream_json_items(
+                        "GET", "https://gstn.example/returns/gstr1", "b2b.item.inv.item"
+                    )
+                ]
+
+        assert invoices == [{"inum": "INV-1", "val": Decimal("1180.50")}, {"inum": "INV-2", "val": 590}]
+        assert isinstance(invoices[0]["val"], Decimal)
+
+    @pytest.mark.asyncio
+    async def test_stream_json_items_raises_on_error_status(self):
+        transport = httpx.MockTransport(lambda request: httpx.Response(404))
+        async with httpx.AsyncClient(transport=transport) as client:
+            with patch.object(GSTNAdapter, "client", new_callable=PropertyMock, return_value=client):
+                adapter = GSTNAdapter()
+                with pytest.raises(httpx.HTTPStatusError):
+                    async for _ in adapter._stream_json_items("GET", "https://gstn.example/x", "item"):
+                        pass
+
+    @pytest.mark.asyncio
+    async def test_iter_gstr1_invoices_v1_stub_is_empty(self):
+        adapter = GSTNAdapter()
+        assert [invoice async for invoice in adapter.iter_gstr1_invoices("29ABCDE1234F1Z5", "032024")] == []
+
+
+class TestMockAdapterResults:
+    """Tests for the typed results behind the mock adapters' dict payloads."""
+
+    @pytest.mark.asyncio
+    async def test_filing_status_is_dict(self):
+        status = await MockGSTNAdapter().fetch_filing_status("GSTR-3B", "032024")
+        assert status == {
+            "status": "Filed",
+            "filing_date": "2024-04-18",
+            "acknowledgment_number": "AB2904240012345",
+            "tax_paid": 125000.00,
+            "taxable_turnover": 5000000.00,
+        }
+
+    @pytest.mark.asyncio
+    async def test_company_master_nests_plain_dicts(self):
+        master = await MockMCAAdapter().sync_master_data(uuid4())
+        assert master["directors"][0] == {"name": "John Doe", "din": "01234567"}
+        assert master["upcoming_filings"][1] == {"form": "MGT-7", "due_date": "2024-10-30"}
+
+    @pytest.mark.asyncio
+    async def test_callers_get_copies_of_shared_payload(self):
+        status = await MockGSTNAdapter().fetch_filing_status("GSTR-3B", "032024")
+        status["status"] = "Pending"
+        assert MOCK_FILING_STATUS.status == "Filed"
+
+    @pytest.mark.asyncio
+    async def test_company_master_nested_lists_are_copied(self):
+        first = await MockMCAAdapter().sync_master_data(uuid4())
+        first["directors"][0]["name"] = "Someone Else"
+        first["upcoming_filings"].clear()
+
+        second = await MockMCAAdapter().sync_master_data(uuid4())
+        assert second["directors"][0]["name"] == "John Doe"
+        assert len(second["upcoming_filings"]) == 2
+
+    @pytest.mark.asyncio
+    async def test_pl_statement_carries_requested_period(self):
+        adapter = MockSAPAdapter()
+        march = await adapter.fetch_pl_statement(uuid4(), "2024-03")
+        april = await adapter.fetch_pl_statement(uuid4(), "2024-04")
+
+        assert march["period"] == "2024-03"
+        assert april["period"] == "2024-04"
+        assert march["revenue"] == 10000000
+        assert MOCK_PL_STATEMENT.period == ""
+
+    def test_results_are_immutable(self):
+        with pytest.raises(FrozenInstanceError):
+            MOCK_FILING_STATUS.status = "Pending"
+
+
+class TestEntityIdentityResolver:
+    """Tests for the cached, single-flight entity identity resolver."""
+
+    @staticmethod
+    def _loader(calls):
+        def load(entity_id):
+            calls.append(entity_id)
+            return EntityIdentity(entity_id=entity_id, tenant_id=entity_id, cin="U74999KA2020PTC123456")
+
+        return load
+
+    @pytest.mark.asyncio
+    async def test_resolve_caches_across_uuid_and_str(self):
+        calls = []
+        resolver = EntityIdentityResolver(loader=self._loader(calls))
+        entity_id = uuid4()
+
+        first = await resolver.resolve(entity_id)
+        second = await resolver.resolve(str(entity_id))
+
+        assert first is second
+        assert first.cin == "U74999KA2020PTC123456"
+        assert calls == [entity_id]
+
+    @pytest.mark.asyncio
+    async def test_concurrent_resolves_are_coalesced(self):
+        calls = []
+        resolver = EntityIdentityResolver(loader=self._loader(calls))
+        entity_id = uuid4()
+
+        results = await asyncio.gather(*(resolver.resolve(entity_id) for _ in range(5)))
+
+        assert len(calls) == 1
+        assert all(result is results[0] for result in results)
+
+    @pytest.mark.asyncio
+    async def test_invalidate_forces_reload(self):
+        calls = []
+        resolver = EntityIdentityResolver(loader=self._loader(calls))
+        entity_id = uuid4()
+
+        await resolver.resolve(entity_id)
+        resolver.invalidate(entity_id)
+        await resolver.resolve(entity_id)
+
+        assert len(calls) == 2
+
+    def test_adapter_uses_injected_resolver(self):
+        resolver = EntityIdentityResolver(loader=lambda entity_id: None)
+        assert GSTNAdapter(resolver=resolver)._resolver is resolver
+        assert SAPAdapter(resolver=resolver)._resolver is resolver
+
+
+class TestAdapterSlots:
+    """Adapters are slotted and carry no per-instance __dict__."""
+
+    @pytest.mark.parametrize(
+        "factory",
+        [GSTNAdapter, MCAAdapter, SAPAdapter, OracleAdapter, MockGSTNAdapter, MockMCAAdapter, MockSAPAdapter],
+    )
+    def test_no_instance_dict(self, factory):
+        adapter = factory(api_key="key", api_url="https://api.example")
+        assert not hasattr(adapter, "__dict__")
+        with pytest.raises(AttributeError):
+            adapter.unexpected_attribute = True
+
+
+class TestEmptySentinels:
+    """No-data results reuse shared read-only sentinels instead of allocating."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("factory", [GSTNAdapter, MCAAdapter, SAPAdapter, MockGSTNAdapter, MockSAPAdapter])
+    async def test_sync_master_data_returns_empty_sentinel(self, factory):
+        assert await factory().sync_master_data(uuid4()) is EMPTY
+
+    @pytest.mark.asyncio
+    async def test_mca_lists_return_empty_sequence(self):
+        adapter = MCAAdapter()
+        assert await adapter.fetch_directors("U74999KA2020PTC123456") is EMPTY_SEQUENCE
+        assert await adapter.get_upcoming_filings("U74999KA2020PTC123456") is EMPTY_SEQUENCE
+
+    def test_empty_is_read_only(self):
+        with pytest.raises(TypeError):
+            EMPTY["status"] = "Filed"
@@ -12,17 +12,28 @@ Test Categories:
 """
 
 import pytest
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 from unittest.mock import MagicMock, patch
 from uuid import uuid4
 
+from app.models import Notification
 from app.services.notification_service import (
     NotificationType,
+    batch_notifications,
+    get_master_name,
+    get_entity_name,
     create_notification,
+    create_notifications_bulk,
+    insert_notifications,
     get_user_notifications,
+    get_user_notifications_rows,
+    encode_notification_cursor,
+    decode_notification_cursor,
     get_unread_count,
     mark_notification_read,
+    mark_notifications_read_bulk,
     mark_all_read,
+    mark_all_read_async,
     delete_notification,
     delete_old_notifications,
     notify_task_assigned,
@@ -35,9 +46,46 @@ from app.services.notification_service import (
     notify_evidence_rejected,
     notify_instance_created,
     notify_instance_completed,
+    NOTIFICATION_TEMPLATES,
+    _render,
+    _templates_for,
 )
 
 
+@pytest.fixture(autouse=True)
+def mock_unread_cache():
+    """Keep unit tests off Redis: unread-count cache always misses."""
+    with patch("app.services.notification_service.unread_count_cache") as mock_cache:
+        mock_cache.get.return_value = None
+        yield mock_cache
+
+
+@pytest.fixture(autouse=True)
+def mock_list_cache():
+    """Keep unit tests off Redis: list cache disabled (size 0) unless a test sets it."""
+    with patch("app.services.notification_service.notification_list_cache") as mock_cache:
+        mock_cache.size = 0
+        mock_cache.get.return_value = None
+        yield mock_cache
+
+
+@pytest.fixture(autouse=True)
+def mock_name_cache():
+    """Keep unit tests off Redis: display-name cache always misses."""
+    with (
+        patch("app.services.notification_service.get_cached_name", return_value=None) as mock_get,
+        patch("app.services.notification_service.set_cached_name"),
+    ):
+        yield mock_get
+
+
+@pytest.fixture(autouse=True)
+def mock_claim_once():
+    """Keep unit tests off Redis: every dedup claim succeeds."""
+    with patch("app.services.notification_service.claim_once", return_value=True) as mock_claim:
+        yield mock_claim
+
+
 class TestNotificationType:
     """Tests for NotificationType constants."""
 
@@ -79,6 +127,43 @@ class TestNotificationType:
         assert NotificationType.APPROVAL_REQUEST == "approval_request"
 
 
+class TestRender:
+    """Tests for notification template rendering."""
+
+    def test_render_fills_all_templates(self):
+        """Should render title, message and link for a type."""
+        instance_id = uuid4()
+
+        title, message, link = _render(
+            NotificationType.REMINDER_DUE, "GSTR-3B", due_date="2026-01-20", instance_id=instance_id
+        )
+
+        assert title == "Due today: GSTR-3B"
+        assert message == "GSTR-3B is due TODAY (2026-01-20). Please complete all pending tasks."
+        assert link == f"/compliance-instances/{instance_id}"
+
+    def test_render_keeps_braces_in_master_name(self):
+        """Braces in the compliance name should not be treated as placeholders."""
+        title, _, _ = _render(NotificationType.REMINDER_T3, "Form {A}", due_date="x", instance_id="1")
+
+        assert title == "Reminder: Form {A} due in 3 days"
+
+    def test_templates_cached_per_master(self):
+        """Should reuse pre-filled templates for the same type and master."""
+        _templates_for.cache_clear()
+
+        _render(NotificationType.REMINDER_T3, "TDS", due_date="a", instance_id="1")
+        _render(NotificationType.REMINDER_T3, "TDS", due_date="b", instance_id="2")
+
+        assert _templates_for.cache_info().hits == 1
+
+    def test_templates_keyed_by_notification_type(self):
+        """Dispatch table keys should all be known notification types."""
+        types = {v for k, v in vars(NotificationType).items() if k.isupper()}
+
+        assert set(NOTIFICATION_TEMPLATES) <= types
+
+
 class TestCreateNotification:
     """Tests for create_notification function."""
 
@@ -97,9 +182,11 @@ class TestCreateNotification:
             message="This is a test message",
         )
 
-        db.add.assert_called_once()
+        db.execute.assert_called_once()
         db.commit.assert_called_once()
-        db.refresh.assert_called_once()
+        db.refresh.assert_not_called()
+        assert result.user_id == user_id
+        assert result.tenant_id == tenant_id
 
     def test_create_notification_with_link(self):
         """Should create notification with optional link."""
@@ -117,9 +204,7 @@ class TestCreateNotification:
             link="/compliance-instances/123",
         )
 
-        db.add.assert_called_once()
-        notification_arg = db.add.call_args[0][0]
-        assert notification_arg.link == "/compliance-instances/123"
+        assert result.link == "/compliance-instances/123"
 
     def test_create_notification_is_unread_by_default(self):
         """New notifications should be unread by default."""
@@ -134,12 +219,14 @@ class TestCreateNotification:
             message="Test",
         )
 
-        notification_arg = db.add.call_args[0][0]
-        assert notification_arg.is_read is False
+        assert result.is_read is False
 
-    def test_create_notification_sets_created_at(self):
-        """Notification should have created_at timestamp."""
+    def test_create_notification_uses_returned_server_columns(self):
+        """id and created_at should come from INSERT ... RETURNING, not a refresh."""
         db = MagicMock()
+        returned = db.execute.return_value.one.return_value
+        returned.id = uuid4()
+        returned.created_at = datetime(2026, 1, 1)
 
         result = create_notification(
             db=db,
@@ -150,8 +237,158 @@ class TestCreateNotification:
             message="Test",
         )
 
-        notification_arg = db.add.call_args[0][0]
-        assert notification_arg.created_at is not None
+        assert result.id == returned.id
+        assert result.created_at == datetime(2026, 1, 1)
+        assert Notification.__table__.c.created_at.server_default.arg.text == "timezone('utc', now())"
+
+
+class TestNotificationBatcher:
+    """Tests for scoped notification batching."""
+
+    def test_create_notification_queues_while_batching(self):
+        """Should queue rows instead of committing while a batcher is active."""
+        db = MagicMock()
+
+        with batch_notifications() as batcher:
+            create_notification(db, uuid4(), uuid4(), NotificationType.TASK_ASSIGNED, "a", "b")
+            create_notifications_bulk(
+                db, [{"user_id": uuid4(), "tenant_id": uuid4(), "notification_type": "x", "title": "t", "message": "m"}]
+            )
+
+        assert len(batcher.rows) == 2
+        db.add.assert_not_called()
+        db.commit.assert_not_called()
+
+    def test_flush_inserts_once(self, mock_unread_cache):
+        """Should insert all queued rows in one statement and one commit."""
+        db = MagicMock()
+        user_id, tenant_id = uuid4(), uuid4()
+
+        db.execute.return_value = [MagicMock(id=uuid4(), created_at=datetime.utcnow()) for _ in range(2)]
+
+        with batch_notifications() as batcher:
+            create_notification(db, user_id, tenant_id, NotificationType.TASK_ASSIGNED, "a", "b")
+            create_notification(db, user_id, tenant_id, NotificationType.TASK_COMPLETED, "c", "d")
+
+        created = batcher.flush(db)
+
+        db.execute.assert_called_once()
+        stmt, rows = db.execute.call_args.args
+        assert "INSERT INTO notifications" in str(stmt)
+        assert [row["title"] for row in rows] == ["a", "c"]
+        db.commit.assert_called_once()
+        assert len(created) == 2
+        assert batcher.rows == []
+        mock_unread_cache.incr_many.assert_called_once_with({(tenant_id, user_id): 2})
+
+    def test_insert_keeps_input_row_order(self, mock_unread_cache):
+        """Should pair RETURNING rows with input rows in parameter order."""
+        db = MagicMock()
+        tenant_id = uuid4()
+        rows = [
+            {"user_id": uuid4(), "tenant_id": tenant_id, "notification_type": "x", "title": f"t{i}", "message": "m"}
+            for i in range(3)
+        ]
+        returned = [MagicMock(id=uuid4(), created_at=datetime.utcnow()) for _ in rows]
+        db.execute.return_value = returned
+
+        created = insert_notifications(db, rows)
+
+        assert db.execute.call_args.args[0]._sort_by_parameter_order is True
+        assert [n.title for n in created] == ["t0", "t1", "t2"]
+        assert [n.id for n in created] == [r.id for r in returned]
+        assert [n.user_id for n in created] == [row["user_id"] for row in rows]
+
+    def test_commits_immediately_outside_batch(self):
+        """Should keep the commit-per-call behaviour when no batcher is active."""
+        db = MagicMock()
+
+        create_notification(db, uuid4(), uuid4(), NotificationType.TASK_ASSIGNED, "a", "b")
+
+        db.execute.assert_called_once()
+        db.commit.assert_called_once()
+
+
+class TestQueuedPersistence:
+    """Tests for persisting notifications via Celery when SYNC_NOTIFICATIONS is off."""
+
+    def test_create_notification_enqueues_instead_of_inserting(self):
+        """Should hand the row to the persistence task without touching the DB."""
+        db = MagicMock()
+        user_id, tenant_id = uuid4(), uuid4()
+
+        with (
+            patch("app.services.notification_service.settings") as mock_settings,
+            patch("app.tasks.notification_tasks.persist_notifications_task") as mock_task,
+        ):
+            mock_settings.SYNC_NOTIFICATIONS = False
+            result = create_notification(db, user_id, tenant_id, NotificationType.TASK_ASSIGNED, "t", "m")
+
+        db.execute.assert_not_called()
+        db.commit.assert_not_called()
+        queued = mock_task.delay.call_args[0][0]
+        assert queued == [
+            {
+                "user_id": user_id,
+                "tenant_id": tenant_id,
+                "notification_type": NotificationType.TASK_ASSIGNED,
+                "title": "t",
+                "message": "m",
+                "link": None,
+                "is_read": False,
+            }
+        ]
+        assert result.user_id == user_id
+
+    def test_bulk_enqueues_one_task(self):
+        """Should queue all bulk rows in a single task."""
+        rows = [
+            {"user_id": uuid4(), "tenant_id": uuid4(), "notification_type": "x", "title": "t", "message": "m"}
+            for _ in range(3)
+        ]
+
+        with (
+            patch("app.services.notification_service.settings") as mock_settings,
+            patch("app.tasks.notification_tasks.persist_notifications_task") as mock_task,
+        ):
+            mock_settings.SYNC_NOTIFICATIONS = False
+            result = create_notifications_bulk(MagicMock(), rows)
+
+        mock_task.delay.assert_called_once()
+        assert len(mock_task.delay.call_args[0][0]) == 3
+        assert len(result) == 3
+
+
+class TestCreateNotificationsBulk:
+    """Tests for create_notifications_bulk function."""
+
+    def test_bulk_insert_single_statement_and_commit(self):
+        """Should insert all rows in one statement and commit once."""
+        db = MagicMock()
+        generated = [MagicMock(id=uuid4(), created_at=datetime.utcnow()) for _ in range(2)]
+        db.execute.return_value = iter(generated)
+        rows = [
+            {"user_id": uuid4(), "tenant_id": uuid4(), "notification_type": "x", "title": "t", "message": "m"}
+            for _ in range(2)
+        ]
+
+        result = create_notifications_bulk(db, rows)
+
+        db.execute.assert_called_once()
+        assert db.execute.call_args[0][1] == rows
+        db.commit.assert_called_once()
+        db.add.assert_not_called()
+        db.scalars.assert_not_called()
+        assert [n.id for n in result] == [g.id for g in generated]
+        assert [n.user_id for n in result] == [row["user_id"] for row in rows]
+
+    def test_bulk_insert_empty_rows_is_noop(self):
+        """Should not touch the database when there are no rows."""
+        db = MagicMock()
+
+        assert create_notifications_bulk(db, []) == []
+        db.execute.assert_not_called()
+        db.commit.assert_not_called()
 
 
 class TestGetUserNotifications:
@@ -232,6 +469,168 @@ class TestGetUserNotifications:
         db.query.return_value.filter.return_value.order_by.return_value.offset.return_value.limit.assert_called_with(50)
 
 
+class TestGetUserNotificationsRows:
+    """Tests for the column-row (non-ORM) list variant."""
+
+    def test_rows_use_core_select(self):
+        """Should select columns via Core and return mappings."""
+        db = MagicMock()
+        rows = [{"id": uuid4(), "is_read": False}]
+        db.execute.return_value.mappings.return_value.all.return_value = rows
+
+        result = get_user_notifications_rows(db, uuid4(), uuid4(), limit=10, offset=5)
+
+        assert result == rows
+        db.query.assert_not_called()
+        stmt = db.execute.call_args[0][0]
+        assert "notifications.title" in str(stmt)
+        assert stmt._offset_clause.value == 5
+
+    def test_rows_served_from_cache(self, mock_list_cache):
+        """Should return cached dicts without touching the database."""
+        db = MagicMock()
+        mock_list_cache.size = 100
+        mock_list_cache.get.return_value = [{"title": "a", "is_read": True}, {"title": "b", "is_read": False}]
+
+        result = get_user_notifications_rows(db, uuid4(), uuid4(), unread_only=True)
+
+        assert result == [{"title": "b", "is_read": False}]
+        db.execute.assert_not_called()
+
+    def test_rows_miss_populates_cache(self, mock_list_cache):
+        """Should load the window with one SELECT and cache it on a miss."""
+        db = MagicMock()
+        user_id, tenant_id = uuid4(), uuid4()
+        mock_list_cache.size = 100
+        row = MagicMock()
+        row._mapping = {"title": "a", "is_read": False}
+        db.execute.return_value.all.return_value = [row]
+
+        result = get_user_notifications_rows(db, user_id, tenant_id)
+
+        assert result == [{"title": "a", "is_read": False}]
+        mock_list_cache.set.assert_called_once_with(tenant_id, user_id, [row])
+
+    def test_rows_miss_fills_cache_from_primary(self, mock_list_cache):
+        """Should never refill the cache from the (possibly lagging) replica."""
+        db, read_db = MagicMock(), MagicMock()
+        mock_list_cache.size = 100
+        db.execute.return_value.all.return_value = []
+
+        get_user_notifications_rows(db, uuid4(), uuid4(), read_db=read_db)
+
+        db.execute.assert_called_once()
+        read_db.execute.assert_not_called()
+        mock_list_cache.set.assert_called_once()
+
+    def test_rows_past_window_read_replica(self, mock_list_cache):
+        """Should serve uncached pages from the replica without touching the cache."""
+        db, read_db = MagicMock(), MagicMock()
+        mock_list_cache.size = 100
+
+        get_user_notifications_rows(db, uuid4(), uuid4(), limit=50, offset=100, read_db=read_db)
+
+        read_db.execute.assert_called_once()
+        db.execute.assert_not_called()
+        mock_list_cache.set.assert_not_called()
+
+
+class TestKeysetPagination:
+    """Tests for (created_at, id) cursor pagination."""
+
+    def test_cursor_roundtrip(self):
+        """Should decode what it encodes."""
+        created_at, notification_id = datetime(2026, 1, 2, 3, 4, 5, 678), uuid4()
+
+        cursor = encode_notification_cursor(created_at, notification_id)
+
+        assert decode_notification_cursor(cursor) == (created_at, notification_id)
+
+    def test_invalid_cursor_raises(self):
+        """Should raise ValueError for a malformed cursor."""
+        with pytest.raises(ValueError):
+            decode_notification_cursor("garbage")
+
+    def test_before_adds_keyset_predicate(self, mock_list_cache):
+        """Should bypass the cache and seek past the cursor in the database."""
+        db = MagicMock()
+        mock_list_cache.size = 100
+
+        get_user_notifications_rows(db, uuid4(), uuid4(), limit=10, before=(datetime(2026, 1, 1), uuid4()))
+
+        mock_list_cache.get.assert_not_called()
+        sql = str(db.execute.call_args[0][0])
+        assert "(notifications.created_at, notifications.id) <" in sql
+        assert "ORDER BY notifications.created_at DESC, notifications.id DESC" in sql
+
+
+class TestNotificationListCache:
+    """Tests for serving the first pages from the Redis list cache."""
+
+    @staticmethod
+    def _cached(n, unread_every=1):
+        return [
+            {
+                "id": str(uuid4()),
+                "user_id": str(uuid4()),
+                "tenant_id": str(uuid4()),
+                "notification_type": "task_assigned",
+                "title": f"n{i}",
+                "message": "m",
+                "link": None,
+                "is_read": i % unread_every != 0,
+                "read_at": None,
+                "created_at": datetime(2026, 1, 1).isoformat(),
+            }
+            for i in range(n)
+        ]
+
+    def test_first_page_served_from_cache(self, mock_list_cache):
+        """Should not query the database on a cache hit."""
+        db = MagicMock()
+        mock_list_cache.size = 100
+        mock_list_cache.get.return_value = self._cached(30)
+
+        result = get_user_notifications(db, uuid4(), uuid4(), limit=10, offset=10)
+
+        assert [n.title for n in result] == [f"n{i}" for i in range(10, 20)]
+        db.query.assert_not_called()
+
+    def test_miss_loads_window_into_cache(self, mock_list_cache):
+        """Should load the newest notifications and populate the cache on a miss."""
+        db = MagicMock()
+        user_id, tenant_id = uuid4(), uuid4()
+        mock_list_cache.size = 100
+        latest = [MagicMock(is_read=False) for _ in range(3)]
+        db.query.return_value.filter.return_value.order_by.return_value.limit.return_value.all.return_value = latest
+
+        result = get_user_notifications(db, user_id, tenant_id)
+
+        assert result == latest
+        db.query.return_value.filter.return_value.order_by.return_value.limit.assert_called_with(100)
+        mock_list_cache.set.assert_called_once_with(tenant_id, user_id, latest)
+
+    def test_unread_page_past_full_window_uses_database(self, mock_list_cache):
+        """Should fall back to the DB when a full window has too few unread items."""
+        db = MagicMock()
+        mock_list_cache.size = 100
+        mock_list_cache.get.return_value = self._cached(100, unread_every=50)
+
+        get_user_notifications(db, uuid4(), uuid4(), unread_only=True, limit=10)
+
+        db.query.return_value.filter.return_value.filter.assert_called()
+
+    def test_deep_page_uses_database(self, mock_list_cache):
+        """Should skip the cache beyond the cached window."""
+        db = MagicMock()
+        mock_list_cache.size = 100
+
+        get_user_notifications(db, uuid4(), uuid4(), limit=50, offset=100)
+
+        mock_list_cache.get.assert_not_called()
+        db.query.return_value.filter.return_value.order_by.return_value.offset.assert_called_with(100)
+
+
 class TestGetUnreadCount:
     """Tests for get_unread_count function."""
 
@@ -241,45 +640,97 @@ class TestGetUnreadCount:
         user_id = uuid4()
         tenant_id = uuid4()
 
-        db.query.return_value.filter.return_value.count.return_value = 5
+        db.query.return_value.filter.return_value.scalar.return_value = 5
 
         result = get_unread_count(db, user_id, tenant_id)
 
         assert result == 5
 
     def test_get_unread_count_zero_when_none(self):
-        """Should return 0 when no unread notifications."""
+        """Should return 0 when the user has no stats row yet."""
         db = MagicMock()
-        db.query.return_value.filter.return_value.count.return_value = 0
+        db.query.return_value.filter.return_value.scalar.return_value = None
 
         result = get_unread_count(db, uuid4(), uuid4())
 
         assert result == 0
 
 
+class TestUnreadCountCache:
+    """Tests for Redis-backed unread count caching."""
+
+    def test_cache_hit_skips_database(self, mock_unread_cache):
+        """Should return cached count without querying."""
+        db = MagicMock()
+        mock_unread_cache.get.return_value = 7
+
+        assert get_unread_count(db, uuid4(), uuid4()) == 7
+        db.query.assert_not_called()
+
+    def test_cache_miss_populates_cache(self, mock_unread_cache):
+        """Should store the DB count on a miss."""
+        db = MagicMock()
+        user_id, tenant_id = uuid4(), uuid4()
+        db.query.return_value.filter.return_value.scalar.return_value = 4
+
+        assert get_unread_count(db, user_id, tenant_id) == 4
+        mock_unread_cache.set.assert_called_once_with(tenant_id, user_id, 4)
+
+    def test_create_increments_cached_count(self, mock_unread_cache):
+        """Should bump the cached count after creating a notification."""
+        user_id, tenant_id = uuid4(), uuid4()
+
+        create_notification(MagicMock(), user_id, tenant_id, NotificationType.TASK_ASSIGNED, "t", "m")
+
+        mock_unread_cache.incr.assert_called_once_with(tenant_id, user_id)
+
+    def test_mark_all_read_invalidates(self, mock_unread_cache):
+        """Should drop the cached count after marking all read."""
+        db = MagicMock()
+        user_id, tenant_id = uuid4(), uuid4()
+        db.execute.return_value.rowcount = 3
+
+        mark_all_read(db, user_id, tenant_id)
+
+        mock_unread_cache.invalidate.assert_called_once_with(tenant_id, user_id)
+
+
 class TestMarkNotificationRead:
     """Tests for mark_notification_read function."""
 
-    def test_mark_notification_read_success(self):
-        """Should mark notification as read."""
+    def test_mark_notification_read_success(self, mock_unread_cache):
+        """Should mark notification as read with a single UPDATE ... RETURNING."""
         db = MagicMock()
         notification_id = uuid4()
         user_id = uuid4()
         tenant_id = uuid4()
 
         mock_notification = MagicMock()
-        mock_notification.is_read = False
-        db.query.return_value.filter.return_value.first.return_value = mock_notification
+        db.scalars.return_value.first.return_value = mock_notification
 
         result = mark_notification_read(db, notification_id, user_id, tenant_id)
 
-        assert mock_notification.is_read is True
-        assert mock_notification.read_at is not None
+        assert result == mock_notification
+        db.scalars.assert_called_once()
+        db.query.assert_not_called()
         db.commit.assert_called_once()
+        mock_unread_cache.incr.assert_called_once_with(tenant_id, user_id, -1)
+
+    def test_mark_notification_read_stamps_utc(self, mock_unread_cache):
+        """Should set read_at to the database clock in UTC, not server-local time."""
+        from sqlalchemy.dialects import postgresql
+
+        db = MagicMock()
+
+        mark_notification_read(db, uuid4(), uuid4(), uuid4())
+
+        stmt = db.scalars.call_args.args[0]
+        assert "read_at=timezone(%(timezone_1)s, now())" in str(stmt.compile(dialect=postgresql.dialect()))
 
     def test_mark_notification_read_returns_none_if_not_found(self):
         """Should return None if notification not found."""
         db = MagicMock()
+        db.scalars.return_value.first.return_value = None
         db.query.return_value.filter.return_value.first.return_value = None
 
         result = mark_notification_read(db, uuid4(), uuid4(), uuid4())
@@ -287,29 +738,61 @@ class TestMarkNotificationRead:
         assert result is None
         db.commit.assert_not_called()
 
-    def test_mark_notification_read_skips_if_already_read(self):
-        """Should not update if already read."""
+    def test_mark_notification_read_skips_if_already_read(self, mock_unread_cache):
+        """Should return the already-read notification without committing."""
         db = MagicMock()
         mock_notification = MagicMock()
         mock_notification.is_read = True
+        db.scalars.return_value.first.return_value = None
         db.query.return_value.filter.return_value.first.return_value = mock_notification
 
         result = mark_notification_read(db, uuid4(), uuid4(), uuid4())
 
-        # Should return the notification but not call commit for update
         assert result == mock_notification
+        db.commit.assert_not_called()
+        mock_unread_cache.incr.assert_not_called()
 
     def test_mark_notification_read_sets_read_at_timestamp(self):
-        """Should set read_at timestamp when marking read."""
+        """Should set is_read and read_at in the UPDATE."""
         db = MagicMock()
-        mock_notification = MagicMock()
-        mock_notification.is_read = False
-        mock_notification.read_at = None
-        db.query.return_value.filter.return_value.first.return_value = mock_notification
 
-        result = mark_notification_read(db, uuid4(), uuid4(), uuid4())
+        mark_notification_read(db, uuid4(), uuid4(), uuid4())
+
+        stmt = db.scalars.call_args[0][0]
+        assert {"is_read", "read_at"} <= {c.key for c in stmt._values}
 
-        assert mock_notification.read_at is not None
+
+class TestMarkNotificationsReadBulk:
+    """Tests for mark_notifications_read_bulk function."""
+
+    def test_single_update_for_small_batch(self):
+        """Should mark a small list with one UPDATE and one commit."""
+        db = MagicMock()
+        db.execute.return_value.rowcount = 3
+
+        result = mark_notifications_read_bulk(db, [uuid4() for _ in range(3)], uuid4(), uuid4())
+
+        assert result == 3
+        db.execute.assert_called_once()
+        db.commit.assert_called_once()
+
+    def test_chunks_by_batch_size(self):
+        """Should issue one UPDATE + commit per batch and sum rowcounts."""
+        db = MagicMock()
+        db.execute.return_value.rowcount = 2
+
+        result = mark_notifications_read_bulk(db, [uuid4() for _ in range(5)], uuid4(), uuid4(), batch_size=2)
+
+        assert db.execute.call_count == 3
+        assert db.commit.call_count == 3
+        assert result == 6
+
+    def test_empty_list_is_noop(self):
+        """Should not touch the database for an empty list."""
+        db = MagicMock()
+
+        assert mark_notifications_read_bulk(db, [], uuid4(), uuid4()) == 0
+        db.execute.assert_not_called()
 
 
 class TestMarkAllRead:
@@ -321,7 +804,7 @@ class TestMarkAllRead:
         user_id = uuid4()
         tenant_id = uuid4()
 
-        db.query.return_value.filter.return_value.update.return_value = 3
+        db.execute.return_value.rowcount = 3
 
         result = mark_all_read(db, user_id, tenant_id)
 
@@ -331,41 +814,70 @@ class TestMarkAllRead:
     def test_mark_all_read_zero_when_none_unread(self):
         """Should return 0 when no unread notifications."""
         db = MagicMock()
-        db.query.return_value.filter.return_value.update.return_value = 0
+        db.execute.return_value.rowcount = 0
 
         result = mark_all_read(db, uuid4(), uuid4())
 
         assert result == 0
 
+    def test_mark_all_read_updates_in_chunks(self):
+        """Should keep updating full chunks, committing after each."""
+        db = MagicMock()
+        db.execute.side_effect = [MagicMock(rowcount=2), MagicMock(rowcount=1)]
+
+        result = mark_all_read(db, uuid4(), uuid4(), batch_size=2)
+
+        assert result == 3
+        assert db.commit.call_count == 2
+
+
+class TestMarkAllReadAsync:
+    """Tests for mark_all_read_async function."""
+
+    def test_zeroes_cache_and_enqueues_task(self, mock_unread_cache):
+        """Should zero the cached count, enqueue the update and return the prior count."""
+        db = MagicMock()
+        user_id, tenant_id = uuid4(), uuid4()
+        mock_unread_cache.get.return_value = 12
+
+        with patch("app.tasks.notification_tasks.mark_all_read_task") as mock_task:
+            result = mark_all_read_async(db, user_id, tenant_id)
+
+        assert result == 12
+        mock_unread_cache.set.assert_called_once_with(tenant_id, user_id, 0)
+        mock_task.delay.assert_called_once_with(user_id, tenant_id)
+        db.execute.assert_not_called()
+
 
 class TestDeleteNotification:
     """Tests for delete_notification function."""
 
-    def test_delete_notification_success(self):
-        """Should delete notification and return True."""
+    def test_delete_notification_success(self, mock_unread_cache):
+        """Should delete notification with a single DELETE ... RETURNING and return True."""
         db = MagicMock()
         notification_id = uuid4()
         user_id = uuid4()
         tenant_id = uuid4()
 
-        mock_notification = MagicMock()
-        db.query.return_value.filter.return_value.first.return_value = mock_notification
+        db.execute.return_value.first.return_value = MagicMock(is_read=False)
 
         result = delete_notification(db, notification_id, user_id, tenant_id)
 
         assert result is True
-        db.delete.assert_called_once_with(mock_notification)
+        db.execute.assert_called_once()
+        db.query.assert_not_called()
         db.commit.assert_called_once()
+        mock_unread_cache.incr.assert_called_once_with(tenant_id, user_id, -1)
 
     def test_delete_notification_returns_false_if_not_found(self):
         """Should return False if notification not found."""
         db = MagicMock()
-        db.query.return_value.filter.return_value.first.return_value = None
+        db.execute.return_value.first.return_value = None
 
         result = delete_notification(db, uuid4(), uuid4(), uuid4())
 
         assert result is False
-        db.delete.assert_not_called()
+        db.commit.assert_not_called()
 
 
 class TestDeleteOldNotifications:
@@ -376,7 +888,7 @@ class TestDeleteOldNotifications:
         db = MagicMock()
         tenant_id = uuid4()
 
-        db.query.return_value.filter.return_value.delete.return_value = 10
+        db.execute.return_value.rowcount = 10
 
         result = delete_old_notifications(db, tenant_id, days_old=90)
 
@@ -386,7 +898,7 @@ class TestDeleteOldNotifications:
     def test_delete_old_notifications_default_90_days(self):
         """Should default to 90 days old threshold."""
         db = MagicMock()
-        db.query.return_value.filter.return_value.delete.return_value = 0
+        db.execute.return_value.rowcount = 0
 
         result = delete_old_notifications(db, uuid4())
 
@@ -395,12 +907,74 @@ class TestDeleteOldNotifications:
     def test_delete_old_notifications_custom_days(self):
         """Should use custom days_old value."""
         db = MagicMock()
-        db.query.return_value.filter.return_value.delete.return_value = 5
+        db.execute.return_value.rowcount = 5
 
         result = delete_old_notifications(db, uuid4(), days_old=30)
 
         assert result == 5
 
+    def test_delete_old_notifications_loops_until_partial_chunk(self):
+        """Should keep deleting full chunks and commit after each one."""
+        db = MagicMock()
+        db.execute.side_effect = [MagicMock(rowcount=2), MagicMock(rowcount=2), MagicMock(rowcount=1)]
+
+        result = delete_old_notifications(db, uuid4(), batch_size=2)
+
+        assert result == 5
+        assert db.execute.call_count == 3
+        assert db.commit.call_count == 3
+
+
+class TestDisplayNameCache:
+    """Tests for Redis-cached master/entity names."""
+
+    def test_master_name_cache_hit_skips_database(self, mock_name_cache):
+        """Should return the cached name without querying."""
+        db = MagicMock()
+        mock_name_cache.return_value = "GSTR-3B"
+
+        assert get_master_name(db, uuid4()) == "GSTR-3B"
+        db.query.assert_not_called()
+
+    def test_master_name_miss_queries_single_column_and_caches(self):
+        """Should select only the name column and cache it."""
+        db = MagicMock()
+        master_id = uuid4()
+        db.query.return_value.filter.return_value.scalar.return_value = "TDS Return"
+
+        with patch("app.services.notification_service.set_cached_name") as mock_set:
+            assert get_master_name(db, master_id) == "TDS Return"
+
+        mock_set.assert_called_once_with("master", master_id, "TDS Return")
+
+    def test_entity_name_defaults_when_missing(self):
+        """Should fall back to "Entity" for unknown or missing entities."""
+        db = MagicMock()
+        db.query.return_value.filter.return_value.scalar.return_value = None
+
+        assert get_entity_name(db, uuid4()) == "Entity"
+        assert get_entity_name(db, None) == "Entity"
+
+    def test_instance_ctx_uses_eager_loaded_names(self, mock_name_cache):
+        """Should read names from loaded relationships instead of the cache or database."""
+        from app.models import ComplianceInstance, ComplianceMaster, Entity
+        from app.services.notification_service import _instance_ctx
+
+        db = MagicMock()
+        instance = ComplianceInstance(
+            id=uuid4(),
+            due_date=date.today(),
+            compliance_master=ComplianceMaster(compliance_name="GSTR-1"),
+            entity=Entity(entity_name="Acme India"),
+        )
+
+        ctx = _instance_ctx(db, instance, with_entity=True)
+
+        assert ctx["master_name"] == "GSTR-1"
+        assert ctx["entity_name"] == "Acme India"
+        mock_name_cache.assert_not_called()
+        db.query.assert_not_called()
+
 
 class TestNotifyTaskAssigned:
     """Tests for notify_task_assigned helper."""
@@ -518,6 +1092,35 @@ class TestNotifyReminderT3:
 
         assert result is None
 
+    def test_notify_reminder_t3_skips_duplicate(self, mock_claim_once):
+        """Should not touch the DB when today's reminder was already sent."""
+        db = MagicMock()
+        instance = MagicMock()
+        owner = MagicMock()
+        mock_claim_once.return_value = False
+
+        with patch("app.services.notification_service.create_notification") as mock_create:
+            result = notify_reminder_t3(db, instance, owner)
+
+        assert result is None
+        mock_create.assert_not_called()
+        key = mock_claim_once.call_args[0][0]
+        assert key.startswith(f"notif_dedup:{instance.tenant_id}:{owner.id}:{NotificationType.REMINDER_T3}:")
+
+    def test_notify_reminder_t3_releases_claim_on_failure(self):
+        """Should release the dedup key if the insert fails so a retry can send it."""
+        instance = MagicMock()
+        instance.compliance_master.compliance_name = "GST Filing"
+
+        with (
+            patch("app.services.notification_service.create_notification", side_effect=RuntimeError),
+            patch("app.services.notification_service.release_claim") as mock_release,
+        ):
+            with pytest.raises(RuntimeError):
+                notify_reminder_t3(MagicMock(), instance, MagicMock())
+
+        mock_release.assert_called_once()
+
 
 class TestNotifyReminderDue:
     """Tests for notify_reminder_due helper."""
@@ -595,9 +1198,10 @@ class TestNotifyOverdueEscalation:
 
         assert result is None
 
-    def test_notify_overdue_escalation_includes_entity_name(self):
+    def test_notify_overdue_escalation_includes_entity_name(self, mock_name_cache):
         """Should include entity name in message."""
         db = MagicMock()
+        mock_name_cache.side_effect = lambda kind, _: {"master": "GST Filing", "entity": "ABC Corp"}[kind]
 
         instance = MagicMock()
         instance.id = uuid4()
@@ -783,12 +1387,15 @@ class TestNotifyInstanceCompleted:
 
         users = [MagicMock(id=uuid4()), MagicMock(id=uuid4()), MagicMock(id=uuid4())]
 
-        with patch("app.services.notification_service.create_notification") as mock_create:
-            mock_create.return_value = MagicMock()
+        with patch("app.services.notification_service.create_notifications_bulk") as mock_bulk:
+            mock_bulk.side_effect = lambda db, rows: [MagicMock() for _ in rows]
 
             result = notify_instance_completed(db, instance, users)
 
-        assert mock_create.call_count == 3
+        mock_bulk.assert_called_once()
+        rows = mock_bulk.call_args[0][1]
+        assert [row["user_id"] for row in rows] == [user.id for user in users]
+        assert all(row["notification_type"] == NotificationType.INSTANCE_COMPLETED for row in rows)
         assert len(result) == 3
 
     def test_notify_instance_completed_skips_none_users(self):
@@ -805,12 +1412,12 @@ class TestNotifyInstanceCompleted:
 
         users = [MagicMock(id=uuid4()), None, MagicMock(id=uuid4())]
 
-        with patch("app.services.notification_service.create_notification") as mock_create:
-            mock_create.return_value = MagicMock()
+        with patch("app.services.notification_service.create_notifications_bulk") as mock_bulk:
+            mock_bulk.side_effect = lambda db, rows: [MagicMock() for _ in rows]
 
             result = notify_instance_completed(db, instance, users)
 
-        assert mock_create.call_count == 2
+        assert len(mock_bulk.call_args[0][1]) == 2
         assert len(result) == 2
 
     def test_notify_instance_completed_returns_empty_list_for_empty_users(self):
@@ -837,6 +1444,7 @@ class TestEdgeCases:
         instance.tenant_id = uuid4()
         instance.due_date = "2024-03-15"
         instance.compliance_master = None
+        instance.compliance_master_id = None
         instance.entity = MagicMock()
         instance.entity.entity_name = "ABC Corp"
 
@@ -25,6 +25,8 @@ from app.services.workflow_engine import (
     STANDARD_WORKFLOW,
     resolve_role_to_user,
     get_role_by_code,
+    resolve_role_assignments,
+    RoleCache,
     create_workflow_tasks,
     get_tasks_for_instance,
     get_current_task,
@@ -34,6 +36,8 @@ from app.services.workflow_engine import (
     reject_task,
     reassign_task,
     check_instance_completion,
+    get_task_status_counts,
+    TaskStatusCounts,
     get_user_assigned_tasks,
     get_overdue_tasks,
     get_tasks_due_soon,
@@ -124,6 +128,62 @@ class TestResolveRoleToUser:
         assert result is None
 
 
+class TestResolveRoleAssignments:
+    """Tests for the batched role resolution used by create_workflow_tasks."""
+
+    def test_prefers_user_and_falls_back_to_role(self):
+        """Roles with an eligible user map to the user, others to the role."""
+        db = MagicMock()
+        tax_role, cfo_role, user_id = uuid4(), uuid4(), uuid4()
+
+        db.query.return_value.filter.return_value.all.return_value = [("TAX_LEAD", tax_role), ("CFO", cfo_role)]
+        db.query.return_value.join.return_value.join.return_value.filter.return_value.all.return_value = [
+            (user_id, tax_role)
+        ]
+
+        result = resolve_role_assignments(db, uuid4(), {"TAX_LEAD", "CFO"})
+
+        assert result == {"TAX_LEAD": (user_id, None), "CFO": (None, cfo_role)}
+
+    def test_unknown_roles_skip_user_query(self):
+        """Should return {} without a user query when no role code exists."""
+        db = MagicMock()
+        db.query.return_value.filter.return_value.all.return_value = []
+
+        assert resolve_role_assignments(db, uuid4(), {"UNKNOWN"}) == {}
+        assert db.query.call_count == 1
+
+    def test_role_cache_reuses_lookups(self):
+        """A shared RoleCache should skip queries for codes/entities already resolved."""
+        db = MagicMock()
+        role_id, user_id, entity_id = uuid4(), uuid4(), uuid4()
+        db.query.return_value.filter.return_value.all.return_value = [("TAX_LEAD", role_id)]
+        db.query.return_value.join.return_value.join.return_value.filter.return_value.all.return_value = [
+            (user_id, role_id)
+        ]
+        cache = RoleCache()
+
+        first = resolve_role_assignments(db, entity_id, {"TAX_LEAD"}, role_cache=cache)
+        second = resolve_role_assignments(db, entity_id, {"TAX_LEAD"}, role_cache=cache)
+
+        assert first == second == {"TAX_LEAD": (user_id, None)}
+        assert db.query.call_count == 2  # role + users, first call only
+
+    def test_role_cache_requeries_users_for_new_entity(self):
+        """Roles come from the cache; a new entity only needs the user query."""
+        db = MagicMock()
+        role_id = uuid4()
+        db.query.return_value.filter.return_value.all.return_value = [("TAX_LEAD", role_id)]
+        db.query.return_value.join.return_value.join.return_value.filter.return_value.all.return_value = []
+        cache = RoleCache()
+
+        resolve_role_assignments(db, uuid4(), {"TAX_LEAD"}, role_cache=cache)
+        result = resolve_role_assignments(db, uuid4(), {"TAX_LEAD"}, role_cache=cache)
+
+        assert result == {"TAX_LEAD": (None, role_id)}
+        assert db.query.call_count == 3
+
+
 class TestGetRoleByCode:
     """Tests for get_role_by_code function."""
 
@@ -165,7 +225,22 @@ class TestTaskStateTransitions:
         assert task.started_at == date.today()
         assert task.updated_by == user_id
         db.commit.assert_called_once()
-        db.refresh.assert_called_once_with(task)
+        db.refresh.assert_not_called()
+
+    def test_transition_commit_keeps_task_loaded(self):
+        """Transitions commit without expiring the task, then restore the session setting."""
+        db = MagicMock()
+        db.expire_on_commit = True
+        task = MagicMock()
+        task.status = "Pending"
+        task.parent_task_id = None
+        expire_during_commit = []
+        db.commit.side_effect = lambda: expire_during_commit.append(db.expire_on_commit)
+
+        start_task(db, task, uuid4())
+
+        assert expire_during_commit == [False]
+        assert db.expire_on_commit is True
 
     def test_start_task_fails_if_not_pending(self):
         """Cannot start a task that is not in Pending state."""
@@ -215,7 +290,8 @@ class TestTaskStateTransitions:
         task.status = "In Progress"
         task.compliance_instance = MagicMock()
 
-        result = complete_task(db, task, user_id, "Task completed successfully")
+        with patch("app.services.workflow_engine.check_instance_completion"):
+            result = complete_task(db, task, user_id, "Task completed successfully")
 
         assert task.status == "Completed"
         assert task.completed_at == date.today()
@@ -307,86 +383,60 @@ class TestSequenceEnforcement:
     """Tests for task sequence ordering."""
 
     def test_get_next_pending_task_returns_first_pending(self):
-        """Should return first pending task when no parent dependency."""
+        """Should return first pending task when its parent is completed."""
         db = MagicMock()
-        instance_id = uuid4()
-
-        task1 = MagicMock()
-        task1.status = "Completed"
-        task1.parent_task_id = None
-
-        task2 = MagicMock()
-        task2.status = "Pending"
-        task2.parent_task_id = task1.id
-
-        task1_mock = MagicMock()
-        task1_mock.status = "Completed"
+        task = MagicMock()
+        task.status = "Pending"
 
-        with patch("app.services.workflow_engine.get_tasks_for_instance") as mock_get_tasks:
-            mock_get_tasks.return_value = [task1, task2]
-            db.query.return_value.filter.return_value.first.return_value = task1_mock
+        db.query.return_value.outerjoin.return_value.filter.return_value.order_by.return_value.first.return_value = (
+            task,
+            "Completed",
+        )
 
-            result = get_next_pending_task(db, instance_id)
+        result = get_next_pending_task(db, uuid4())
 
-        assert result == task2
+        assert result == task
 
     def test_get_next_pending_task_blocked_by_parent(self):
         """Should return None if parent task is not completed."""
         db = MagicMock()
-        instance_id = uuid4()
-
-        task1 = MagicMock()
-        task1.id = uuid4()
-        task1.status = "In Progress"
-
-        task2 = MagicMock()
-        task2.status = "Pending"
-        task2.parent_task_id = task1.id
-
-        parent_mock = MagicMock()
-        parent_mock.status = "In Progress"
+        task = MagicMock()
+        task.status = "Pending"
 
-        with patch("app.services.workflow_engine.get_tasks_for_instance") as mock_get_tasks:
-            mock_get_tasks.return_value = [task1, task2]
-            db.query.return_value.filter.return_value.first.return_value = parent_mock
+        db.query.return_value.outerjoin.return_value.filter.return_value.order_by.return_value.first.return_value = (
+            task,
+            "In Progress",
+        )
 
-            result = get_next_pending_task(db, instance_id)
+        result = get_next_pending_task(db, uuid4())
 
         assert result is None
 
     def test_get_next_pending_task_no_parent_starts_immediately(self):
         """First task without parent can start immediately."""
         db = MagicMock()
-        instance_id = uuid4()
-
         task = MagicMock()
         task.status = "Pending"
         task.parent_task_id = None
 
-        with patch("app.services.workflow_engine.get_tasks_for_instance") as mock_get_tasks:
-            mock_get_tasks.return_value = [task]
+        db.query.return_value.outerjoin.return_value.filter.return_value.order_by.return_value.first.return_value = (
+            task,
+            None,
+        )
 
-            result = get_next_pending_task(db, instance_id)
+        result = get_next_pending_task(db, uuid4())
 
         assert result == task
 
     def test_get_next_pending_task_returns_none_when_all_completed(self):
-        """Should return None when all tasks are completed."""
+        """Should return None when no task is pending."""
         db = MagicMock()
-        instance_id = uuid4()
-
-        task1 = MagicMock()
-        task1.status = "Completed"
-
-        task2 = MagicMock()
-        task2.status = "Completed"
+        db.query.return_value.outerjoin.return_value.filter.return_value.order_by.return_value.first.return_value = None
 
-        with patch("app.services.workflow_engine.get_tasks_for_instance") as mock_get_tasks:
-            mock_get_tasks.return_value = [task1, task2]
-
-            result = get_next_pending_task(db, instance_id)
+        result = get_next_pending_task(db, uuid4())
 
         assert result is None
+        db.query.assert_called_once()
 
 
 class TestGetTasksForInstance:
@@ -398,17 +448,17 @@ class TestGetTasksForInstance:
         instance_id = uuid4()
 
         tasks = [MagicMock(sequence_order=i) for i in range(1, 4)]
-        db.query.return_value.filter.return_value.order_by.return_value.all.return_value = tasks
+        db.execute.return_value.scalars.return_value.all.return_value = tasks
 
         result = get_tasks_for_instance(db, instance_id)
 
         assert len(result) == 3
-        db.query.return_value.filter.return_value.order_by.assert_called_once()
+        db.execute.assert_called_once()
 
     def test_get_tasks_for_instance_returns_empty_list(self):
         """Should return empty list if no tasks exist."""
         db = MagicMock()
-        db.query.return_value.filter.return_value.order_by.return_value.all.return_value = []
+        db.execute.return_value.scalars.return_value.all.return_value = []
 
         result = get_tasks_for_instance(db, uuid4())
 
@@ -425,7 +475,7 @@ class TestGetCurrentTask:
 
         current_task = MagicMock()
         current_task.status = "In Progress"
-        db.query.return_value.filter.return_value.order_by.return_value.first.return_value = current_task
+        db.execute.return_value.scalars.return_value.first.return_value = current_task
 
         result = get_current_task(db, instance_id)
 
@@ -434,7 +484,7 @@ class TestGetCurrentTask:
     def test_get_current_task_returns_none_when_all_completed(self):
         """Should return None when all tasks are completed."""
         db = MagicMock()
-        db.query.return_value.filter.return_value.order_by.return_value.first.return_value = None
+        db.execute.return_value.scalars.return_value.first.return_value = None
 
         result = get_current_task(db, uuid4())
 
@@ -494,14 +544,8 @@ class TestInstanceCompletion:
         instance.id = uuid4()
         instance.status = "In Progress"
 
-        tasks = [
-            MagicMock(status="Completed"),
-            MagicMock(status="Completed"),
-            MagicMock(status="Completed"),
-        ]
-
-        with patch("app.services.workflow_engine.get_tasks_for_instance") as mock_get:
-            mock_get.return_value = tasks
+        with patch("app.services.workflow_engine.get_task_status_counts") as mock_counts:
+            mock_counts.return_value = TaskStatusCounts(total=3, completed=3, in_progress=0, rejected=0)
 
             result = check_instance_completion(db, instance)
 
@@ -518,14 +562,8 @@ class TestInstanceCompletion:
         instance.id = uuid4()
         instance.status = "In Progress"
 
-        tasks = [
-            MagicMock(status="Completed"),
-            MagicMock(status="In Progress"),
-            MagicMock(status="Pending"),
-        ]
-
-        with patch("app.services.workflow_engine.get_tasks_for_instance") as mock_get:
-            mock_get.return_value = tasks
+        with patch("app.services.workflow_engine.get_task_status_counts") as mock_counts:
+            mock_counts.return_value = TaskStatusCounts(total=3, completed=1, in_progress=1, rejected=0)
 
             result = check_instance_completion(db, instance)
 
@@ -539,8 +577,8 @@ class TestInstanceCompletion:
         instance = MagicMock()
         instance.id = uuid4()
 
-        with patch("app.services.workflow_engine.get_tasks_for_instance") as mock_get:
-            mock_get.return_value = []
+        with patch("app.services.workflow_engine.get_task_status_counts") as mock_counts:
+            mock_counts.return_value = TaskStatusCounts(total=0, completed=0, in_progress=0, rejected=0)
 
             result = check_instance_completion(db, instance)
 
@@ -553,19 +591,24 @@ class TestInstanceCompletion:
         instance.id = uuid4()
         instance.status = "Completed"
 
-        tasks = [
-            MagicMock(status="Completed"),
-            MagicMock(status="Completed"),
-        ]
-
-        with patch("app.services.workflow_engine.get_tasks_for_instance") as mock_get:
-            mock_get.return_value = tasks
+        with patch("app.services.workflow_engine.get_task_status_counts") as mock_counts:
+            mock_counts.return_value = TaskStatusCounts(total=2, completed=2, in_progress=0, rejected=0)
 
             result = check_instance_completion(db, instance)
 
         # Returns False because status didn't change
         assert result is False
 
+    def test_get_task_status_counts_single_row(self):
+        """Should return the aggregate row as TaskStatusCounts."""
+        db = MagicMock()
+        db.query.return_value.filter.return_value.one.return_value = (5, 2, 1, 1)
+
+        counts = get_task_status_counts(db, uuid4())
+
+        assert counts == TaskStatusCounts(total=5, completed=2, in_progress=1, rejected=1)
+        db.query.assert_called_once()
+
 
 class TestUpdateInstanceStatusFromTasks:
     """Tests for updating instance status based on task states."""
@@ -577,13 +620,8 @@ class TestUpdateInstanceStatusFromTasks:
         instance.id = uuid4()
         instance.status = "In Progress"
 
-        tasks = [
-            MagicMock(status="Completed"),
-            MagicMock(status="Completed"),
-        ]
-
-        with patch("app.services.workflow_engine.get_tasks_for_instance") as mock_get:
-            mock_get.return_value = tasks
+        with patch("app.services.workflow_engine.get_task_status_counts") as mock_counts:
+            mock_counts.return_value = TaskStatusCounts(total=2, completed=2, in_progress=0, rejected=0)
 
             result = update_instance_status_from_tasks(db, instance)
 
@@ -597,14 +635,8 @@ class TestUpdateInstanceStatusFromTasks:
         instance.id = uuid4()
         instance.status = "In Progress"
 
-        tasks = [
-            MagicMock(status="Completed"),
-            MagicMock(status="Rejected"),
-            MagicMock(status="Pending"),
-        ]
-
-        with patch("app.services.workflow_engine.get_tasks_for_instance") as mock_get:
-            mock_get.return_value = tasks
+        with patch("app.services.workflow_engine.get_task_status_counts") as mock_counts:
+            mock_counts.return_value = TaskStatusCounts(total=3, completed=1, in_progress=0, rejected=1)
 
             result = update_instance_status_from_tasks(db, instance)
 
@@ -617,14 +649,8 @@ class TestUpdateInstanceStatusFromTasks:
         instance.id = uuid4()
         instance.status = "Not Started"
 
-        tasks = [
-            MagicMock(status="Completed"),
-            MagicMock(status="In Progress"),
-            MagicMock(status="Pending"),
-        ]
-
-        with patch("app.services.workflow_engine.get_tasks_for_instance") as mock_get:
-            mock_get.return_value = tasks
+        with patch("app.services.workflow_engine.get_task_status_counts") as mock_counts:
+            mock_counts.return_value = TaskStatusCounts(total=3, completed=1, in_progress=1, rejected=0)
 
             result = update_instance_status_from_tasks(db, instance)
 
@@ -637,13 +663,8 @@ class TestUpdateInstanceStatusFromTasks:
         instance.id = uuid4()
         instance.status = "Not Started"
 
-        tasks = [
-            MagicMock(status="Pending"),
-            MagicMock(status="Pending"),
-        ]
-
-        with patch("app.services.workflow_engine.get_tasks_for_instance") as mock_get:
-            mock_get.return_value = tasks
+        with patch("app.services.workflow_engine.get_task_status_counts") as mock_counts:
+            mock_counts.return_value = TaskStatusCounts(total=2, completed=0, in_progress=0, rejected=0)
 
             result = update_instance_status_from_tasks(db, instance)
 
@@ -656,8 +677,8 @@ class TestUpdateInstanceStatusFromTasks:
         instance.id = uuid4()
         instance.status = "Pending"
 
-        with patch("app.services.workflow_engine.get_tasks_for_instance") as mock_get:
-            mock_get.return_value = []
+        with patch("app.services.workflow_engine.get_task_status_counts") as mock_counts:
+            mock_counts.return_value = TaskStatusCounts(total=0, completed=0, in_progress=0, rejected=0)
 
             result = update_instance_status_from_tasks(db, instance)
 
@@ -674,22 +695,27 @@ class TestGetUserAssignedTasks:
         tenant_id = uuid4()
 
         tasks = [MagicMock(), MagicMock()]
-        db.query.return_value.filter.return_value.filter.return_value.order_by.return_value.all.return_value = tasks
+        query = db.query.return_value.options.return_value
+        query.filter.return_value.filter.return_value.order_by.return_value.all.return_value = tasks
 
         result = get_user_assigned_tasks(db, user_id, tenant_id, include_role_tasks=False)
 
         assert len(result) == 2
 
+    def test_get_user_assigned_tasks_single_query_for_roles(self):
+        """Role-assigned tasks should be resolved via a subquery, not a User load."""
+        db = MagicMock()
+
+        get_user_assigned_tasks(db, uuid4(), uuid4())
+
+        db.query.assert_called_once()
+
     def test_get_user_assigned_tasks_with_status_filter(self):
         """Should filter by status when specified."""
         db = MagicMock()
         user_id = uuid4()
         tenant_id = uuid4()
 
-        mock_user = MagicMock()
-        mock_user.roles = []
-        db.query.return_value.filter.return_value.first.return_value = mock_user
-
         result = get_user_assigned_tasks(db, user_id, tenant_id, status_filter=["Pending", "In Progress"])
 
         # Verify filter was applied
@@ -709,7 +735,7 @@ class TestGetOverdueTasks:
             MagicMock(due_date=date(2024, 6, 10)),
             MagicMock(due_date=date(2024, 6, 14)),
         ]
-        db.query.return_value.filter.return_value.order_by.return_value.all.return_value = overdue_tasks
+        db.execute.return_value.scalars.return_value.all.return_value = overdue_tasks
 
         result = get_overdue_tasks(db, tenant_id, today=today)
 
@@ -720,17 +746,17 @@ class TestGetOverdueTasks:
         db = MagicMock()
         tenant_id = uuid4()
 
-        db.query.return_value.filter.return_value.order_by.return_value.all.return_value = []
+        db.execute.return_value.scalars.return_value.all.return_value = []
 
         result = get_overdue_tasks(db, tenant_id)
 
         # Verify filter includes status check
-        db.query.assert_called()
+        db.execute.assert_called_once()
 
     def test_get_overdue_tasks_defaults_to_today(self):
         """Should use today's date when not specified."""
         db = MagicMock()
-        db.query.return_value.filter.return_value.order_by.return_value.all.return_value = []
+        db.execute.return_value.scalars.return_value.all.return_value = []
 
         result = get_overdue_tasks(db, uuid4())
 
@@ -750,7 +776,7 @@ class TestGetTasksDueSoon:
             MagicMock(due_date=date(2024, 6, 16)),
             MagicMock(due_date=date(2024, 6, 17)),
         ]
-        db.query.return_value.filter.return_value.order_by.return_value.all.return_value = upcoming_tasks
+        db.execute.return_value.scalars.return_value.all.return_value = upcoming_tasks
 
         result = get_tasks_due_soon(db, tenant_id, days=3, today=today)
 
@@ -759,7 +785,7 @@ class TestGetTasksDueSoon:
     def test_get_tasks_due_soon_default_3_days(self):
         """Should default to 3 days lookahead."""
         db = MagicMock()
-        db.query.return_value.filter.return_value.order_by.return_value.all.return_value = []
+        db.execute.return_value.scalars.return_value.all.return_value = []
 
         result = get_tasks_due_soon(db, uuid4())
 
@@ -772,11 +798,11 @@ class TestGetTasksDueSoon:
         today = date(2024, 6, 15)
 
         # Only include tasks due on or after today
-        db.query.return_value.filter.return_value.order_by.return_value.all.return_value = []
+        db.execute.return_value.scalars.return_value.all.return_value = []
 
         result = get_tasks_due_soon(db, tenant_id, today=today)
 
-        db.query.assert_called()
+        db.execute.assert_called_once()
 
 
 class TestCreateWorkflowTasks:
@@ -793,16 +819,16 @@ class TestCreateWorkflowTasks:
         instance.compliance_master = None
 
         # Mock resolve_role_to_user to return None
-        with patch("app.services.workflow_engine.resolve_role_to_user") as mock_resolve:
-            mock_resolve.return_value = None
-            with patch("app.services.workflow_engine.get_role_by_code") as mock_role:
-                mock_role.return_value = MagicMock(id=uuid4())
+        with patch("app.services.workflow_engine.resolve_role_assignments") as mock_assign:
+            mock_assign.return_value = {}
 
-                result = create_workflow_tasks(db, instance)
+            result = create_workflow_tasks(db, instance)
 
         assert len(result) == 5  # STANDARD_WORKFLOW has 5 steps
-        db.add.assert_called()
+        db.add_all.assert_called_once_with(result)
         db.commit.assert_called_once()
+        db.flush.assert_not_called()
+        db.refresh.assert_not_called()
 
     def test_create_workflow_tasks_uses_custom_config(self):
         """Should use provided workflow_config when specified."""
@@ -819,12 +845,10 @@ class TestCreateWorkflowTasks:
             {"step": "Step 2", "task_type": "Complete", "description": "Second step", "sequence": 2},
         ]
 
-        with patch("app.services.workflow_engine.resolve_role_to_user") as mock_resolve:
-            mock_resolve.return_value = None
-            with patch("app.services.workflow_engine.get_role_by_code") as mock_role:
-                mock_role.return_value = MagicMock(id=uuid4())
+        with patch("app.services.workflow_engine.resolve_role_assignments") as mock_assign:
+            mock_assign.return_value = {}
 
-                result = create_workflow_tasks(db, instance, workflow_config=custom_workflow)
+            result = create_workflow_tasks(db, instance, workflow_config=custom_workflow)
 
         assert len(result) == 2
 
@@ -842,18 +866,18 @@ class TestCreateWorkflowTasks:
         instance.compliance_master.owner_role_code = "TAX_LEAD"
         instance.compliance_master.approver_role_code = "CFO"
 
-        mock_user = MagicMock()
-        mock_user.id = uuid4()
+        user_id = uuid4()
 
-        with patch("app.services.workflow_engine.resolve_role_to_user") as mock_resolve:
-            mock_resolve.return_value = mock_user
-            with patch("app.services.workflow_engine.get_role_by_code") as mock_role:
-                mock_role.return_value = None
+        with patch("app.services.workflow_engine.resolve_role_assignments") as mock_assign:
+            mock_assign.return_value = {"TAX_LEAD": (user_id, None), "CFO": (None, uuid4())}
 
-                result = create_workflow_tasks(db, instance)
+            result = create_workflow_tasks(db, instance)
 
-        # Verify at least one task was created with user assignment
-        db.add.assert_called()
+        # One batched lookup for all distinct role codes
+        mock_assign.assert_called_once_with(db, instance.entity_id, {"TAX_LEAD", "CFO"}, role_cache=None)
+        assert result[0].assigned_to_user_id == user_id
+        assert result[2].assigned_to_user_id is None
+        assert result[2].assigned_to_role_id is not None
 
     def test_create_workflow_tasks_calculates_due_dates(self):
         """Task due dates should be before instance due date."""
@@ -865,46 +889,68 @@ class TestCreateWorkflowTasks:
         instance.due_date = date.today() + timedelta(days=30)
         instance.compliance_master = None
 
-        with patch("app.services.workflow_engine.resolve_role_to_user") as mock_resolve:
-            mock_resolve.return_value = None
-            with patch("app.services.workflow_engine.get_role_by_code") as mock_role:
-                mock_role.return_value = MagicMock(id=uuid4())
+        with patch("app.services.workflow_engine.resolve_role_assignments") as mock_assign:
+            mock_assign.return_value = {}
 
-                result = create_workflow_tasks(db, instance)
+            result = create_workflow_tasks(db, instance)
 
         # All tasks created, due dates calculated
-        assert db.add.call_count == 5
+        assert len(db.add_all.call_args.args[0]) == 5
+        assert all(task.due_date < instance.due_date for task in result)
 
-    def test_create_workflow_tasks_sets_parent_task_id(self):
-        """Tasks should be linked via parent_task_id."""
+    def test_create_workflow_tasks_moves_past_due_dates_to_tomorrow(self):
+        """Steps whose computed due date is already past should be due tomorrow."""
         db = MagicMock()
         instance = MagicMock()
         instance.id = uuid4()
         instance.tenant_id = uuid4()
         instance.entity_id = uuid4()
-        instance.due_date = date.today() + timedelta(days=30)
+        instance.due_date = date.today() + timedelta(days=4)
         instance.compliance_master = None
 
-        created_tasks = []
+        with patch("app.services.workflow_engine.resolve_role_assignments") as mock_assign:
+            mock_assign.return_value = {}
+
+            result = create_workflow_tasks(db, instance)
 
-        def capture_add(task):
-            task.id = uuid4()  # Simulate flush assigning ID
-            created_tasks.append(task)
+        assert all(task.due_date >= date.today() for task in result)
+        assert result[0].due_date == date.today() + timedelta(days=1)
 
-        db.add.side_effect = capture_add
+    def test_create_workflow_tasks_sets_parent_task_id(self):
+        """Tasks should be linked via parent_task_id."""
+        db = MagicMock()
+        instance = MagicMock()
+        instance.id = uuid4()
+        instance.tenant_id = uuid4()
+        instance.entity_id = uuid4()
+        instance.due_date = date.today() + timedelta(days=30)
+        instance.compliance_master = None
 
-        with patch("app.services.workflow_engine.resolve_role_to_user") as mock_resolve:
-            mock_resolve.return_value = None
-            with patch("app.services.workflow_engine.get_role_by_code") as mock_role:
-                mock_role.return_value = MagicMock(id=uuid4())
+        with patch("app.services.workflow_engine.resolve_role_assignments") as mock_assign:
+            mock_assign.return_value = {}
 
-                result = create_workflow_tasks(db, instance)
+            created_tasks = create_workflow_tasks(db, instance)
 
         # First task should have no parent
         assert created_tasks[0].parent_task_id is None
-        # Subsequent tasks should have parent
+        # Subsequent tasks link to the previous task's client-side id
         for i in range(1, len(created_tasks)):
-            assert created_tasks[i].parent_task_id is not None
+            assert created_tasks[i].parent_task_id == created_tasks[i - 1].id
+
+    def test_create_workflow_tasks_reads_master_once(self):
+        """Master relationship should be read once, not per step."""
+        db = MagicMock()
+        instance = MagicMock()
+        instance.due_date = date.today() + timedelta(days=30)
+        master = MagicMock(compliance_name="GSTR-3B", workflow_config=None)
+        master_prop = PropertyMock(return_value=master)
+        type(instance).compliance_master = master_prop
+
+        with patch("app.services.workflow_engine.resolve_role_assignments", return_value={}):
+            result = create_workflow_tasks(db, instance)
+
+        assert master_prop.call_count == 1
+        assert all(task.task_name.endswith(" - GSTR-3B") for task in result)
 
 
 class TestEdgeCases:
@@ -953,7 +999,7 @@ class TestEdgeCases:
         tenant_id = uuid4()
         custom_date = date(2024, 12, 31)
 
-        db.query.return_value.filter.return_value.order_by.return_value.all.return_value = []
+        db.execute.return_value.scalars.return_value.all.return_value = []
 
         result = get_overdue_tasks(db, tenant_id, today=custom_date)
 
@@ -965,7 +1011,7 @@ class TestEdgeCases:
         tenant_id = uuid4()
         today = date(2024, 6, 15)
 
-        db.query.return_value.filter.return_value.order_by.return_value.all.return_value = []
+        db.execute.return_value.scalars.return_value.all.return_value = []
 
         result = get_tasks_due_soon(db, tenant_id, days=0, today=today)
 
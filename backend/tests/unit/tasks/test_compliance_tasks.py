@@ -9,148 +9,200 @@ Tests cover:
 - Overdue status updates
 """
 
-from datetime import date, timedelta
+from datetime import date
 from unittest.mock import patch, MagicMock
 from uuid import uuid4
 
-from app.models import Tenant, ComplianceInstance
-
 
 class TestGenerateComplianceInstancesDaily:
-    """Tests for generate_compliance_instances_daily task."""
+    """Tests for generate_compliance_instances_daily and its per-tenant subtasks."""
 
+    @patch("app.tasks.compliance_tasks.chord")
     @patch("app.tasks.compliance_tasks.SessionLocal")
-    @patch("app.tasks.compliance_tasks.generate_instances_for_period")
     @patch("app.tasks.compliance_tasks.calculate_period_for_frequency")
-    def test_generates_instances_for_all_tenants(self, mock_calc_period, mock_generate, mock_session):
-        """Test that instances are generated for all active tenants."""
+    def test_fans_out_one_subtask_per_tenant(self, mock_calc_period, mock_session, mock_chord):
+        """Test that one generate_tenant_instances subtask is dispatched per tenant."""
         from app.tasks.compliance_tasks import generate_compliance_instances_daily
 
-        # Setup mock tenants
-        tenant1 = MagicMock(spec=Tenant)
-        tenant1.id = uuid4()
-        tenant1.tenant_name = "Tenant 1"
-        tenant1.status = "active"
+        tenants = [(uuid4(), "Tenant 1"), (uuid4(), "Tenant 2")]
 
-        tenant2 = MagicMock(spec=Tenant)
-        tenant2.id = uuid4()
-        tenant2.tenant_name = "Tenant 2"
-        tenant2.status = "active"
-
-        # Mock database session
         mock_db = MagicMock()
-        mock_db.query.return_value.filter.return_value.all.return_value = [tenant1, tenant2]
-        mock_session.return_value = mock_db
+        mock_db.execute.return_value.all.return_value = tenants
+        mock_session.return_value.__enter__.return_value = mock_db
 
-        # Mock period calculation
         mock_calc_period.return_value = (date(2025, 12, 1), date(2025, 12, 31))
 
-        # Mock instance generation
-        mock_generate.return_value = [MagicMock(), MagicMock()]
-
-        # Execute task
         result = generate_compliance_instances_daily()
 
-        # Verify
-        assert result["status"] == "success"
-        assert result["total_created"] == 4  # 2 tenants x 2 instances each
-        assert len(result["tenants"]) == 2
-        assert mock_generate.call_count == 2
+        assert result == {"status": "dispatched", "tenants": 2}
+        header = list(mock_chord.call_args.args[0])
+        assert [sig.args for sig in header] == [
+            (str(tenants[0][0]), "Tenant 1", "2025-12-01", "2025-12-31"),
+            (str(tenants[1][0]), "Tenant 2", "2025-12-01", "2025-12-31"),
+        ]
+        mock_chord.return_value.assert_called_once()
 
+    @patch("app.tasks.compliance_tasks.chord")
     @patch("app.tasks.compliance_tasks.SessionLocal")
-    def test_skips_when_no_active_tenants(self, mock_session):
+    def test_skips_when_no_active_tenants(self, mock_session, mock_chord):
         """Test task handles no active tenants gracefully."""
         from app.tasks.compliance_tasks import generate_compliance_instances_daily
 
         mock_db = MagicMock()
-        mock_db.query.return_value.filter.return_value.all.return_value = []
-        mock_session.return_value = mock_db
+        mock_db.execute.return_value.all.return_value = []
+        mock_session.return_value.__enter__.return_value = mock_db
 
         result = generate_compliance_instances_daily()
 
         assert result["status"] == "no_tenants"
         assert result["created"] == 0
+        mock_chord.assert_not_called()
 
     @patch("app.tasks.compliance_tasks.SessionLocal")
     @patch("app.tasks.compliance_tasks.generate_instances_for_period")
-    @patch("app.tasks.compliance_tasks.calculate_period_for_frequency")
-    def test_handles_tenant_error_gracefully(self, mock_calc_period, mock_generate, mock_session):
-        """Test task continues when one tenant fails."""
-        from app.tasks.compliance_tasks import generate_compliance_instances_daily
+    def test_tenant_subtask_generates_instances(self, mock_generate, mock_session):
+        """Test the per-tenant subtask opens its own session and counts instances."""
+        from app.tasks.compliance_tasks import generate_tenant_instances
 
-        tenant1 = MagicMock(spec=Tenant)
-        tenant1.id = uuid4()
-        tenant1.tenant_name = "Tenant 1"
+        tenant_id = str(uuid4())
+        mock_generate.return_value = [MagicMock(), MagicMock()]
 
-        tenant2 = MagicMock(spec=Tenant)
-        tenant2.id = uuid4()
-        tenant2.tenant_name = "Tenant 2"
+        result = generate_tenant_instances(tenant_id, "Tenant 1", "2025-12-01", "2025-12-31")
 
-        mock_db = MagicMock()
-        mock_db.query.return_value.filter.return_value.all.return_value = [tenant1, tenant2]
-        mock_session.return_value = mock_db
+        assert result["instances_created"] == 2
+        assert mock_generate.call_args.kwargs["period_start"] == date(2025, 12, 1)
+        mock_session.return_value.close.assert_called_once()
 
-        mock_calc_period.return_value = (date(2025, 12, 1), date(2025, 12, 31))
+    @patch("app.tasks.compliance_tasks.SessionLocal")
+    @patch("app.tasks.compliance_tasks.generate_instances_for_period")
+    def test_tenant_subtask_reports_error_after_retries(self, mock_generate, mock_session):
+        """Test a tenant that keeps failing is reported instead of failing the chord."""
+        from app.tasks.compliance_tasks import generate_tenant_instances
+
+        mock_generate.side_effect = Exception("DB Error")
+        tenant_id = str(uuid4())
+
+        result = generate_tenant_instances.apply(
+            args=(tenant_id, "Tenant 1", "2025-12-01", "2025-12-31"),
+            retries=generate_tenant_instances.max_retries,
+        ).get()
+
+        assert result == {"tenant_id": tenant_id, "error": True}
+        mock_session.return_value.rollback.assert_called_once()
+
+    @patch("app.tasks.compliance_tasks.SessionLocal")
+    @patch("app.tasks.compliance_tasks.generate_instances_for_period")
+    def test_tenant_subtask_retries_transient_error(self, mock_generate, mock_session):
+        """Test a failing tenant is retried and succeeds without affecting its result."""
+        from app.tasks.compliance_tasks import generate_tenant_instances
 
-        # First tenant fails, second succeeds
         mock_generate.side_effect = [Exception("DB Error"), [MagicMock()]]
 
-        result = generate_compliance_instances_daily()
+        result = generate_tenant_instances.apply(args=(str(uuid4()), "Tenant 1", "2025-12-01", "2025-12-31")).get()
 
-        assert result["status"] == "success"
-        assert result["total_created"] == 1
-        assert "error" in result["tenants"][str(tenant1.id)]
-        assert result["tenants"][str(tenant2.id)]["instances_created"] == 1
+        assert result["instances_created"] == 1
+        assert mock_generate.call_count == 2
+        mock_session.return_value.rollback.assert_called_once()
+
+    def test_summary_totals_tenants(self):
+        """Test the chord callback aggregates per-tenant results."""
+        from app.tasks.compliance_tasks import summarize_instance_generation
+
+        result = summarize_instance_generation(
+            [
+                {"tenant_id": "t1", "instances_created": 2},
+                {"tenant_id": "t2", "error": True},
+            ]
+        )
+
+        assert result == {"status": "success", "total_created": 2, "total_errors": 1, "errors": ["t2"]}
+
+    def test_summary_caps_reported_errors(self):
+        """Test only the first MAX_REPORTED_ERRORS failed tenant IDs are returned."""
+        from app.tasks.compliance_tasks import MAX_REPORTED_ERRORS, summarize_instance_generation
+
+        results = [{"tenant_id": f"t{i}", "error": True} for i in range(MAX_REPORTED_ERRORS + 10)]
+
+        result = summarize_instance_generation(results)
+
+        assert result["total_errors"] == MAX_REPORTED_ERRORS + 10
+        assert len(result["errors"]) == MAX_REPORTED_ERRORS
 
 
 class TestRecalculateRagStatusHourly:
-    """Tests for recalculate_rag_status_hourly task."""
+    """Tests for recalculate_rag_status_hourly and its per-tenant subtasks."""
 
-    @patch("app.tasks.compliance_tasks.invalidate_dashboard_cache")
+    @patch("app.tasks.compliance_tasks.chord")
     @patch("app.tasks.compliance_tasks.SessionLocal")
-    @patch("app.tasks.compliance_tasks.recalculate_rag_for_tenant")
-    def test_recalculates_rag_for_all_tenants(self, mock_recalc, mock_session, mock_invalidate):
-        """Test that RAG is recalculated for all active tenants."""
+    def test_fans_out_one_subtask_per_tenant(self, mock_session, mock_chord):
+        """Test that RAG recalculation is dispatched per active tenant."""
         from app.tasks.compliance_tasks import recalculate_rag_status_hourly
 
-        tenant1 = MagicMock(spec=Tenant)
-        tenant1.id = uuid4()
-        tenant1.tenant_name = "Tenant 1"
+        tenant = (uuid4(), "Tenant 1")
 
         mock_db = MagicMock()
-        mock_db.query.return_value.filter.return_value.all.return_value = [tenant1]
-        mock_session.return_value = mock_db
+        mock_db.execute.return_value.all.return_value = [tenant]
+        mock_session.return_value.__enter__.return_value = mock_db
+
+        result = recalculate_rag_status_hourly()
+
+        assert result == {"status": "dispatched", "tenants": 1}
+        header = list(mock_chord.call_args.args[0])
+        assert header[0].args == (str(tenant[0]), "Tenant 1")
+
+    @patch("app.tasks.compliance_tasks.invalidate_dashboard_cache")
+    @patch("app.tasks.compliance_tasks.SessionLocal")
+    @patch("app.tasks.compliance_tasks.bulk_recalculate_rag")
+    def test_tenant_subtask_recalculates(self, mock_recalc, mock_session, mock_invalidate):
+        """Test the per-tenant subtask returns the updated count and busts that tenant's cache."""
+        from app.tasks.compliance_tasks import recalculate_tenant_rag
 
         mock_recalc.return_value = 10
+        tenant_id = str(uuid4())
 
-        result = recalculate_rag_status_hourly()
+        result = recalculate_tenant_rag(tenant_id, "Tenant 1")
 
-        assert result["status"] == "success"
-        assert result["total_updated"] == 10
-        mock_invalidate.assert_called_once()
+        assert result["instances_updated"] == 10
+        mock_invalidate.assert_called_once_with(tenant_id)
 
     @patch("app.tasks.compliance_tasks.invalidate_dashboard_cache")
     @patch("app.tasks.compliance_tasks.SessionLocal")
-    @patch("app.tasks.compliance_tasks.recalculate_rag_for_tenant")
-    def test_handles_redis_failure_gracefully(self, mock_recalc, mock_session, mock_invalidate):
-        """Test task continues when Redis cache invalidation fails."""
-        from app.tasks.compliance_tasks import recalculate_rag_status_hourly
+    @patch("app.tasks.compliance_tasks.bulk_recalculate_rag")
+    def test_tenant_subtask_keeps_cache_when_nothing_changed(self, mock_recalc, mock_session, mock_invalidate):
+        """Test no invalidation is done when no instance changed RAG status."""
+        from app.tasks.compliance_tasks import recalculate_tenant_rag
 
-        tenant = MagicMock(spec=Tenant)
-        tenant.id = uuid4()
-        tenant.tenant_name = "Tenant"
+        mock_recalc.return_value = 0
 
-        mock_db = MagicMock()
-        mock_db.query.return_value.filter.return_value.all.return_value = [tenant]
-        mock_session.return_value = mock_db
+        recalculate_tenant_rag(str(uuid4()), "Tenant 1")
+
+        mock_invalidate.assert_not_called()
+
+    @patch("app.core.redis.redis_client")
+    @patch("app.tasks.compliance_tasks.SessionLocal")
+    @patch("app.tasks.compliance_tasks.bulk_recalculate_rag")
+    def test_tenant_subtask_handles_redis_failure_gracefully(self, mock_recalc, mock_session, mock_redis):
+        """Test the subtask still reports its count when cache invalidation fails."""
+        from app.tasks.compliance_tasks import recalculate_tenant_rag
 
         mock_recalc.return_value = 5
-        mock_invalidate.side_effect = Exception("Redis down")
+        mock_redis.scan.side_effect = Exception("Redis down")
 
-        result = recalculate_rag_status_hourly()
+        result = recalculate_tenant_rag(str(uuid4()), "Tenant 1")
+
+        assert result["instances_updated"] == 5
+        mock_session.return_value.rollback.assert_not_called()
+
+    @patch("app.tasks.compliance_tasks.invalidate_dashboard_cache")
+    def test_summary_totals_tenants(self, mock_invalidate):
+        """Test the chord callback totals results without a global cache flush."""
+        from app.tasks.compliance_tasks import summarize_rag_recalculation
+
+        result = summarize_rag_recalculation([{"tenant_id": "t1", "instances_updated": 10}])
 
         assert result["status"] == "success"
-        assert result["total_updated"] == 5
+        assert result["total_updated"] == 10
+        mock_invalidate.assert_not_called()
 
     @patch("app.tasks.compliance_tasks.SessionLocal")
     def test_returns_no_tenants_when_empty(self, mock_session):
@@ -158,8 +210,8 @@ class TestRecalculateRagStatusHourly:
         from app.tasks.compliance_tasks import recalculate_rag_status_hourly
 
         mock_db = MagicMock()
-        mock_db.query.return_value.filter.return_value.all.return_value = []
-        mock_session.return_value = mock_db
+        mock_db.execute.return_value.all.return_value = []
+        mock_session.return_value.__enter__.return_value = mock_db
 
         result = recalculate_rag_status_hourly()
 
@@ -174,36 +226,48 @@ class TestGenerateQuarterlyInstances:
     @patch("app.tasks.compliance_tasks.generate_instances_for_period")
     @patch("app.tasks.compliance_tasks.calculate_period_for_frequency")
     def test_generates_quarterly_instances(self, mock_calc_period, mock_generate, mock_session):
-        """Test quarterly instance generation filters correctly."""
+        """Test quarterly generation only asks for quarterly masters."""
         from app.tasks.compliance_tasks import generate_quarterly_instances
 
-        tenant = MagicMock(spec=Tenant)
-        tenant.id = uuid4()
-        tenant.tenant_name = "Tenant"
+        tenant = (uuid4(), "Tenant")
 
         mock_db = MagicMock()
-        mock_db.query.return_value.filter.return_value.all.return_value = [tenant]
-        mock_session.return_value = mock_db
+        mock_db.execute.return_value.all.return_value = [tenant]
+        mock_session.return_value.__enter__.return_value = mock_db
 
         # Q1 period (Apr-Jun)
         mock_calc_period.return_value = (date(2025, 4, 1), date(2025, 6, 30))
 
-        # Create mock instances with different frequencies
-        quarterly_instance = MagicMock()
-        quarterly_master = MagicMock(frequency="Quarterly")
-        quarterly_instance.compliance_master = quarterly_master
+        # Frequency is filtered in SQL, so only quarterly instances come back
+        mock_generate.return_value = [MagicMock()]
 
-        monthly_instance = MagicMock()
-        monthly_master = MagicMock(frequency="Monthly")
-        monthly_instance.compliance_master = monthly_master
+        result = generate_quarterly_instances()
 
-        mock_generate.return_value = [quarterly_instance, monthly_instance]
+        assert result["status"] == "success"
+        assert result["total_created"] == 1
+        assert mock_generate.call_args.kwargs["frequency"] == "Quarterly"
+
+    @patch("app.tasks.compliance_tasks.SessionLocal")
+    @patch("app.tasks.compliance_tasks.generate_instances_for_period")
+    @patch("app.tasks.compliance_tasks.calculate_period_for_frequency")
+    def test_reports_failed_tenant_ids_only(self, mock_calc_period, mock_generate, mock_session):
+        """Test the summary keeps totals and failed tenant IDs, not per-tenant detail."""
+        from app.tasks.compliance_tasks import generate_quarterly_instances
+
+        ok, bad = (uuid4(), "Ok"), (uuid4(), "Bad")
+
+        mock_db = MagicMock()
+        mock_db.execute.return_value.all.return_value = [ok, bad]
+        mock_session.return_value.__enter__.return_value = mock_db
+        mock_calc_period.return_value = (date(2025, 4, 1), date(2025, 6, 30))
+        mock_generate.side_effect = [[MagicMock(), MagicMock()], Exception("DB Error")]
 
         result = generate_quarterly_instances()
 
-        assert result["status"] == "success"
-        # Should only count the quarterly instance
-        assert result["tenants"][str(tenant.id)]["quarterly_instances"] == 1
+        assert result == {"status": "success", "total_created": 2, "total_errors": 1, "errors": [str(bad[0])]}
+        # Tenant list plus one short-lived session per tenant; the failed tenant is rolled back
+        assert mock_session.call_count == 3
+        mock_db.rollback.assert_called_once()
 
 
 class TestGenerateAnnualInstances:
@@ -216,13 +280,11 @@ class TestGenerateAnnualInstances:
         """Test annual instance generation for India FY."""
         from app.tasks.compliance_tasks import generate_annual_instances
 
-        tenant = MagicMock(spec=Tenant)
-        tenant.id = uuid4()
-        tenant.tenant_name = "Tenant"
+        tenant = (uuid4(), "Tenant")
 
         mock_db = MagicMock()
-        mock_db.query.return_value.filter.return_value.all.return_value = [tenant]
-        mock_session.return_value = mock_db
+        mock_db.execute.return_value.all.return_value = [tenant]
+        mock_session.return_value.__enter__.return_value = mock_db
 
         # FY 2025-26 period
         mock_calc_period.return_value = (date(2025, 4, 1), date(2026, 3, 31))
@@ -237,44 +299,30 @@ class TestGenerateAnnualInstances:
         result = generate_annual_instances()
 
         assert result["status"] == "success"
-        assert result["tenants"][str(tenant.id)]["annual_instances"] == 1
-        assert (
-            "FY" in result["tenants"][str(tenant.id)]["period"]
-            or "2025-04-01" in result["tenants"][str(tenant.id)]["period"]
-        )
+        assert result["total_created"] == 1
+        assert mock_generate.call_args.kwargs["period_start"] == date(2025, 4, 1)
 
     @patch("app.tasks.compliance_tasks.SessionLocal")
     @patch("app.tasks.compliance_tasks.generate_instances_for_period")
     @patch("app.tasks.compliance_tasks.calculate_period_for_frequency")
     def test_filters_annual_frequency_only(self, mock_calc_period, mock_generate, mock_session):
-        """Test that only annual frequency instances are counted."""
+        """Test that only annual masters are requested from the generator."""
         from app.tasks.compliance_tasks import generate_annual_instances
 
-        tenant = MagicMock(spec=Tenant)
-        tenant.id = uuid4()
-        tenant.tenant_name = "Tenant"
+        tenant = (uuid4(), "Tenant")
 
         mock_db = MagicMock()
-        mock_db.query.return_value.filter.return_value.all.return_value = [tenant]
-        mock_session.return_value = mock_db
+        mock_db.execute.return_value.all.return_value = [tenant]
+        mock_session.return_value.__enter__.return_value = mock_db
 
         mock_calc_period.return_value = (date(2025, 4, 1), date(2026, 3, 31))
 
-        # Mix of frequencies
-        annual_instance = MagicMock()
-        annual_instance.compliance_master = MagicMock(frequency="Annual")
-
-        monthly_instance = MagicMock()
-        monthly_instance.compliance_master = MagicMock(frequency="Monthly")
-
-        quarterly_instance = MagicMock()
-        quarterly_instance.compliance_master = MagicMock(frequency="Quarterly")
-
-        mock_generate.return_value = [annual_instance, monthly_instance, quarterly_instance]
+        mock_generate.return_value = [MagicMock()]
 
         result = generate_annual_instances()
 
-        assert result["tenants"][str(tenant.id)]["annual_instances"] == 1
+        assert result["total_created"] == 1
+        assert mock_generate.call_args.kwargs["frequency"] == "Annual"
 
 
 class TestUpdateOverdueStatus:
@@ -282,68 +330,55 @@ class TestUpdateOverdueStatus:
 
     @patch("app.tasks.compliance_tasks.SessionLocal")
     def test_marks_past_due_as_overdue(self, mock_session):
-        """Test instances past due are marked as overdue."""
+        """Test past-due instances are marked overdue with one UPDATE."""
         from app.tasks.compliance_tasks import update_overdue_status
 
         mock_db = MagicMock()
-
-        # Create overdue instance
-        overdue_instance = MagicMock(spec=ComplianceInstance)
-        overdue_instance.due_date = date.today() - timedelta(days=5)
-        overdue_instance.status = "In Progress"
-        overdue_instance.rag_status = "Amber"
-
-        mock_db.query.return_value.filter.return_value.all.return_value = [overdue_instance]
+        mock_db.execute.return_value.rowcount = 1
         mock_session.return_value = mock_db
 
         result = update_overdue_status()
 
         assert result["status"] == "success"
         assert result["overdue_count"] == 1
-        assert overdue_instance.status == "Overdue"
-        assert overdue_instance.rag_status == "Red"
+        mock_db.execute.assert_called_once()
+        mock_db.query.assert_not_called()
         mock_db.commit.assert_called_once()
 
     @patch("app.tasks.compliance_tasks.SessionLocal")
-    def test_skips_completed_instances(self, mock_session):
-        """Test completed instances are not marked overdue."""
+    def test_update_sets_overdue_and_red(self, mock_session):
+        """Test the UPDATE sets status/rag_status and skips completed instances."""
         from app.tasks.compliance_tasks import update_overdue_status
 
         mock_db = MagicMock()
-        # Query returns no instances (filter excludes Completed)
-        mock_db.query.return_value.filter.return_value.all.return_value = []
+        mock_db.execute.return_value.rowcount = 5
         mock_session.return_value = mock_db
 
         result = update_overdue_status()
 
-        assert result["status"] == "success"
-        assert result["overdue_count"] == 0
+        stmt = mock_db.execute.call_args.args[0]
+        sql = str(stmt)
+        params = stmt.compile().params
+        assert "UPDATE compliance_instances" in sql
+        assert "NOT IN" in sql
+        assert params["status"] == "Overdue"
+        assert params["rag_status"] == "Red"
+        assert "Completed" in params["status_1"]
+        assert result["overdue_count"] == 5
 
     @patch("app.tasks.compliance_tasks.SessionLocal")
-    def test_handles_multiple_overdue_instances(self, mock_session):
-        """Test multiple instances are updated correctly."""
+    def test_handles_no_overdue_instances(self, mock_session):
+        """Test nothing to update reports zero."""
         from app.tasks.compliance_tasks import update_overdue_status
 
         mock_db = MagicMock()
-
-        instances = []
-        for i in range(5):
-            instance = MagicMock(spec=ComplianceInstance)
-            instance.due_date = date.today() - timedelta(days=i + 1)
-            instance.status = "In Progress"
-            instance.rag_status = "Amber"
-            instances.append(instance)
-
-        mock_db.query.return_value.filter.return_value.all.return_value = instances
+        mock_db.execute.return_value.rowcount = 0
         mock_session.return_value = mock_db
 
         result = update_overdue_status()
 
         assert result["status"] == "success"
-        assert result["overdue_count"] == 5
-        for instance in instances:
-            assert instance.status == "Overdue"
-            assert instance.rag_status == "Red"
+        assert result["overdue_count"] == 0
 
     @patch("app.tasks.compliance_tasks.SessionLocal")
     def test_handles_database_error(self, mock_session):
@@ -351,7 +386,7 @@ class TestUpdateOverdueStatus:
         from app.tasks.compliance_tasks import update_overdue_status
 
         mock_db = MagicMock()
-        mock_db.query.side_effect = Exception("Database connection failed")
+        mock_db.execute.side_effect = Exception("Database connection failed")
         mock_session.return_value = mock_db
 
         result = update_overdue_status()
@@ -377,9 +412,22 @@ class TestInvalidateDashboardCache:
 
         invalidate_dashboard_cache()
 
-        assert mock_redis.delete.call_count == 2
-        mock_redis.delete.assert_any_call(b"dashboard:tenant1", b"dashboard:tenant2")
-        mock_redis.delete.assert_any_call(b"dashboard:tenant3")
+        assert mock_redis.unlink.call_count == 2
+        mock_redis.unlink.assert_any_call(b"dashboard:tenant1", b"dashboard:tenant2")
+        mock_redis.unlink.assert_any_call(b"dashboard:tenant3")
+        mock_redis.delete.assert_not_called()
+
+    @patch("app.core.redis.redis_client")
+    def test_scopes_scan_to_tenant(self, mock_redis):
+        """Test tenant-scoped invalidation only scans that tenant's namespace."""
+        from app.tasks.compliance_tasks import invalidate_dashboard_cache
+
+        mock_redis.scan.return_value = (0, [])
+
+        invalidate_dashboard_cache("tenant1")
+
+        assert mock_redis.scan.call_args.kwargs["match"] == "dashboard:tenant1:*"
+        mock_redis.unlink.assert_not_called()
 
     @patch("app.core.redis.redis_client")
     def test_handles_redis_error(self, mock_redis):
@@ -0,0 +1,158 @@
+"""
+Unit tests for notification email tasks.
+
+Tests cover:
+- Duplicate email suppression via idempotency claims
+- Claim release on send failure
+- Retry policy (transient failures only)
+- Typed email dispatch through EMAIL_HANDLERS
+"""
+
+from contextlib import contextmanager
+from dataclasses import replace
+from unittest.mock import patch, MagicMock
+from uuid import uuid4
+
+import pytest
+
+
+@contextmanager
+def patched_send(kind: str, return_value: bool = True):
+    """Swap the send function of one EMAIL_HANDLERS entry for a mock."""
+    from app.tasks.notification_tasks import EMAIL_HANDLERS
+
+    mock_send = MagicMock(return_value=return_value)
+    with patch.dict(EMAIL_HANDLERS, {kind: replace(EMAIL_HANDLERS[kind], send=mock_send)}):
+        yield mock_send
+
+
+class TestEmailIdempotency:
+    """Tests for the idempotency claim around email tasks."""
+
+    @patch("app.tasks.notification_tasks.SessionLocal")
+    @patch("app.tasks.notification_tasks.claim_once", return_value=False)
+    def test_skips_already_claimed_email(self, mock_claim, mock_session):
+        """Test that an email claimed by an earlier delivery is not sent again."""
+        from app.tasks.notification_tasks import send_reminder_email_task
+
+        user_id, instance_id = str(uuid4()), str(uuid4())
+        result = send_reminder_email_task(user_id, instance_id, "due")
+
+        assert result["status"] == "skipped"
+        mock_session.assert_not_called()
+        op_id = mock_claim.call_args[0][0]
+        assert user_id in op_id and instance_id in op_id
+
+    @patch("app.tasks.notification_tasks.SessionLocal")
+    @patch("app.tasks.notification_tasks.release_claim")
+    @patch("app.tasks.notification_tasks.claim_once", return_value=True)
+    def test_sends_and_keeps_claim(self, mock_claim, mock_release, mock_session):
+        """Test that a successful send keeps its claim."""
+        from app.tasks.notification_tasks import send_task_reminder_email_task
+
+        mock_session.return_value = MagicMock()
+
+        with patched_send("task_reminder") as mock_send:
+            result = send_task_reminder_email_task(str(uuid4()), str(uuid4()), 2)
+
+        assert result["status"] == "success"
+        mock_send.assert_called_once()
+        mock_release.assert_not_called()
+
+    @patch("app.tasks.notification_tasks.SessionLocal")
+    @patch("app.tasks.notification_tasks.release_claim")
+    @patch("app.tasks.notification_tasks.claim_once", return_value=True)
+    def test_releases_claim_on_failure(self, mock_claim, mock_release, mock_session):
+        """Test that a failed send releases its claim so the retry can run."""
+        from app.tasks.notification_tasks import send_task_reminder_email_task
+
+        mock_session.return_value = MagicMock()
+
+        with patched_send("task_reminder", return_value=False), pytest.raises(Exception):
+            send_task_reminder_email_task(str(uuid4()), str(uuid4()), 2)
+
+        mock_release.assert_called_once_with(mock_claim.call_args[0][0])
+
+
+class TestEmailRetryPolicy:
+    """Tests for the email task retry configuration."""
+
+    def test_email_tasks_retry_only_transient_errors(self):
+        """Test email tasks autoretry transient failures and ack late."""
+        from app.services.email_service import TransientEmailError
+        from app.tasks.notification_tasks import send_escalation_email_task, send_reminder_email_task
+
+        for task in (send_reminder_email_task, send_escalation_email_task):
+            assert TransientEmailError in task.autoretry_for
+            assert Exception not in task.autoretry_for
+            assert task.acks_late is True
+            assert task.reject_on_worker_lost is True
+
+    @patch("app.tasks.notification_tasks.SessionLocal")
+    @patch("app.tasks.notification_tasks.release_claim")
+    @patch("app.tasks.notification_tasks.claim_once", return_value=True)
+    def test_permanent_failure_is_not_retried(self, mock_claim, mock_release, mock_session):
+        """Test a permanent send failure raises immediately instead of scheduling a retry."""
+        from celery.exceptions import Retry
+
+        from app.tasks.notification_tasks import send_reminder_email_task
+
+        mock_session.return_value = MagicMock()
+
+        with patched_send("reminder", return_value=False), pytest.raises(Exception) as exc_info:
+            send_reminder_email_task(str(uuid4()), str(uuid4()), "due")
+
+        assert not isinstance(exc_info.value, Retry)
+        mock_release.assert_called_once()
+
+
+class TestTypedEmailDispatch:
+    """Tests for the shared typed email path."""
+
+    @patch("app.tasks.notification_tasks.SessionLocal")
+    @patch("app.tasks.notification_tasks.claim_once", return_value=True)
+    def test_dispatches_to_registered_handler(self, mock_claim, mock_session):
+        """Test the generic task loads the handler's model with Session.get and sends."""
+        from app.models import ComplianceInstance, User
+        from app.tasks.notification_tasks import send_typed_email_task
+
+        mock_db = MagicMock()
+        mock_session.return_value = mock_db
+
+        user_id, instance_id = str(uuid4()), str(uuid4())
+        with patched_send("escalation") as mock_send:
+            result = send_typed_email_task("escalation", user_id, instance_id, {"days_overdue": 5})
+
+        assert result == {"status": "success", "days_overdue": 5}
+        assert [call.args[0] for call in mock_db.get.call_args_list] == [User, ComplianceInstance]
+        mock_send.assert_called_once_with(mock_db.get.return_value, mock_db.get.return_value, days_overdue=5)
+        mock_db.query.assert_not_called()
+
+    @patch("app.tasks.notification_tasks.SessionLocal")
+    @patch("app.tasks.notification_tasks.claim_once", return_value=True)
+    def test_evidence_claim_distinguishes_approval(self, mock_claim, mock_session):
+        """Test approval and rejection of the same evidence use different claims."""
+        from app.tasks.notification_tasks import send_evidence_status_email_task
+
+        mock_session.return_value = MagicMock()
+        user_id, evidence_id = str(uuid4()), str(uuid4())
+
+        with patched_send("evidence_status"):
+            send_evidence_status_email_task(user_id, evidence_id, True)
+            send_evidence_status_email_task(user_id, evidence_id, False, "Blurry scan")
+
+        approved_key, rejected_key = (call.args[0] for call in mock_claim.call_args_list)
+        assert approved_key != rejected_key
+
+
+class TestUUIDArguments:
+    """Tests for UUID task arguments."""
+
+    def test_as_uuid_accepts_uuid_and_string(self):
+        """Test UUIDs pass through untouched and strings are parsed."""
+        from app.tasks.notification_tasks import as_uuid
+
+        value = uuid4()
+
+        assert as_uuid(value) is value
+        assert as_uuid(str(value)) == value
@@ -24,11 +24,14 @@ from app.models import (
 class TestSendT3Reminders:
     """Tests for send_t3_reminders task."""
 
+    @patch("app.tasks.reminder_tasks.group")
     @patch("app.tasks.reminder_tasks.send_reminder_email_task")
     @patch("app.tasks.reminder_tasks.SessionLocal")
     @patch("app.tasks.reminder_tasks.notify_reminder_t3")
-    @patch("app.tasks.reminder_tasks.get_instance_owner")
-    def test_sends_reminder_3_days_before_due(self, mock_get_owner, mock_notify, mock_session, mock_email_task):
+    @patch("app.tasks.reminder_tasks.get_instances_with_owners")
+    def test_sends_reminder_3_days_before_due(
+        self, mock_get_owners, mock_notify, mock_session, mock_email_task, mock_group
+    ):
         """Test T-3 reminders are sent for instances due in 3 days."""
         from app.tasks.reminder_tasks import send_t3_reminders
 
@@ -44,9 +47,8 @@ class TestSendT3Reminders:
         owner.id = uuid4()
         owner.email = "owner@example.com"
 
-        mock_db.query.return_value.filter.return_value.all.return_value = [instance]
-        mock_session.return_value = mock_db
-        mock_get_owner.return_value = owner
+        mock_session.return_value.__enter__.return_value = mock_db
+        mock_get_owners.return_value = [(instance, owner)]
         mock_notify.return_value = MagicMock()  # Notification created
 
         result = send_t3_reminders()
@@ -54,29 +56,32 @@ class TestSendT3Reminders:
         assert result["status"] == "success"
         assert result["reminders_sent"] == 1
         mock_notify.assert_called_once_with(mock_db, instance, owner)
-        mock_email_task.delay.assert_called_once()
+        # Emails are queued as one group after the loop
+        assert len(list(mock_group.call_args.args[0])) == 1
+        mock_group.return_value.apply_async.assert_called_once()
+        mock_email_task.delay.assert_not_called()
 
     @patch("app.tasks.reminder_tasks.SessionLocal")
-    @patch("app.tasks.reminder_tasks.get_instance_owner")
-    def test_skips_completed_instances(self, mock_get_owner, mock_session):
+    @patch("app.tasks.reminder_tasks.notify_reminder_t3")
+    @patch("app.tasks.reminder_tasks.get_instances_with_owners")
+    def test_skips_completed_instances(self, mock_get_owners, mock_notify, mock_session):
         """Test completed instances are not sent reminders."""
         from app.tasks.reminder_tasks import send_t3_reminders
 
-        mock_db = MagicMock()
+        mock_session.return_value = MagicMock()
         # Query filters out completed, so returns empty
-        mock_db.query.return_value.filter.return_value.all.return_value = []
-        mock_session.return_value = mock_db
+        mock_get_owners.return_value = []
 
         result = send_t3_reminders()
 
         assert result["status"] == "success"
         assert result["reminders_sent"] == 0
-        mock_get_owner.assert_not_called()
+        mock_notify.assert_not_called()
 
     @patch("app.tasks.reminder_tasks.SessionLocal")
     @patch("app.tasks.reminder_tasks.notify_reminder_t3")
-    @patch("app.tasks.reminder_tasks.get_instance_owner")
-    def test_handles_missing_owner(self, mock_get_owner, mock_notify, mock_session):
+    @patch("app.tasks.reminder_tasks.get_instances_with_owners")
+    def test_handles_missing_owner(self, mock_get_owners, mock_notify, mock_session):
         """Test task handles instances without owner."""
         from app.tasks.reminder_tasks import send_t3_reminders
 
@@ -86,9 +91,8 @@ class TestSendT3Reminders:
         instance.id = uuid4()
         instance.due_date = date.today() + timedelta(days=3)
 
-        mock_db.query.return_value.filter.return_value.all.return_value = [instance]
-        mock_session.return_value = mock_db
-        mock_get_owner.return_value = None  # No owner found
+        mock_session.return_value.__enter__.return_value = mock_db
+        mock_get_owners.return_value = [(instance, None)]  # No owner found
 
         result = send_t3_reminders()
 
@@ -100,11 +104,12 @@ class TestSendT3Reminders:
 class TestSendDueDateReminders:
     """Tests for send_due_date_reminders task."""
 
+    @patch("app.tasks.reminder_tasks.group")
     @patch("app.tasks.reminder_tasks.send_reminder_email_task")
     @patch("app.tasks.reminder_tasks.SessionLocal")
     @patch("app.tasks.reminder_tasks.notify_reminder_due")
-    @patch("app.tasks.reminder_tasks.get_instance_owner")
-    def test_sends_reminder_on_due_date(self, mock_get_owner, mock_notify, mock_session, mock_email_task):
+    @patch("app.tasks.reminder_tasks.get_instances_with_owners")
+    def test_sends_reminder_on_due_date(self, mock_get_owners, mock_notify, mock_session, mock_email_task, mock_group):
         """Test due date reminders are sent for instances due today."""
         from app.tasks.reminder_tasks import send_due_date_reminders
 
@@ -119,25 +124,25 @@ class TestSendDueDateReminders:
         owner.id = uuid4()
         owner.email = "owner@example.com"
 
-        mock_db.query.return_value.filter.return_value.all.return_value = [instance]
-        mock_session.return_value = mock_db
-        mock_get_owner.return_value = owner
+        mock_session.return_value.__enter__.return_value = mock_db
+        mock_get_owners.return_value = [(instance, owner)]
         mock_notify.return_value = MagicMock()
 
         result = send_due_date_reminders()
 
         assert result["status"] == "success"
         assert result["reminders_sent"] == 1
-        mock_email_task.delay.assert_called_once_with(
-            user_id=str(owner.id),
-            instance_id=str(instance.id),
+        list(mock_group.call_args.args[0])
+        mock_email_task.s.assert_called_once_with(
+            user_id=owner.id,
+            instance_id=instance.id,
             reminder_type="due",
         )
 
     @patch("app.tasks.reminder_tasks.SessionLocal")
     @patch("app.tasks.reminder_tasks.notify_reminder_due")
-    @patch("app.tasks.reminder_tasks.get_instance_owner")
-    def test_handles_missing_owner(self, mock_get_owner, mock_notify, mock_session):
+    @patch("app.tasks.reminder_tasks.get_instances_with_owners")
+    def test_handles_missing_owner(self, mock_get_owners, mock_notify, mock_session):
         """Test task continues when owner not found."""
         from app.tasks.reminder_tasks import send_due_date_reminders
 
@@ -147,9 +152,8 @@ class TestSendDueDateReminders:
         instance.id = uuid4()
         instance.due_date = date.today()
 
-        mock_db.query.return_value.filter.return_value.all.return_value = [instance]
-        mock_session.return_value = mock_db
-        mock_get_owner.return_value = None
+        mock_session.return_value.__enter__.return_value = mock_db
+        mock_get_owners.return_value = [(instance, None)]
 
         result = send_due_date_reminders()
 
@@ -160,11 +164,12 @@ class TestSendDueDateReminders:
 class TestEscalateOverdueItems:
     """Tests for escalate_overdue_items task."""
 
+    @patch("app.tasks.reminder_tasks.group")
     @patch("app.tasks.reminder_tasks.send_escalation_email_task")
     @patch("app.tasks.reminder_tasks.SessionLocal")
     @patch("app.tasks.reminder_tasks.notify_overdue_escalation")
-    @patch("app.tasks.reminder_tasks.get_escalation_user")
-    def test_escalates_3_days_overdue(self, mock_get_escalation_user, mock_notify, mock_session, mock_email_task):
+    @patch("app.tasks.reminder_tasks.get_instances_with_escalation_users")
+    def test_escalates_3_days_overdue(self, mock_get_overdue, mock_notify, mock_session, mock_email_task, mock_group):
         """Test items overdue by 3+ days are escalated."""
         from app.tasks.reminder_tasks import escalate_overdue_items
 
@@ -175,94 +180,288 @@ class TestEscalateOverdueItems:
         instance.tenant_id = uuid4()
         instance.due_date = date.today() - timedelta(days=5)
         instance.status = "In Progress"
-        instance.metadata = None
+        instance.meta_data = None
 
         cfo = MagicMock(spec=User)
         cfo.id = uuid4()
         cfo.email = "cfo@example.com"
 
-        mock_db.query.return_value.filter.return_value.all.return_value = [instance]
-        mock_session.return_value = mock_db
-        mock_get_escalation_user.return_value = cfo
+        mock_get_overdue.return_value = [(instance, cfo)]
+        mock_session.return_value.__enter__.return_value = mock_db
         mock_notify.return_value = MagicMock()
 
         result = escalate_overdue_items()
 
         assert result["status"] == "success"
         assert result["escalations_sent"] == 1
-        mock_email_task.delay.assert_called_once()
+        mock_group.return_value.apply_async.assert_called_once()
+        # Escalation flag written with one bulk UPDATE and committed before the notifications
+        mock_db.execute.assert_called_once()
+        mock_db.commit.assert_called_once()
 
     @patch("app.tasks.reminder_tasks.SessionLocal")
-    @patch("app.tasks.reminder_tasks.get_escalation_user")
-    def test_prevents_duplicate_escalations(self, mock_get_escalation_user, mock_session):
-        """Test already escalated items are not re-escalated."""
-        from app.tasks.reminder_tasks import escalate_overdue_items
-
-        mock_db = MagicMock()
+    @patch("app.tasks.reminder_tasks.notify_overdue_escalation")
+    @patch("app.tasks.reminder_tasks.get_instances_with_escalation_users")
+    def test_prevents_duplicate_escalations(self, mock_get_overdue, mock_notify, mock_session):
+        """Test already escalated items are filtered out in SQL."""
+        from sqlalchemy.dialects import postgresql
 
-        # Instance already escalated
-        instance = MagicMock(spec=ComplianceInstance)
-        instance.id = uuid4()
-        instance.tenant_id = uuid4()
-        instance.due_date = date.today() - timedelta(days=5)
-        instance.metadata = {"escalated": True}
+        from app.tasks.reminder_tasks import escalate_overdue_items
 
-        mock_db.query.return_value.filter.return_value.all.return_value = [instance]
-        mock_session.return_value = mock_db
+        mock_get_overdue.return_value = []
+        mock_session.return_value.__enter__.return_value = MagicMock()
 
         result = escalate_overdue_items()
 
         assert result["status"] == "success"
         assert result["escalations_sent"] == 0
-        mock_get_escalation_user.assert_not_called()
+        mock_notify.assert_not_called()
+        assert mock_get_overdue.call_args.kwargs == {"skip_locked": True}
+        criteria = [str(c.compile(dialect=postgresql.dialect())) for c in mock_get_overdue.call_args.args[1:]]
+        assert any("compliance_instances.meta_data ->>" in c and c.endswith("IS NULL") for c in criteria)
 
+    @patch("app.tasks.reminder_tasks.group")
     @patch("app.tasks.reminder_tasks.SessionLocal")
     @patch("app.tasks.reminder_tasks.notify_overdue_escalation")
-    @patch("app.tasks.reminder_tasks.get_escalation_user")
-    def test_finds_cfo_for_escalation(self, mock_get_escalation_user, mock_notify, mock_session):
-        """Test escalation user lookup is done per tenant."""
+    @patch("app.tasks.reminder_tasks.get_instances_with_escalation_users")
+    def test_finds_cfo_for_escalation(self, mock_get_overdue, mock_notify, mock_session, mock_group):
+        """Test each instance is escalated to the user paired with it by the query."""
         from app.tasks.reminder_tasks import escalate_overdue_items
 
         mock_db = MagicMock()
 
-        tenant1_id = uuid4()
-        tenant2_id = uuid4()
-
         instance1 = MagicMock(spec=ComplianceInstance)
         instance1.id = uuid4()
-        instance1.tenant_id = tenant1_id
+        instance1.tenant_id = uuid4()
         instance1.due_date = date.today() - timedelta(days=4)
-        instance1.metadata = None
+        instance1.meta_data = None
 
         instance2 = MagicMock(spec=ComplianceInstance)
         instance2.id = uuid4()
-        instance2.tenant_id = tenant2_id
+        instance2.tenant_id = uuid4()
         instance2.due_date = date.today() - timedelta(days=4)
-        instance2.metadata = None
-
-        mock_db.query.return_value.filter.return_value.all.return_value = [instance1, instance2]
-        mock_session.return_value = mock_db
+        instance2.meta_data = None
 
         cfo1 = MagicMock(spec=User)
         cfo1.id = uuid4()
-        cfo2 = MagicMock(spec=User)
-        cfo2.id = uuid4()
 
-        mock_get_escalation_user.side_effect = [cfo1, cfo2]
+        mock_get_overdue.return_value = [(instance1, cfo1), (instance2, None)]
+        mock_session.return_value.__enter__.return_value = mock_db
         mock_notify.return_value = MagicMock()
 
-        escalate_overdue_items()
+        result = escalate_overdue_items()
+
+        mock_get_overdue.assert_called_once()
+        assert result["escalations_sent"] == 1
+        assert [call.args[2] for call in mock_notify.call_args_list] == [cfo1]
+
+    @patch("app.tasks.reminder_tasks.group")
+    @patch("app.tasks.reminder_tasks.SessionLocal")
+    @patch("app.tasks.reminder_tasks.get_instances_with_escalation_users")
+    def test_failed_commit_enqueues_nothing(self, mock_get_overdue, mock_session, mock_group):
+        """Test a failed escalation commit queues no notifications and releases the dedup claims."""
+        from app.tasks.reminder_tasks import escalate_overdue_items
 
-        assert mock_get_escalation_user.call_count == 2
+        mock_db = MagicMock()
+        mock_db.commit.side_effect = RuntimeError("db down")
+
+        instance = MagicMock(spec=ComplianceInstance)
+        instance.id = uuid4()
+        instance.tenant_id = uuid4()
+        instance.due_date = date.today() - timedelta(days=5)
+        instance.meta_data = None
+        cfo = MagicMock(spec=User)
+        cfo.id = uuid4()
+        cfo.email = "cfo@example.com"
+
+        mock_get_overdue.return_value = [(instance, cfo)]
+        mock_session.return_value.__enter__.return_value = mock_db
+
+        # In-memory stand-in for the Redis SET NX claims
+        claimed = set()
+
+        def claim(key, ttl=86400):
+            if key in claimed:
+                return False
+            claimed.add(key)
+            return True
+
+        with (
+            patch("app.services.notification_service.claim_once", side_effect=claim),
+            patch("app.services.notification_service.release_claim", side_effect=claimed.discard) as mock_release,
+            patch("app.services.notification_service.get_master_name", return_value="GST Filing"),
+            patch("app.services.notification_service.get_entity_name", return_value="Acme India"),
+            patch("app.services.notification_service.settings.SYNC_NOTIFICATIONS", False),
+            patch("app.tasks.notification_tasks.persist_notifications_task") as mock_persist,
+        ):
+            result = escalate_overdue_items()
+
+        assert result["escalations_sent"] == 0
+        mock_db.rollback.assert_called_once()
+        mock_persist.delay.assert_not_called()
+        mock_release.assert_called_once()
+        assert claimed == set()
+        mock_group.assert_not_called()
+
+
+class TestSaveNotifications:
+    """Tests for the per-loop notification flush."""
+
+    def test_flushes_batch_once(self):
+        """Test queued notifications are written by one flush."""
+        from app.tasks.reminder_tasks import save_notifications
+
+        batcher = MagicMock(rows=[{}, {}])
+        errors = []
+
+        assert save_notifications(MagicMock(), batcher, errors) is True
+        batcher.flush.assert_called_once()
+        assert errors == []
+
+    def test_failure_rolls_back_and_reports(self):
+        """Test a failed write is rolled back and recorded instead of raised."""
+        from app.tasks.reminder_tasks import save_notifications
+
+        mock_db = MagicMock()
+        batcher = MagicMock(rows=[{}])
+        batcher.flush.side_effect = RuntimeError("db down")
+        errors = []
+
+        assert save_notifications(mock_db, batcher, errors) is False
+        mock_db.rollback.assert_called_once()
+        assert errors == ["Error saving 1 notifications: db down"]
+
+    @patch("app.tasks.reminder_tasks.group")
+    @patch("app.tasks.reminder_tasks.save_notifications", return_value=False)
+    @patch("app.tasks.reminder_tasks.SessionLocal")
+    @patch("app.tasks.reminder_tasks.notify_reminder_t3")
+    @patch("app.tasks.reminder_tasks.get_instances_with_owners")
+    def test_unsaved_reminders_send_no_email(self, mock_get_owners, mock_notify, mock_session, mock_save, mock_group):
+        """Test emails are not queued for notifications that failed to save."""
+        from app.tasks.reminder_tasks import send_t3_reminders
+
+        owner = MagicMock(spec=User)
+        owner.id = uuid4()
+        instance = MagicMock(spec=ComplianceInstance)
+        instance.id = uuid4()
+
+        mock_get_owners.return_value = [(instance, owner)]
+        mock_session.return_value.__enter__.return_value = MagicMock()
+        mock_notify.return_value = MagicMock()
+
+        result = send_t3_reminders()
+
+        assert result["reminders_sent"] == 0
+        mock_save.assert_called_once()
+        mock_group.assert_not_called()
+
+    @patch("app.tasks.reminder_tasks.group")
+    @patch("app.tasks.reminder_tasks.SessionLocal")
+    @patch("app.tasks.reminder_tasks.get_instances_with_owners")
+    def test_failed_flush_lets_retry_resend(self, mock_get_owners, mock_session, mock_group):
+        """Test a failed flush releases today's dedup claims so the next run sends the reminder."""
+        from app.tasks.reminder_tasks import send_t3_reminders
+
+        owner = MagicMock(spec=User)
+        owner.id = uuid4()
+        owner.email = "owner@example.com"
+        instance = MagicMock(spec=ComplianceInstance)
+        instance.id = uuid4()
+        instance.tenant_id = uuid4()
+        instance.due_date = date.today() + timedelta(days=3)
+
+        mock_get_owners.return_value = [(instance, owner)]
+        mock_session.return_value.__enter__.return_value = MagicMock()
+
+        # In-memory stand-in for the Redis SET NX claims
+        claimed = set()
+
+        def claim(key, ttl=86400):
+            if key in claimed:
+                return False
+            claimed.add(key)
+            return True
+
+        with (
+            patch("app.services.notification_service.claim_once", side_effect=claim),
+            patch("app.services.notification_service.release_claim", side_effect=claimed.discard),
+            patch("app.services.notification_service.get_master_name", return_value="GST Filing"),
+            patch("app.services.notification_service.settings.SYNC_NOTIFICATIONS", True),
+            patch(
+                "app.services.notification_service.insert_notifications",
+                side_effect=[RuntimeError("db down"), [MagicMock()]],
+            ) as mock_insert,
+        ):
+            first = send_t3_reminders()
+            retry = send_t3_reminders()
+
+        assert first["reminders_sent"] == 0
+        assert retry["reminders_sent"] == 1
+        assert mock_insert.call_count == 2
+        assert len(claimed) == 1
+
+
+class TestEmptyScans:
+    """Tests for runs whose scan finds nothing."""
+
+    @patch("app.tasks.reminder_tasks.save_notifications")
+    @patch("app.tasks.reminder_tasks.SessionLocal")
+    @patch("app.tasks.reminder_tasks.get_instances_with_escalation_users", return_value=[])
+    def test_empty_escalation_scan_skips_writes(self, mock_get_overdue, mock_session, mock_save):
+        """Test an empty escalation scan returns without UPDATE or COMMIT."""
+        from app.tasks.reminder_tasks import escalate_overdue_items
+
+        mock_db = MagicMock()
+        mock_session.return_value.__enter__.return_value = mock_db
+
+        result = escalate_overdue_items()
+
+        assert result == {"status": "success", "escalations_sent": 0, "overdue_instances_found": 0, "errors": None}
+        mock_save.assert_not_called()
+        mock_db.execute.assert_not_called()
+        mock_db.commit.assert_not_called()
+
+
+class TestMarkEscalated:
+    """Tests for mark_escalated helper."""
+
+    def test_one_jsonb_update_per_escalation_user(self):
+        """Test escalations are merged into meta_data with one UPDATE per user, left for the caller to commit."""
+        from sqlalchemy.dialects import postgresql
+
+        from app.tasks.reminder_tasks import mark_escalated
+
+        mock_db = MagicMock()
+        cfo1, cfo2 = uuid4(), uuid4()
+
+        mark_escalated(mock_db, {cfo1: [uuid4(), uuid4()], cfo2: [uuid4()]}, date.today())
+
+        assert mock_db.execute.call_count == 2
+        mock_db.commit.assert_not_called()
+        sql = str(mock_db.execute.call_args_list[0].args[0].compile(dialect=postgresql.dialect()))
+        assert "UPDATE compliance_instances SET meta_data=(coalesce(compliance_instances.meta_data" in sql
+        assert "||" in sql
+
+    def test_no_escalations_skips_write(self):
+        """Test nothing is written when no instance was escalated."""
+        from app.tasks.reminder_tasks import mark_escalated
+
+        mock_db = MagicMock()
+
+        mark_escalated(mock_db, {}, date.today())
+
+        mock_db.execute.assert_not_called()
+        mock_db.commit.assert_not_called()
 
 
 class TestSendTaskReminders:
     """Tests for send_task_reminders task."""
 
+    @patch("app.tasks.reminder_tasks.group")
     @patch("app.tasks.reminder_tasks.send_task_reminder_email_task")
-    @patch("app.services.notification_service.create_notification")
+    @patch("app.services.notification_service.create_notifications_bulk")
     @patch("app.tasks.reminder_tasks.SessionLocal")
-    def test_sends_reminder_2_days_before_task_due(self, mock_session, mock_create_notif, mock_email_task):
+    def test_sends_reminder_2_days_before_task_due(self, mock_session, mock_create_bulk, mock_email_task, mock_group):
         """Test task reminders are sent for tasks due within 2 days."""
         from app.tasks.reminder_tasks import send_task_reminders
 
@@ -280,17 +479,44 @@ class TestSendTaskReminders:
         user = MagicMock(spec=User)
         user.id = task.assigned_to_user_id
 
-        # Setup query mocks
-        mock_db.query.return_value.filter.return_value.all.return_value = [task]
-        mock_db.query.return_value.filter.return_value.first.return_value = user
-        mock_session.return_value = mock_db
-        mock_create_notif.return_value = MagicMock()
+        # Setup query mocks: tasks, then their assigned users
+        mock_db.query.return_value.filter.return_value.all.side_effect = [[task], [user]]
+        mock_session.return_value.__enter__.return_value = mock_db
+        mock_create_bulk.side_effect = lambda db, rows: [MagicMock() for _ in rows]
 
         result = send_task_reminders()
 
         assert result["status"] == "success"
         assert result["reminders_sent"] == 1
-        mock_email_task.delay.assert_called_once()
+        mock_group.return_value.apply_async.assert_called_once()
+        # One query for tasks, one for users; one bulk notification insert
+        assert mock_db.query.call_count == 2
+        mock_create_bulk.assert_called_once()
+        assert mock_create_bulk.call_args.args[1][0]["user_id"] == user.id
+
+    @patch("app.tasks.reminder_tasks.group")
+    @patch("app.services.notification_service.create_notifications_bulk")
+    @patch("app.tasks.reminder_tasks.SessionLocal")
+    def test_skips_unassigned_tasks(self, mock_session, mock_create_bulk, mock_group):
+        """Test tasks without an assigned user get no reminder and no user query."""
+        from app.tasks.reminder_tasks import send_task_reminders
+
+        mock_db = MagicMock()
+
+        task = MagicMock(spec=WorkflowTask)
+        task.id = uuid4()
+        task.due_date = date.today() + timedelta(days=1)
+        task.assigned_to_user_id = None
+
+        mock_db.query.return_value.filter.return_value.all.return_value = [task]
+        mock_session.return_value.__enter__.return_value = mock_db
+        mock_create_bulk.return_value = []
+
+        result = send_task_reminders()
+
+        assert result["reminders_sent"] == 0
+        assert mock_db.query.call_count == 1
+        mock_group.return_value.apply_async.assert_not_called()
 
     @patch("app.tasks.reminder_tasks.SessionLocal")
     def test_skips_completed_tasks(self, mock_session):
@@ -300,7 +526,7 @@ class TestSendTaskReminders:
         mock_db = MagicMock()
         # Query filters completed, returns empty
         mock_db.query.return_value.filter.return_value.all.return_value = []
-        mock_session.return_value = mock_db
+        mock_session.return_value.__enter__.return_value = mock_db
 
         result = send_task_reminders()
 
@@ -324,8 +550,8 @@ class TestCleanupOldNotifications:
         tenant2 = MagicMock(spec=Tenant)
         tenant2.id = uuid4()
 
-        mock_db.query.return_value.filter.return_value.all.return_value = [tenant1, tenant2]
-        mock_session.return_value = mock_db
+        mock_db.query.return_value.filter.return_value.all.return_value = [(tenant1.id,), (tenant2.id,)]
+        mock_session.return_value.__enter__.return_value = mock_db
 
         mock_delete_old.side_effect = [50, 30]  # Delete counts
 
@@ -334,6 +560,8 @@ class TestCleanupOldNotifications:
         assert result["status"] == "success"
         assert result["notifications_deleted"] == 80
         assert mock_delete_old.call_count == 2
+        # Tenant list plus one session per tenant
+        assert mock_session.call_count == 3
 
     @patch("app.services.notification_service.delete_old_notifications")
     @patch("app.tasks.reminder_tasks.SessionLocal")
@@ -346,8 +574,8 @@ class TestCleanupOldNotifications:
         tenant = MagicMock(spec=Tenant)
         tenant.id = uuid4()
 
-        mock_db.query.return_value.filter.return_value.all.return_value = [tenant]
-        mock_session.return_value = mock_db
+        mock_db.query.return_value.filter.return_value.all.return_value = [(tenant.id,)]
+        mock_session.return_value.__enter__.return_value = mock_db
         mock_delete_old.return_value = 0
 
         result = cleanup_old_notifications()
@@ -356,9 +584,231 @@ class TestCleanupOldNotifications:
         assert result["notifications_deleted"] == 0
 
 
+class TestEnqueueEmails:
+    """Tests for batched email submission."""
+
+    @patch("app.tasks.reminder_tasks.group")
+    def test_submits_one_group(self, mock_group):
+        """All collected emails go out in a single group."""
+        from app.tasks.reminder_tasks import enqueue_emails
+
+        email_task = MagicMock()
+        enqueue_emails(email_task, [{"user_id": "u1"}, {"user_id": "u2"}])
+
+        assert len(list(mock_group.call_args.args[0])) == 2
+        mock_group.return_value.apply_async.assert_called_once()
+
+    @patch("app.tasks.reminder_tasks.group")
+    def test_nothing_to_send(self, mock_group):
+        """No broker call when the loop queued no emails."""
+        from app.tasks.reminder_tasks import enqueue_emails
+
+        enqueue_emails(MagicMock(), [])
+
+        mock_group.assert_not_called()
+
+    @patch("app.tasks.reminder_tasks.group")
+    def test_broker_failure_is_logged(self, mock_group):
+        """A broker error should not propagate (notifications are already saved)."""
+        from app.tasks.reminder_tasks import enqueue_emails
+
+        mock_group.return_value.apply_async.side_effect = ConnectionError("broker down")
+
+        enqueue_emails(MagicMock(), [{"user_id": "u1"}])  # No exception raised
+
+
+class TestReminderSharding:
+    """Tests for tenant-sharded reminder dispatch."""
+
+    def test_single_shard_adds_no_filter(self):
+        """Test an unsharded run covers every tenant."""
+        from app.tasks.reminder_tasks import shard_criteria
+
+        assert shard_criteria(ComplianceInstance.tenant_id, 0, 1) == []
+
+    def test_shard_filter_hashes_tenant_id(self):
+        """Test shards are selected by hashtext(tenant_id) modulo shard count."""
+        from sqlalchemy.dialects import postgresql
+
+        from app.tasks.reminder_tasks import shard_criteria
+
+        (criterion,) = shard_criteria(ComplianceInstance.tenant_id, 2, 4)
+        sql = str(criterion.compile(dialect=postgresql.dialect()))
+
+        assert "hashtext(CAST(compliance_instances.tenant_id AS VARCHAR))" in sql
+        assert "%" in sql
+
+    @patch("app.tasks.reminder_tasks.group")
+    @patch("app.tasks.reminder_tasks.settings")
+    def test_dispatches_one_task_per_shard_queue(self, mock_settings, mock_group):
+        """Test each shard is queued on its own reminders_<n> queue."""
+        from app.tasks.reminder_tasks import dispatch_reminder_shards
+
+        mock_settings.REMINDER_SHARD_COUNT = 3
+        mock_task = MagicMock()
+
+        with patch.dict("app.tasks.reminder_tasks.celery_app.tasks", {"reminders.t3": mock_task}):
+            result = dispatch_reminder_shards("reminders.t3")
+            signatures = list(mock_group.call_args.args[0])
+
+        assert result["shards"] == 3
+        assert len(signatures) == 3
+        assert [call.args for call in mock_task.s.call_args_list] == [(0, 3), (1, 3), (2, 3)]
+        queues = [call.kwargs["queue"] for call in mock_task.s.return_value.set.call_args_list]
+        assert queues == ["reminders_0", "reminders_1", "reminders_2"]
+        mock_group.return_value.apply_async.assert_called_once()
+
+    @patch("app.tasks.reminder_tasks.group")
+    @patch("app.tasks.reminder_tasks.settings")
+    def test_single_shard_queues_task_directly(self, mock_settings, mock_group):
+        """Test an unsharded deployment queues the task once, without a group."""
+        from app.tasks.reminder_tasks import dispatch_reminder_shards
+
+        mock_settings.REMINDER_SHARD_COUNT = 1
+        mock_task = MagicMock()
+
+        with patch.dict("app.tasks.reminder_tasks.celery_app.tasks", {"reminders.tasks": mock_task}):
+            dispatch_reminder_shards("reminders.tasks")
+
+        mock_task.apply_async.assert_called_once_with(args=(0, 1))
+        mock_group.assert_not_called()
+
+
+class TestGetEscalationUsers:
+    """Tests for the batched escalation user lookup."""
+
+    def setup_method(self):
+        from app.tasks import reminder_tasks
+
+        reminder_tasks._ROLE_IDS.clear()
+
+    def test_prefers_cfo_per_tenant_in_one_query(self):
+        """CFO wins over Admin within a tenant; role ids come from the cache."""
+        from app.tasks.reminder_tasks import _ROLE_IDS, get_escalation_users
+
+        cfo_role, admin_role = uuid4(), uuid4()
+        _ROLE_IDS.update({"CFO": cfo_role, "ADMIN": admin_role})
+        tenant1, tenant2 = uuid4(), uuid4()
+        admin1 = MagicMock(tenant_id=tenant1)
+        cfo1 = MagicMock(tenant_id=tenant1)
+        admin2 = MagicMock(tenant_id=tenant2)
+
+        db = MagicMock()
+        db.query.return_value.join.return_value.filter.return_value.all.return_value = [
+            (admin1, admin_role),
+            (cfo1, cfo_role),
+            (admin2, admin_role),
+        ]
+
+        result = get_escalation_users(db, {tenant1, tenant2})
+
+        assert result == {tenant1: cfo1, tenant2: admin2}
+        db.query.assert_called_once()  # no Role lookups
+
+    def test_overdue_instances_joined_to_escalation_users(self):
+        """Escalation users come from a DISTINCT ON subquery in the same statement."""
+        from sqlalchemy.dialects import postgresql
+        from sqlalchemy.orm import Query, Session
+
+        from app.tasks.reminder_tasks import _ROLE_IDS, get_instances_with_escalation_users
+
+        _ROLE_IDS.update({"CFO": uuid4(), "ADMIN": uuid4()})
+
+        with patch.object(Query, "all", autospec=True, return_value=[]) as mock_all:
+            result = get_instances_with_escalation_users(Session(), ComplianceInstance.due_date <= date.today())
+
+        assert result == []
+        mock_all.assert_called_once()
+        sql = str(mock_all.call_args.args[0].statement.compile(dialect=postgresql.dialect()))
+        assert "SELECT DISTINCT ON (users.tenant_id)" in sql
+        assert "ORDER BY users.tenant_id, CASE user_roles.role_id" in sql
+        assert "LEFT OUTER JOIN users ON users.id = anon_1.user_id" in sql
+
+    def test_escalation_scan_skips_locked_instances(self):
+        """Only instance rows are locked, skipping rows another run holds."""
+        from sqlalchemy.dialects import postgresql
+        from sqlalchemy.orm import Query, Session
+
+        from app.tasks.reminder_tasks import _ROLE_IDS, get_instances_with_escalation_users
+
+        _ROLE_IDS.update({"CFO": uuid4(), "ADMIN": uuid4()})
+
+        overdue = ComplianceInstance.due_date <= date.today()
+        with patch.object(Query, "all", autospec=True, return_value=[]) as mock_all:
+            get_instances_with_escalation_users(Session(), overdue, skip_locked=True)
+
+        sql = str(mock_all.call_args.args[0].statement.compile(dialect=postgresql.dialect()))
+        assert sql.endswith("FOR UPDATE OF compliance_instances SKIP LOCKED")
+
+    def test_role_ids_cached_after_first_lookup(self):
+        """Role ids are queried once per worker process."""
+        from app.tasks.reminder_tasks import _role_id_by_code
+
+        role_id = uuid4()
+        db = MagicMock()
+        db.query.return_value.filter.return_value.scalar.return_value = role_id
+
+        assert _role_id_by_code(db, "CFO") == role_id
+        assert _role_id_by_code(db, "CFO") == role_id
+        db.query.assert_called_once()
+
+
+class TestGetInstancesWithOwners:
+    """Tests for the batched instance + owner query."""
+
+    def test_single_distinct_on_query_prefers_role_holder(self):
+        """Owners are resolved in the same statement, one row per instance."""
+        from sqlalchemy.dialects import postgresql
+        from sqlalchemy.orm import Query, Session
+
+        from app.tasks.reminder_tasks import get_instances_with_owners
+
+        with patch.object(Query, "all", autospec=True, return_value=[]) as mock_all:
+            result = get_instances_with_owners(Session(), ComplianceInstance.due_date == date.today())
+
+        assert result == []
+        sql = str(mock_all.call_args.args[0].statement.compile(dialect=postgresql.dialect()))
+        assert sql.startswith("SELECT DISTINCT ON (compliance_instances.id)")
+        assert "LEFT OUTER JOIN user_roles" in sql
+        assert "ORDER BY compliance_instances.id, user_roles.role_id IS NULL, users.id IS NULL" in sql
+
+    def test_bulk_owner_lookup_omits_ownerless_instances(self):
+        """Owners for many instances come from one query; instances without one are dropped."""
+        from sqlalchemy.dialects import postgresql
+        from sqlalchemy.orm import Query, Session
+
+        from app.tasks.reminder_tasks import get_instance_owners_bulk
+
+        owned, ownerless = uuid4(), uuid4()
+        owner = MagicMock(spec=User)
+
+        with patch.object(Query, "all", autospec=True, return_value=[(owned, owner), (ownerless, None)]) as mock_all:
+            result = get_instance_owners_bulk(Session(), [owned, ownerless])
+
+        assert result == {owned: owner}
+        mock_all.assert_called_once()
+        sql = str(mock_all.call_args.args[0].statement.compile(dialect=postgresql.dialect()))
+        assert sql.startswith("SELECT DISTINCT ON (compliance_instances.id) compliance_instances.id, users.")
+        assert "compliance_instances.id IN" in sql
+
+    def test_bulk_owner_lookup_without_ids_skips_query(self):
+        """No query is issued for an empty batch."""
+        from app.tasks.reminder_tasks import get_instance_owners_bulk
+
+        mock_db = MagicMock()
+
+        assert get_instance_owners_bulk(mock_db, []) == {}
+        mock_db.query.assert_not_called()
+
+
 class TestGetInstanceOwner:
     """Tests for get_instance_owner helper function."""
 
+    def setup_method(self):
+        from app.tasks import reminder_tasks
+
+        reminder_tasks._ROLE_IDS.clear()
+
     def test_finds_owner_by_role_and_entity_access(self, db_session, test_tenant):
         """Test owner is found by role code and entity access."""
         from app.tasks.reminder_tasks import get_instance_owner
@@ -443,6 +893,12 @@ class TestGetInstanceOwner:
 class TestGetEscalationUser:
     """Tests for get_escalation_user helper function."""
 
+    def setup_method(self):
+        from app.tasks import reminder_tasks
+
+        # Roles are recreated per test, so drop ids cached by earlier tests
+        reminder_tasks._ROLE_IDS.clear()
+
     def test_finds_cfo_first(self, db_session, test_tenant):
         """Test CFO is preferred over Admin for escalation."""
         from app.tasks.reminder_tasks import get_escalation_user
@@ -529,3 +985,64 @@ class TestGetEscalationUser:
 
         assert escalation_user is not None
         assert escalation_user.email == "admin@example.com"
+
+
+class TestInstanceNotifyOptions:
+    """Tests for the loader options used by the reminder scans."""
+
+    def test_notification_context_needs_no_queries(self, db_session, test_tenant):
+        """Test instances loaded with INSTANCE_NOTIFY_OPTIONS render without lazy loads or name lookups."""
+        from sqlalchemy import event
+        from sqlalchemy.orm import raiseload
+
+        from app.models import Entity, ComplianceMaster
+        from app.services.notification_service import INSTANCE_NOTIFY_OPTIONS, _instance_ctx
+
+        entity = Entity(tenant_id=test_tenant.id, entity_name="Acme India", entity_code="ACME01")
+        master = ComplianceMaster(
+            tenant_id=test_tenant.id,
+            compliance_code="GST01",
+            compliance_name="GST Return",
+            category="GST",
+            frequency="Monthly",
+            due_date_rule={"type": "monthly", "day": 11},
+        )
+        db_session.add_all([entity, master])
+        db_session.flush()
+        db_session.add(
+            ComplianceInstance(
+                tenant_id=test_tenant.id,
+                compliance_master_id=master.id,
+                entity_id=entity.id,
+                period_start=date.today(),
+                period_end=date.today() + timedelta(days=30),
+                due_date=date.today() - timedelta(days=5),
+                status="Pending",
+                rag_status="Red",
+            )
+        )
+        db_session.commit()
+        db_session.expunge_all()
+
+        # Any relationship the options do not load raises instead of lazy-loading
+        instance = (
+            db_session.query(ComplianceInstance)
+            .options(*INSTANCE_NOTIFY_OPTIONS, raiseload("*"))
+            .filter(ComplianceInstance.entity_id == entity.id)
+            .one()
+        )
+
+        statements = []
+        connection = db_session.connection()
+        event.listen(connection, "before_cursor_execute", lambda *args: statements.append(args[2]))
+        with (
+            patch("app.services.notification_service.get_master_name") as mock_master_name,
+            patch("app.services.notification_service.get_entity_name") as mock_entity_name,
+        ):
+            ctx = _instance_ctx(db_session, instance, with_entity=True)
+
+        assert ctx["master_name"] == "GST Return"
+        assert ctx["entity_name"] == "Acme India"
+        assert statements == []
+        mock_master_name.assert_not_called()
+        mock_entity_name.assert_not_called()